@@ -0,0 +1,340 @@
+"""
+Array versions of warm_up_2.calculate_distance for working with many points at once.
+"""
+import math
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 2048  # rows of the distance matrix computed at a time
+DEFAULT_BLOCK_DISTANCES = 1 << 22  # distances GridIndex.query_many computes at a time (32 MB)
+
+
+def as_points(points) -> np.ndarray:
+    """Converts a sequence of (x, y) pairs into a float N×2 array
+
+    Args:
+      points: anything numpy can turn into an N×2 array, e.g. a list of tuples
+
+    Returns:
+      A float64 array with shape (N, 2)
+
+    Examples
+    --------
+    >>>as_points([(3, 4), (0, 0)])
+    array([[3., 4.],
+           [0., 0.]])
+    """
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim == 1 and points.size == 0:
+        return points.reshape(0, 2)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError(f"expected an N×2 array of points, got shape {points.shape}")
+    return points
+
+
+def iter_distance_blocks(points_a, points_b=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yields the pairwise distance matrix between two point sets one block of rows at a time,
+    so at most chunk_size × len(points_b) distances are held in memory.
+
+    Args:
+      points_a: N×2 array of points (the rows of the matrix)
+      points_b: M×2 array of points (the columns of the matrix), defaults to points_a
+      chunk_size: maximum number of rows in each block
+
+    Returns:
+      A generator of (start, block) tuples, where block[i, j] is the distance between
+      points_a[start + i] and points_b[j]
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    points_a = as_points(points_a)
+    points_b = points_a if points_b is None else as_points(points_b)
+
+    for start in range(0, len(points_a), chunk_size):
+        rows = points_a[start : start + chunk_size]
+        diff = rows[:, np.newaxis, :] - points_b[np.newaxis, :, :]
+        yield start, np.hypot(diff[..., 0], diff[..., 1])
+
+
+def pairwise_distances(points_a, points_b=None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.ndarray:
+    """Computes the full distance matrix between two point sets using broadcasting
+
+    Args:
+      points_a: N×2 array of points
+      points_b: M×2 array of points, defaults to points_a
+      chunk_size: maximum number of rows broadcast at once, which bounds the temporary memory
+
+    Returns:
+      An N×M array where entry [i, j] equals calculate_distance(*points_a[i], *points_b[j])
+
+    Examples
+    --------
+    >>>pairwise_distances([(3, 4), (0, 0)])
+    array([[0., 5.],
+           [5., 0.]])
+    """
+    points_a = as_points(points_a)
+    points_b = points_a if points_b is None else as_points(points_b)
+    distances = np.empty((len(points_a), len(points_b)))
+
+    for start, block in iter_distance_blocks(points_a, points_b, chunk_size):
+        distances[start : start + len(block)] = block
+
+    return distances
+
+
+class GridIndex:
+    """Buckets points into a uniform grid of square cells so nearest-neighbour queries only
+    look at the cells around the query point instead of the whole point set.
+
+    Points are stored sorted by cell (row-major), so every run of cells along a grid row is
+    one contiguous slice of the sorted arrays. Only occupied cells take up memory, so a few
+    far-away points can stretch the grid without shrinking or multiplying its cells.
+    """
+
+    def __init__(self, points, cell_size: float = None, points_per_cell: int = 12):
+        self.__points = as_points(points)
+        if len(self.__points) == 0:
+            raise ValueError("cannot index an empty set of points")
+
+        self.__origin = self.__points.min(axis=0)
+        extent = self.__points.max(axis=0) - self.__origin
+        if cell_size is None:
+            # size cells from the bulk of the points, so outliers don't blow the cells up
+            low, high = np.quantile(self.__points, [0.01, 0.99], axis=0)
+            core_extent = high - low
+            in_core = np.count_nonzero(np.all((self.__points >= low) & (self.__points <= high), axis=1))
+            area = max(core_extent[0], 1e-12) * max(core_extent[1], 1e-12)
+            cell_size = math.sqrt(area * points_per_cell / max(in_core, 1))
+            # keep cell ids well inside int64
+            cell_size = max(cell_size, float(core_extent.max()) / 4096, float(extent.max()) / 2**24, 1e-12)
+        elif cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.__cell_size = float(cell_size)
+
+        cells = np.floor((self.__points - self.__origin) / self.__cell_size).astype(np.int64)
+        self.__shape = (int(cells[:, 0].max()) + 1, int(cells[:, 1].max()) + 1)
+        cell_ids = cells[:, 0] * self.__shape[1] + cells[:, 1]
+
+        self.__order = np.argsort(cell_ids, kind="stable")
+        self.__sorted_points = self.__points[self.__order]
+        self.__sorted_cell_ids = cell_ids[self.__order]
+
+    @property
+    def points(self):
+        return self.__points
+
+    @property
+    def cell_size(self):
+        return self.__cell_size
+
+    def __len__(self):
+        return len(self.__points)
+
+    def __row_slice(self, x: int, y0: int, y1: int) -> slice:
+        """Returns the slice of sorted points in cells (x, y0) through (x, y1), clipped to the grid"""
+        nx, ny = self.__shape
+        if x < 0 or x >= nx:
+            return slice(0, 0)
+        y0, y1 = max(y0, 0), min(y1, ny - 1)
+        if y0 > y1:
+            return slice(0, 0)
+        ids = self.__sorted_cell_ids
+        return slice(int(np.searchsorted(ids, x * ny + y0)), int(np.searchsorted(ids, x * ny + y1, side="right")))
+
+    def __ring_slices(self, cx: int, cy: int, r: int) -> list[slice]:
+        """Returns slices covering the cells at Chebyshev distance exactly r from cell (cx, cy)"""
+        if r == 0:
+            return [self.__row_slice(cx, cy, cy)]
+        slices = [self.__row_slice(cx - r, cy - r, cy + r), self.__row_slice(cx + r, cy - r, cy + r)]
+        for x in range(max(cx - r + 1, 0), min(cx + r, self.__shape[0])):
+            slices.append(self.__row_slice(x, cy - r, cy - r))
+            slices.append(self.__row_slice(x, cy + r, cy + r))
+        return slices
+
+    def query(self, point, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the k points closest to a single query point
+
+        Args:
+          point: an (x, y) pair
+          k: how many neighbours to return
+
+        Returns:
+          distances: array of the k smallest distances, in increasing order
+          indices: array of the positions of those neighbours in the indexed points
+        """
+        if not 1 <= k <= len(self.__points):
+            raise ValueError(f"k must be between 1 and {len(self.__points)}")
+        qx, qy = float(point[0]), float(point[1])
+        cx = int(math.floor((qx - self.__origin[0]) / self.__cell_size))
+        cy = int(math.floor((qy - self.__origin[1]) / self.__cell_size))
+
+        # rings past this radius lie entirely outside the grid
+        max_ring = max(cx, self.__shape[0] - 1 - cx, cy, self.__shape[1] - 1 - cy)
+
+        best_dist = np.empty(0)
+        best_pos = np.empty(0, dtype=np.int64)
+        r = 0
+        while r <= max_ring:
+            if (2 * r + 1) ** 2 > len(self.__points):
+                # the rings would cover more cells than there are points: scanning every point is cheaper
+                best_pos = np.arange(len(self.__points))
+                best_dist = np.hypot(self.__sorted_points[:, 0] - qx, self.__sorted_points[:, 1] - qy)
+                keep = np.argpartition(best_dist, k - 1)[:k]
+                best_dist, best_pos = best_dist[keep], best_pos[keep]
+                break
+
+            positions = [np.arange(s.start, s.stop) for s in self.__ring_slices(cx, cy, r) if s.stop > s.start]
+            if positions:
+                positions = np.concatenate(positions)
+                found = self.__sorted_points[positions]
+                dist = np.hypot(found[:, 0] - qx, found[:, 1] - qy)
+                best_dist = np.concatenate((best_dist, dist))
+                best_pos = np.concatenate((best_pos, positions))
+                if len(best_dist) > k:
+                    keep = np.argpartition(best_dist, k - 1)[:k]
+                    best_dist, best_pos = best_dist[keep], best_pos[keep]
+
+            # any point outside the searched rings is at least r cells away
+            if len(best_dist) == k and best_dist.max() <= r * self.__cell_size:
+                break
+            r += 1
+
+        ranked = np.argsort(best_dist, kind="stable")
+        return best_dist[ranked], self.__order[best_pos[ranked]]
+
+    def __block_positions(self, cx: int, cy: int, r: int) -> np.ndarray:
+        """Returns the sorted-point positions inside the (2r + 1) × (2r + 1) block of cells centred on (cx, cy)"""
+        nx, ny = self.__shape
+        y0, y1 = max(cy - r, 0), min(cy + r, ny - 1)
+        rows = np.arange(max(cx - r, 0), min(cx + r, nx - 1) + 1, dtype=np.int64)
+        if y0 > y1 or len(rows) == 0:
+            return np.empty(0, dtype=np.int64)
+        starts = np.searchsorted(self.__sorted_cell_ids, rows * ny + y0)
+        stops = np.searchsorted(self.__sorted_cell_ids, rows * ny + y1, side="right")
+        # concatenate the ranges starts[i]:stops[i] without a Python loop
+        lengths = stops - starts
+        offsets = np.cumsum(lengths) - lengths
+        return np.repeat(starts - offsets, lengths) + np.arange(lengths.sum())
+
+    def query_many(
+        self, points, k: int = 1, max_block_distances: int = DEFAULT_BLOCK_DISTANCES
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Finds the k nearest indexed points for every point in a batch.
+        Queries that fall in the same cell share one candidate block, and their distances to it
+        are broadcast a chunk of queries at a time, so at most about max_block_distances
+        distances are held in memory however the points are spread out.
+
+        Args:
+          points: M×2 array of query points
+          k: how many neighbours to return for each query
+          max_block_distances: how many query-to-candidate distances to compute at once
+
+        Returns:
+          distances: M×k array of neighbour distances, each row in increasing order
+          indices: M×k array of neighbour positions in the indexed points
+        """
+        if not 1 <= k <= len(self.__points):
+            raise ValueError(f"k must be between 1 and {len(self.__points)}")
+        if max_block_distances < 1:
+            raise ValueError("max_block_distances must be at least 1")
+        points = as_points(points)
+        distances = np.empty((len(points), k))
+        indices = np.empty((len(points), k), dtype=np.int64)
+        if len(points) == 0:
+            return distances, indices
+
+        cells = np.floor((points - self.__origin) / self.__cell_size).astype(np.int64)
+        group_cells, group_of = np.unique(cells, axis=0, return_inverse=True)
+        by_group = np.argsort(group_of.ravel(), kind="stable")
+        bounds = np.searchsorted(group_of.ravel()[by_group], np.arange(len(group_cells) + 1))
+
+        for g, (cx, cy) in enumerate(group_cells.tolist()):
+            pending = by_group[bounds[g] : bounds[g + 1]]
+            max_ring = max(cx, self.__shape[0] - 1 - cx, cy, self.__shape[1] - 1 - cy)
+            r = 1
+            while len(pending):
+                # past the grid's edge, or once the block has more cells than there are points, take every point
+                covers_all = r >= max_ring or (2 * r + 1) ** 2 > len(self.__points)
+                positions = np.arange(len(self.__points)) if covers_all else self.__block_positions(cx, cy, r)
+                if len(positions) >= k:
+                    found = self.__sorted_points[positions]
+                    rows = max(1, max_block_distances // len(positions))
+                    unfinished = []
+                    for start in range(0, len(pending), rows):
+                        members = pending[start : start + rows]
+                        queries = points[members]
+                        dist = np.hypot(
+                            queries[:, 0, np.newaxis] - found[np.newaxis, :, 0],
+                            queries[:, 1, np.newaxis] - found[np.newaxis, :, 1],
+                        )
+                        nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+                        nearest_dist = np.take_along_axis(dist, nearest, axis=1)
+                        # any point outside the block is at least r cells away
+                        done = covers_all | (nearest_dist.max(axis=1) <= r * self.__cell_size)
+                        if not done.all():
+                            unfinished.append(members[~done])
+                            members, nearest, nearest_dist = members[done], nearest[done], nearest_dist[done]
+                        ranked = np.argsort(nearest_dist, axis=1, kind="stable")
+                        distances[members] = np.take_along_axis(nearest_dist, ranked, axis=1)
+                        indices[members] = self.__order[positions[np.take_along_axis(nearest, ranked, axis=1)]]
+                    pending = np.concatenate(unfinished + [np.empty(0, dtype=np.int64)])
+                r += 1
+
+        return distances, indices
+
+
+def k_nearest_neighbours(points, queries=None, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    """Finds the k nearest neighbours of each query point among points.
+    When queries is omitted, each point's neighbours are found among the other points (itself excluded).
+
+    Args:
+      points: N×2 array of points to search
+      queries: M×2 array of query points, defaults to points
+      k: how many neighbours to return for each query
+
+    Returns:
+      distances: M×k array of neighbour distances, each row in increasing order
+      indices: M×k array of neighbour positions in points
+
+    Examples
+    --------
+    >>>k_nearest_neighbours([(0, 0), (3, 4), (1, 0)], k=1)
+    (array([[1.], [4.47213595], [1.]]), array([[2], [2], [0]]))
+    """
+    index = GridIndex(points)
+    if queries is not None:
+        return index.query_many(queries, k)
+
+    distances, indices = index.query_many(index.points, k + 1)
+    # drop each point's match with itself, which isn't always in column 0 when points repeat
+    own = np.arange(len(index))[:, np.newaxis]
+    is_self = indices == own
+    is_self[~is_self.any(axis=1), -1] = True
+    keep = ~is_self
+    return distances[keep].reshape(-1, k), indices[keep].reshape(-1, k)
+
+
+if __name__ == "__main__":
+    from warm_up_2 import calculate_distance
+
+    rng = np.random.default_rng(0)
+    points = rng.random((2000, 2)) * 100
+
+    matrix = pairwise_distances(points, chunk_size=256)
+    x1, y1 = points[3]
+    x2, y2 = points[7]
+    print(f"matrix[3, 7] = {matrix[3, 7]}, calculate_distance = {calculate_distance(x1, y1, x2, y2)}")
+
+    distances, indices = k_nearest_neighbours(points, k=3)
+    np.fill_diagonal(matrix, np.inf)
+    brute = np.sort(matrix, axis=1)[:, :3]
+    print(f"grid k-nearest matches brute force: {np.allclose(distances, brute)}")
+
+    # a few far-away points must not pile the rest into one cell
+    clustered = np.vstack((rng.normal(size=(3000, 2)), rng.normal(size=(10, 2)) * 1000, [(1e6, 1e6)]))
+    distances, indices = k_nearest_neighbours(clustered, k=3)
+    matrix = pairwise_distances(clustered, chunk_size=256)
+    np.fill_diagonal(matrix, np.inf)
+    brute = np.sort(matrix, axis=1)[:, :3]
+    print(f"grid k-nearest with outliers matches brute force: {np.allclose(distances, brute)}")
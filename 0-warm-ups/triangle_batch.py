@@ -0,0 +1,134 @@
+"""
+Batch version of warm_up_3.classify_triangle for classifying many side triples at once.
+"""
+from fractions import Fraction
+
+import numpy as np
+
+# category codes returned by classify_triangles
+DOES_NOT_EXIST = 0
+ACUTE = 1
+OBTUSE = 2
+RIGHT = 3
+
+LABELS = ("does not exist", "acute", "obtuse", "right")
+
+# sides above this can overflow int64 once squared and summed, so they're handled as python ints
+_MAX_EXACT_INT64_SIDE = 2**31 - 1
+
+
+def order_sides_batch(sides: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Orders every row of an N×3 array from largest to smallest with a 3-element sorting network,
+    which avoids a full np.sort over each tiny row
+
+    Args:
+      sides: N×3 array of side lengths
+
+    Returns:
+      Three length-N arrays: the largest, middle, and smallest side of each row
+
+    Examples
+    --------
+    >>>order_sides_batch(np.array([[3, 5, 4]]))
+    (array([5]), array([4]), array([3]))
+    """
+    a, b, c = sides[:, 0], sides[:, 1], sides[:, 2]
+    low, high = np.minimum(a, b), np.maximum(a, b)
+    largest = np.maximum(high, c)
+    middle = np.maximum(low, np.minimum(high, c))
+    smallest = np.minimum(low, c)
+    return largest, middle, smallest
+
+
+def _as_exact(sides: np.ndarray) -> np.ndarray:
+    """Returns sides in a dtype whose squares and sums are computed without rounding"""
+    if sides.dtype.kind in "iu":
+        if sides.size == 0 or int(np.abs(sides).max()) <= _MAX_EXACT_INT64_SIDE:
+            return sides.astype(np.int64, copy=False)
+        return sides.astype(object)
+    if sides.dtype.kind == "f":
+        # every float is an exact binary fraction, so Fraction keeps the comparison exact
+        return np.vectorize(Fraction, otypes=[object])(sides)
+    return sides
+
+
+def classify_triangles(sides, exact: bool = None, rel_tol: float = 1e-9) -> np.ndarray:
+    """Given an N×3 array of side lengths, classifies every row into 1 of 4 categories,
+    using the same rules as classify_triangle
+
+    Args:
+      sides: N×3 array-like of side lengths (ints, floats, or Fractions)
+      exact: whether to compare squares exactly. Defaults to True for integer and Fraction input
+        and False for float input
+      rel_tol: relative tolerance used to detect right triangles when exact is False
+
+    Returns:
+      A uint8 array of category codes: DOES_NOT_EXIST, ACUTE, OBTUSE, or RIGHT.
+      LABELS[code] gives the matching classify_triangle string.
+
+    Examples
+    --------
+    >>>classify_triangles([[2, 2, 4], [3, 5, 4], [2, 3, 4], [3, 3, 3]])
+    array([0, 3, 2, 1], dtype=uint8)
+
+    >>>classify_triangles([[1, 1, 2 ** 0.5]])
+    array([3], dtype=uint8)
+    """
+    sides = np.asarray(sides)
+    if sides.ndim == 1 and sides.size == 0:
+        sides = sides.reshape(0, 3)
+    if sides.ndim != 2 or sides.shape[1] != 3:
+        raise ValueError(f"expected an N×3 array of sides, got shape {sides.shape}")
+
+    if exact is None:
+        exact = sides.dtype.kind != "f"
+    if exact:
+        sides = _as_exact(sides)
+    elif sides.dtype.kind != "f":
+        sides = sides.astype(np.float64)
+
+    largest, middle, smallest = order_sides_batch(sides)
+    largest_sq = largest * largest
+    others_sq = middle * middle + smallest * smallest
+
+    if exact:
+        is_right = largest_sq == others_sq
+    else:
+        is_right = np.abs(largest_sq - others_sq) <= rel_tol * largest_sq
+
+    exists = np.asarray((largest < middle + smallest) & (smallest > 0), dtype=bool)
+    is_obtuse = np.asarray(largest_sq > others_sq, dtype=bool)
+    codes = np.where(is_obtuse, np.uint8(OBTUSE), np.uint8(ACUTE))
+    np.putmask(codes, np.asarray(is_right, dtype=bool), RIGHT)
+    np.putmask(codes, ~exists, DOES_NOT_EXIST)
+    return codes
+
+
+def label_triangles(codes: np.ndarray) -> np.ndarray:
+    """Converts category codes from classify_triangles into classify_triangle's string labels
+
+    Examples
+    --------
+    >>>label_triangles(np.array([0, 3]))
+    array(['does not exist', 'right'], dtype='<U14')
+    """
+    return np.array(LABELS)[codes]
+
+
+if __name__ == "__main__":
+    import time
+    from warm_up_3 import classify_triangle
+
+    triples = [(2, 2, 4), (3, 5, 4), (2, 3, 4), (3, 3, 3), (5, 12, 13)]
+    codes = classify_triangles(triples)
+    for triple, label in zip(triples, label_triangles(codes)):
+        print(f"{triple}: {label} (classify_triangle says {classify_triangle(*triple)})")
+
+    print(label_triangles(classify_triangles([[Fraction(3, 10), Fraction(4, 10), Fraction(1, 2)]])))
+    print(f"1, 1, sqrt(2) with classify_triangle: {classify_triangle(1, 1, 2 ** 0.5)}")
+    print(f"1, 1, sqrt(2) with classify_triangles: {label_triangles(classify_triangles([[1, 1, 2 ** 0.5]]))}")
+
+    sides = np.random.default_rng(0).integers(1, 1000, size=(10**7, 3))
+    start = time.perf_counter()
+    classify_triangles(sides)
+    print(f"Classified {len(sides)} triples in {round(time.perf_counter() - start, 3)}s")
@@ -6,6 +6,7 @@ from colorama import Back, Style, init
 
 init(autoreset=True)
 from wordle_wordlist import get_word_list
+from corpus_index import load_index
 
 
 def get_feedback(guess: str, secret_word: str) -> str:
@@ -16,7 +17,7 @@ def get_feedback(guess: str, secret_word: str) -> str:
 
     final = ["-"] * 5
 
-    if guess not in get_word_list() or len(guess) != 5:
+    if guess not in load_index(get_word_list) or len(guess) != 5:
         return "not a valid guess"
 
     for i in range(0, len(guess_list)):
@@ -175,7 +176,7 @@ def valid_guess(past_guesses, guess: str) -> str:
         return "Guess must be exactly 5 letters long!"
     if not guess.isalpha():
         return "Guess must contain only letters!"
-    if guess.upper() not in get_word_list():
+    if guess.upper() not in load_index(get_word_list):
         return "Guess must be a valid word!"
     if guess.upper() in past_guesses:
         return "You already guessed that!"
@@ -186,7 +187,7 @@ def run_game():
     print("\n============== Welcome to Wordle! ==============")
     print("Guess a five-letter word in at most six attempts.")
 
-    secret_word = random.choice(get_word_list()).upper()
+    secret_word = random.choice(load_index(get_word_list).words).upper()
 
     # print(secret_word)  # for testing purposes
 
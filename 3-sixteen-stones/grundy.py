@@ -0,0 +1,164 @@
+"""
+Sprague-Grundy solver for single-pile subtraction games: on each turn a player removes any
+number of stones from the move set, as long as the pile has that many left.
+"""
+from array import array
+from functools import lru_cache
+
+
+class SubtractionGame:
+    """Computes Grundy values and winning moves for a subtraction game with a fixed move set.
+
+    Values are memoized in a compact array. Once max(moves) consecutive values repeat, the
+    sequence is periodic forever, so any pile size is answered from the period in O(1).
+
+    In normal play the player who takes the last stone wins. In misère play the player who takes
+    the last stone loses; the values then use a terminal value of 1, which gives the correct
+    winner for a single pile but, unlike normal play, can't be XOR-ed across several piles.
+    """
+
+    def __init__(self, moves, misere: bool = False):
+        self.__moves = tuple(sorted(set(moves)))
+        if len(self.__moves) == 0 or self.__moves[0] < 1:
+            raise ValueError("moves must be a non-empty collection of positive integers")
+        self.__misere = misere
+        self.__max_move = self.__moves[-1]
+
+        # grundy values never exceed the number of moves, so pick the smallest item size that fits
+        if len(self.__moves) < 2**8:
+            typecode = "B"
+        elif len(self.__moves) < 2**16:
+            typecode = "H"
+        else:
+            typecode = "L"
+        self.__values = array(typecode)
+        self.__seen_windows = {}
+        self.__preperiod = None
+        self.__period = None
+
+    @property
+    def moves(self):
+        return self.__moves
+
+    @property
+    def misere(self):
+        return self.__misere
+
+    @property
+    def preperiod(self):
+        """The pile size from which the Grundy sequence is purely periodic"""
+        self.__find_period()
+        return self.__preperiod
+
+    @property
+    def period(self):
+        """The length of the repeating part of the Grundy sequence"""
+        self.__find_period()
+        return self.__period
+
+    def __extend(self):
+        """Computes the Grundy value of the next pile size and checks whether the sequence has started repeating"""
+        values = self.__values
+        n = len(values)
+        options = {values[n - move] for move in self.__moves if move <= n}
+        if len(options) == 0:
+            values.append(1 if self.__misere else 0)
+        else:
+            mex = 0
+            while mex in options:
+                mex += 1
+            values.append(mex)
+
+        # the next value only depends on the last max_move values, so a repeated window means a repeated sequence
+        n += 1
+        if self.__period is None and n >= self.__max_move:
+            window = values[n - self.__max_move : n].tobytes()
+            first_seen = self.__seen_windows.setdefault(window, n)
+            if first_seen != n:
+                self.__preperiod = first_seen - self.__max_move
+                self.__period = n - first_seen
+                self.__seen_windows = None
+
+    def __find_period(self):
+        while self.__period is None:
+            self.__extend()
+
+    def grundy(self, pile: int) -> int:
+        """Returns the Grundy value of a pile
+
+        Args:
+          pile: Number of stones in the pile
+
+        Returns:
+          The Grundy value; 0 means the player to move loses with perfect play
+
+        Examples
+        --------
+        >>>SubtractionGame([1, 2, 3, 4]).grundy(15)
+        0
+
+        >>>SubtractionGame([1, 2, 3, 4]).grundy(10**15 + 3)
+        3
+        """
+        if pile < 0:
+            raise ValueError("pile must not be negative")
+        if pile < len(self.__values):
+            return self.__values[pile]
+        if self.__period is None and pile < 4 * self.__max_move:
+            while len(self.__values) <= pile:
+                self.__extend()
+            return self.__values[pile]
+
+        self.__find_period()
+        if pile >= self.__preperiod:
+            pile = self.__preperiod + (pile - self.__preperiod) % self.__period
+        return self.__values[pile]
+
+    def is_winning(self, pile: int) -> bool:
+        """Whether the player to move can force a win from this pile"""
+        return self.grundy(pile) != 0
+
+    def winning_moves(self, pile: int) -> list[int]:
+        """Returns every move that leaves the opponent in a losing position
+
+        Examples
+        --------
+        >>>SubtractionGame([1, 3, 4]).winning_moves(10)
+        [1, 3]
+        """
+        return [move for move in self.__moves if move <= pile and self.grundy(pile - move) == 0]
+
+    def moves_to_value(self, pile: int, target: int) -> list[int]:
+        """Returns every move that leaves a pile with the given Grundy value"""
+        return [move for move in self.__moves if move <= pile and self.grundy(pile - move) == target]
+
+    def best_move(self, pile: int):
+        """Returns the smallest winning move, or None when every move loses against perfect play"""
+        for move in self.__moves:
+            if move > pile:
+                break
+            if self.grundy(pile - move) == 0:
+                return move
+        return None
+
+
+@lru_cache(maxsize=None)
+def get_game(moves: tuple, misere: bool = False) -> SubtractionGame:
+    """Returns a shared SubtractionGame for a move set so its memoized table is only built once
+
+    Args:
+      moves: A sorted tuple of allowed moves
+      misere: Whether taking the last stone loses instead of wins
+    """
+    return SubtractionGame(moves, misere)
+
+
+if __name__ == "__main__":
+    for moves in [(1, 2, 3, 4), (1, 3, 4), (2, 5, 7), (3, 7, 11, 19)]:
+        for misere in [False, True]:
+            game = get_game(moves, misere)
+            print(
+                f"moves {moves} {'misère' if misere else 'normal'}: preperiod {game.preperiod}, "
+                f"period {game.period}, first values {[game.grundy(n) for n in range(15)]}"
+            )
+    print(f"grundy(10**15) for {{2, 5, 7}}: {get_game((2, 5, 7)).grundy(10**15)}")
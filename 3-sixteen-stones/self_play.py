@@ -0,0 +1,155 @@
+"""
+Headless self-play simulator for tuning the 16 Stones AI: plays AI skill levels against each other
+across a process pool and reports how often each one wins.
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from stones import get_ai_guess, is_valid_move
+
+GAMES_PER_TASK = 20000
+
+
+def build_move_table(stones: int, valid_guesses: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+    """Precomputes, for every pile size, the optimal guess and the incorrect guesses that
+    get_ai_guess_extension would pick from, so simulated games skip the per-move work
+
+    Args:
+      stones: The number of stones the game starts with
+      valid_guesses: All valid guesses
+
+    Returns:
+      A list indexed by stones_in_pile of (optimal_guess, incorrect_guesses) tuples
+    """
+    table = [(0, ())] * (stones + 1)
+    for stones_in_pile in range(2, stones + 1):
+        legal = [guess for guess in valid_guesses if is_valid_move(guess, stones_in_pile, valid_guesses)]
+        if len(legal) == 0:
+            continue
+        optimal_guess = get_ai_guess(stones_in_pile, valid_guesses)
+        table[stones_in_pile] = (optimal_guess, tuple(guess for guess in legal if guess != optimal_guess))
+    return table
+
+
+def simulate_games(
+    skill_a: int,
+    skill_b: int,
+    num_games: int,
+    seed: str,
+    stones: int = 16,
+    valid_guesses: tuple[int, ...] = (1, 2, 3, 4),
+) -> int:
+    """Plays num_games games between two AIs, picking who goes first at random each game
+
+    Args:
+      skill_a: ai_skill (0 - 10) of the first AI
+      skill_b: ai_skill (0 - 10) of the second AI
+      num_games: How many games to play
+      seed: Seed for this batch's random number generator
+      stones: The number of stones each game starts with
+      valid_guesses: All valid guesses
+
+    Returns:
+      The number of games won by the first AI
+    """
+    rng = random.Random(seed)
+    chance = rng.random
+    pick = rng.choice
+    table = build_move_table(stones, valid_guesses)
+    # a move is optimal when random() * 10 < ai_skill, matching get_ai_guess_extension
+    thresholds = (skill_a / 10, skill_b / 10)
+    wins = 0
+
+    for __ in range(num_games):
+        stones_in_pile = stones
+        turn = 0 if chance() < 0.5 else 1
+        while True:
+            optimal_guess, incorrect_guesses = table[stones_in_pile]
+            if optimal_guess == 0:  # no valid moves left: the player who moved last wins
+                turn ^= 1
+                break
+            if incorrect_guesses and chance() >= thresholds[turn]:
+                stones_in_pile -= pick(incorrect_guesses)
+            else:
+                stones_in_pile -= optimal_guess
+            if stones_in_pile == 1:
+                break
+            turn ^= 1
+        if turn == 0:
+            wins += 1
+
+    return wins
+
+
+def _simulate_task(task: tuple) -> tuple[int, int, int]:
+    skill_a, skill_b, num_games, seed, stones, valid_guesses = task
+    return skill_a, skill_b, simulate_games(skill_a, skill_b, num_games, seed, stones, valid_guesses)
+
+
+def win_rate_table(
+    skills=range(11),
+    games_per_matchup: int = 100000,
+    seed=0,
+    processes: int = None,
+    stones: int = 16,
+    valid_guesses: tuple[int, ...] = (1, 2, 3, 4),
+) -> dict[tuple[int, int], float]:
+    """Plays every skill level against every skill level and reports the win rates
+
+    Each matchup is split into batches of at most GAMES_PER_TASK games. Every batch seeds its own
+    random.Random from (seed, skill_a, skill_b, batch), so the streams are independent of each other
+    and the results are reproducible no matter how the pool schedules the batches.
+
+    Args:
+      skills: The ai_skill levels to compare
+      games_per_matchup: How many games to play for each pair of skill levels
+      seed: Base seed for all random number generators
+      processes: Number of worker processes, defaults to the number of CPUs
+      stones: The number of stones each game starts with
+      valid_guesses: All valid guesses
+
+    Returns:
+      A dictionary mapping (skill_a, skill_b) to the fraction of games skill_a won
+
+    Example
+    -------
+    >>>win_rate_table(skills=[0, 10], games_per_matchup=1000)
+    {(0, 0): 0.491, (0, 10): 0.0, (10, 0): 1.0, (10, 10): 0.506}
+    """
+    skills = list(skills)
+    valid_guesses = tuple(sorted(set(valid_guesses)))
+    tasks = []
+    for skill_a in skills:
+        for skill_b in skills:
+            for batch, start in enumerate(range(0, games_per_matchup, GAMES_PER_TASK)):
+                num_games = min(GAMES_PER_TASK, games_per_matchup - start)
+                batch_seed = f"{seed}:{skill_a}:{skill_b}:{batch}"
+                tasks.append((skill_a, skill_b, num_games, batch_seed, stones, valid_guesses))
+
+    wins = {(skill_a, skill_b): 0 for skill_a in skills for skill_b in skills}
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for skill_a, skill_b, batch_wins in executor.map(_simulate_task, tasks, chunksize=4):
+            wins[(skill_a, skill_b)] += batch_wins
+
+    if games_per_matchup == 0:
+        return {matchup: 0.0 for matchup in wins}
+    return {matchup: count / games_per_matchup for matchup, count in wins.items()}
+
+
+def format_win_rate_table(table: dict[tuple[int, int], float]) -> str:
+    """Generates a grid of win percentages: rows are the AI's skill, columns are the opponent's skill"""
+    skills = sorted({skill_a for skill_a, __ in table})
+    rows = ["skill " + "".join(f"{skill_b:>7}" for skill_b in skills)]
+    for skill_a in skills:
+        rows.append(f"{skill_a:>5} " + "".join(f"{table[(skill_a, skill_b)] * 100:>6.1f}%" for skill_b in skills))
+    return "\n".join(rows)
+
+
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    table = win_rate_table(games_per_matchup=20000)
+    elapsed = time.perf_counter() - start
+    print(format_win_rate_table(table))
+    print(f"\nPlayed {len(table) * 20000} games in {round(elapsed, 2)}s")
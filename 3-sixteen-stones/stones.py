@@ -1,5 +1,9 @@
+import inspect
 import math
 import random
+from functools import lru_cache
+from typing import NamedTuple, Optional
+from grundy import get_game
 
 
 def randomly_pick_who_goes_first(num_players: int) -> int:
@@ -14,6 +18,7 @@ def randomly_pick_who_goes_first(num_players: int) -> int:
     return turn
 
 
+@lru_cache(maxsize=1024)
 def format_pile(stones_in_pile: int) -> str:
     """Generates a pretty string version of the pile of stones
 
@@ -36,13 +41,11 @@ def format_pile(stones_in_pile: int) -> str:
       "\n***\n***\n*\nThere are 7 stones in the pile."
     """
     max_row_length = math.ceil(math.sqrt(stones_in_pile))
-    stones_str = ""
-
-    for __ in range(stones_in_pile // max_row_length):
-        stones_str += f"\n{'*'*max_row_length}"
+    rows = [f"\n{'*'*max_row_length}"] * (stones_in_pile // max_row_length)
 
     if stones_in_pile % max_row_length != 0:
-        stones_str += f"\n{'*'*(stones_in_pile % max_row_length)}"
+        rows.append(f"\n{'*'*(stones_in_pile % max_row_length)}")
+    stones_str = "".join(rows)
 
     if stones_in_pile == 1:
         return f"{stones_str}\nThere is {stones_in_pile} stone in the pile."
@@ -94,49 +97,323 @@ def get_ai_guess(stones_in_pile: int, valid_guesses: list[int]) -> int:
 
     >>>get_ai_guess(6, [1,2,3,4])
     1
+
+    >>>get_ai_guess(2, [2, 5])
+    1
     """
-    if stones_in_pile % 5 == 1:
-        return 1
-    return (stones_in_pile - 1) % 5
+    # leaving 1 stone wins, so this is a normal-play subtraction game on the stones_in_pile - 1 removable stones
+    game = get_game(tuple(sorted(set(valid_guesses))))
+    best_move = game.best_move(stones_in_pile - 1)
+    if best_move is not None:
+        return best_move
+    # no winning move: take as little as the rules allow, never the last stone
+    for move in game.moves:
+        if is_valid_move(move, stones_in_pile, valid_guesses):
+            return move
+    return 1
 
 
 def get_ai_guess_extension(
-    stones_in_pile: int, valid_guesses: list[int], ai_skill=10
+    stones_in_pile: int, valid_guesses: list[int], ai_skill=10, rng=random
 ) -> int:
     """
-    finds most optimal guess, then creates a list of 10 possible guesses, with x of the numbers in the list
-    being the most optimal guess and the remaining numbers being incorrect guesses. The function then chooses
-    a random choice from the list of possible guesses to make a move.
+    finds most optimal guess, then plays it ai_skill out of 10 times. The rest of the time the AI picks
+    a random incorrect guess (a valid move other than the optimal one), if there is one.
+    valid_guesses is never modified.
 
     Examples
     --------
     >>>get_ai_guess_extension(15, [1,2,3,4], 10)
-    # creates a list [4, 4, 4, 4, 4, 4, 4, 4, 4, 4] --> 100% of choices are optimal
+    # 100% of choices are optimal
     4
 
     >>>get_ai_guess_extension(15, [1,2,3,4], 5)
-    # creates a list [4, 4, 4, 4, 4, 2, 2, 3, 1, 1] --> 50% of choices are optimal
+    # 50% of choices are optimal
     4
 
     >>>get_ai_guess_extension(15, [1,2,3,4], 3)
-    # creates a list [4, 4, 4, 2, 3, 3, 1, 3, 2, 3] --> 30% of choices are optimal
+    # 30% of choices are optimal
     2
 
     >>>get_ai_guess_extension(15, [1,2,3,4], 0)
-    # creates a list [3, 2, 2, 3, 1, 3, 3, 3, 3, 3] --> 0% of choices are optimal
+    # 0% of choices are optimal
     3
 
     """
-    optimal_guess = 1
-    if stones_in_pile % 5 != 1:
-        optimal_guess = (stones_in_pile - 1) % 5
-    possible_guesses = [optimal_guess for _ in range(ai_skill)]
-    incorrect_guesses = valid_guesses
-    incorrect_guesses.remove(optimal_guess)
-    possible_guesses.extend(
-        [random.choice(incorrect_guesses) for _ in range(10 - ai_skill)]
-    )
-    return random.choice(possible_guesses)
+    optimal_guess = get_ai_guess(stones_in_pile, valid_guesses)
+    if rng.random() * 10 < ai_skill:
+        return optimal_guess
+    incorrect_guesses = [
+        guess
+        for guess in valid_guesses
+        if guess != optimal_guess and is_valid_move(guess, stones_in_pile, valid_guesses)
+    ]
+    if len(incorrect_guesses) == 0:
+        return optimal_guess
+    return rng.choice(incorrect_guesses)
+
+
+class MultiPileGame:
+    """Tracks a game of 16 Stones played on several piles at once. On each turn a player takes
+    stones from a single pile, and no pile may be emptied, so the player who makes the last
+    possible move (leaving every pile at 1 stone) wins.
+
+    Each pile is a subtraction game on its stones_in_pile - 1 removable stones, so the position is
+    won for the player to move exactly when the XOR of the per-pile Grundy values is not 0. The XOR
+    and, for each bit, the set of piles whose Grundy value has that bit set are kept up to date
+    after every move, so best_move never has to look at all of the piles.
+    """
+
+    def __init__(self, piles: list[int], valid_guesses: list[int]):
+        self.__game = get_game(tuple(sorted(set(valid_guesses))))
+        self.__piles = list(piles)
+        if any(stones_in_pile < 1 for stones_in_pile in self.__piles):
+            raise ValueError("every pile needs at least 1 stone")
+        self.__grundy = [self.__game.grundy(stones_in_pile - 1) for stones_in_pile in self.__piles]
+        self.__nim_sum = 0
+        self.__piles_with_bit = {}
+        self.__movable = set()  # piles with at least one valid move left
+        for pile_index in range(len(self.__piles)):
+            self.__add_pile(pile_index)
+
+    @property
+    def piles(self):
+        return tuple(self.__piles)
+
+    @property
+    def valid_guesses(self):
+        return self.__game.moves
+
+    @property
+    def nim_sum(self):
+        return self.__nim_sum
+
+    def __add_pile(self, pile_index: int):
+        value = self.__grundy[pile_index]
+        self.__nim_sum ^= value
+        bit = 0
+        while value >> bit:
+            if (value >> bit) & 1:
+                self.__piles_with_bit.setdefault(bit, set()).add(pile_index)
+            bit += 1
+        if self.__piles[pile_index] > self.__game.moves[0]:
+            self.__movable.add(pile_index)
+
+    def __remove_pile(self, pile_index: int):
+        value = self.__grundy[pile_index]
+        self.__nim_sum ^= value
+        bit = 0
+        while value >> bit:
+            if (value >> bit) & 1:
+                self.__piles_with_bit[bit].discard(pile_index)
+            bit += 1
+        self.__movable.discard(pile_index)
+
+    def is_valid_move(self, pile_index: int, stones_taken: int) -> bool:
+        return 0 <= pile_index < len(self.__piles) and is_valid_move(
+            stones_taken, self.__piles[pile_index], self.__game.moves
+        )
+
+    def is_over(self) -> bool:
+        """The game is over once no pile has a valid move left"""
+        return len(self.__movable) == 0
+
+    def is_winning(self) -> bool:
+        """Whether the player to move can force a win"""
+        return self.__nim_sum != 0
+
+    def take(self, pile_index: int, stones_taken: int):
+        """Removes stones_taken stones from one pile"""
+        if not self.is_valid_move(pile_index, stones_taken):
+            raise ValueError(f"can't take {stones_taken} stones from pile {pile_index}")
+        self.__remove_pile(pile_index)
+        self.__piles[pile_index] -= stones_taken
+        self.__grundy[pile_index] = self.__game.grundy(self.__piles[pile_index] - 1)
+        self.__add_pile(pile_index)
+
+    def best_move(self) -> tuple[int, int]:
+        """Picks a move that leaves the other player with a nim sum of 0, if there is one.
+        Otherwise, takes the fewest stones possible to maximize room for the other player to make a mistake.
+
+        Returns:
+          A (pile_index, stones_taken) tuple, or None if the game is over
+
+        Examples
+        --------
+        >>>MultiPileGame([16, 6, 3], [1, 2, 3, 4]).best_move()
+        (2, 2)
+        """
+        if self.__nim_sum != 0:
+            # any pile whose value has the nim sum's highest bit set can be lowered to cancel it out
+            pile_index = next(iter(self.__piles_with_bit[self.__nim_sum.bit_length() - 1]))
+            target = self.__grundy[pile_index] ^ self.__nim_sum
+            stones_in_pile = self.__piles[pile_index]
+            for stones_taken in self.__game.moves_to_value(stones_in_pile - 1, target):
+                if stones_taken < stones_in_pile:
+                    return pile_index, stones_taken
+
+        if len(self.__movable) == 0:
+            return None
+        return next(iter(self.__movable)), self.__game.moves[0]
+
+
+def get_ai_multi_pile_guess(piles: list[int], valid_guesses: list[int]) -> tuple[int, int]:
+    """Picks the perfect move for a game of 16 Stones played on several piles
+
+    Args:
+      piles: The number of stones in each pile
+      valid_guesses: A list of integers representing all valid guesses
+
+    Returns:
+      A (pile_index, stones_taken) tuple, or None if no pile has a valid move
+
+    Examples
+    --------
+    >>>get_ai_multi_pile_guess([16, 6, 3], [1, 2, 3, 4])
+    (2, 2)
+    """
+    return MultiPileGame(piles, valid_guesses).best_move()
+
+
+class GameState(NamedTuple):
+    """A snapshot of a game of 16 Stones. States are never modified; apply_move returns a new one,
+    so any number of games can be stepped side by side without sharing anything."""
+
+    stones_in_pile: int
+    turn: int  # 0->AI, 1->Player 1, 2->Player 2
+    num_players: int
+    valid_guesses: tuple[int, ...] = (1, 2, 3, 4)
+    winner: Optional[int] = None
+
+
+def new_game(
+    num_players: int, stones_in_pile: int = 16, valid_guesses=range(1, 5), turn: int = None
+) -> GameState:
+    """Creates the starting state of a game, picking who goes first at random unless turn is given"""
+    if turn is None:
+        turn = randomly_pick_who_goes_first(num_players)
+    return GameState(stones_in_pile, turn, num_players, tuple(valid_guesses))
+
+
+def next_turn(turn: int, num_players: int) -> int:
+    """Returns whose turn is next: 0->AI, 1->Player 1, 2->Player 2"""
+    if turn == 1 and num_players == 1:
+        return 0
+    elif turn == 1 and num_players == 2:
+        return 2
+    return 1
+
+
+def apply_move(state: GameState, stones_taken: int) -> GameState:
+    """Returns the state after the current player takes stones_taken stones.
+    The player who leaves 1 stone in the pile (or leaves the other player without a valid move) wins.
+    """
+    if state.winner is not None:
+        raise ValueError("the game is already over")
+    if not is_valid_move(stones_taken, state.stones_in_pile, state.valid_guesses):
+        raise ValueError(f"can't take {stones_taken} stones from a pile of {state.stones_in_pile}")
+
+    stones_in_pile = state.stones_in_pile - stones_taken
+    if stones_in_pile == 1 or not any(
+        is_valid_move(guess, stones_in_pile, state.valid_guesses) for guess in state.valid_guesses
+    ):
+        return state._replace(stones_in_pile=stones_in_pile, winner=state.turn)
+    return state._replace(stones_in_pile=stones_in_pile, turn=next_turn(state.turn, state.num_players))
+
+
+class AIPlayer:
+    """Picks moves with get_ai_guess_extension; ai_skill=10 always plays perfectly"""
+
+    def __init__(self, ai_skill: int = 10, rng=random):
+        self.ai_skill = ai_skill
+        self.rng = rng
+
+    def choose(self, state: GameState) -> int:
+        return get_ai_guess_extension(state.stones_in_pile, state.valid_guesses, self.ai_skill, self.rng)
+
+
+class ConsolePlayer:
+    """Prompts a person at the terminal until a valid guess has been entered"""
+
+    def __init__(self, player: int, read=None, write=None):
+        self.player = player
+        self.read = read if read is not None else input
+        self.write = write if write is not None else print
+
+    def choose(self, state: GameState) -> int:
+        stones_taken = int(
+            self.read(f"\nPlayer {self.player} - How many stones would you like to remove from the pile?")
+        )
+        while not is_valid_move(stones_taken, state.stones_in_pile, state.valid_guesses):
+            self.write("Invalid input. Please make another guess.")
+            stones_taken = int(
+                self.read(f"{self.player}- How many stones would you like to remove from the pile?\n")
+            )
+        return stones_taken
+
+
+class Renderer:
+    """Receives game events; the base class ignores them so headless games do no I/O at all"""
+
+    def show_pile(self, state: GameState):
+        pass
+
+    def show_move(self, state: GameState, stones_taken: int):
+        pass
+
+
+class ConsoleRenderer(Renderer):
+    """Prints the pile and every move, the way the terminal version of the game always has"""
+
+    def __init__(self, write=None):
+        self.write = write if write is not None else print
+
+    def show_pile(self, state: GameState):
+        self.write(format_pile(state.stones_in_pile))
+
+    def show_move(self, state: GameState, stones_taken: int):
+        if state.turn == 0:
+            player_label = "The AI"
+        else:
+            player_label = f"Player {state.turn}"
+
+        if stones_taken > 1:
+            self.write(f"\n{player_label} takes {stones_taken} stones.\n")
+        else:
+            self.write(f"\n{player_label} takes 1 stone.\n")
+
+
+def run_game(state: GameState, players: dict, renderer: Renderer = Renderer()) -> int:
+    """Plays a game to the end
+
+    Args:
+      state: The state to start from, usually new_game(num_players)
+      players: Maps each turn label (0->AI, 1->Player 1, 2->Player 2) to an object with a choose(state) method
+      renderer: Receives the pile before every move, every move, and the final pile
+
+    Returns:
+      An integer representing the winner of the game: 0->AI, 1->Player 1, 2->Player 2
+    """
+    while state.winner is None:
+        renderer.show_pile(state)
+        stones_taken = players[state.turn].choose(state)
+        renderer.show_move(state, stones_taken)
+        state = apply_move(state, stones_taken)
+    renderer.show_pile(state)  # final display of the pile for visual confirmation of the win
+    return state.winner
+
+
+async def run_game_async(state: GameState, players: dict, renderer: Renderer = Renderer()) -> int:
+    """Same as run_game, but players may return an awaitable from choose (e.g. a move arriving over the network)"""
+    while state.winner is None:
+        renderer.show_pile(state)
+        stones_taken = players[state.turn].choose(state)
+        if inspect.isawaitable(stones_taken):
+            stones_taken = await stones_taken
+        renderer.show_move(state, stones_taken)
+        state = apply_move(state, stones_taken)
+    renderer.show_pile(state)
+    return state.winner
 
 
 def get_player_guess(player, stones_in_pile: int, valid_guesses: list) -> int:
@@ -150,31 +427,13 @@ def get_player_guess(player, stones_in_pile: int, valid_guesses: list) -> int:
     Returns:
       int: The number of stones to stones_taken from the pile
     """
+    state = GameState(stones_in_pile, player, 2, tuple(valid_guesses))
     if player == 0:
         stones_taken = get_ai_guess(stones_in_pile, valid_guesses)
     else:
-        stones_taken = input(
-            f"\nPlayer {player} - How many stones would you like to remove from the pile?"
-        )
-        stones_taken = int(stones_taken)
-
-        while is_valid_move(stones_taken, stones_in_pile, valid_guesses) == False:
-            print("Invalid input. Please make another guess.")
-            stones_taken = input(
-                f"{player}- How many stones would you like to remove from the pile?\n"
-            )
-            stones_taken = int(stones_taken)
-
-    if player == 0:
-        player_label = "The AI"
-    else:
-        player_label = f"Player {player}"
-
-    if stones_taken > 1:
-        print(f"\n{player_label} takes {stones_taken} stones.\n")
-    else:
-        print(f"\n{player_label} takes 1 stone.\n")
+        stones_taken = ConsolePlayer(player).choose(state)
 
+    ConsoleRenderer().show_move(state, stones_taken)
     return stones_taken
 
 
@@ -187,31 +446,8 @@ def play_game(num_players: int) -> int:
     Returns:
       An integer representing the winner of the game: 0->AI, 1->Player 1, 2->Player 2
     """
-    stones_in_pile = 16
-    valid_guesses = range(1, 5)  # [1, 2, 3, 4]
-    turn = randomly_pick_who_goes_first(num_players)
-
-    while stones_in_pile > 1:
-        # Display the current number of stones in the pile
-        print(format_pile(stones_in_pile))
-
-        # Next player takes some stones
-        stones_taken = get_player_guess(turn, stones_in_pile, valid_guesses)
-        stones_in_pile -= stones_taken
-
-        # Check to see if the game is over
-        if stones_in_pile == 1:
-            print(
-                format_pile(stones_in_pile)
-            )  # final display of the pile for visual confirmation of the win
-            return turn
-        else:  # otherwise, switch players
-            if turn == 1 and num_players == 1:
-                turn = 0
-            elif turn == 1 and num_players == 2:
-                turn = 2
-            else:
-                turn = 1
+    players = {0: AIPlayer(), 1: ConsolePlayer(1), 2: ConsolePlayer(2)}
+    return run_game(new_game(num_players), players, ConsoleRenderer())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+from stones import get_ai_guess, is_valid_move
+
+
+def test_ai_guess_plays_the_winning_move():
+    assert get_ai_guess(15, [1, 2, 3, 4]) == 4
+    assert get_ai_guess(3, [2, 5]) == 2
+
+
+def test_ai_guess_without_a_winning_move_never_empties_the_pile():
+    assert get_ai_guess(6, [1, 2, 3, 4]) == 1
+    assert get_ai_guess(8, [2, 5]) == 2
+    assert is_valid_move(get_ai_guess(8, [2, 5]), 8, [2, 5])
+
+
+def test_ai_guess_falls_back_to_1_when_no_move_is_legal():
+    # taking 2 of 2 stones would empty the pile
+    assert get_ai_guess(2, [2, 5]) == 1
@@ -1,3 +1,15 @@
+import re
+from collections.abc import Sequence
+
+_RUNS = re.compile(r"F+|B+")
+_STRIP_WHITESPACE = str.maketrans("", "", " \t\r\n")
+_TEXT_RUN = re.compile(r"(.)\1*", re.DOTALL)
+_BINARY_RUN = re.compile(rb"(.)\1*", re.DOTALL)
+_ENCODED_TOKEN = re.compile(r"(\d*)(\D)")
+_OPPOSITE = {"F": "B", "B": "F"}
+_FLIP_RUNS = {"F": re.compile(r"F+"), "B": re.compile(r"B+")}
+
+
 def please_flip_original(caps: list[str]) -> list[str]:
     """
     Generates a minimal list of shouts needed to have all fan caps face the same direction.
@@ -153,33 +165,389 @@ def please_flip_one_pass(caps: list) -> list:
       a list of shouts, which could be empty if the list of caps is either empty or all the same direction
     """
     interval_start = 0
-    shouts = {"F": [], "B": []}
+    intervals = {"F": [], "B": []}
 
     if len(caps) == 0:
         return []
 
     for i in range(1, len(caps) + 1):
         if (i == len(caps)) or (caps[interval_start] != caps[i]):
-            if interval_start == i - 1:
-                shouts[caps[interval_start]].append(
-                    f"Person in position {str(interval_start)} flip your cap!"
-                )
-            else:
-                shouts[caps[interval_start]].append(
-                    f"People in positions {str(interval_start)} through {str(i - 1)} flip your caps!"
-                )
+            intervals[caps[interval_start]].append((interval_start, i - 1))
             interval_start = i
 
     flip_direction = "B"
-    if len(shouts["F"]) < len(shouts["B"]):
+    if len(intervals["F"]) < len(intervals["B"]):
         flip_direction = "F"
 
-    return shouts[flip_direction]
+    # only the winning direction's intervals are ever formatted
+    return list(ShoutView(intervals[flip_direction]))
+
+
+def format_shout(start: int, end: int) -> str:
+    """Formats the shout for one flip interval
+
+    Example
+    ------
+    >>>format_shout(2, 4)
+    'People in positions 2 through 4 flip your caps!'
+    """
+    if start == end:
+        return f"Person in position {str(start)} flip your cap!"
+    return f"People in positions {str(start)} through {str(end)} flip your caps!"
+
+
+class ShoutView(Sequence):
+    """A read-only list of shouts that formats each one only when it's read, so intervals that
+    nobody looks at never become strings"""
+
+    def __init__(self, intervals):
+        self.__intervals = intervals
+
+    def __len__(self):
+        return len(self.__intervals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ShoutView(self.__intervals[index])
+        return format_shout(*self.__intervals[index])
+
+    def __iter__(self):
+        for start, end in self.__intervals:
+            yield format_shout(start, end)
+
+
+def runs_per_direction(first_cap: str, runs: int) -> dict[str, int]:
+    """Splits a number of runs between the two directions. Runs alternate direction, so the first
+    cap's direction has the extra run when there is one.
+
+    Examples
+    --------
+    >>>runs_per_direction("F", 5)
+    {'F': 3, 'B': 2}
+    """
+    return {first_cap: (runs + 1) // 2, _OPPOSITE[first_cap]: runs // 2}
+
+
+def _as_cap_string(caps) -> str:
+    if isinstance(caps, str):
+        return caps
+    return "".join(caps)
+
+
+def iter_flip_intervals(caps):
+    """
+    Generates a minimal set of flip intervals lazily, choosing the same intervals as please_flip_one_pass.
+    Only (start, end) tuples are created; use format_shout or ShoutView to get the shouts.
+
+    The number of runs is counted with str.count on the places where the direction changes, which
+    decides the flip direction before any interval is produced.
+
+      Args:
+      caps: list of strings which are either 'F' (Forward) or 'B' (Backward), or a string of them
+
+      Return:
+      a generator of (start, end) tuples of positions, inclusive
+
+      Example
+      ------
+      >>>list(iter_flip_intervals(["F", "F", "B", "B", "B", "F", "B", "B", "F"]))
+      [(2, 4), (6, 7)]
+    """
+    caps = _as_cap_string(caps)
+    if len(caps) == 0:
+        return
+
+    counts = runs_per_direction(caps[0], caps.count("FB") + caps.count("BF") + 1)
+    flip_direction = "B"
+    if counts["F"] < counts["B"]:
+        flip_direction = "F"
+
+    for run in _FLIP_RUNS[flip_direction].finditer(caps):
+        yield (run.start(), run.end() - 1)
+
+
+def flip_intervals(caps) -> list[tuple[int, int]]:
+    """Returns the intervals from iter_flip_intervals as a list"""
+    return list(iter_flip_intervals(caps))
+
+
+def fill_flip_intervals(caps, out) -> int:
+    """Writes the intervals from iter_flip_intervals into a preallocated flat buffer as
+    start, end, start, end, ... so no per-interval objects are kept
+
+      Args:
+      caps: list of strings which are either 'F' (Forward) or 'B' (Backward), or a string of them
+      out: a writable sequence with room for 2 entries per interval, e.g. array('q', bytes(8 * 2 * len(caps)))
+
+      Return:
+      the number of intervals written
+    """
+    count = 0
+    for start, end in iter_flip_intervals(caps):
+        out[2 * count] = start
+        out[2 * count + 1] = end
+        count += 1
+    return count
+
+
+def iter_cap_chunks(caps, chunk_size: int = 65536):
+    """Reads caps in chunks of roughly chunk_size characters, so only one chunk is in memory at a time
+
+    Args:
+      caps: a text or binary file, or any iterable of 'F'/'B' strings (single caps or longer pieces)
+      chunk_size: how many characters to read at once
+
+    Return:
+      a generator of strings made of 'F' and 'B', with whitespace such as newlines removed
+    """
+    if hasattr(caps, "read"):
+        while True:
+            chunk = caps.read(chunk_size)
+            if not chunk:
+                return
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode("ascii")
+            yield chunk.translate(_STRIP_WHITESPACE)
+    else:
+        pieces = []
+        size = 0
+        for piece in caps:
+            if isinstance(piece, bytes):
+                piece = piece.decode("ascii")
+            pieces.append(piece)
+            size += len(piece)
+            if size >= chunk_size:
+                yield "".join(pieces).translate(_STRIP_WHITESPACE)
+                pieces = []
+                size = 0
+        if pieces:
+            yield "".join(pieces).translate(_STRIP_WHITESPACE)
+
+
+def please_flip_stream(caps, chunk_size: int = 65536):
+    """
+    Generates a minimal list of flip intervals without ever holding all of the caps in memory.
+    Each interval is yielded as soon as its run of caps ends, and a run that reaches the end of a
+    chunk stays open until a later chunk closes it.
+
+    Runs alternate direction, so the runs facing the other way from the first cap can never
+    outnumber the runs facing the same way as it. Flipping those is always minimal, and the
+    direction is known from the very first cap. When both directions have the same number of runs,
+    this can pick the opposite direction from please_flip_one_pass.
+
+      Args:
+      caps: a text or binary file, or any iterable of 'F'/'B' strings
+      chunk_size: how many characters to read at once
+
+      Return:
+      a generator of (start, end) tuples of positions, inclusive
+
+      Example
+      ------
+      >>>list(please_flip_stream(iter(["FFB", "BBF", "BBF"])))
+      [(2, 4), (6, 7)]
+    """
+    flip_direction = None
+    run_direction = None
+    run_start = 0
+    position = 0
+
+    for chunk in iter_cap_chunks(caps, chunk_size):
+        if flip_direction is None and chunk:
+            flip_direction = "B" if chunk[0] == "F" else "F"
+            run_direction = chunk[0]
+
+        covered = 0
+        for run in _RUNS.finditer(chunk):
+            direction = run.group()[0]
+            if direction != run_direction:
+                if run_direction == flip_direction:
+                    yield (run_start, position + run.start() - 1)
+                run_direction = direction
+                run_start = position + run.start()
+            covered += run.end() - run.start()
+
+        if covered != len(chunk):
+            raise ValueError("caps must only contain 'F' and 'B'")
+        position += len(chunk)
+
+    if run_direction == flip_direction and position > run_start:
+        yield (run_start, position - 1)
+
+
+class CapSequence:
+    """Keeps a crowd's caps in a form where flips are cheap and the minimal number of shouts is
+    always known.
+
+    Instead of storing every run, the sequence stores where runs begin: position i is a boundary
+    when caps[i] differs from caps[i - 1]. Flipping positions start through end only changes the
+    boundaries at start and end + 1, so a range flip is two updates to a Fenwick tree over the
+    boundary bits (O(log n)), and the direction of any cap is the first cap's direction flipped
+    once per boundary at or before it (also O(log n)). The number of runs is the boundary count
+    plus one, which gives the number of forward and backward runs, and the minimal number of
+    shouts, in O(1).
+    """
+
+    def __init__(self, caps: list[str]):
+        self.__size = len(caps)
+        self.__first = caps[0] if self.__size > 0 else None
+        self.__is_boundary = bytearray(self.__size)
+        self.__tree = [0] * (self.__size + 1)  # Fenwick tree, 1-indexed
+        for i in range(1, self.__size):
+            if caps[i] != caps[i - 1]:
+                self.__is_boundary[i] = 1
+                self.__tree[i + 1] += 1
+        # build the tree in place: every node passes its total up to its parent once
+        for node in range(1, self.__size + 1):
+            parent = node + (node & -node)
+            if parent <= self.__size:
+                self.__tree[parent] += self.__tree[node]
+        self.__boundary_count = sum(self.__is_boundary)
+
+    def __len__(self):
+        return self.__size
+
+    def __boundaries_through(self, position: int) -> int:
+        """Counts the boundaries at positions 0 through position"""
+        total = 0
+        node = position + 1
+        while node > 0:
+            total += self.__tree[node]
+            node -= node & -node
+        return total
+
+    def __toggle_boundary(self, position: int):
+        delta = -1 if self.__is_boundary[position] else 1
+        self.__is_boundary[position] ^= 1
+        self.__boundary_count += delta
+        node = position + 1
+        while node <= self.__size:
+            self.__tree[node] += delta
+            node += node & -node
+
+    def __getitem__(self, position: int) -> str:
+        if position < 0:
+            position += self.__size
+        if not 0 <= position < self.__size:
+            raise IndexError("cap position out of range")
+        if self.__boundaries_through(position) % 2 == 0:
+            return self.__first
+        return _OPPOSITE[self.__first]
+
+    def flip(self, position: int):
+        """Flips the cap of one person"""
+        self.flip_range(position, position)
+
+    def flip_range(self, start: int, end: int):
+        """Flips the caps of everyone in positions start through end (inclusive)"""
+        if not 0 <= start <= end < self.__size:
+            raise IndexError("flip range out of range")
+        if start == 0:
+            self.__first = _OPPOSITE[self.__first]
+        else:
+            self.__toggle_boundary(start)
+        if end + 1 < self.__size:
+            self.__toggle_boundary(end + 1)
+
+    def run_counts(self) -> dict[str, int]:
+        """Returns how many runs of caps face each direction"""
+        counts = {"F": 0, "B": 0}
+        if self.__size == 0:
+            return counts
+        counts.update(runs_per_direction(self.__first, self.__boundary_count + 1))
+        return counts
+
+    def minimal_shouts(self) -> int:
+        """The fewest shouts needed to get every cap facing the same direction"""
+        if self.__size == 0:
+            return 0
+        return (self.__boundary_count + 1) // 2
+
+    def flip_direction(self) -> str:
+        """The direction whose runs should be flipped, breaking ties like please_flip_one_pass"""
+        counts = self.run_counts()
+        if counts["F"] < counts["B"]:
+            return "F"
+        return "B"
+
+    def __next_boundary(self, after: int) -> int:
+        """Finds the first boundary after a position by descending the Fenwick tree, or returns len(self)"""
+        target = self.__boundaries_through(after) + 1
+        if target > self.__boundary_count:
+            return self.__size
+        node = 0
+        step = 1 << self.__size.bit_length()
+        while step > 0:
+            if node + step <= self.__size and self.__tree[node + step] < target:
+                node += step
+                target -= self.__tree[node]
+            step >>= 1
+        return node  # the tree is 1-indexed, so node is the 0-indexed position of the boundary
+
+    def runs(self):
+        """Generates (start, end, direction) for every run of caps, in order"""
+        start = 0
+        direction = self.__first
+        while start < self.__size:
+            next_start = self.__next_boundary(start)
+            yield (start, next_start - 1, direction)
+            start = next_start
+            direction = _OPPOSITE[direction]
+
+    def shouts(self) -> list[str]:
+        """Generates the same minimal list of shouts as please_flip_one_pass would for the current caps"""
+        flip_direction = self.flip_direction()
+        return [format_shout(start, end) for start, end, direction in self.runs() if direction == flip_direction]
+
+
+def _as_chunks(message, chunk_size: int = 65536):
+    """Treats a whole string/bytes as a single chunk, reads files in chunks, and passes any other iterable through"""
+    if isinstance(message, (str, bytes, bytearray, memoryview)):
+        return (message,)
+    if hasattr(message, "read"):
+        return iter(lambda: message.read(chunk_size), message.read(0))
+    return message
+
+
+def _iter_runs(chunks, pattern):
+    """Yields (character, count) for every run in a sequence of chunks, joining runs split across chunks"""
+    run_char = None
+    run_count = 0
+    for chunk in chunks:
+        for run in pattern.finditer(chunk):
+            char = run.group(1)
+            if char == run_char:
+                run_count += run.end() - run.start()
+            else:
+                if run_char is not None:
+                    yield run_char, run_count
+                run_char = char
+                run_count = run.end() - run.start()
+    if run_char is not None:
+        yield run_char, run_count
+
+
+def iter_run_length_encode(message):
+    """Generates the run-length encoding of message one run at a time
+
+    Args:
+    message: a string, a text file, or an iterable of string chunks, containing no digits
+
+    Return:
+    a generator of encoded runs such as '12F'
+    """
+    for char, count in _iter_runs(_as_chunks(message), _TEXT_RUN):
+        if char.isdecimal():  # what the decoder's \d reads as part of a count
+            raise ValueError(f"cannot run-length encode the digit {char!r}, it would be read back as part of a count")
+        yield f"{count}{char}"
 
 
 def run_length_encode(message: str) -> str:
     """Optional Challenge: Run-length Encoding
 
+    Runs of any length are supported, with counts written in as many digits as they need.
+    The message must not contain digits; a ValueError is raised if it does.
+
     Args:
     message: a single string comprised of exactly two characters:  'F'  or 'B'
 
@@ -190,18 +558,45 @@ def run_length_encode(message: str) -> str:
     ------
     >>>run_length_encode('BFFFFFBFFFF')
     '1B5F1B4F'
+
+    >>>run_length_encode('FFFFFFFFFFFFB')
+    '12F1B'
     """
-    encoded_msg = ""
+    return "".join(iter_run_length_encode(message))
 
-    for c in message:
-        if encoded_msg == "":
-            encoded_msg += "1" + c
-        elif encoded_msg[-1] == c:
-            encoded_msg = encoded_msg[:-2] + str(int(encoded_msg[-2]) + 1) + c
-        else:
-            encoded_msg += "1" + c
 
-    return encoded_msg
+def iter_run_length_decode(encoded_message, max_piece: int = 65536):
+    """Generates the decoded message in pieces of at most max_piece characters, so huge runs
+    are never expanded in memory all at once
+
+    Args:
+    encoded_message: an encoded string, a text file, or an iterable of encoded string chunks.
+      A count may be split across chunks.
+    max_piece: the largest string yielded at once
+
+    Return:
+    a generator of decoded strings
+    """
+    pending = ""
+    for chunk in _as_chunks(encoded_message):
+        chunk = pending + chunk
+        consumed = 0
+        for token in _ENCODED_TOKEN.finditer(chunk):
+            if token.start() != consumed or token.group(1) == "":
+                raise ValueError(f"missing run length before position {token.start()}")
+            count = int(token.group(1))
+            char = token.group(2)
+            while count > 0:
+                piece = min(count, max_piece)
+                yield char * piece
+                count -= piece
+            consumed = token.end()
+        pending = chunk[consumed:]
+        if not pending.isdigit() and pending != "":
+            raise ValueError("invalid run-length encoding")
+
+    if pending != "":
+        raise ValueError("encoded message ends with a count but no character")
 
 
 def run_length_decode(encoded_message: str) -> str:
@@ -217,13 +612,96 @@ def run_length_decode(encoded_message: str) -> str:
     ------
     >>>run_length_decode('1B5F1B4F')
     'BFFFFFBFFFF'
+
+    >>>run_length_decode('12F1B')
+    'FFFFFFFFFFFFB'
+    """
+    return "".join(iter_run_length_decode(encoded_message))
+
+
+def _write_varint(count: int, out: bytearray):
+    """Appends count as an unsigned LEB128 varint: 7 bits per byte, high bit set on all but the last byte"""
+    while count >= 0x80:
+        out.append((count & 0x7F) | 0x80)
+        count >>= 7
+    out.append(count)
+
+
+def iter_run_length_encode_binary(message):
+    """Generates the binary run-length encoding of message one run at a time.
+    Each run is the repeated byte followed by its count as a varint, so any byte value and any
+    count can be encoded.
+
+    Args:
+    message: bytes, an ASCII string, a binary file, or an iterable of bytes chunks
+
+    Return:
+    a generator of bytes, one per run
     """
-    decoded_msg = ""
+    if isinstance(message, str):
+        message = message.encode("ascii")
+    for byte, count in _iter_runs(_as_chunks(message), _BINARY_RUN):
+        run = bytearray(byte)
+        _write_varint(count, run)
+        yield bytes(run)
 
-    for i in range(0, len(encoded_message), 2):
-        decoded_msg += int(encoded_message[i]) * encoded_message[i + 1]
 
-    return decoded_msg
+def run_length_encode_binary(message) -> bytes:
+    """Binary Run-length Encoding
+
+    Example
+    ------
+    >>>run_length_encode_binary('BFFFFFBFFFF')
+    b'B\\x01F\\x05B\\x01F\\x04'
+
+    >>>run_length_encode_binary('F' * 300)
+    b'F\\xac\\x02'
+    """
+    return b"".join(iter_run_length_encode_binary(message))
+
+
+def iter_run_length_decode_binary(encoded_message, max_piece: int = 65536):
+    """Generates the bytes encoded by run_length_encode_binary, in pieces of at most max_piece bytes
+
+    Args:
+    encoded_message: bytes, a binary file, or an iterable of bytes chunks. A run may be split across chunks.
+    max_piece: the largest bytes object yielded at once
+
+    Return:
+    a generator of decoded bytes
+    """
+    byte = None
+    count = 0
+    shift = 0
+    for chunk in _as_chunks(encoded_message):
+        for value in bytes(chunk):
+            if byte is None:
+                byte = bytes((value,))
+                count = shift = 0
+                continue
+            count |= (value & 0x7F) << shift
+            shift += 7
+            if value & 0x80:
+                continue
+            while count > 0:
+                piece = min(count, max_piece)
+                yield byte * piece
+                count -= piece
+            byte = None
+
+    if byte is not None:
+        raise ValueError("encoded message ends in the middle of a run")
+
+
+def run_length_decode_binary(encoded_message) -> bytes:
+    """Binary Run-length Decoding
+
+    Example
+    ------
+    >>>run_length_decode_binary(b'B\\x01F\\x05B\\x01F\\x04')
+    b'BFFFFFBFFFF'
+    """
+    return b"".join(iter_run_length_decode_binary(encoded_message))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,310 @@
+"""
+NumPy versions of the please_flip functions for cap lists too large to walk one string at a time.
+
+Caps are stored as one uint8 per person, either the ASCII codes of 'F'/'B' (so a bytes buffer
+or a memory-mapped file can be used directly) or 1/0.
+"""
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from conform import runs_per_direction
+
+FORWARD = ord("F")
+BACKWARD = ord("B")
+
+_POPCOUNT_TABLE = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def as_cap_array(caps) -> np.ndarray:
+    """Converts caps into a uint8 array without copying when caps is already a buffer
+
+    Args:
+      caps: a bytes-like object or uint8 array of b'F'/b'B' (or 1/0), a string, or a list of 'F'/'B' strings
+
+    Returns:
+      A 1-D uint8 array with one entry per person
+
+    Examples
+    --------
+    >>>as_cap_array(["F", "B"])
+    array([70, 66], dtype=uint8)
+    """
+    if isinstance(caps, np.ndarray):
+        if caps.dtype != np.uint8:
+            caps = caps.astype(np.uint8)
+        return caps.ravel()
+    if isinstance(caps, str):
+        caps = caps.encode("ascii")
+    elif isinstance(caps, (list, tuple)):
+        caps = "".join(caps).encode("ascii")
+    return np.frombuffer(caps, dtype=np.uint8)
+
+
+def find_run_starts(caps: np.ndarray) -> np.ndarray:
+    """Returns the index where every run of same-direction caps begins
+
+    Examples
+    --------
+    >>>find_run_starts(as_cap_array("BFFFFFBFFFF"))
+    array([0, 1, 6, 7])
+    """
+    if len(caps) == 0:
+        return np.empty(0, dtype=np.int64)
+    boundaries = np.flatnonzero(caps[1:] != caps[:-1])
+    starts = np.empty(len(boundaries) + 1, dtype=np.int64)
+    starts[0] = 0
+    np.add(boundaries, 1, out=starts[1:])
+    return starts
+
+
+def _first_flipped_run(run_count: int, first_cap: int) -> int:
+    """Returns 0 if the even-numbered runs should be flipped or 1 for the odd-numbered runs"""
+    # runs alternate direction, so the first cap's direction owns the even-numbered runs and
+    # never has fewer of them; only a tie with the first cap facing backward flips the even runs
+    if run_count % 2 == 0 and first_cap in (BACKWARD, 0):
+        return 0
+    return 1
+
+
+def _intervals_from_starts(starts: np.ndarray, first_flipped: int, size: int = None) -> np.ndarray:
+    """Builds the flip intervals for every other run, beginning with run number first_flipped
+
+    Args:
+      starts: where each run begins, in order
+      first_flipped: 0 to flip the even-numbered runs, 1 for the odd-numbered ones
+      size: the number of people, which ends the last run; if None, a run still open at the end gets an end of -1
+
+    Returns:
+      An N×2 int64 array of inclusive (start, end) positions
+    """
+    flipped_starts = starts[first_flipped::2]
+    intervals = np.full((len(flipped_starts), 2), -1, dtype=np.int64)
+    intervals[:, 0] = flipped_starts
+    # each flipped run ends right before the next run starts
+    next_starts = starts[first_flipped + 1 :: 2]
+    intervals[: len(next_starts), 1] = next_starts - 1
+    if size is not None and len(next_starts) < len(flipped_starts):
+        intervals[-1, 1] = size - 1
+    return intervals
+
+
+def please_flip_intervals(caps) -> np.ndarray:
+    """Finds a minimal set of intervals whose caps need flipping so all caps face the same direction.
+    Chooses the same intervals as please_flip_one_pass (the 'B' runs when both directions tie).
+
+    Args:
+      caps: anything as_cap_array accepts
+
+    Returns:
+      An N×2 int64 array of inclusive (start, end) positions, empty if there is nothing to flip
+
+    Examples
+    --------
+    >>>please_flip_intervals("FFBBBFBBF")
+    array([[2, 4],
+           [6, 7]])
+    """
+    caps = as_cap_array(caps)
+    starts = find_run_starts(caps)
+    if len(starts) == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    return _intervals_from_starts(starts, _first_flipped_run(len(starts), caps[0]), len(caps))
+
+
+def _map_caps(path: str):
+    """Opens a cap file as a read-only memory map, or returns None for an empty file"""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _shard_boundaries(path: str, start: int, stop: int) -> np.ndarray:
+    """Returns every position in [start, stop) whose cap differs from the cap before it.
+    Reading one cap before the shard is what lets neighbouring shards agree on their shared edge."""
+    caps_map = _map_caps(path)
+    caps = np.frombuffer(caps_map, dtype=np.uint8)
+    lo = max(start - 1, 0)
+    shard = caps[lo:stop]
+    boundaries = np.flatnonzero(shard[1:] != shard[:-1]) + (lo + 1)
+    del caps, shard  # the map can't close while numpy still views it
+    caps_map.close()
+    return boundaries
+
+
+def _count_shard(task: tuple) -> tuple[int, int]:
+    """Phase 1: how many runs start inside the shard, and where the first one starts (-1 if none)"""
+    path, start, stop = task
+    boundaries = _shard_boundaries(path, start, stop)
+    if len(boundaries) == 0:
+        return 0, -1
+    return len(boundaries), int(boundaries[0])
+
+
+def _flip_shard(task: tuple) -> np.ndarray:
+    """Phase 2: the flip intervals for runs that start inside the shard. A run still open at the
+    end of the shard gets an end of -1 for the merge step to fill in."""
+    path, start, stop, boundaries_before, first_flipped = task
+    run_starts = _shard_boundaries(path, start, stop)
+    # the run starting at a boundary is numbered by how many boundaries come at or before it
+    first_index = boundaries_before + 1
+    if start == 0:
+        run_starts = np.concatenate(([0], run_starts))
+        first_index = 0
+
+    return _intervals_from_starts(run_starts, (first_flipped - first_index) % 2)
+
+
+def please_flip_parallel(path: str, processes: int = None, shard_size: int = 64 * 2**20) -> np.ndarray:
+    """Finds the same flip intervals as please_flip_intervals for a cap file too big to load,
+    splitting it into shards handled by a process pool. Every worker memory-maps the file, so
+    no cap data is copied between processes.
+
+    Phase 1 counts the run boundaries in every shard. That fixes the flip direction and tells
+    each shard how its runs are numbered. Phase 2 finds each shard's flipped runs, and the
+    merge step closes a run left open at the end of a shard where the next boundary in a
+    later shard begins.
+
+    Args:
+      path: a file holding one byte per person, b'F'/b'B' (or 1/0), with nothing else in it
+      processes: number of worker processes, defaults to the number of CPUs
+      shard_size: how many caps each task handles
+
+    Returns:
+      An N×2 int64 array of inclusive (start, end) positions
+    """
+    caps_map = _map_caps(path)
+    if caps_map is None:
+        return np.empty((0, 2), dtype=np.int64)
+    size = len(caps_map)
+    first_cap = caps_map[0]
+    caps_map.close()
+
+    bounds = [(start, min(start + shard_size, size)) for start in range(0, size, shard_size)]
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        counts = list(executor.map(_count_shard, [(path, start, stop) for start, stop in bounds]))
+
+        total_boundaries = sum(count for count, __ in counts)
+        first_flipped = _first_flipped_run(total_boundaries + 1, first_cap)
+        tasks = []
+        boundaries_before = 0
+        for (start, stop), (count, __) in zip(bounds, counts):
+            tasks.append((path, start, stop, boundaries_before, first_flipped))
+            boundaries_before += count
+        pieces = list(executor.map(_flip_shard, tasks))
+
+    # merge: an open run ends right before the first boundary in any later shard, or at the last cap
+    next_boundary = size
+    for i in range(len(pieces) - 1, -1, -1):
+        if len(pieces[i]) > 0 and pieces[i][-1, 1] == -1:
+            pieces[i][-1, 1] = next_boundary - 1
+        if counts[i][1] != -1:
+            next_boundary = counts[i][1]
+
+    return np.concatenate(pieces) if pieces else np.empty((0, 2), dtype=np.int64)
+
+
+def pack_caps(caps) -> tuple[np.ndarray, int]:
+    """Stores caps one bit per person, F=1 and B=0, first person in the highest bit of the first byte
+
+    Args:
+      caps: anything as_cap_array accepts
+
+    Returns:
+      The packed uint8 array and the number of people (the last byte may be padded)
+
+    Examples
+    --------
+    >>>pack_caps("FFBBBFBBF")
+    (array([196, 128], dtype=uint8), 9)
+    """
+    caps = as_cap_array(caps)
+    return np.packbits((caps == FORWARD) | (caps == 1)), len(caps)
+
+
+def unpack_caps(packed: np.ndarray, size: int) -> np.ndarray:
+    """Turns packed caps back into one b'F'/b'B' byte per person"""
+    bits = np.unpackbits(packed, count=size)
+    return np.where(bits == 1, FORWARD, BACKWARD).astype(np.uint8)
+
+
+def _popcount(words: np.ndarray) -> int:
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum())
+    return int(_POPCOUNT_TABLE[words.view(np.uint8)].sum())
+
+
+def _packed_boundaries(packed: np.ndarray, size: int) -> np.ndarray:
+    """XORs every bit with the bit before it, so a 1 marks a person whose cap differs from the previous person's.
+    The result is padded to whole 64-bit words."""
+    packed = np.asarray(packed, dtype=np.uint8)
+    previous = packed >> 1
+    previous[1:] |= packed[:-1] << 7  # the bit before each byte's first bit is the last bit of the byte before
+    boundaries = packed ^ previous
+
+    words = np.zeros(-(-len(boundaries) // 8) * 8, dtype=np.uint8)
+    words[: len(boundaries)] = boundaries
+    if size > 0:
+        words[0] &= 0x7F  # the first person has nobody before them
+        # clear the padding bits after the last person
+        if size % 8:
+            words[size // 8] &= np.uint8((0xFF00 >> (size % 8)) & 0xFF)
+        words[-(-size // 8) :] = 0
+    return words.view(np.uint64)
+
+
+def count_runs_packed(packed: np.ndarray, size: int) -> dict[str, int]:
+    """Counts the runs facing each direction with XOR-with-shift and a popcount, a word at a time
+
+    Examples
+    --------
+    >>>count_runs_packed(*pack_caps("FFBBBFBBF"))
+    {'F': 3, 'B': 2}
+    """
+    if size == 0:
+        return {"F": 0, "B": 0}
+    runs = _popcount(_packed_boundaries(packed, size)) + 1
+    return runs_per_direction("F" if packed[0] & 0x80 else "B", runs)
+
+
+def please_flip_packed(packed: np.ndarray, size: int) -> np.ndarray:
+    """Finds the same flip intervals as please_flip_intervals from bit-packed caps.
+    Only the 64-bit words that contain a run boundary are unpacked.
+
+    Args:
+      packed: caps from pack_caps
+      size: the number of people
+
+    Returns:
+      An N×2 int64 array of inclusive (start, end) positions
+    """
+    if size == 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    words = _packed_boundaries(packed, size)
+    busy = np.flatnonzero(words)
+    bits = np.unpackbits(words[busy].view(np.uint8)).reshape(len(busy), 64)
+    word_index, bit_index = np.nonzero(bits)
+    starts = np.empty(len(word_index) + 1, dtype=np.int64)
+    starts[0] = 0
+    starts[1:] = busy[word_index] * 64 + bit_index
+
+    return _intervals_from_starts(starts, _first_flipped_run(len(starts), 1 if packed[0] & 0x80 else 0), size)
+
+
+if __name__ == "__main__":
+    import time
+    from conform import please_flip_one_pass
+
+    caps = ["F", "F", "B", "B", "B", "F", "B", "B", "B", "F", "F", "B", "F"]
+    print(please_flip_intervals(caps).tolist())
+    print(please_flip_one_pass(caps))
+
+    seats = np.where(np.random.default_rng(0).random(10**8) < 0.999, FORWARD, BACKWARD).astype(np.uint8)
+    start = time.perf_counter()
+    intervals = please_flip_intervals(seats)
+    print(f"{len(intervals)} flips for {len(seats)} seats in {round(time.perf_counter() - start, 3)}s")
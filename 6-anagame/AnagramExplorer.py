@@ -1,46 +1,306 @@
-from itertools import combinations
+import hashlib
+import mmap
+import multiprocessing
+import os
+import struct
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+PRIME_MAP = {
+    "a": 2,
+    "b": 3,
+    "c": 5,
+    "d": 7,
+    "e": 11,
+    "f": 13,
+    "g": 17,
+    "h": 19,
+    "i": 23,
+    "j": 29,
+    "k": 31,
+    "l": 37,
+    "m": 41,
+    "n": 43,
+    "o": 47,
+    "p": 53,
+    "q": 59,
+    "r": 61,
+    "s": 67,
+    "t": 71,
+    "u": 73,
+    "v": 79,
+    "w": 83,
+    "x": 89,
+    "y": 97,
+    "z": 101,
+}
+
+# persisted index files: see save_anagram_groups for the layout
+INDEX_MAGIC = b"ANAX"
+INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct("<4sHH32sII")
+
+# a letter-count key packs 26 4-bit counts into one int: a's count in the lowest 4 bits, then b, ...
+LETTER_UNITS = {chr(97 + i): 1 << (4 * i) for i in range(26)}
+_NIBBLE_HIGH_BITS = sum(0x8 << (4 * i) for i in range(26))
+
+
+def letter_key(word) -> int:
+    """Packs the letter counts of a word (or list of letters) into a single int.
+    Words made of the same letters get the same key, so it works as an anagram hash, and it
+    costs the same small amount to build no matter which letters are in the word.
+
+    Each letter can appear at most 15 times.
+
+    Examples
+    --------
+    >>>letter_key("abba") == letter_key("baba")
+    True
+    >>>hex(letter_key("abbc"))
+    '0x121'
+    """
+    key = sum(map(LETTER_UNITS.__getitem__, word))
+    if len(word) > 15:
+        # a count above 15 would carry into the next letter's bits
+        for letter in set(word):
+            if word.count(letter) > 15:
+                raise ValueError(f"at most 15 of each letter are supported, got {word.count(letter)} '{letter}'")
+    return key
+
+
+def rack_letter_key(letters) -> int:
+    """letter_key for a player's rack, which accepts any rack instead of raising.
+    Letters are lowercased and anything other than a-z is ignored. A count above 15 is stored as 15,
+    which changes no sub-multiset check because no word with a key uses more than 15 of a letter.
+
+    Examples
+    --------
+    >>>rack_letter_key(["R", "a", "t", "?"]) == letter_key("rat")
+    True
+    """
+    try:
+        return letter_key(letters)
+    except (KeyError, TypeError, ValueError):
+        pass
+    counts = Counter(letter.lower() for letter in letters if isinstance(letter, str))
+    return sum(min(count, 15) * LETTER_UNITS[letter] for letter, count in counts.items() if letter in LETTER_UNITS)
+
+
+def is_sub_multiset(key: int, rack_key: int) -> bool:
+    """Checks whether every letter count in key is at most the matching count in rack_key,
+    i.e. whether the word behind key can be spelled from the letters behind rack_key.
+
+    When all counts are below 8 this is one SWAR subtraction: setting the high bit of each of the
+    rack's 4-bit counts and subtracting key leaves that bit set exactly where the rack had enough.
+    """
+    if (key | rack_key) & _NIBBLE_HIGH_BITS == 0:
+        return ((rack_key | _NIBBLE_HIGH_BITS) - key) & _NIBBLE_HIGH_BITS == _NIBBLE_HIGH_BITS
+    while key:
+        if key & 0xF > rack_key & 0xF:
+            return False
+        key >>= 4
+        rack_key >>= 4
+    return True
+
+
+def pair_key(pair: tuple[str, str]) -> tuple[str, str]:
+    """The same key for a pair of words whichever order they're given in, so a guess and its
+    reverse count as one guess
+
+    Examples
+    --------
+    >>>pair_key(("tar", "art")) == pair_key(("art", "tar"))
+    True
+    """
+    return (pair[0], pair[1]) if pair[0] <= pair[1] else (pair[1], pair[0])
+
+
+def build_letter_trie(keys) -> dict:
+    """Builds a trie over letter-count keys so racks can be matched against the whole corpus at once.
+
+    Each edge is a (letter, count) pair, taken in alphabetical order and only for letters the key
+    actually uses, so "abba" is the path ("a", 2) -> ("b", 2). The node at the end of a path stores
+    its key under None. Every distinct multiset of letters in the corpus has exactly one path.
+
+    Examples
+    --------
+    >>>build_letter_trie([letter_key("abba")])
+    {('a', 2): {('b', 2): {None: 34}}}
+    """
+    letters = list(LETTER_UNITS)
+    trie = {}
+    for key in keys:
+        node = trie
+        remaining = key
+        letter = 0
+        while remaining:
+            count = remaining & 0xF
+            if count:
+                node = node.setdefault((letters[letter], count), {})
+            remaining >>= 4
+            letter += 1
+        node[None] = key
+    return trie
+
+
+def corpus_checksum(words) -> bytes:
+    """SHA-256 of a word list, in order. A saved index is only reused for the exact corpus it was built from."""
+    return hashlib.sha256("\n".join(words).encode("utf-8")).digest()
+
+
+def save_anagram_groups(path: str, words, groups: dict, checksum: bytes = None):
+    """Writes anagram groups to an index file that load_anagram_groups can read back without
+    recomputing a single key. The file is written next to path and then moved into place, so a
+    process starting at the same time never sees half of it.
+
+    File layout (all integers little-endian):
+      header   magic b"ANAX", version (u16), padding (u16), corpus checksum (32 bytes),
+               word count (u32), group count (u32)
+      keys     group count × 16 bytes, each group's letter-count key
+      offsets  (group count + 1) × u32, where each group's word ids start and end
+      word ids word count × u32, positions in the corpus, grouped and in corpus order
+
+    Args:
+        path: where to write the file
+        words: the corpus the groups were built from
+        groups: letter-count key -> list of words, as made by AnagramExplorer.get_lookup_dict
+        checksum: corpus_checksum(words), if it's already known
+    """
+    word_ids = {}
+    for word_id, word in enumerate(words):
+        word_ids.setdefault(word, []).append(word_id)
+
+    keys = bytearray()
+    offsets = [0]
+    ids = []
+    for key, group in groups.items():
+        keys += key.to_bytes(16, "little")
+        # duplicates in the corpus are kept, each under its own id
+        used = {}
+        for word in group:
+            ids.append(word_ids[word][used.get(word, 0)])
+            used[word] = used.get(word, 0) + 1
+        offsets.append(len(ids))
+
+    if checksum is None:
+        checksum = corpus_checksum(words)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(_INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, 0, checksum, len(ids), len(groups)))
+        file.write(keys)
+        file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        file.write(struct.pack(f"<{len(ids)}I", *ids))
+    os.replace(temporary_path, path)
+
+
+def load_anagram_groups(path: str, words, checksum: bytes = None):
+    """Reads the anagram groups saved by save_anagram_groups
+
+    Args:
+        path: the index file
+        words: the corpus the groups should belong to
+        checksum: corpus_checksum(words), if it's already known
+
+    Returns:
+        dict: letter-count key -> list of words, or None if the file is missing, from another
+        version, was built from a different corpus, or is truncated or corrupt
+    """
+    try:
+        file = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    with file:
+        size = os.fstat(file.fileno()).st_size
+        if size < _INDEX_HEADER.size:
+            return None
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                magic, version, __, saved_checksum, word_count, group_count = _INDEX_HEADER.unpack_from(data, 0)
+                if magic != INDEX_MAGIC or version != INDEX_VERSION:
+                    return None
+                if saved_checksum != (corpus_checksum(words) if checksum is None else checksum):
+                    return None
+                if size != _INDEX_HEADER.size + 16 * group_count + 4 * (group_count + 1) + 4 * word_count:
+                    return None
+                keys_start = _INDEX_HEADER.size
+                offsets_start = keys_start + 16 * group_count
+                offsets = struct.unpack_from(f"<{group_count + 1}I", data, offsets_start)
+                ids = struct.unpack_from(f"<{word_count}I", data, offsets_start + 4 * (group_count + 1))
+                halves = struct.unpack_from(f"<{2 * group_count}Q", data, keys_start)
+            except struct.error:
+                return None
+    if ids and max(ids) >= len(words):
+        return None
+    if offsets[0] != 0 or offsets[-1] != len(ids) or any(end < start for start, end in zip(offsets, offsets[1:])):
+        return None
+
+    keys = [low | high << 64 for low, high in zip(halves[::2], halves[1::2])]
+    grouped_words = [words[word_id] for word_id in ids]
+    groups = dict(zip(keys, [grouped_words[start:end] for start, end in zip(offsets, offsets[1:])]))
+    return groups
 
 
 class AnagramExplorer:
-    def __init__(self, all_words: list[str]):
+    def __init__(self, all_words: list[str], index_path: str = None):
+        """
+        Args:
+            all_words: the corpus
+            index_path: optional index file. If it was saved for this exact corpus the anagram
+                groups are loaded from it; otherwise they're computed and the file is (re)written.
+                Relative paths are relative to this module's folder.
+        """
         self.__corpus = all_words
-        self.prime_map = {
-            "a": 2,
-            "b": 3,
-            "c": 5,
-            "d": 7,
-            "e": 11,
-            "f": 13,
-            "g": 17,
-            "h": 19,
-            "i": 23,
-            "j": 29,
-            "k": 31,
-            "l": 37,
-            "m": 41,
-            "n": 43,
-            "o": 47,
-            "p": 53,
-            "q": 59,
-            "r": 61,
-            "s": 67,
-            "t": 71,
-            "u": 73,
-            "v": 79,
-            "w": 83,
-            "x": 89,
-            "y": 97,
-            "z": 101,
-        }
-        self.anagram_lookup = (
-            self.get_lookup_dict()
-        )  # Only calculated once, when the object is created
-        self.anagram_dict = self.get_prime_hash_dict()
+        self.__index_path = None
+        self.__checksum = None
+        self.prime_map = PRIME_MAP
+
+        groups = None
+        if index_path is not None:
+            if not os.path.isabs(index_path):
+                index_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), index_path)
+            groups = load_anagram_groups(index_path, all_words, self.checksum)
+            self.__index_path = index_path
+        if groups is None:
+            groups = self.get_lookup_dict()
+            if index_path is not None:
+                save_anagram_groups(index_path, all_words, groups, self.checksum)
+        # Only calculated once, when the object is created. Both names hold the same groups.
+        self.anagram_lookup = groups
+        self.anagram_dict = groups
+        # only groups of 2+ words can form an anagram pair, so only they go in the trie
+        self.__letter_trie = build_letter_trie(key for key, words in self.anagram_dict.items() if len(words) > 1)
+        self.__ranked_groups = self.get_ranked_groups()
+        self.__group_ranks = {key: rank for rank, (__, key, __) in enumerate(self.__ranked_groups)}
+        # a game asks for the same rack's anagrams several times, so recent racks are remembered
+        self.__cached_all_anagrams = lru_cache(maxsize=1024)(self.__find_all_anagrams)
 
     @property
     def corpus(self):
         return self.__corpus
 
+    @property
+    def checksum(self) -> bytes:
+        """corpus_checksum of the corpus, worked out the first time it's asked for"""
+        if self.__checksum is None:
+            self.__checksum = corpus_checksum(self.__corpus)
+        return self.__checksum
+
+    def save_index(self, path: str):
+        """Writes the anagram groups to an index file for AnagramExplorer(words, index_path=path) to load"""
+        save_anagram_groups(path, self.__corpus, self.anagram_lookup, self.checksum)
+
+    def __is_word(self, word: str) -> bool:
+        # a corpus word is always in the group for its own letters
+        try:
+            return word in self.anagram_dict.get(letter_key(word), ())
+        except (KeyError, ValueError):  # not made of a-z, or too many of one letter to have a key
+            return False
+
+    @property
+    def ranked_groups(self):
+        return self.__ranked_groups
+
     def top_level_checks(
         self, letters: list[str], pair: tuple[str, str] = ("", ""), check_single_word=""
     ) -> bool:
@@ -51,14 +311,9 @@ class AnagramExplorer:
         Could return bool, though a more streamlined process would also return lowercase versions of each word along with a boolean
         """
         if check_single_word != "":
-            if check_single_word not in self.corpus:
+            if not self.__is_word(check_single_word):
                 return False
-            valid_letters = letters.copy()
-            for letter in check_single_word:
-                if letter not in valid_letters:
-                    return False
-                valid_letters.remove(letter)
-            return True
+            return is_sub_multiset(letter_key(check_single_word), rack_letter_key(letters))
 
         word1 = pair[0].lower()
         word2 = pair[1].lower()
@@ -66,24 +321,13 @@ class AnagramExplorer:
         if (
             len(word1) != len(word2)
             or word1 == word2
-            or word1 not in self.corpus
-            or word2 not in self.corpus
+            or not self.__is_word(word1)
+            or not self.__is_word(word2)
         ):
             return False
 
-        valid_letters = letters.copy()
-        for letter in word1:
-            if letter not in valid_letters:
-                return False
-            valid_letters.remove(letter)
-
-        valid_letters = letters.copy()
-        for letter in word2:
-            if letter not in valid_letters:
-                return False
-            valid_letters.remove(letter)
-
-        return True
+        rack_key = rack_letter_key(letters)
+        return is_sub_multiset(letter_key(word1), rack_key) and is_sub_multiset(letter_key(word2), rack_key)
 
     def is_valid_anagram_pair(self, pair: tuple[str, str], letters: list[str]) -> bool:
         """Checks whether a pair of words:
@@ -98,12 +342,49 @@ class AnagramExplorer:
         Returns:
             bool: Returns True if the word pair fulfills all validation requirements, otherwise returns False
         """
-        if not self.top_level_checks(pair=pair, letters=letters):
+        return self.__is_valid_pair(pair, rack_letter_key(letters))
+
+    def __is_valid_pair(self, pair: tuple[str, str], rack_key: int) -> bool:
+        word1 = pair[0].lower()
+        word2 = pair[1].lower()
+        if len(word1) != len(word2) or word1 == word2 or not self.__is_word(word1) or not self.__is_word(word2):
             return False
-        return sorted(pair[0].lower()) == sorted(pair[1].lower())
+        # the words are anagrams when their keys match, and then one rack check covers both
+        key = letter_key(word1)
+        return key == letter_key(word2) and is_sub_multiset(key, rack_key)
+
+    def validate_guesses(self, guesses: list[tuple[str, str]], letters: list[str]) -> tuple[list, list]:
+        """Checks a whole list of guesses in one pass. A guess is valid when is_valid_anagram_pair
+        accepts it and neither it nor its reverse was already accepted earlier in the list.
+
+        Args:
+            guesses: word pairs, in the order they were guessed
+            letters: The letters from which the anagrams should be created
+
+        Returns:
+            tuple: the valid guesses and the invalid or repeated guesses, each in guess order
+
+        Examples
+        --------
+        >>>explorer = AnagramExplorer(["rat", "tar", "art"])
+        >>>explorer.validate_guesses([("rat", "tar"), ("tar", "rat"), ("rat", "rat")], ["r", "a", "t"])
+        ([('rat', 'tar')], [('tar', 'rat'), ('rat', 'rat')])
+        """
+        rack_key = rack_letter_key(letters)
+        valid = []
+        invalid = []
+        accepted = set()
+        for guess in guesses:
+            key = pair_key(guess)
+            if key not in accepted and self.__is_valid_pair(guess, rack_key):
+                accepted.add(key)
+                valid.append(guess)
+            else:
+                invalid.append(guess)
+        return valid, invalid
 
     def get_lookup_dict(self) -> dict:
-        """Creates a fast dictionary look-up (via prime hash or sorted tuple) of all anagrams in a word corpus.
+        """Creates a fast dictionary look-up (via packed letter-count keys) of all anagrams in a word corpus.
 
         Args:
             corpus (list): A list of words which should be considered
@@ -114,59 +395,22 @@ class AnagramExplorer:
         lookup_dict = {}
 
         for word in self.corpus:
-            prime_hash_value = self.prime_hash(word)
-            if prime_hash_value not in lookup_dict:
-                lookup_dict[prime_hash_value] = [word]
+            key = letter_key(word)
+            if key not in lookup_dict:
+                lookup_dict[key] = [word]
             else:
-                lookup_dict[prime_hash_value].append(word)
+                lookup_dict[key].append(word)
 
         return lookup_dict
 
     def prime_hash(self, str):
-        prime_map = {
-            "a": 2,
-            "b": 3,
-            "c": 5,
-            "d": 7,
-            "e": 11,
-            "f": 13,
-            "g": 17,
-            "h": 19,
-            "i": 23,
-            "j": 29,
-            "k": 31,
-            "l": 37,
-            "m": 41,
-            "n": 43,
-            "o": 47,
-            "p": 53,
-            "q": 59,
-            "r": 61,
-            "s": 67,
-            "t": 71,
-            "u": 73,
-            "v": 79,
-            "w": 83,
-            "x": 89,
-            "y": 97,
-            "z": 101,
-        }
         hash_value = 1
         for letter in str:
-            hash_value *= prime_map[letter]
+            hash_value *= PRIME_MAP[letter]
         return hash_value
 
     def get_prime_hash_dict(self):
-        lookup_dict = {}
-
-        for word in self.corpus:
-            prime_hash_value = self.prime_hash(word)
-            if prime_hash_value not in lookup_dict:
-                lookup_dict[prime_hash_value] = [word]
-            else:
-                lookup_dict[prime_hash_value].append(word)
-
-        return lookup_dict
+        return self.get_lookup_dict()
 
     def get_all_anagrams(self, letters: list[str]) -> set:
         """Creates a set of all unique words that could have been used to form an anagram pair.
@@ -181,44 +425,135 @@ class AnagramExplorer:
 
         Returns:
            set: all unique words in corpus which form at least 1 anagram pair
+
+        The last 1024 racks' results are remembered, in whatever order their letters came.
         """
+        return set(self.__cached_all_anagrams(tuple(sorted(letters))))
 
+    def __find_all_anagrams(self, rack: tuple[str, ...]) -> frozenset:
         all_anagrams = set()
+        for key in self.iter_sub_multiset_keys(rack):
+            words = self.anagram_dict[key]
+            if len(words[0]) >= 3:
+                all_anagrams.update(words)
+        return frozenset(all_anagrams)
+
+    def iter_sub_multiset_keys(self, letters: list[str]):
+        """Yields the letter-count key of every anagram group (2 or more corpus words made of the same
+        letters) that can be spelled from the letters.
+
+        Walks the letter trie instead of trying every combination of letters: each distinct
+        sub-multiset of the rack is visited at most once, and a branch is dropped as soon as it
+        needs more of a letter than the rack has, so only prefixes of real words are ever explored.
+        The cost depends on how many words fit the rack rather than on the rack's length, which keeps
+        racks of 15 or more letters fast.
 
-        combos = []
-        for i in range(3, len(letters) + 1):
-            combos += list(combinations(letters, i))
+        Args:
+            letters: the rack; any number of each letter is allowed
 
-        hash_keys = []
-        for combo in combos:
-            hash_keys.append(self.prime_hash("".join(combo)))
+        Examples
+        --------
+        >>>explorer = AnagramExplorer(["rat", "tar", "art", "stop"])
+        >>>[explorer.anagram_dict[key] for key in explorer.iter_sub_multiset_keys(list("trab"))]
+        [['rat', 'tar', 'art']]
+        """
+        rack = Counter(letters)
+        stack = [self.__letter_trie]
+        while stack:
+            node = stack.pop()
+            for edge, child in node.items():
+                if edge is None:
+                    yield child
+                elif rack[edge[0]] >= edge[1]:
+                    stack.append(child)
+
+    def get_ranked_groups(self) -> list[tuple[int, int, str]]:
+        """Lists every anagram group (2 or more words made of the same letters), largest first.
+        Groups of the same size keep the order their first word has in the corpus.
 
-        for key in hash_keys:
-            if key in self.anagram_dict.keys() and len(self.anagram_dict[key]) > 1:
-                for word in self.anagram_dict[key]:
-                    all_anagrams.add(word)
-        return all_anagrams
+        Returns:
+            list: (size, letter-count key, alphabetically first word) for each group
+        """
+        groups = [
+            (len(words), key, min(words)) for key, words in self.anagram_lookup.items() if len(words) > 1
+        ]
+        groups.sort(key=lambda group: -group[0])
+        return groups
 
     def get_most_anagrams(self, letters: list[str]) -> str:
-        """Returns a word from one of the largest lists of anagrams that can be formed using the given letters."""
-
-        anagram_dict = self.anagram_lookup
-        max_anagrams = [-1, ""]
-
-        for key in anagram_dict:
-            word = sorted(anagram_dict[key])[0]
-            if (
-                len(anagram_dict[key]) > max_anagrams[0]
-                and len(anagram_dict[key]) > 1
-                and self.top_level_checks(letters=letters, check_single_word=word)
-            ):
-                max_anagrams[0] = len(anagram_dict[key])
-                max_anagrams[1] = word
-
-        if max_anagrams[0] <= 1 or len(self.corpus) == 0:
+        """Returns a word from one of the largest lists of anagrams that can be formed using the given letters.
+
+        The groups are ranked once up front, so a hint only has to walk the groups the rack can spell
+        and keep the best-ranked one; nothing is sorted or re-checked per request.
+        """
+        ranks = self.__group_ranks
+        best = len(self.__ranked_groups)
+        for key in self.iter_sub_multiset_keys(letters):
+            rank = ranks[key]
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+
+        if best == len(self.__ranked_groups):
             return ""
+        return self.__ranked_groups[best][2]
+
+    def analyze_racks(
+        self, racks: list[list[str]], processes: int = None, batch_size: int = 256
+    ) -> list[tuple[set, str]]:
+        """Runs get_all_anagrams and get_most_anagrams on many racks across a process pool
+
+        Where the OS can fork, workers are forked from this process and use this explorer's groups,
+        trie and rankings as they are in memory, copy-on-write, so nothing is rebuilt or pickled.
+        Elsewhere each worker builds its own explorer once, from the index file when this one was
+        loaded with index_path.
+
+        Args:
+            racks: the racks to analyze
+            processes: number of worker processes, defaults to the number of CPUs; 1 runs here instead
+            batch_size: how many racks each task handles
+
+        Returns:
+            list: (get_all_anagrams(rack), get_most_anagrams(rack)) for each rack, in order
+        """
+        if processes == 1 or len(racks) <= batch_size:
+            return _analyze(self, racks)
+
+        global _shared_explorer
+        batches = [racks[start : start + batch_size] for start in range(0, len(racks), batch_size)]
+        if "fork" in multiprocessing.get_all_start_methods():
+            _shared_explorer = self
+            executor = ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("fork"))
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=processes, initializer=_load_worker_explorer, initargs=(self.__corpus, self.__index_path)
+            )
+        try:
+            with executor:
+                results = []
+                for batch_results in executor.map(_analyze_batch, batches):
+                    results += batch_results
+        finally:
+            _shared_explorer = None
+        return results
+
+
+# the explorer analyze_racks' workers use: inherited when forked, otherwise built by _load_worker_explorer
+_shared_explorer = None
+
+
+def _load_worker_explorer(words: list[str], index_path: str):
+    global _shared_explorer
+    _shared_explorer = AnagramExplorer(words, index_path=index_path)
+
+
+def _analyze(explorer: AnagramExplorer, racks: list[list[str]]) -> list[tuple[set, str]]:
+    return [(explorer.get_all_anagrams(rack), explorer.get_most_anagrams(rack)) for rack in racks]
+
 
-        return max_anagrams[1]
+def _analyze_batch(racks: list[list[str]]) -> list[tuple[set, str]]:
+    return _analyze(_shared_explorer, racks)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ import time
 import random
 from valid_word_list import get_valid_word_list
 from AnagramExplorer import AnagramExplorer
+from rack_table import load_rack_table
 
 
 def generate_letters(
@@ -20,12 +21,28 @@ def generate_letters(
        Returns:
            A set of lowercase letters with length 7
 
+       When the precomputed rack table (see rack_table.py) was built from the explorer's corpus and
+       covers fun_factor, a qualifying rack is drawn from it directly, with the same odds as drawing
+       random racks until one is fun enough. Otherwise racks are drawn until one is.
+
        Example
        -------
        >>>explorer = AnagramExplorer(get_valid_word_list())
        >>>generate_letters(75, "scrabble", explorer)
        ["p", "o", "t", "s", "r", "i", "a"]
     """
+    table = load_rack_table()
+    if (
+        table is not None
+        and table.rack_size == 7
+        and fun_factor >= table.min_fun_factor
+        and table.matches(explorer.checksum)
+    ):
+        letters = table.sample(fun_factor, distribution)
+        if letters is None:
+            raise ValueError(f"no 7 letters can form {fun_factor} anagram words with the {distribution} distribution")
+        return letters
+
     finished = False
     letters = []
     while (
@@ -163,22 +180,11 @@ def calc_stats(guesses: list, letters: list, explorer) -> dict:
     }
     """
 
-    all_anagrams = explorer.get_all_anagrams(letters).copy()
+    all_anagrams = explorer.get_all_anagrams(letters)
 
     stats = {}
-    stats["valid"] = []  # list of tuples
-    stats["invalid"] = []  # list of tuples
-    for guess in guesses:
-        if (
-            explorer.is_valid_anagram_pair(pair=guess, letters=letters)
-            and guess not in stats["valid"]
-            and (guess[1], guess[0]) not in stats["valid"]
-            # and guess[0] not in [x[0] or x[1] for x in stats["valid"]]
-            # and guess[1] not in [x[0] or x[1] for x in stats["valid"]]
-        ):
-            stats["valid"].append(guess)
-        else:
-            stats["invalid"].append(guess)
+    # a repeated guess, in either order, counts as invalid
+    stats["valid"], stats["invalid"] = explorer.validate_guesses(guesses, letters)
 
     stats["score"] = 0  # total score per the rules of the game
     for v_guess in stats["valid"]:
@@ -191,26 +197,20 @@ def calc_stats(guesses: list, letters: list, explorer) -> dict:
             (len(stats["valid"]) / (len(guesses))) * 100
         )  # int percentage representing valid player guesses out of all player guesses
 
+    unique_guesses = set()  # unique valid guessed words
+    for v_guess in stats["valid"]:
+        unique_guesses.add(v_guess[0])
+        unique_guesses.add(v_guess[1])
+
     if len(all_anagrams) == 0:
         stats["skill"] = 0
     else:
-        unique_guesses = set()
-        for v_guess in stats["valid"]:
-            unique_guesses.add(v_guess[0])
-            unique_guesses.add(v_guess[1])
         stats["skill"] = int((len(unique_guesses) / len(all_anagrams)) * 100)
-    stats["guessed"] = set()  # unique valid guessed words
-    for v_guess in stats["valid"]:
-        stats["guessed"].add(v_guess[0])
-        stats["guessed"].add(v_guess[1])
+    stats["guessed"] = unique_guesses
 
     stats[
         "not guessed"
-    ] = set()  # unique words the player could have guessed, but didn’t
-
-    for word in all_anagrams:
-        if word not in stats["guessed"]:
-            stats["not guessed"].add(word)
+    ] = all_anagrams - unique_guesses  # unique words the player could have guessed, but didn’t
 
     return stats
 
@@ -231,7 +231,7 @@ def display_stats(stats, explorer: AnagramExplorer):
     print("\n------------")
     print(f"Skill: {round(stats['skill'], 2)}%")
     print(
-        f" unique words you could have guessed ({len(explorer.get_all_anagrams(letters)) - len(stats['guessed'])}):"
+        f" unique words you could have guessed ({len(stats['not guessed'])}):"
     )
     for guess in stats["not guessed"]:
         print(f"  {guess}", end=" ")
@@ -240,7 +240,7 @@ def display_stats(stats, explorer: AnagramExplorer):
 if __name__ == "__main__":
     time_limit = 60
 
-    explorer = AnagramExplorer(get_valid_word_list())  # helper object
+    explorer = AnagramExplorer(get_valid_word_list(), index_path="anagrams.idx")  # helper object
 
     letters = generate_letters(100, "scrabble", explorer)
 
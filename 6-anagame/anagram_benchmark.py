@@ -0,0 +1,158 @@
+"""
+Benchmarks the is_anagram_* algorithms from anagram_race across word lengths.
+
+Each algorithm's core comparison (the compare_* functions) is timed on its own, on random
+same-length letter strings, so the numbers show how the comparison scales rather than the cost of
+looking the words up in the corpus. top_level_checks, the corpus validation every is_anagram_*
+call starts with, is timed as a separate column (the corpus only has words of up to 7 letters,
+so longer lengths time how quickly it rejects them). Half the pairs are anagrams and half differ in one
+letter, which is the worst case for the permutation search.
+
+A cell stops early once its calls have used up the time budget, and an algorithm whose last cell
+ran out of budget skips every longer length, which keeps the factorial-time exhaustive search
+from running for hours.
+"""
+import math
+import random
+import string
+import time
+from statistics import median
+
+from anagram_race import (
+    compare_checkoff,
+    compare_exhaustive,
+    compare_lettercount,
+    compare_prime,
+    compare_sort,
+    top_level_checks,
+)
+
+CORE_COMPARISONS = [compare_exhaustive, compare_checkoff, compare_lettercount, compare_sort, compare_prime]
+LENGTHS = range(2, 25)
+PAIRS_PER_LENGTH = 200
+TIME_BUDGET = 1.0  # seconds per algorithm and word length
+
+
+def make_word_pairs(length: int, count: int, rng=random) -> list[tuple[str, str]]:
+    """Generates random lowercase word pairs: every other pair is an anagram, the rest differ in one letter
+
+    Args:
+      length: letters per word
+      count: number of pairs
+      rng: source of randomness
+
+    Returns:
+      A list of (word1, word2) tuples
+    """
+    pairs = []
+    for i in range(count):
+        word1 = rng.choices(string.ascii_lowercase, k=length)
+        word2 = word1.copy()
+        rng.shuffle(word2)
+        if i % 2 == 1:
+            position = rng.randrange(length)
+            word2[position] = rng.choice(string.ascii_lowercase.replace(word2[position], ""))
+        pairs.append(("".join(word1), "".join(word2)))
+    return pairs
+
+
+def time_calls(function, pairs: list[tuple[str, str]], time_budget: float = TIME_BUDGET):
+    """Times function(word1, word2) on each pair until the pairs or the time budget run out
+
+    Returns:
+      The median seconds per call, and whether the budget ran out before every pair was timed
+    """
+    timings = []
+    spent = 0.0
+    for word1, word2 in pairs:
+        start = time.perf_counter()
+        function(word1, word2)
+        elapsed = time.perf_counter() - start
+        timings.append(elapsed)
+        spent += elapsed
+        if spent > time_budget:
+            return median(timings), len(timings) < len(pairs)
+    return median(timings), False
+
+
+def run_benchmark(
+    algorithms=CORE_COMPARISONS,
+    lengths=LENGTHS,
+    pairs_per_length: int = PAIRS_PER_LENGTH,
+    time_budget: float = TIME_BUDGET,
+    seed=0,
+) -> list[dict]:
+    """Times each algorithm, and top_level_checks, at every word length
+
+    Args:
+      algorithms: comparison functions taking two lowercase words
+      lengths: word lengths to sweep
+      pairs_per_length: how many word pairs to time at each length
+      time_budget: seconds each algorithm may spend at one length
+      seed: seed for the word pairs, so every run times the same words
+
+    Returns:
+      A list with one dictionary per algorithm, like TimingProfiler's results:
+      "name", "lengths", and "data", the median milliseconds per call (None for skipped lengths)
+    """
+    lengths = list(lengths)
+    rng = random.Random(seed)
+    pairs = {length: make_word_pairs(length, pairs_per_length, rng) for length in lengths}
+
+    results = []
+    for algorithm in list(algorithms) + [top_level_checks]:
+        data = []
+        out_of_budget = False
+        for length in lengths:
+            if out_of_budget:
+                data.append(None)
+                continue
+            seconds, out_of_budget = time_calls(algorithm, pairs[length], time_budget)
+            data.append(seconds * 1000)
+        results.append({"name": algorithm.__name__, "lengths": lengths, "data": data})
+    return results
+
+
+def scaling_exponent(lengths: list[int], data: list[float]):
+    """Fits time ≈ c·n^k through the measured lengths of 4 letters or more and returns k, or None
+    if there are fewer than two such lengths. An exponent that keeps growing with n, like the
+    exhaustive search's, means the time isn't polynomial at all."""
+    points = [(math.log(n), math.log(ms)) for n, ms in zip(lengths, data) if ms is not None and ms > 0 and n >= 4]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, __ in points) / len(points)
+    mean_y = sum(y for __, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, __ in points)
+    if spread == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def format_results(results: list[dict]) -> str:
+    """Generates a table of microseconds per call: rows are word lengths, columns are algorithms,
+    followed by each algorithm's fitted scaling exponent"""
+    names = [result["name"].replace("compare_", "") for result in results]
+    width = max(12, *(len(name) + 2 for name in names))
+    rows = ["length" + "".join(f"{name:>{width}}" for name in names)]
+    for i, length in enumerate(results[0]["lengths"]):
+        cells = []
+        for result in results:
+            ms = result["data"][i]
+            cells.append(f"{'-':>{width}}" if ms is None else f"{ms * 1000:>{width - 3}.2f} µs")
+        rows.append(f"{length:>6}" + "".join(cells))
+
+    rows.append("")
+    name_width = max(len(name) for name in names) + 1
+    for name, result in zip(names, results):
+        exponent = scaling_exponent(result["lengths"], result["data"])
+        measured = [n for n, ms in zip(result["lengths"], result["data"]) if ms is not None]
+        scaling = "n/a" if exponent is None else f"~n^{exponent:.2f}"
+        rows.append(f"{name:<{name_width}} {scaling:<10} timed up to {max(measured)} letters")
+    return "\n".join(rows)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    results = run_benchmark()
+    print(format_results(results))
+    print(f"\nBenchmark took {round(time.perf_counter() - start, 2)}s")
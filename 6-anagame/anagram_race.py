@@ -1,7 +1,6 @@
 import itertools
 from valid_word_list import get_valid_word_list  # only words with 2 - 7 letters
-
-# from TimingProfiler2 import TimingProfiler
+from corpus_index import load_index
 
 
 def top_level_checks(word1: str, word2: str) -> bool:
@@ -13,12 +12,13 @@ def top_level_checks(word1: str, word2: str) -> bool:
     """
     word1 = word1.lower()
     word2 = word2.lower()
+    valid_words = load_index(get_valid_word_list)
 
     if (
         len(word1) != len(word2)
         or word1 == word2
-        or word1 not in get_valid_word_list()
-        or word2 not in get_valid_word_list()
+        or word1 not in valid_words
+        or word2 not in valid_words
     ):
         return False
     return True
@@ -38,10 +38,11 @@ def is_anagram_exhaustive(word1: str, word2: str) -> bool:
 
     if not top_level_checks(word1, word2):
         return False
+    return compare_exhaustive(word1.lower(), word2.lower())
 
-    word1 = word1.lower()
-    word2 = word2.lower()
 
+def compare_exhaustive(word1: str, word2: str) -> bool:
+    """The comparison behind is_anagram_exhaustive, for lowercase words, without top_level_checks"""
     for perm in itertools.permutations(word1):
         if "".join(perm) == word2:
             return True
@@ -62,9 +63,13 @@ def is_anagram_checkoff(word1: str, word2: str) -> bool:
 
     if not top_level_checks(word1, word2):
         return False
+    return compare_checkoff(word1.lower(), word2.lower())
+
 
-    wordlist1 = list(word1.lower())
-    wordlist2 = list(word2.lower())
+def compare_checkoff(word1: str, word2: str) -> bool:
+    """The comparison behind is_anagram_checkoff, for lowercase words, without top_level_checks"""
+    wordlist1 = list(word1)
+    wordlist2 = list(word2)
 
     for letter in wordlist1:
         if letter in wordlist2:
@@ -94,10 +99,11 @@ def is_anagram_lettercount(word1: str, word2: str) -> bool:
 
     if not top_level_checks(word1, word2):
         return False
+    return compare_lettercount(word1.lower(), word2.lower())
 
-    word1 = word1.lower()
-    word2 = word2.lower()
 
+def compare_lettercount(word1: str, word2: str) -> bool:
+    """The comparison behind is_anagram_lettercount, for lowercase words, without top_level_checks"""
     letter_count1 = {}
     letter_count2 = {}
 
@@ -130,7 +136,12 @@ def is_anagram_sort(word1: str, word2: str) -> bool:
 
     if not top_level_checks(word1, word2):
         return False
-    return sorted(word1.lower()) == sorted(word2.lower())
+    return compare_sort(word1.lower(), word2.lower())
+
+
+def compare_sort(word1: str, word2: str) -> bool:
+    """The comparison behind is_anagram_sort, for lowercase words, without top_level_checks"""
+    return sorted(word1) == sorted(word2)
 
 
 ch_to_prime = {
@@ -179,10 +190,11 @@ def is_anagram_prime(word1: str, word2: str) -> bool:
 
     if not top_level_checks(word1, word2):
         return False
+    return compare_prime(word1.lower(), word2.lower())
 
-    word1 = word1.lower()
-    word2 = word2.lower()
 
+def compare_prime(word1: str, word2: str) -> bool:
+    """The comparison behind is_anagram_prime, for lowercase words, without top_level_checks"""
     word1_hash = 1
     word2_hash = 1
 
@@ -212,12 +224,4 @@ if __name__ == "__main__":
     for algorithm in algorithms:
         print(f"{algorithm.__name__}- {word1}, {word2}: {algorithm(word1, word2)}")
 
-    """
-    inputs=[("eat","ate"), ("tale", "late"), ("sneak", "snake"), ("actors", "costar"), ("allergy", "gallery"), ("calipers", "replicas"), ("cautioned", "education"), ("percussion", "supersonic"), ("calligraphy", "graphically")]
-    trials = 10
-
-    experiment = TimingProfiler(algorithms, inputs, trials)
-    experiment.run_experiments()
-    # print(experiment.results)
-    experiment.graph(title="is_anagrams Timings", scale="linear")
-    """
+    # timings for each algorithm across word lengths: python anagram_benchmark.py
@@ -0,0 +1,343 @@
+"""
+A local asyncio server that lets several anagame front-ends share one warm AnagramExplorer.
+
+Requests and responses are JSON objects, one per line, over TCP. Every request has an "op" and
+may have an "id", which is copied into its response so a client can send many requests without
+waiting for each answer:
+
+  {"id": 1, "op": "validate", "letters": "potsria", "pair": ["rat", "tar"]}  -> {"id": 1, "valid": true}
+  {"id": 2, "op": "hint", "letters": "potsria"}                             -> {"id": 2, "hint": "pastor"}
+  {"id": 3, "op": "all_anagrams", "letters": "potsria"}                     -> {"id": 3, "words": [...]}
+  {"id": 4, "op": "metrics"}                                                -> {"id": 4, "metrics": {...}}
+
+A request that can't be answered gets {"id": ..., "error": "..."} instead.
+
+Requests that arrive close together are answered as one batch: the batch waits at most
+batch_window seconds for company, then each distinct rack in it is looked up once. Hints and
+anagram lists are kept in an LRU cache keyed by the rack's sorted letters, so the same rack in
+any order, from any front-end, is only worked out once.
+
+Each batch is worked out on one background thread, so the event loop keeps accepting connections
+and reading requests while a slow lookup (say all_anagrams for a very long rack) runs. Batches are
+still answered one at a time, though, so requests that arrive meanwhile wait for the slow one to
+finish: the lookups are pure Python and would only contend for the GIL on more threads.
+A batch that fails unexpectedly gets an error response for every request in it, and the service carries on.
+"""
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+HOST = "127.0.0.1"
+PORT = 8765
+CACHE_SIZE = 4096
+BATCH_SIZE = 64
+BATCH_WINDOW = 0.002  # seconds
+LATENCY_SAMPLES = 10000  # most recent requests kept per op for the percentiles
+
+OPS = ("validate", "hint", "all_anagrams", "metrics")
+
+
+class LRUCache:
+    """A dictionary that forgets its least recently used entry once it holds maxsize entries"""
+
+    def __init__(self, maxsize: int = CACHE_SIZE):
+        self.__maxsize = maxsize
+        self.__entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get(self, key, default=None):
+        if key in self.__entries:
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return self.__entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self.__entries[key] = value
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__maxsize:
+            self.__entries.popitem(last=False)
+
+
+class LatencyStats:
+    """Counts requests per op and keeps their most recent latencies for percentiles"""
+
+    def __init__(self, samples: int = LATENCY_SAMPLES):
+        self.__samples = samples
+        self.__counts = {}
+        self.__latencies = {}
+
+    def record(self, op: str, seconds: float):
+        self.__counts[op] = self.__counts.get(op, 0) + 1
+        self.__latencies.setdefault(op, deque(maxlen=self.__samples)).append(seconds)
+
+    def summary(self) -> dict:
+        """Returns {op: {"count", "p50_ms", "p95_ms", "p99_ms", "max_ms"}} over the recent samples"""
+        summary = {}
+        for op, latencies in self.__latencies.items():
+            ordered = sorted(latencies)
+
+            def percentile(fraction):
+                return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1000, 3)
+
+            summary[op] = {
+                "count": self.__counts[op],
+                "p50_ms": percentile(0.50),
+                "p95_ms": percentile(0.95),
+                "p99_ms": percentile(0.99),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return summary
+
+
+def _as_letters(letters) -> list[str]:
+    """Accepts a rack as a string or a list of letters"""
+    if isinstance(letters, str):
+        letters = list(letters)
+    if not isinstance(letters, list) or not all(
+        isinstance(letter, str) and len(letter) == 1 for letter in letters
+    ):
+        raise ValueError("letters must be a string or a list of single letters")
+    letters = [letter.lower() for letter in letters]
+    if not all("a" <= letter <= "z" for letter in letters):
+        raise ValueError("letters must be a-z")
+    return letters
+
+
+def _request_id(request):
+    return request.get("id") if isinstance(request, dict) else None
+
+
+class AnagramService:
+    """Answers anagram requests for one AnagramExplorer, batching and caching them"""
+
+    def __init__(
+        self,
+        explorer,
+        cache_size: int = CACHE_SIZE,
+        batch_size: int = BATCH_SIZE,
+        batch_window: float = BATCH_WINDOW,
+    ):
+        self.__explorer = explorer
+        self.__cache = LRUCache(cache_size)
+        self.__batch_size = batch_size
+        self.__batch_window = batch_window
+        self.__latency = LatencyStats()
+        self.__batches = 0
+        self.__batched_requests = 0
+        self.__queue = None
+        self.__batcher = None
+        # one thread, so batches are still answered one at a time and the cache needs no lock
+        self.__lookups = ThreadPoolExecutor(max_workers=1, thread_name_prefix="anagram-lookups")
+
+    @property
+    def cache(self):
+        return self.__cache
+
+    def metrics(self) -> dict:
+        """Latency percentiles per op, cache hit rate, and the average batch size"""
+        lookups = self.__cache.hits + self.__cache.misses
+        return {
+            "latency": self.__latency.summary(),
+            "cache": {
+                "size": len(self.__cache),
+                "hits": self.__cache.hits,
+                "misses": self.__cache.misses,
+                "hit_rate": round(self.__cache.hits / lookups, 4) if lookups else 0.0,
+            },
+            "batches": self.__batches,
+            "average_batch_size": round(self.__batched_requests / self.__batches, 2) if self.__batches else 0.0,
+        }
+
+    async def handle_request(self, request: dict) -> dict:
+        """Answers one request once its batch has been processed"""
+        if self.__queue is None:
+            self.__queue = asyncio.Queue()
+        if self.__batcher is None or self.__batcher.done():
+            self.__batcher = asyncio.create_task(self.__run_batches())
+        future = asyncio.get_running_loop().create_future()
+        await self.__queue.put((request, future, time.perf_counter()))
+        return await future
+
+    async def __run_batches(self):
+        queue = self.__queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            if queue.empty() and self.__batch_window > 0:
+                await asyncio.sleep(self.__batch_window)  # let concurrent requests join this batch
+            while len(batch) < self.__batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            self.__batches += 1
+            self.__batched_requests += len(batch)
+            try:
+                responses = await loop.run_in_executor(self.__lookups, self.__process, batch)
+            except Exception as error:  # e.g. MemoryError or RecursionError from a lookup
+                responses = [
+                    {"id": _request_id(request), "error": f"internal error: {error!r}"} for request, __, __ in batch
+                ]
+            for (request, future, started), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+                op = request.get("op") if isinstance(request, dict) else None
+                self.__latency.record(op if op in OPS else "invalid", time.perf_counter() - started)
+
+    def __process(self, batch: list) -> list[dict]:
+        """Answers every request in a batch, looking up each distinct rack only once"""
+        racks = {}  # sorted letters -> (all anagrams, hint), for this batch
+        responses = []
+        for request, __, __ in batch:
+            response = {"id": _request_id(request)}
+            try:
+                response.update(self.__answer(request, racks))
+            except (KeyError, TypeError, ValueError) as error:
+                response["error"] = str(error) if not isinstance(error, KeyError) else f"missing field {error}"
+            responses.append(response)
+        return responses
+
+    def __answer(self, request: dict, racks: dict) -> dict:
+        if not isinstance(request, dict):
+            raise ValueError("a request must be a JSON object")
+        op = request.get("op")
+        if op not in OPS:
+            raise ValueError(f"op must be one of {', '.join(OPS)}")
+        if op == "metrics":
+            return {"metrics": self.metrics()}
+
+        letters = _as_letters(request["letters"])
+        if op == "validate":
+            pair = request["pair"]
+            if not isinstance(pair, list) or len(pair) != 2 or not all(isinstance(word, str) for word in pair):
+                raise ValueError("pair must be a list of two words")
+            return {"valid": self.__explorer.is_valid_anagram_pair(tuple(pair), letters)}
+
+        rack = "".join(sorted(letters))
+        if rack not in racks:
+            entry = self.__cache.get(rack)
+            if entry is None:
+                entry = (sorted(self.__explorer.get_all_anagrams(letters)), self.__explorer.get_most_anagrams(letters))
+                self.__cache.put(rack, entry)
+            racks[rack] = entry
+        words, hint = racks[rack]
+        return {"words": words} if op == "all_anagrams" else {"hint": hint}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Reads requests line by line and writes each response as soon as it's ready,
+        so a slow request never holds up the ones behind it"""
+        pending = set()
+
+        async def respond(line: bytes):
+            try:
+                request = json.loads(line)
+            except ValueError:
+                response = {"id": None, "error": "request is not valid JSON"}
+            else:
+                response = await self.handle_request(request)
+            writer.write(json.dumps(response).encode("utf-8") + b"\n")
+            await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    task = asyncio.create_task(respond(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def start(self, host: str = HOST, port: int = PORT) -> asyncio.Server:
+        """Starts listening; the returned server keeps running until it's closed"""
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+class AnagramClient:
+    """Talks to an AnagramService. Requests can be awaited concurrently over one connection.
+
+    Example
+    -------
+    >>>client = await AnagramClient.connect()
+    >>>await client.hint(["p", "o", "t", "s", "r", "i", "a"])
+    'pastor'
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.__reader = reader
+        self.__writer = writer
+        self.__next_id = 0
+        self.__waiting = {}
+        self.__listener = asyncio.create_task(self.__listen())
+
+    @classmethod
+    async def connect(cls, host: str = HOST, port: int = PORT):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def __listen(self):
+        while line := await self.__reader.readline():
+            response = json.loads(line)
+            future = self.__waiting.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self.__waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("the anagram service closed the connection"))
+
+    async def request(self, op: str, **fields) -> dict:
+        """Sends one request and returns its response"""
+        self.__next_id += 1
+        request_id = self.__next_id
+        future = asyncio.get_running_loop().create_future()
+        self.__waiting[request_id] = future
+        self.__writer.write(json.dumps({"id": request_id, "op": op, **fields}).encode("utf-8") + b"\n")
+        await self.__writer.drain()
+        response = await future
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response
+
+    async def validate(self, pair: tuple[str, str], letters: list[str]) -> bool:
+        return (await self.request("validate", pair=list(pair), letters=letters))["valid"]
+
+    async def hint(self, letters: list[str]) -> str:
+        return (await self.request("hint", letters=letters))["hint"]
+
+    async def all_anagrams(self, letters: list[str]) -> set:
+        return set((await self.request("all_anagrams", letters=letters))["words"])
+
+    async def metrics(self) -> dict:
+        return (await self.request("metrics"))["metrics"]
+
+    async def close(self):
+        self.__writer.close()
+        await self.__writer.wait_closed()
+        await self.__listener
+
+
+async def serve(explorer, host: str = HOST, port: int = PORT):
+    """Runs an AnagramService until the process is stopped"""
+    server = await AnagramService(explorer).start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    import sys
+
+    from valid_word_list import get_valid_word_list
+    from AnagramExplorer import AnagramExplorer
+
+    # python anagram_service.py [port]
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    explorer = AnagramExplorer(get_valid_word_list(), index_path="anagrams.idx")
+    print(f"Serving anagrams on {HOST}:{port}")
+    asyncio.run(serve(explorer, HOST, port))
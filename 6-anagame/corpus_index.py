@@ -0,0 +1,93 @@
+from functools import lru_cache
+
+
+def letter_signature(word: str) -> bytes:
+    """Counts how many times each letter a-z appears in a word (case-insensitive)
+
+    Args:
+        word: the word to count
+
+    Returns:
+        26 bytes, one count per letter. Anagrams share the same signature.
+
+    Examples
+    --------
+    >>>letter_signature("abba")[:3]
+    b'\\x02\\x02\\x00'
+    """
+    counts = bytearray(26)
+    for letter in word.lower():
+        counts[ord(letter) - 97] += 1
+    return bytes(counts)
+
+
+class CorpusIndex:
+    """A read-only index over a word list, built once and shared by every lookup.
+
+    - membership uses a frozenset, so `word in index` is O(1)
+    - every word gets an integer id (its position in the original list)
+    - words are bucketed by length
+    - every word's letter-count signature is precomputed, and words are grouped by signature
+    """
+
+    def __init__(self, words: list[str]):
+        self.__words = tuple(words)
+        self.__word_set = frozenset(self.__words)
+        self.__ids = {}
+        self.__by_length = {}
+        self.__signatures = []
+        self.__by_signature = {}
+
+        for word_id, word in enumerate(self.__words):
+            self.__ids.setdefault(word, word_id)
+            self.__by_length.setdefault(len(word), []).append(word_id)
+            signature = letter_signature(word)
+            self.__signatures.append(signature)
+            self.__by_signature.setdefault(signature, []).append(word_id)
+
+    @property
+    def words(self):
+        return self.__words
+
+    def __len__(self):
+        return len(self.__words)
+
+    def __contains__(self, word) -> bool:
+        return word in self.__word_set
+
+    def __iter__(self):
+        return iter(self.__words)
+
+    def word_id(self, word: str) -> int:
+        """Returns the id of a word, or -1 if it isn't in the corpus"""
+        return self.__ids.get(word, -1)
+
+    def word(self, word_id: int) -> str:
+        return self.__words[word_id]
+
+    def signature(self, word_id: int) -> bytes:
+        return self.__signatures[word_id]
+
+    def ids_of_length(self, length: int) -> list[int]:
+        return self.__by_length.get(length, [])
+
+    def words_of_length(self, length: int) -> list[str]:
+        """Returns every word with the given length, in corpus order"""
+        return [self.__words[word_id] for word_id in self.ids_of_length(length)]
+
+    def anagram_ids(self, word: str) -> list[int]:
+        """Returns the ids of every corpus word made of exactly the same letters as word (including word itself)"""
+        return self.__by_signature.get(letter_signature(word), [])
+
+
+@lru_cache(maxsize=None)
+def load_index(get_word_list) -> CorpusIndex:
+    """Builds the index for a word list loader (e.g. get_valid_word_list) the first time it's asked for,
+    then returns that same index every time after
+
+    Example
+    -------
+    >>>load_index(get_valid_word_list) is load_index(get_valid_word_list)
+    True
+    """
+    return CorpusIndex(get_word_list())
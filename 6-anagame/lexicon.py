@@ -0,0 +1,160 @@
+"""
+Compact on-disk word lists.
+
+A .lex file holds a sorted word list front-coded in blocks: the first word of every block is stored
+in full, and each following word only stores how many letters it shares with the word before it
+plus the letters that differ. An offset table points at the start of every block, so a lookup
+binary searches the blocks' first words and then decodes at most one block. Files are memory-mapped
+and only opened the first time they're used.
+
+File layout (all integers little-endian):
+  header   magic b"LEX1", version (u16), block size (u16), word count (u32), block count (u32)
+  offsets  block count × u32, each relative to the start of the blob
+  blob     for each word: shared prefix length (u8), suffix length (u8), suffix bytes
+"""
+import mmap
+import os
+import struct
+import sys
+from bisect import bisect_right
+from collections.abc import Sequence
+from functools import lru_cache
+
+MAGIC = b"LEX1"
+VERSION = 1
+BLOCK_SIZE = 16
+_HEADER = struct.Struct("<4sHHII")
+
+
+def build_lexicon(words: list[str], path: str, block_size: int = BLOCK_SIZE):
+    """Writes a word list to a .lex file
+
+    Args:
+        words: the words to store; they're sorted and de-duplicated first
+        path: where to write the file
+        block_size: how many words share one entry in the offset table
+    """
+    words = sorted(set(words))
+    blob = bytearray()
+    offsets = []
+    previous = b""
+    for i, word in enumerate(words):
+        encoded = word.encode("ascii")
+        if len(encoded) > 255:
+            raise ValueError(f"{word!r} is longer than 255 letters")
+        if i % block_size == 0:
+            offsets.append(len(blob))
+            shared = 0
+        else:
+            shared = 0
+            limit = min(len(previous), len(encoded), 255)
+            while shared < limit and previous[shared] == encoded[shared]:
+                shared += 1
+        blob.append(shared)
+        blob.append(len(encoded) - shared)
+        blob += encoded[shared:]
+        previous = encoded
+
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, VERSION, block_size, len(words), len(offsets)))
+        file.write(struct.pack(f"<{len(offsets)}I", *offsets))
+        file.write(blob)
+
+
+class Lexicon(Sequence):
+    """A sorted word list backed by a memory-mapped .lex file.
+    Supports len, indexing, iteration, and `word in lexicon` without decoding the whole file."""
+
+    def __init__(self, path: str):
+        self.__path = path
+        self.__map = None
+        self.__words = None
+
+    def __open(self):
+        if self.__map is not None:
+            return
+        with open(self.__path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.__block_size, self.__count, block_count = _HEADER.unpack_from(self.__map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.__path} is not a version {VERSION} lexicon file")
+        self.__offsets = struct.unpack_from(f"<{block_count}I", self.__map, _HEADER.size)
+        self.__blob_start = _HEADER.size + 4 * block_count
+        self.__block_firsts = [self.__decode_block(block, 1)[0] for block in range(block_count)]
+
+    def __decode_block(self, block: int, limit: int) -> list[str]:
+        """Decodes up to limit words from the start of a block"""
+        data = self.__map
+        position = self.__blob_start + self.__offsets[block]
+        words = []
+        previous = b""
+        for __ in range(min(limit, self.__count - block * self.__block_size)):
+            shared = data[position]
+            suffix_length = data[position + 1]
+            position += 2
+            previous = previous[:shared] + data[position : position + suffix_length]
+            position += suffix_length
+            words.append(previous.decode("ascii"))
+        return words
+
+    def __len__(self):
+        self.__open()
+        return self.__count
+
+    def __getitem__(self, index):
+        if self.__words is not None:
+            return self.__words[index]
+        self.__open()
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.__count))]
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError("lexicon index out of range")
+        block, within = divmod(index, self.__block_size)
+        return self.__decode_block(block, within + 1)[within]
+
+    def __contains__(self, word) -> bool:
+        if self.__words is not None:
+            return word in self.__word_set
+        self.__open()
+        block = bisect_right(self.__block_firsts, word) - 1
+        if block < 0:
+            return False
+        return word in self.__decode_block(block, self.__block_size)
+
+    def __iter__(self):
+        return iter(self.words)
+
+    @property
+    def words(self) -> tuple[str, ...]:
+        """Every word, decoded once and then shared by every caller"""
+        if self.__words is None:
+            self.__open()
+            words = []
+            for block in range(len(self.__offsets)):
+                words += self.__decode_block(block, self.__block_size)
+            self.__words = tuple(words)
+            self.__word_set = frozenset(words)
+        return self.__words
+
+
+@lru_cache(maxsize=None)
+def load_lexicon(path: str) -> Lexicon:
+    """Returns the shared Lexicon for a file. Relative paths are relative to this module's folder."""
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+    return Lexicon(path)
+
+
+if __name__ == "__main__":
+    # python lexicon.py build words.txt words.lex   (one word per line)
+    # python lexicon.py dump words.lex
+    if len(sys.argv) == 4 and sys.argv[1] == "build":
+        with open(sys.argv[2]) as file:
+            build_lexicon(file.read().split(), sys.argv[3])
+    elif len(sys.argv) == 3 and sys.argv[1] == "dump":
+        for word in Lexicon(sys.argv[2]):
+            print(word)
+    else:
+        print("usage: python lexicon.py build <words.txt> <out.lex> | dump <file.lex>")
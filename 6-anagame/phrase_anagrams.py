@@ -0,0 +1,162 @@
+"""
+Multi-word anagrams of a phrase: every multiset of corpus words whose letters use up the phrase's
+letters exactly ("dormitory" -> "dirty room").
+
+The search works on letter counts, not words. Each anagram group of the corpus is one candidate,
+and a depth-first search subtracts candidates from the phrase's counts until nothing is left.
+Candidates are only ever taken in one fixed order (longest first), so each multiset is found once
+rather than once per ordering, and every word of a group is substituted in at the end.
+
+Counts are widened from AnagramExplorer's 4-bit keys to 8 bits per letter, which leaves room for
+a guard bit in every letter: "does this word fit in what's left" is then one subtraction and mask
+(see is_sub_multiset) however many of a letter the phrase has.
+"""
+from collections import Counter
+from itertools import combinations_with_replacement, groupby, product
+
+from AnagramExplorer import is_sub_multiset
+
+_LANE_HIGH_BITS = sum(0x80 << (8 * i) for i in range(26))
+
+
+def _widen(key: int) -> int:
+    """Moves each 4-bit letter count of a key into its own byte"""
+    wide = 0
+    shift = 0
+    while key:
+        wide |= (key & 0xF) << shift
+        key >>= 4
+        shift += 8
+    return wide
+
+
+def _phrase_counts(phrase: str) -> Counter:
+    return Counter(letter for letter in phrase.lower() if "a" <= letter <= "z")
+
+
+def iter_phrase_key_solutions(explorer, phrase: str, min_word_length: int = 1, max_words: int = None):
+    """Yields every way to use up the phrase's letters with anagram groups of the corpus
+
+    Depth first over the letters still to be used. A state that turned out to have no solutions is
+    remembered, together with how many more words it was allowed, so reaching the same remaining
+    letters again through a different set of words skips it straight away.
+
+    Args:
+        explorer: the AnagramExplorer whose corpus words may be used
+        phrase: the letters to use; anything other than a-z is ignored
+        min_word_length: the shortest word that may be used
+        max_words: the most words a solution may have, or None for no limit
+
+    Returns:
+        A generator of tuples of letter-count keys (keys of explorer.anagram_dict), longest first.
+        A key appears more than once when the solution uses several words from its group.
+    """
+    counts = _phrase_counts(phrase)
+    if not counts or 127 < max(counts.values()):
+        return
+    size = sum(counts.values())
+    target = sum(count << (8 * (ord(letter) - 97)) for letter, count in counts.items())
+    # no word has more than 15 of a letter, so the 4-bit check works as a first pass with capped counts
+    capped_key = sum(min(count, 15) << (4 * (ord(letter) - 97)) for letter, count in counts.items())
+
+    candidates = [
+        (_widen(key), len(words[0]), key)
+        for key, words in explorer.anagram_dict.items()
+        if len(words[0]) >= min_word_length and is_sub_multiset(key, capped_key)
+    ]
+    guarded = target | _LANE_HIGH_BITS
+    candidates = [
+        candidate for candidate in candidates if (guarded - candidate[0]) & _LANE_HIGH_BITS == _LANE_HIGH_BITS
+    ]
+    candidates.sort(key=lambda candidate: (-candidate[1], candidate[0]))
+    wide_keys = [wide for wide, __, __ in candidates]
+    lengths = [length for __, length, __ in candidates]
+    keys = [key for __, __, key in candidates]
+
+    # (remaining letters, candidate to continue from) -> most words it has been shown to be impossible with
+    dead = {}
+
+    def search(remaining: int, remaining_size: int, fits: list[int], words_left: int):
+        """fits holds, in order, every candidate that may come next and fits in remaining"""
+        for position, candidate in enumerate(fits):
+            rest = remaining - wide_keys[candidate]
+            if rest == 0:
+                yield (keys[candidate],)
+                continue
+            rest_size = remaining_size - lengths[candidate]
+            # later words are never longer than this one, and later candidates are shorter still
+            if rest_size > (words_left - 1) * lengths[candidate]:
+                break
+            state = (rest, candidate)
+            if dead.get(state, 0) >= words_left - 1:
+                continue
+
+            guarded = rest | _LANE_HIGH_BITS
+            next_fits = [
+                following
+                for following in fits[position:]
+                if (guarded - wide_keys[following]) & _LANE_HIGH_BITS == _LANE_HIGH_BITS
+            ]
+            found = False
+            for solution in search(rest, rest_size, next_fits, words_left - 1):
+                found = True
+                yield (keys[candidate],) + solution
+            if not found:
+                dead[state] = words_left - 1
+
+    yield from search(target, size, list(range(len(candidates))), max_words or size)
+
+
+def iter_phrase_anagrams(explorer, phrase: str, min_word_length: int = 1, max_words: int = None):
+    """Yields every multiset of corpus words whose letters are exactly the phrase's letters.
+    Results stream out as they're found, so the first ones arrive long before a big search ends;
+    stop iterating whenever enough have come out.
+
+    The number of results grows very fast with the phrase's length: a 13-letter phrase has
+    thousands, an 18-letter one hundreds of thousands. For 20-30 letters, limit max_words (3 or 4)
+    or raise min_word_length to get a complete answer in seconds.
+
+    Args:
+        explorer: the AnagramExplorer whose corpus words may be used
+        phrase: the letters to use; anything other than a-z is ignored
+        min_word_length: the shortest word that may be used
+        max_words: the most words an anagram may have, or None for no limit
+
+    Returns:
+        A generator of word tuples, longest word first
+
+    Examples
+    --------
+    >>>explorer = AnagramExplorer(["dirty", "room", "moor", "dry", "riot", "my", "dormitory"])
+    >>>list(iter_phrase_anagrams(explorer, "Dormitory"))
+    [('dormitory',), ('dirty', 'room'), ('dirty', 'moor')]
+    """
+    groups = explorer.anagram_dict
+    for keys in iter_phrase_key_solutions(explorer, phrase, min_word_length, max_words):
+        # a key used n times can be any n words from its group, repeats allowed
+        choices = [
+            combinations_with_replacement(groups[key], sum(1 for __ in repeats)) for key, repeats in groupby(keys)
+        ]
+        for picked in product(*choices):
+            yield tuple(word for words in picked for word in words)
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    from valid_word_list import get_valid_word_list
+    from AnagramExplorer import AnagramExplorer
+
+    # python phrase_anagrams.py "william shakespeare" [max words]
+    phrase = sys.argv[1] if len(sys.argv) > 1 else "clint eastwood"
+    max_words = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    explorer = AnagramExplorer(get_valid_word_list(), index_path="anagrams.idx")
+
+    start = time.perf_counter()
+    count = 0
+    for anagram in iter_phrase_anagrams(explorer, phrase, min_word_length=3, max_words=max_words):
+        if count < 20:
+            print(" ".join(anagram))
+        count += 1
+    print(f"{count} anagrams of {phrase!r} in {round(time.perf_counter() - start, 2)}s")
@@ -0,0 +1,207 @@
+"""
+Offline table of "fun" letter racks, so generate_letters can draw a rack that meets a fun_factor
+directly instead of drawing random racks until one does.
+
+The table lists every rack (a multiset of RACK_SIZE letters) that can make at least MIN_FUN_FACTOR
+of get_all_anagrams' words, with that word count, largest counts first. Counting every rack is done
+once, by a depth-first walk over the letters a-z that carries along the set of anagram groups still
+reachable, so racks sharing a prefix share the work.
+
+File layout (all integers little-endian):
+  header   magic b"RACK", version (u16), rack size (u16), corpus checksum (32 bytes),
+           rack count (u32), minimum fun factor (u16), padding (u16)
+  racks    rack count × (rack size letters, sorted, ASCII; word count u16)
+"""
+import os
+import random
+import struct
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from math import factorial
+
+MAGIC = b"RACK"
+VERSION = 1
+RACK_SIZE = 7
+MIN_FUN_FACTOR = 20
+TABLE_PATH = "racks.tbl"
+_HEADER = struct.Struct("<4sHH32sIHH")
+
+
+def count_rack_words(explorer, rack_size: int = RACK_SIZE):
+    """Yields every rack of rack_size letters with the number of words get_all_anagrams finds for it
+
+    Args:
+        explorer: the AnagramExplorer whose corpus is used
+        rack_size: letters per rack
+
+    Returns:
+        A generator of (rack, count) pairs, rack being its letters in alphabetical order
+    """
+    # a trie like build_letter_trie's, but each node is [words in the group ending here, children]
+    root = [0, {}]
+    for key, words in explorer.anagram_dict.items():
+        if len(words) < 2 or not 3 <= len(words[0]) <= rack_size:
+            continue
+        node = root
+        remaining = key
+        letter = 0
+        while remaining:
+            count = remaining & 0xF
+            if count:
+                node = node[1].setdefault((letter, count), [0, {}])
+            remaining >>= 4
+            letter += 1
+        node[0] += len(words)
+
+    stack = [(0, rack_size, [root], 0, "")]
+    while stack:
+        letter, remaining, reachable, total, rack = stack.pop()
+        if remaining == 0:
+            yield rack, total
+            continue
+        if letter == 26:
+            continue
+        stack.append((letter + 1, remaining, reachable, total, rack))
+        for count in range(1, remaining + 1):
+            # taking `count` of this letter reaches every child edge for up to that many of it
+            extended = list(reachable)
+            extended_total = total
+            for node in reachable:
+                children = node[1]
+                for used in range(1, count + 1):
+                    child = children.get((letter, used))
+                    if child is not None:
+                        extended.append(child)
+                        extended_total += child[0]
+            stack.append((letter + 1, remaining - count, extended, extended_total, rack + chr(97 + letter) * count))
+
+
+def build_rack_table(explorer, path: str, rack_size: int = RACK_SIZE, min_fun_factor: int = MIN_FUN_FACTOR):
+    """Counts every rack and writes the ones with at least min_fun_factor words to a table file"""
+    racks = [(count, rack) for rack, count in count_rack_words(explorer, rack_size) if count >= min_fun_factor]
+    racks.sort(key=lambda entry: (-entry[0], entry[1]))
+
+    with open(path, "wb") as file:
+        file.write(
+            _HEADER.pack(MAGIC, VERSION, rack_size, explorer.checksum, len(racks), min_fun_factor, 0)
+        )
+        for count, rack in racks:
+            file.write(struct.pack(f"<{rack_size}sH", rack.encode("ascii"), min(count, 0xFFFF)))
+
+
+def _rack_weight(rack: str, distribution: str) -> int:
+    """How likely generate_letters' random draw is to produce this rack, up to a constant factor"""
+    if distribution == "uniform":
+        # letters drawn with replacement: the number of orders the rack can be drawn in
+        weight = factorial(len(rack))
+        for letter in set(rack):
+            weight //= factorial(rack.count(letter))
+        return weight
+    if distribution == "scrabble":
+        # distinct letters drawn without replacement: every set of letters is equally likely
+        return 1 if len(set(rack)) == len(rack) else 0
+    raise ValueError(f"unknown distribution {distribution!r}")
+
+
+class RackTable:
+    """The racks from a table file, ready to sample from"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            data = file.read()
+        magic, version, self.__rack_size, self.__checksum, rack_count, self.__min_fun_factor, __ = (
+            _HEADER.unpack_from(data, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} rack table")
+
+        records = struct.Struct(f"<{self.__rack_size}sH")
+        body = data[_HEADER.size : _HEADER.size + rack_count * records.size]
+        self.__racks = []
+        self.__negated_counts = []  # counts are stored largest first; negated so bisect can search them
+        for rack, count in records.iter_unpack(body):
+            self.__racks.append(rack.decode("ascii"))
+            self.__negated_counts.append(-count)
+        self.__cumulative_weights = {}
+
+    @property
+    def rack_size(self):
+        return self.__rack_size
+
+    @property
+    def min_fun_factor(self):
+        return self.__min_fun_factor
+
+    def __len__(self):
+        return len(self.__racks)
+
+    def matches(self, checksum: bytes) -> bool:
+        """Whether the table was built from the corpus with this corpus_checksum (an explorer's checksum)"""
+        return self.__checksum == checksum
+
+    def count(self, fun_factor: int) -> int:
+        """How many racks in the table make at least fun_factor words"""
+        return bisect_right(self.__negated_counts, -fun_factor)
+
+    def sample(self, fun_factor: int, distribution: str, rng=random) -> list[str]:
+        """Draws a rack with at least fun_factor anagram words, with the same probability
+        generate_letters' draw-until-fun loop would have picked it
+
+        Args:
+            fun_factor: minimum number of anagram words, at least min_fun_factor
+            distribution: "uniform" or "scrabble", as in generate_letters
+            rng: source of randomness
+
+        Returns:
+            The rack's letters in random order, or None if no rack makes that many words
+        """
+        if fun_factor < self.__min_fun_factor:
+            raise ValueError(f"the table only holds racks with at least {self.__min_fun_factor} words")
+        if distribution not in self.__cumulative_weights:
+            self.__cumulative_weights[distribution] = list(
+                accumulate(_rack_weight(rack, distribution) for rack in self.__racks)
+            )
+        cumulative = self.__cumulative_weights[distribution]
+
+        # racks are sorted by count, so the qualifying ones are a prefix of the table
+        end = self.count(fun_factor)
+        if end == 0 or cumulative[end - 1] == 0:
+            return None
+        index = bisect_right(cumulative, rng.randrange(cumulative[end - 1]), 0, end)
+        letters = list(self.__racks[index])
+        rng.shuffle(letters)
+        return letters
+
+
+def _resolve(path: str) -> str:
+    """Relative paths are relative to this module's folder"""
+    if not os.path.isabs(path):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), path)
+    return path
+
+
+@lru_cache(maxsize=None)
+def load_rack_table(path: str = TABLE_PATH):
+    """Returns the shared RackTable for a file, or None if there isn't one.
+    Relative paths are relative to this module's folder."""
+    path = _resolve(path)
+    if not os.path.exists(path):
+        return None
+    return RackTable(path)
+
+
+if __name__ == "__main__":
+    # python rack_table.py build   (takes about half a minute for the full word list)
+    from valid_word_list import get_valid_word_list
+    from AnagramExplorer import AnagramExplorer
+
+    if len(sys.argv) == 2 and sys.argv[1] == "build":
+        build_rack_table(AnagramExplorer(get_valid_word_list()), _resolve(TABLE_PATH))
+        table = load_rack_table()
+        print(f"{len(table)} racks with at least {table.min_fun_factor} words")
+        for fun_factor in [25, 50, 75, 100]:
+            print(f"  at least {fun_factor}: {table.count(fun_factor)}")
+    else:
+        print("usage: python rack_table.py build")
@@ -0,0 +1,36 @@
+import pytest
+
+from AnagramExplorer import AnagramExplorer
+
+
+@pytest.fixture(scope="module")
+def explorer():
+    return AnagramExplorer(["rat", "tar", "art", "stop", "pots", "tops"])
+
+
+def test_uppercase_rack_is_lowercased(explorer):
+    assert explorer.is_valid_anagram_pair(("rat", "tar"), ["R", "A", "T"]) is True
+    assert explorer.top_level_checks(["R", "A", "T"], ("rat", "tar")) is True
+
+
+def test_rack_with_a_non_letter_ignores_it(explorer):
+    assert explorer.is_valid_anagram_pair(("rat", "tar"), ["r", "a", "t", "?"]) is True
+    assert explorer.top_level_checks(["r", "a", "t", "?"], check_single_word="art") is True
+    assert explorer.is_valid_anagram_pair(("rat", "tar"), ["r", "a", "?"]) is False
+
+
+def test_rack_with_16_of_one_letter(explorer):
+    letters = ["a"] * 16 + ["r", "t"]
+    assert explorer.is_valid_anagram_pair(("rat", "tar"), letters) is True
+    assert explorer.top_level_checks(letters, ("rat", "art")) is True
+    assert explorer.validate_guesses([("rat", "tar")], letters) == ([("rat", "tar")], [])
+
+
+def test_rack_with_more_than_15_of_one_letter_works_everywhere(explorer):
+    letters = ["a"] * 20 + list("rtspo")
+    assert explorer.get_all_anagrams(letters) == {"rat", "tar", "art", "stop", "pots", "tops"}
+    assert explorer.get_most_anagrams(letters) == "art"
+    assert explorer.is_valid_anagram_pair(("stop", "pots"), letters) is True
+    assert explorer.top_level_checks(letters, ("tops", "stop")) is True
+    assert explorer.top_level_checks(letters, check_single_word="rat") is True
+    assert explorer.validate_guesses([("rat", "tar"), ("tar", "rat")], letters) == ([("rat", "tar")], [("tar", "rat")])
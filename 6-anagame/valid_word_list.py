@@ -1,23860 +1,10 @@
+from lexicon import load_lexicon
+
+
 def get_valid_word_list():
-	return [
-    "aa",
-    "aaa",
-    "aachen",
-    "aaron",
-    "aback",
-    "abacus",
-    "abaft",
-    "abalone",
-    "abandon",
-    "abase",
-    "abased",
-    "abases",
-    "abash",
-    "abashed",
-    "abasing",
-    "abate",
-    "abated",
-    "abates",
-    "abating",
-    "abbess",
-    "abbey",
-    "abbeys",
-    "abbot",
-    "abbots",
-    "abc",
-    "abdomen",
-    "abduct",
-    "abducts",
-    "abe",
-    "abeam",
-    "abed",
-    "abel",
-    "abet",
-    "abets",
-    "abetted",
-    "abettor",
-    "abeyant",
-    "abhor",
-    "abhors",
-    "abide",
-    "abided",
-    "abides",
-    "abiding",
-    "abidjan",
-    "abigail",
-    "ability",
-    "abject",
-    "abjure",
-    "abjured",
-    "abjures",
-    "ablaze",
-    "able",
-    "ablest",
-    "ably",
-    "aboard",
-    "abode",
-    "abodes",
-    "abolish",
-    "abort",
-    "aborted",
-    "aborts",
-    "abound",
-    "abounds",
-    "about",
-    "above",
-    "abrade",
-    "abraded",
-    "abrades",
-    "abraham",
-    "abreast",
-    "abridge",
-    "abroad",
-    "abrupt",
-    "absalom",
-    "abscess",
-    "abscond",
-    "abseil",
-    "abseils",
-    "absence",
-    "absent",
-    "absents",
-    "absolve",
-    "absorb",
-    "absorbs",
-    "abstain",
-    "absurd",
-    "abuse",
-    "abused",
-    "abuser",
-    "abusers",
-    "abuses",
-    "abusing",
-    "abusive",
-    "abut",
-    "abuts",
-    "abutted",
-    "abysmal",
-    "abyss",
-    "abyssal",
-    "acacia",
-    "academe",
-    "academy",
-    "accede",
-    "acceded",
-    "accedes",
-    "accent",
-    "accents",
-    "accept",
-    "accepts",
-    "access",
-    "acclaim",
-    "accord",
-    "accords",
-    "accost",
-    "accosts",
-    "account",
-    "accra",
-    "accrual",
-    "accrue",
-    "accrued",
-    "accrues",
-    "accurse",
-    "accurst",
-    "accusal",
-    "accuse",
-    "accused",
-    "accuser",
-    "accuses",
-    "ace",
-    "acerbic",
-    "aces",
-    "acetate",
-    "acetic",
-    "acetone",
-    "ache",
-    "ached",
-    "aches",
-    "achieve",
-    "aching",
-    "acid",
-    "acidic",
-    "acidify",
-    "acidity",
-    "acids",
-    "acme",
-    "acne",
-    "acolyte",
-    "aconite",
-    "acorn",
-    "acorns",
-    "acquire",
-    "acquit",
-    "acquits",
-    "acre",
-    "acreage",
-    "acres",
-    "acrid",
-    "acrobat",
-    "acronym",
-    "across",
-    "acryl",
-    "acrylic",
-    "act",
-    "acted",
-    "actin",
-    "acting",
-    "action",
-    "actions",
-    "active",
-    "actor",
-    "actors",
-    "actress",
-    "acts",
-    "actual",
-    "actuals",
-    "actuary",
-    "actuate",
-    "acuity",
-    "acumen",
-    "acute",
-    "acutely",
-    "acyclic",
-    "ad",
-    "ada",
-    "adage",
-    "adages",
-    "adagio",
-    "adam",
-    "adamant",
-    "adams",
-    "adamson",
-    "adapt",
-    "adapted",
-    "adapter",
-    "adapts",
-    "add",
-    "added",
-    "addend",
-    "addenda",
-    "adder",
-    "adders",
-    "addict",
-    "addicts",
-    "adding",
-    "addison",
-    "addle",
-    "addled",
-    "addles",
-    "addling",
-    "address",
-    "adds",
-    "adduce",
-    "adduced",
-    "adduces",
-    "aden",
-    "adenoid",
-    "adept",
-    "adeptly",
-    "adhere",
-    "adhered",
-    "adherer",
-    "adheres",
-    "adieu",
-    "adject",
-    "adjoin",
-    "adjoins",
-    "adjoint",
-    "adjourn",
-    "adjudge",
-    "adjunct",
-    "adjure",
-    "adjust",
-    "adjusts",
-    "adler",
-    "adman",
-    "admiral",
-    "admire",
-    "admired",
-    "admirer",
-    "admires",
-    "admit",
-    "admits",
-    "admix",
-    "ado",
-    "adon",
-    "adonis",
-    "adopt",
-    "adopted",
-    "adopts",
-    "adore",
-    "adored",
-    "adorer",
-    "adorers",
-    "adores",
-    "adoring",
-    "adorn",
-    "adorned",
-    "adorns",
-    "adrenal",
-    "adrian",
-    "adrift",
-    "adroit",
-    "adsorb",
-    "adsorbs",
-    "adulate",
-    "adult",
-    "adults",
-    "advance",
-    "advent",
-    "adverb",
-    "adverbs",
-    "adverse",
-    "advert",
-    "adverts",
-    "advice",
-    "advise",
-    "advised",
-    "advisee",
-    "adviser",
-    "advises",
-    "advisor",
-    "aegean",
-    "aegis",
-    "aerate",
-    "aerated",
-    "aerates",
-    "aerator",
-    "aerial",
-    "aerials",
-    "aerobic",
-    "aerosol",
-    "aesop",
-    "afar",
-    "affable",
-    "affably",
-    "affair",
-    "affaire",
-    "affairs",
-    "affect",
-    "affects",
-    "affirm",
-    "affirms",
-    "affix",
-    "affixed",
-    "affixes",
-    "afflict",
-    "afford",
-    "affords",
-    "affray",
-    "affrays",
-    "affront",
-    "afghan",
-    "afghani",
-    "afield",
-    "afire",
-    "aflame",
-    "afloat",
-    "afoot",
-    "afore",
-    "afoul",
-    "afraid",
-    "afresh",
-    "africa",
-    "african",
-    "afro",
-    "aft",
-    "after",
-    "again",
-    "against",
-    "agana",
-    "agape",
-    "agate",
-    "agatha",
-    "age",
-    "aged",
-    "ageless",
-    "agelong",
-    "agency",
-    "agenda",
-    "agendas",
-    "agent",
-    "agents",
-    "ages",
-    "aggress",
-    "aghast",
-    "agile",
-    "agilely",
-    "agility",
-    "aging",
-    "agitate",
-    "agleam",
-    "aglow",
-    "agnes",
-    "ago",
-    "agog",
-    "agonies",
-    "agonize",
-    "agony",
-    "agree",
-    "agreed",
-    "agrees",
-    "aground",
-    "ague",
-    "agues",
-    "ah",
-    "aha",
-    "ahead",
-    "ahem",
-    "ahoy",
-    "aid",
-    "aida",
-    "aide",
-    "aided",
-    "aider",
-    "aiders",
-    "aides",
-    "aiding",
-    "aids",
-    "ail",
-    "ailed",
-    "aileron",
-    "ailing",
-    "ailment",
-    "ails",
-    "aim",
-    "aimed",
-    "aiming",
-    "aimless",
-    "aims",
-    "air",
-    "airdrop",
-    "aired",
-    "airfare",
-    "airflow",
-    "airfoil",
-    "airhole",
-    "airily",
-    "airing",
-    "airless",
-    "airlift",
-    "airline",
-    "airlock",
-    "airmail",
-    "airman",
-    "airmen",
-    "airport",
-    "airpost",
-    "airs",
-    "airship",
-    "airsick",
-    "airwave",
-    "airway",
-    "airways",
-    "airy",
-    "aisle",
-    "aisles",
-    "aitken",
-    "ajar",
-    "ajax",
-    "akimbo",
-    "akin",
-    "al",
-    "alabama",
-    "aladdin",
-    "alamo",
-    "alan",
-    "alarm",
-    "alarmed",
-    "alarms",
-    "alas",
-    "alaska",
-    "albania",
-    "albany",
-    "albeit",
-    "albert",
-    "albino",
-    "albinos",
-    "album",
-    "albumen",
-    "albumin",
-    "albums",
-    "alcazar",
-    "alchemy",
-    "alcohol",
-    "alcove",
-    "alcoves",
-    "alder",
-    "alders",
-    "ale",
-    "alec",
-    "alert",
-    "alerted",
-    "alertly",
-    "alerts",
-    "ales",
-    "alex",
-    "alfalfa",
-    "alfred",
-    "algae",
-    "algebra",
-    "algeria",
-    "algiers",
-    "alias",
-    "aliases",
-    "alibi",
-    "alibis",
-    "alice",
-    "alicia",
-    "alien",
-    "aliens",
-    "alight",
-    "alights",
-    "align",
-    "aligned",
-    "aligns",
-    "alike",
-    "alimony",
-    "alison",
-    "alit",
-    "alive",
-    "alkali",
-    "alkalis",
-    "all",
-    "allan",
-    "allay",
-    "allayed",
-    "allays",
-    "allege",
-    "alleged",
-    "alleges",
-    "allegro",
-    "allergy",
-    "alley",
-    "alleys",
-    "allied",
-    "allies",
-    "allison",
-    "allot",
-    "allots",
-    "allow",
-    "allowed",
-    "allows",
-    "alloy",
-    "alloyed",
-    "alloys",
-    "allude",
-    "alluded",
-    "alludes",
-    "allure",
-    "allured",
-    "allures",
-    "ally",
-    "allying",
-    "alm",
-    "almanac",
-    "almond",
-    "almonds",
-    "almoner",
-    "almost",
-    "alms",
-    "aloft",
-    "aloha",
-    "alone",
-    "along",
-    "aloof",
-    "aloofly",
-    "aloud",
-    "alp",
-    "alpha",
-    "alpine",
-    "alps",
-    "already",
-    "alright",
-    "also",
-    "altar",
-    "altars",
-    "alter",
-    "altered",
-    "alters",
-    "alto",
-    "altos",
-    "alum",
-    "alumni",
-    "alumnus",
-    "alvin",
-    "always",
-    "am",
-    "amadeus",
-    "amain",
-    "amalgam",
-    "amanda",
-    "amass",
-    "amassed",
-    "amasses",
-    "amateur",
-    "amaze",
-    "amazed",
-    "amazes",
-    "amazing",
-    "amazon",
-    "amber",
-    "ambient",
-    "ambit",
-    "amble",
-    "ambled",
-    "ambler",
-    "ambles",
-    "ambling",
-    "ambush",
-    "ameba",
-    "amebic",
-    "amen",
-    "amend",
-    "amended",
-    "amends",
-    "amenity",
-    "america",
-    "amharic",
-    "amiable",
-    "amiably",
-    "amid",
-    "amidst",
-    "amine",
-    "amines",
-    "amino",
-    "amiss",
-    "amissa",
-    "amity",
-    "amman",
-    "ammeter",
-    "ammonia",
-    "amnesia",
-    "amnesty",
-    "amoebae",
-    "amok",
-    "among",
-    "amongst",
-    "amoral",
-    "amorous",
-    "amos",
-    "amount",
-    "amounts",
-    "amour",
-    "amp",
-    "ampere",
-    "amperes",
-    "amphora",
-    "ample",
-    "amplify",
-    "amply",
-    "ampoule",
-    "amps",
-    "amputee",
-    "amsted",
-    "amtrak",
-    "amuck",
-    "amulet",
-    "amulets",
-    "amuse",
-    "amused",
-    "amuses",
-    "amusing",
-    "amy",
-    "an",
-    "anagram",
-    "analog",
-    "analogy",
-    "analyst",
-    "analyze",
-    "anarchy",
-    "anatomy",
-    "anchor",
-    "anchors",
-    "anchovy",
-    "ancient",
-    "and",
-    "andante",
-    "andes",
-    "andorra",
-    "andover",
-    "andre",
-    "andrea",
-    "andrew",
-    "andrews",
-    "android",
-    "andy",
-    "anemia",
-    "anemic",
-    "anemone",
-    "anew",
-    "angel",
-    "angela",
-    "angelic",
-    "angels",
-    "anger",
-    "angered",
-    "angers",
-    "angina",
-    "anginal",
-    "angle",
-    "angled",
-    "angler",
-    "anglers",
-    "angles",
-    "angliae",
-    "angling",
-    "anglo",
-    "angola",
-    "angolan",
-    "angora",
-    "angrier",
-    "angrily",
-    "angry",
-    "angst",
-    "anguish",
-    "angular",
-    "angus",
-    "aniline",
-    "animal",
-    "animals",
-    "animate",
-    "animism",
-    "animist",
-    "animus",
-    "anise",
-    "aniseed",
-    "anita",
-    "ankara",
-    "ankle",
-    "ankles",
-    "anklet",
-    "anklets",
-    "ann",
-    "anna",
-    "annals",
-    "anne",
-    "anneal",
-    "annette",
-    "annex",
-    "annexed",
-    "annexes",
-    "annie",
-    "annoy",
-    "annoyed",
-    "annoys",
-    "annual",
-    "annuals",
-    "annuity",
-    "annul",
-    "annular",
-    "annuli",
-    "annuls",
-    "annulus",
-    "annum",
-    "anode",
-    "anodes",
-    "anodic",
-    "anodyne",
-    "anoint",
-    "anoints",
-    "anomaly",
-    "anomie",
-    "anon",
-    "anonyme",
-    "anorak",
-    "anoraks",
-    "another",
-    "answer",
-    "answers",
-    "ant",
-    "antacid",
-    "ante",
-    "antenna",
-    "anthem",
-    "anthems",
-    "anthill",
-    "anthony",
-    "anthrax",
-    "anti",
-    "antic",
-    "antics",
-    "antigen",
-    "antigua",
-    "antique",
-    "antler",
-    "antlers",
-    "anton",
-    "antonio",
-    "antony",
-    "antonym",
-    "antrim",
-    "ants",
-    "antwerp",
-    "anus",
-    "anuses",
-    "anvil",
-    "anvils",
-    "anxiety",
-    "anxious",
-    "any",
-    "anybody",
-    "anyhow",
-    "anymore",
-    "anyone",
-    "anytime",
-    "anyway",
-    "aorta",
-    "aortae",
-    "aortas",
-    "aortic",
-    "apace",
-    "apache",
-    "apaches",
-    "apart",
-    "apathy",
-    "ape",
-    "aped",
-    "apes",
-    "apex",
-    "apexes",
-    "aphasia",
-    "aphelia",
-    "aphid",
-    "aphids",
-    "apia",
-    "apiary",
-    "apiece",
-    "aping",
-    "apish",
-    "apishly",
-    "aplomb",
-    "apogee",
-    "apollo",
-    "apology",
-    "apostle",
-    "appall",
-    "appalls",
-    "apparel",
-    "appeal",
-    "appeals",
-    "appear",
-    "appears",
-    "appease",
-    "append",
-    "appends",
-    "applaud",
-    "apple",
-    "apples",
-    "applied",
-    "applies",
-    "apply",
-    "appoint",
-    "apprise",
-    "approve",
-    "apricot",
-    "april",
-    "apron",
-    "aprons",
-    "apropos",
-    "apse",
-    "apt",
-    "aptly",
-    "aptness",
-    "aqua",
-    "aquaria",
-    "aquatic",
-    "aqueous",
-    "aquifer",
-    "aquinas",
-    "arab",
-    "arabia",
-    "arabian",
-    "arabic",
-    "arable",
-    "arabs",
-    "arbiter",
-    "arbor",
-    "arbors",
-    "arc",
-    "arcade",
-    "arcaded",
-    "arcades",
-    "arcane",
-    "arced",
-    "arch",
-    "archaic",
-    "arched",
-    "archer",
-    "archers",
-    "archery",
-    "arches",
-    "archie",
-    "arching",
-    "archive",
-    "archly",
-    "archway",
-    "arcing",
-    "arcs",
-    "arcsin",
-    "arcsine",
-    "arctan",
-    "arctic",
-    "arden",
-    "ardent",
-    "ardor",
-    "arduous",
-    "are",
-    "area",
-    "areas",
-    "areaway",
-    "arena",
-    "arenas",
-    "argent",
-    "argh",
-    "argon",
-    "argos",
-    "argot",
-    "argue",
-    "argued",
-    "argues",
-    "arguing",
-    "argus",
-    "argyle",
-    "argyll",
-    "aria",
-    "arias",
-    "arid",
-    "aridity",
-    "aries",
-    "aright",
-    "aril",
-    "arise",
-    "arisen",
-    "arises",
-    "arising",
-    "arizona",
-    "ark",
-    "arks",
-    "arm",
-    "armada",
-    "armadas",
-    "armband",
-    "armed",
-    "armenia",
-    "armful",
-    "armhole",
-    "armies",
-    "arming",
-    "armless",
-    "armlet",
-    "armoire",
-    "armor",
-    "armored",
-    "armors",
-    "armory",
-    "armpit",
-    "armpits",
-    "armrest",
-    "arms",
-    "army",
-    "arnold",
-    "aroma",
-    "aromas",
-    "arose",
-    "around",
-    "arousal",
-    "arouse",
-    "aroused",
-    "arouses",
-    "arraign",
-    "arrange",
-    "arrant",
-    "array",
-    "arrayed",
-    "arrays",
-    "arrear",
-    "arrears",
-    "arrest",
-    "arrests",
-    "arrival",
-    "arrive",
-    "arrived",
-    "arrives",
-    "arrow",
-    "arrowed",
-    "arrows",
-    "arsenal",
-    "arsenic",
-    "arson",
-    "art",
-    "artery",
-    "artful",
-    "arthur",
-    "article",
-    "artily",
-    "artisan",
-    "artist",
-    "artiste",
-    "artists",
-    "artless",
-    "arts",
-    "artwork",
-    "arty",
-    "aruba",
-    "arvin",
-    "aryan",
-    "as",
-    "ascend",
-    "ascends",
-    "ascent",
-    "ascents",
-    "ascetic",
-    "ascii",
-    "ascot",
-    "ascribe",
-    "aseptic",
-    "asexual",
-    "ash",
-    "ashame",
-    "ashamed",
-    "ashen",
-    "ashes",
-    "ashley",
-    "ashore",
-    "ashton",
-    "ashtray",
-    "ashy",
-    "asia",
-    "asian",
-    "asians",
-    "asiatic",
-    "aside",
-    "asides",
-    "asimov",
-    "asinine",
-    "ask",
-    "askance",
-    "asked",
-    "asker",
-    "askers",
-    "askew",
-    "asking",
-    "asks",
-    "aslant",
-    "asleep",
-    "asocial",
-    "asp",
-    "aspect",
-    "aspects",
-    "aspen",
-    "asphalt",
-    "aspic",
-    "aspire",
-    "aspired",
-    "aspires",
-    "aspirin",
-    "asps",
-    "asquith",
-    "assail",
-    "assails",
-    "assam",
-    "assault",
-    "assay",
-    "assayed",
-    "assays",
-    "assent",
-    "assents",
-    "assert",
-    "asserts",
-    "asses",
-    "assess",
-    "asset",
-    "assets",
-    "assign",
-    "assigns",
-    "assist",
-    "assists",
-    "assize",
-    "assizes",
-    "assort",
-    "assuage",
-    "assume",
-    "assumed",
-    "assumes",
-    "assure",
-    "assured",
-    "assurer",
-    "assures",
-    "assyria",
-    "aster",
-    "asteria",
-    "astern",
-    "asters",
-    "asthma",
-    "astir",
-    "astoria",
-    "astound",
-    "astral",
-    "astray",
-    "astrid",
-    "astride",
-    "astute",
-    "asunder",
-    "asylum",
-    "asylums",
-    "at",
-    "atavism",
-    "ate",
-    "atelier",
-    "atheism",
-    "atheist",
-    "athena",
-    "athens",
-    "athirst",
-    "athlete",
-    "athwart",
-    "atilt",
-    "atkins",
-    "atlanta",
-    "atlas",
-    "atlases",
-    "atoll",
-    "atolls",
-    "atom",
-    "atomic",
-    "atomics",
-    "atomize",
-    "atoms",
-    "atonal",
-    "atone",
-    "atoned",
-    "atones",
-    "atonic",
-    "atoning",
-    "atop",
-    "atrium",
-    "atriums",
-    "atrophy",
-    "attach",
-    "attache",
-    "attack",
-    "attacks",
-    "attain",
-    "attains",
-    "attaint",
-    "attempt",
-    "attend",
-    "attends",
-    "attest",
-    "attests",
-    "attic",
-    "attics",
-    "attire",
-    "attired",
-    "attires",
-    "attract",
-    "attune",
-    "attuned",
-    "attunes",
-    "au",
-    "aubrey",
-    "auburn",
-    "auction",
-    "audible",
-    "audibly",
-    "audio",
-    "audit",
-    "audited",
-    "auditor",
-    "audits",
-    "audrey",
-    "auger",
-    "aught",
-    "augment",
-    "augur",
-    "augured",
-    "augurs",
-    "augury",
-    "august",
-    "augusts",
-    "auk",
-    "auks",
-    "auld",
-    "aunt",
-    "auntie",
-    "aunts",
-    "aura",
-    "aural",
-    "aurally",
-    "auras",
-    "auricle",
-    "aurora",
-    "auspice",
-    "austen",
-    "austere",
-    "austin",
-    "austral",
-    "austria",
-    "author",
-    "authors",
-    "autism",
-    "auto",
-    "autocue",
-    "automat",
-    "autopsy",
-    "autos",
-    "autumn",
-    "autumns",
-    "avail",
-    "availed",
-    "avails",
-    "avant",
-    "avarice",
-    "avenge",
-    "avenged",
-    "avenger",
-    "avenges",
-    "avenue",
-    "avenues",
-    "aver",
-    "average",
-    "averred",
-    "avers",
-    "averse",
-    "avert",
-    "averted",
-    "averts",
-    "avery",
-    "aviary",
-    "aviate",
-    "aviated",
-    "aviates",
-    "aviator",
-    "avid",
-    "avidity",
-    "avidly",
-    "avocado",
-    "avocat",
-    "avocet",
-    "avocets",
-    "avoid",
-    "avoided",
-    "avoids",
-    "avon",
-    "avow",
-    "avowal",
-    "avowed",
-    "avowing",
-    "avows",
-    "await",
-    "awaited",
-    "awaits",
-    "awake",
-    "awaked",
-    "awaken",
-    "awakens",
-    "awakes",
-    "awaking",
-    "award",
-    "awarded",
-    "awards",
-    "aware",
-    "awash",
-    "away",
-    "awe",
-    "aweary",
-    "awed",
-    "aweigh",
-    "awes",
-    "awesome",
-    "awful",
-    "awfully",
-    "awhile",
-    "awhirl",
-    "awing",
-    "awkward",
-    "awl",
-    "awls",
-    "awn",
-    "awning",
-    "awnings",
-    "awoke",
-    "awoken",
-    "awol",
-    "awry",
-    "ax",
-    "axed",
-    "axes",
-    "axial",
-    "axially",
-    "axing",
-    "axiom",
-    "axioms",
-    "axis",
-    "axle",
-    "axles",
-    "ay",
-    "aye",
-    "ayes",
-    "azalea",
-    "azaleas",
-    "azimuth",
-    "azonal",
-    "azores",
-    "aztec",
-    "azure",
-    "ba",
-    "baba",
-    "babble",
-    "babbled",
-    "babbler",
-    "babbles",
-    "babe",
-    "babes",
-    "babies",
-    "baboon",
-    "baboons",
-    "baby",
-    "babyish",
-    "babylon",
-    "babysat",
-    "babysit",
-    "bacardi",
-    "bacchus",
-    "bach",
-    "bacilli",
-    "back",
-    "backed",
-    "backer",
-    "backers",
-    "backing",
-    "backlog",
-    "backs",
-    "backup",
-    "backups",
-    "bacon",
-    "bad",
-    "bade",
-    "badge",
-    "badged",
-    "badger",
-    "badgers",
-    "badges",
-    "badging",
-    "badly",
-    "badness",
-    "baffin",
-    "baffle",
-    "baffled",
-    "baffles",
-    "bag",
-    "bagel",
-    "bagful",
-    "bagfuls",
-    "baggage",
-    "bagged",
-    "baggier",
-    "baggily",
-    "bagging",
-    "baggy",
-    "baghdad",
-    "bagman",
-    "bagmen",
-    "bagpipe",
-    "bags",
-    "bah",
-    "bahaman",
-    "bahamas",
-    "bahrain",
-    "bahrein",
-    "bail",
-    "bailed",
-    "bailee",
-    "bailey",
-    "bailiff",
-    "bailing",
-    "bails",
-    "bait",
-    "baited",
-    "baiting",
-    "baits",
-    "baize",
-    "bake",
-    "baked",
-    "baker",
-    "bakers",
-    "bakery",
-    "bakes",
-    "baking",
-    "balance",
-    "balcony",
-    "bald",
-    "balder",
-    "baldest",
-    "balding",
-    "baldish",
-    "baldly",
-    "baldwin",
-    "bale",
-    "baleful",
-    "baler",
-    "balers",
-    "bales",
-    "balfour",
-    "bali",
-    "balk",
-    "balkan",
-    "balkans",
-    "balked",
-    "balkier",
-    "balking",
-    "balks",
-    "balky",
-    "ball",
-    "ballad",
-    "ballads",
-    "ballast",
-    "ballet",
-    "ballets",
-    "balloon",
-    "ballot",
-    "ballots",
-    "balls",
-    "balm",
-    "balmier",
-    "balms",
-    "balmy",
-    "baloney",
-    "balsa",
-    "balsam",
-    "balsams",
-    "baltic",
-    "balzac",
-    "bamako",
-    "bambi",
-    "bamboo",
-    "ban",
-    "banal",
-    "banana",
-    "bananas",
-    "banco",
-    "bancos",
-    "band",
-    "bandage",
-    "banded",
-    "bandied",
-    "banding",
-    "bandit",
-    "bandits",
-    "bands",
-    "bandy",
-    "bane",
-    "baneful",
-    "banff",
-    "bang",
-    "banged",
-    "banging",
-    "bangkok",
-    "bangle",
-    "bangled",
-    "bangles",
-    "bangor",
-    "bangs",
-    "bangui",
-    "banish",
-    "banjo",
-    "banjos",
-    "banjul",
-    "bank",
-    "banked",
-    "banker",
-    "bankers",
-    "banking",
-    "banks",
-    "banned",
-    "banner",
-    "banners",
-    "banning",
-    "banns",
-    "banquet",
-    "bans",
-    "banshee",
-    "bantam",
-    "bantams",
-    "banter",
-    "banters",
-    "bantu",
-    "baptism",
-    "baptist",
-    "baptize",
-    "bar",
-    "barb",
-    "barbara",
-    "barbed",
-    "barbell",
-    "barber",
-    "barbers",
-    "barbs",
-    "bard",
-    "bards",
-    "bare",
-    "bared",
-    "barely",
-    "bares",
-    "barest",
-    "bargain",
-    "barge",
-    "barged",
-    "barges",
-    "barging",
-    "baring",
-    "barium",
-    "bark",
-    "barked",
-    "barker",
-    "barking",
-    "barks",
-    "barley",
-    "barmaid",
-    "barman",
-    "barmen",
-    "barn",
-    "barnard",
-    "barns",
-    "baron",
-    "baronet",
-    "barons",
-    "barony",
-    "baroque",
-    "barrack",
-    "barrage",
-    "barred",
-    "barrel",
-    "barrels",
-    "barren",
-    "barrens",
-    "barrier",
-    "barring",
-    "barrio",
-    "barroom",
-    "barrow",
-    "barrows",
-    "barry",
-    "bars",
-    "bart",
-    "barter",
-    "barters",
-    "bartok",
-    "basal",
-    "basalt",
-    "base",
-    "based",
-    "basel",
-    "basely",
-    "baser",
-    "bases",
-    "basest",
-    "bash",
-    "bashed",
-    "bashes",
-    "bashful",
-    "bashing",
-    "basic",
-    "basics",
-    "basil",
-    "basin",
-    "basing",
-    "basins",
-    "basis",
-    "bask",
-    "basked",
-    "basket",
-    "baskets",
-    "basking",
-    "basks",
-    "basle",
-    "basque",
-    "basra",
-    "bass",
-    "basses",
-    "bassoon",
-    "bast",
-    "baste",
-    "basted",
-    "bastes",
-    "basting",
-    "bastion",
-    "bat",
-    "bata",
-    "batavia",
-    "batch",
-    "batches",
-    "bate",
-    "bateau",
-    "bateaux",
-    "bated",
-    "bates",
-    "bath",
-    "bathe",
-    "bathed",
-    "bather",
-    "bathers",
-    "bathes",
-    "bathing",
-    "bathos",
-    "baths",
-    "bathtub",
-    "bating",
-    "batman",
-    "batmen",
-    "baton",
-    "batons",
-    "bats",
-    "batted",
-    "battel",
-    "batten",
-    "battens",
-    "batter",
-    "batters",
-    "battery",
-    "batting",
-    "battle",
-    "battled",
-    "battles",
-    "batty",
-    "bauble",
-    "baubles",
-    "baud",
-    "baulk",
-    "baulked",
-    "baulks",
-    "bauxite",
-    "bavaria",
-    "bawd",
-    "bawdier",
-    "bawdily",
-    "bawds",
-    "bawdy",
-    "bawl",
-    "bawled",
-    "bawling",
-    "bawls",
-    "baxter",
-    "bay",
-    "baying",
-    "bayonet",
-    "bayou",
-    "bays",
-    "bazaar",
-    "bazaars",
-    "bazooka",
-    "bbc",
-    "bc",
-    "be",
-    "beach",
-    "beached",
-    "beaches",
-    "beacon",
-    "beacons",
-    "bead",
-    "beaded",
-    "beadier",
-    "beading",
-    "beadle",
-    "beadles",
-    "beads",
-    "beady",
-    "beagle",
-    "beagles",
-    "beak",
-    "beaker",
-    "beakers",
-    "beaks",
-    "beam",
-    "beamed",
-    "beaming",
-    "beams",
-    "bean",
-    "beanies",
-    "beans",
-    "bear",
-    "beard",
-    "bearded",
-    "beards",
-    "bearer",
-    "bearers",
-    "bearing",
-    "bearish",
-    "bears",
-    "beast",
-    "beastly",
-    "beasts",
-    "beat",
-    "beaten",
-    "beater",
-    "beaters",
-    "beatify",
-    "beating",
-    "beatnik",
-    "beats",
-    "beau",
-    "beauty",
-    "beaux",
-    "beaver",
-    "beavers",
-    "bebop",
-    "becalm",
-    "becalms",
-    "became",
-    "because",
-    "beck",
-    "beckon",
-    "beckons",
-    "become",
-    "becomes",
-    "bed",
-    "bedaub",
-    "bedaubs",
-    "bedbug",
-    "bedbugs",
-    "bedded",
-    "bedding",
-    "bedeck",
-    "bedecks",
-    "bedevil",
-    "bedewed",
-    "bedlam",
-    "bedouin",
-    "bedpan",
-    "bedpans",
-    "bedpost",
-    "bedrock",
-    "bedroll",
-    "bedroom",
-    "beds",
-    "bedside",
-    "bedsore",
-    "bedtime",
-    "bee",
-    "beech",
-    "beeches",
-    "beef",
-    "beefed",
-    "beefier",
-    "beefs",
-    "beefy",
-    "beehive",
-    "beeline",
-    "been",
-    "beep",
-    "beeped",
-    "beeper",
-    "beepers",
-    "beeping",
-    "beeps",
-    "beer",
-    "beers",
-    "bees",
-    "beeswax",
-    "beet",
-    "beetle",
-    "beetled",
-    "beetles",
-    "beets",
-    "befall",
-    "befalls",
-    "befell",
-    "befit",
-    "befits",
-    "befog",
-    "before",
-    "befoul",
-    "befouls",
-    "beg",
-    "began",
-    "beget",
-    "beggar",
-    "beggars",
-    "beggary",
-    "begged",
-    "begging",
-    "begin",
-    "begins",
-    "begonia",
-    "begot",
-    "begs",
-    "beguile",
-    "begun",
-    "behalf",
-    "behave",
-    "behaved",
-    "behaves",
-    "behead",
-    "beheads",
-    "beheld",
-    "behest",
-    "behind",
-    "behinds",
-    "behold",
-    "beholds",
-    "behoof",
-    "behoove",
-    "beige",
-    "beijing",
-    "being",
-    "beings",
-    "beirut",
-    "belabor",
-    "belated",
-    "belay",
-    "belayed",
-    "belays",
-    "belch",
-    "belched",
-    "belches",
-    "belfast",
-    "belfry",
-    "belgian",
-    "belgium",
-    "belie",
-    "belied",
-    "belief",
-    "beliefs",
-    "belies",
-    "believe",
-    "belinda",
-    "belize",
-    "bell",
-    "bellboy",
-    "belle",
-    "belles",
-    "bellhop",
-    "bellied",
-    "bellies",
-    "bello",
-    "bellow",
-    "bellows",
-    "bells",
-    "belly",
-    "belong",
-    "belongs",
-    "beloved",
-    "below",
-    "belt",
-    "belted",
-    "belting",
-    "belts",
-    "belying",
-    "bemire",
-    "bemoan",
-    "bemoans",
-    "bemock",
-    "bemuse",
-    "bemused",
-    "bemuses",
-    "ben",
-    "bench",
-    "benched",
-    "benches",
-    "bend",
-    "bender",
-    "benders",
-    "bending",
-    "bends",
-    "beneath",
-    "benefit",
-    "benelux",
-    "bengal",
-    "bengali",
-    "benign",
-    "benin",
-    "bennett",
-    "bent",
-    "bentley",
-    "benumb",
-    "benumbs",
-    "benzene",
-    "beowulf",
-    "bequest",
-    "berate",
-    "berated",
-    "berates",
-    "berber",
-    "bereave",
-    "bereft",
-    "beret",
-    "berets",
-    "berg",
-    "bergen",
-    "bergs",
-    "bering",
-    "berlin",
-    "berlioz",
-    "bermuda",
-    "bern",
-    "bernard",
-    "bernie",
-    "berries",
-    "berry",
-    "berserk",
-    "bert",
-    "berth",
-    "bertha",
-    "berthed",
-    "berths",
-    "bertie",
-    "bertram",
-    "beryl",
-    "beseech",
-    "beset",
-    "besets",
-    "beside",
-    "besides",
-    "besiege",
-    "besmear",
-    "bespeak",
-    "bespoke",
-    "bess",
-    "best",
-    "bested",
-    "bestial",
-    "bestir",
-    "bestirs",
-    "bestow",
-    "bestows",
-    "bests",
-    "bet",
-    "beta",
-    "betel",
-    "beth",
-    "bethink",
-    "betide",
-    "betimes",
-    "betoken",
-    "betray",
-    "betrays",
-    "betroth",
-    "bets",
-    "betsy",
-    "betted",
-    "better",
-    "betters",
-    "betting",
-    "betty",
-    "between",
-    "betwixt",
-    "bevel",
-    "beveled",
-    "bevels",
-    "beverly",
-    "bevies",
-    "bevy",
-    "bewail",
-    "beware",
-    "bewitch",
-    "beyond",
-    "bhutan",
-    "bi",
-    "bias",
-    "biased",
-    "biases",
-    "biasing",
-    "biassed",
-    "bib",
-    "bible",
-    "bibles",
-    "bibs",
-    "biceps",
-    "bicker",
-    "bickers",
-    "bicycle",
-    "bid",
-    "bidden",
-    "bidder",
-    "bidders",
-    "biddies",
-    "bidding",
-    "biddy",
-    "bide",
-    "bided",
-    "bides",
-    "bidet",
-    "biding",
-    "bids",
-    "bier",
-    "biers",
-    "bifocal",
-    "big",
-    "bigamy",
-    "bigger",
-    "biggest",
-    "bighorn",
-    "bight",
-    "bights",
-    "bigness",
-    "bigot",
-    "bigoted",
-    "bigotry",
-    "bigots",
-    "bigwig",
-    "bigwigs",
-    "bike",
-    "biked",
-    "bikes",
-    "biking",
-    "bikini",
-    "bikinis",
-    "bile",
-    "bilge",
-    "bilges",
-    "bilious",
-    "bilked",
-    "bill",
-    "billed",
-    "billet",
-    "billets",
-    "billing",
-    "billion",
-    "billow",
-    "billows",
-    "billowy",
-    "bills",
-    "billy",
-    "bimodal",
-    "bin",
-    "binary",
-    "bind",
-    "binder",
-    "binders",
-    "bindery",
-    "binding",
-    "binds",
-    "binge",
-    "binged",
-    "binges",
-    "bingo",
-    "bins",
-    "biology",
-    "biomes",
-    "bionic",
-    "biopsy",
-    "bios",
-    "biotic",
-    "biped",
-    "bipeds",
-    "biplane",
-    "bipolar",
-    "birch",
-    "birches",
-    "bird",
-    "birdie",
-    "birdied",
-    "birdies",
-    "birdman",
-    "birdmen",
-    "birds",
-    "birth",
-    "birthed",
-    "births",
-    "biscuit",
-    "bisect",
-    "bisects",
-    "bishop",
-    "bishops",
-    "bismuth",
-    "bison",
-    "bisons",
-    "bisque",
-    "bissau",
-    "bistro",
-    "bistros",
-    "bit",
-    "bite",
-    "biter",
-    "biters",
-    "bites",
-    "biting",
-    "bits",
-    "bitten",
-    "bitter",
-    "bittern",
-    "bitters",
-    "bitty",
-    "bitumen",
-    "bivouac",
-    "bizarre",
-    "blab",
-    "blabbed",
-    "blabber",
-    "blabs",
-    "black",
-    "blacked",
-    "blacken",
-    "bladder",
-    "blade",
-    "bladed",
-    "blades",
-    "blake",
-    "blame",
-    "blamed",
-    "blames",
-    "blaming",
-    "blanch",
-    "bland",
-    "blandly",
-    "blank",
-    "blanked",
-    "blanket",
-    "blankly",
-    "blanks",
-    "blare",
-    "blared",
-    "blares",
-    "blaring",
-    "blarney",
-    "blase",
-    "blast",
-    "blasted",
-    "blasts",
-    "blatant",
-    "blather",
-    "blaze",
-    "blazed",
-    "blazer",
-    "blazers",
-    "blazes",
-    "blazing",
-    "blazon",
-    "bleach",
-    "bleak",
-    "bleaker",
-    "bleakly",
-    "blear",
-    "bleared",
-    "blears",
-    "bleary",
-    "bleat",
-    "bleated",
-    "bleats",
-    "bled",
-    "bleed",
-    "bleeder",
-    "bleeds",
-    "bleep",
-    "bleeped",
-    "bleeps",
-    "blemish",
-    "blench",
-    "blend",
-    "blended",
-    "blender",
-    "blends",
-    "bless",
-    "blessed",
-    "blesses",
-    "blest",
-    "blew",
-    "blight",
-    "blights",
-    "blimp",
-    "blimps",
-    "blind",
-    "blinded",
-    "blindly",
-    "blinds",
-    "blink",
-    "blinked",
-    "blinker",
-    "blinks",
-    "blip",
-    "blips",
-    "bliss",
-    "blister",
-    "blithe",
-    "blither",
-    "blitz",
-    "blitzes",
-    "bloat",
-    "bloated",
-    "bloats",
-    "blob",
-    "blobs",
-    "bloc",
-    "block",
-    "blocked",
-    "blocks",
-    "bloke",
-    "blokes",
-    "blond",
-    "blonde",
-    "blondes",
-    "blood",
-    "blooded",
-    "bloods",
-    "bloody",
-    "bloom",
-    "bloomed",
-    "blooms",
-    "blooper",
-    "blossom",
-    "blot",
-    "blotch",
-    "blotchy",
-    "blots",
-    "blotted",
-    "blotter",
-    "blouse",
-    "blouses",
-    "blouson",
-    "blow",
-    "blower",
-    "blowers",
-    "blowfly",
-    "blowgun",
-    "blowing",
-    "blown",
-    "blowout",
-    "blows",
-    "blowup",
-    "blowzy",
-    "blubber",
-    "blue",
-    "blues",
-    "bluest",
-    "bluff",
-    "bluffed",
-    "bluffer",
-    "bluffs",
-    "bluish",
-    "blunder",
-    "blunt",
-    "blunted",
-    "blunter",
-    "bluntly",
-    "blunts",
-    "blur",
-    "blurb",
-    "blurred",
-    "blurry",
-    "blurs",
-    "blurt",
-    "blurted",
-    "blurts",
-    "blush",
-    "blushed",
-    "blusher",
-    "blushes",
-    "bluster",
-    "bo",
-    "boa",
-    "boar",
-    "board",
-    "boarded",
-    "boarder",
-    "boards",
-    "boars",
-    "boas",
-    "boast",
-    "boasted",
-    "boaster",
-    "boasts",
-    "boat",
-    "boater",
-    "boaters",
-    "boating",
-    "boatman",
-    "boatmen",
-    "boats",
-    "bob",
-    "bobbed",
-    "bobbie",
-    "bobbies",
-    "bobbin",
-    "bobbing",
-    "bobbins",
-    "bobble",
-    "bobbled",
-    "bobbles",
-    "bobby",
-    "bobcat",
-    "bobcats",
-    "bobs",
-    "bobsled",
-    "bode",
-    "boded",
-    "bodes",
-    "bodice",
-    "bodices",
-    "bodied",
-    "bodies",
-    "bodily",
-    "boding",
-    "bods",
-    "body",
-    "boeing",
-    "boer",
-    "boers",
-    "bog",
-    "bogey",
-    "bogeyed",
-    "bogeys",
-    "bogged",
-    "bogging",
-    "boggle",
-    "boggled",
-    "boggles",
-    "boggy",
-    "bogie",
-    "bogies",
-    "bogota",
-    "bogs",
-    "bogus",
-    "bogy",
-    "bohemia",
-    "boil",
-    "boiled",
-    "boiler",
-    "boilers",
-    "boiling",
-    "boils",
-    "bold",
-    "bolder",
-    "boldest",
-    "boldly",
-    "bolero",
-    "bolivia",
-    "bollard",
-    "bologna",
-    "bolster",
-    "bolt",
-    "bolted",
-    "bolting",
-    "bolts",
-    "bomb",
-    "bombard",
-    "bombast",
-    "bombay",
-    "bombed",
-    "bomber",
-    "bombers",
-    "bombing",
-    "bombs",
-    "bonanza",
-    "bonbon",
-    "bonbons",
-    "bond",
-    "bondage",
-    "bonded",
-    "bonding",
-    "bonds",
-    "bone",
-    "boned",
-    "boner",
-    "bones",
-    "bonfire",
-    "bong",
-    "bongo",
-    "boning",
-    "bonn",
-    "bonnet",
-    "bonnets",
-    "bonny",
-    "bonsai",
-    "bonus",
-    "bonuses",
-    "bony",
-    "boo",
-    "boob",
-    "boobs",
-    "booby",
-    "booed",
-    "boogie",
-    "boogied",
-    "booing",
-    "book",
-    "booked",
-    "bookend",
-    "bookful",
-    "bookie",
-    "bookies",
-    "booking",
-    "bookish",
-    "booklet",
-    "books",
-    "boolean",
-    "boom",
-    "boomed",
-    "booming",
-    "booms",
-    "boon",
-    "boons",
-    "boor",
-    "boorish",
-    "boors",
-    "boos",
-    "boost",
-    "boosted",
-    "booster",
-    "boosts",
-    "boot",
-    "booted",
-    "bootee",
-    "bootees",
-    "booth",
-    "booths",
-    "bootie",
-    "booting",
-    "bootleg",
-    "boots",
-    "booty",
-    "booze",
-    "boozed",
-    "boozer",
-    "boozers",
-    "boozes",
-    "boozing",
-    "boozy",
-    "bop",
-    "bopping",
-    "borate",
-    "borates",
-    "borax",
-    "border",
-    "borders",
-    "bore",
-    "bored",
-    "boredom",
-    "borer",
-    "bores",
-    "boring",
-    "boris",
-    "born",
-    "borne",
-    "borneo",
-    "borodin",
-    "boron",
-    "borough",
-    "borrow",
-    "borrows",
-    "bosh",
-    "bosom",
-    "bosoms",
-    "bosomy",
-    "boss",
-    "bossed",
-    "bosses",
-    "bossier",
-    "bossily",
-    "bossing",
-    "bossy",
-    "boston",
-    "bosun",
-    "bosuns",
-    "botanic",
-    "botany",
-    "botch",
-    "botched",
-    "botches",
-    "botfly",
-    "both",
-    "bother",
-    "bothers",
-    "bottle",
-    "bottled",
-    "bottler",
-    "bottles",
-    "bottom",
-    "bottoms",
-    "boudoir",
-    "bough",
-    "boughs",
-    "bought",
-    "boulder",
-    "bounce",
-    "bounced",
-    "bouncer",
-    "bounces",
-    "bouncy",
-    "bound",
-    "bounded",
-    "bounder",
-    "bounds",
-    "bounty",
-    "bouquet",
-    "bourbon",
-    "bout",
-    "bouts",
-    "bovine",
-    "bovines",
-    "bow",
-    "bowed",
-    "bowel",
-    "bowels",
-    "bower",
-    "bowers",
-    "bowfin",
-    "bowie",
-    "bowing",
-    "bowl",
-    "bowled",
-    "bowler",
-    "bowlers",
-    "bowlful",
-    "bowline",
-    "bowling",
-    "bowls",
-    "bowman",
-    "bowmen",
-    "bowmore",
-    "bows",
-    "box",
-    "boxcar",
-    "boxcars",
-    "boxed",
-    "boxer",
-    "boxers",
-    "boxes",
-    "boxing",
-    "boxwood",
-    "boy",
-    "boycott",
-    "boyd",
-    "boyhood",
-    "boyish",
-    "boys",
-    "bra",
-    "brace",
-    "braced",
-    "bracer",
-    "bracers",
-    "braces",
-    "bracing",
-    "bracken",
-    "bracket",
-    "brad",
-    "brads",
-    "brag",
-    "bragged",
-    "bragger",
-    "brags",
-    "brahmin",
-    "brahms",
-    "braid",
-    "braided",
-    "braids",
-    "braille",
-    "brain",
-    "brained",
-    "brains",
-    "brainy",
-    "braise",
-    "braised",
-    "braises",
-    "brake",
-    "braked",
-    "brakes",
-    "braking",
-    "bramble",
-    "brambly",
-    "bran",
-    "branch",
-    "brand",
-    "branded",
-    "brands",
-    "brandy",
-    "bras",
-    "brash",
-    "brashly",
-    "brass",
-    "brasses",
-    "brassy",
-    "brat",
-    "brats",
-    "bravado",
-    "brave",
-    "braved",
-    "bravely",
-    "braver",
-    "bravery",
-    "braves",
-    "bravest",
-    "braving",
-    "bravo",
-    "bravura",
-    "brawl",
-    "brawled",
-    "brawler",
-    "brawls",
-    "brawn",
-    "brawny",
-    "bray",
-    "brayed",
-    "braying",
-    "brays",
-    "braze",
-    "brazen",
-    "brazens",
-    "brazier",
-    "brazil",
-    "breach",
-    "bread",
-    "breads",
-    "breadth",
-    "break",
-    "breaker",
-    "breaks",
-    "breakup",
-    "bream",
-    "breast",
-    "breasts",
-    "breath",
-    "breathe",
-    "breaths",
-    "breathy",
-    "bred",
-    "breech",
-    "breed",
-    "breeder",
-    "breeds",
-    "breeze",
-    "breezed",
-    "breezes",
-    "breezy",
-    "bremen",
-    "brenda",
-    "brendan",
-    "brennan",
-    "breton",
-    "brevet",
-    "brevity",
-    "brew",
-    "brewed",
-    "brewer",
-    "brewers",
-    "brewery",
-    "brewing",
-    "brews",
-    "brian",
-    "briar",
-    "briars",
-    "bribe",
-    "bribed",
-    "briber",
-    "bribers",
-    "bribery",
-    "bribes",
-    "bribing",
-    "brick",
-    "bricked",
-    "bricks",
-    "bridal",
-    "bride",
-    "brides",
-    "bridge",
-    "bridged",
-    "bridges",
-    "bridget",
-    "bridle",
-    "bridled",
-    "bridles",
-    "brie",
-    "brief",
-    "briefed",
-    "briefer",
-    "briefly",
-    "briefs",
-    "brier",
-    "briers",
-    "brig",
-    "brigade",
-    "brigand",
-    "briggs",
-    "bright",
-    "brim",
-    "brimful",
-    "brimmed",
-    "brims",
-    "brine",
-    "bring",
-    "bringer",
-    "brings",
-    "brink",
-    "briny",
-    "brio",
-    "brioche",
-    "brisk",
-    "brisker",
-    "brisket",
-    "briskly",
-    "bristle",
-    "bristly",
-    "bristol",
-    "britain",
-    "british",
-    "briton",
-    "britons",
-    "brittle",
-    "broach",
-    "broad",
-    "broaden",
-    "broader",
-    "broadly",
-    "broads",
-    "brocade",
-    "brogue",
-    "brogues",
-    "broil",
-    "broiled",
-    "broiler",
-    "broils",
-    "broke",
-    "broken",
-    "broker",
-    "brokers",
-    "bromide",
-    "bromine",
-    "bronchi",
-    "bronco",
-    "broncos",
-    "bronx",
-    "bronze",
-    "bronzed",
-    "brooch",
-    "brood",
-    "brooded",
-    "brooder",
-    "broods",
-    "broody",
-    "brook",
-    "brooke",
-    "brooked",
-    "brooks",
-    "broom",
-    "brooms",
-    "broth",
-    "brothel",
-    "brother",
-    "brought",
-    "brow",
-    "brown",
-    "browned",
-    "brownie",
-    "browns",
-    "brows",
-    "browse",
-    "browsed",
-    "browses",
-    "bruce",
-    "bruges",
-    "bruise",
-    "bruised",
-    "bruiser",
-    "bruises",
-    "brunch",
-    "brunei",
-    "brunet",
-    "brunt",
-    "brush",
-    "brushed",
-    "brushes",
-    "brushy",
-    "brusque",
-    "brutal",
-    "brute",
-    "brutes",
-    "brutish",
-    "bryan",
-    "bsc",
-    "btu",
-    "bubble",
-    "bubbled",
-    "bubbles",
-    "bubbly",
-    "buck",
-    "bucked",
-    "bucket",
-    "buckets",
-    "bucking",
-    "buckle",
-    "buckled",
-    "buckles",
-    "bucks",
-    "bucolic",
-    "bud",
-    "budded",
-    "buddha",
-    "buddies",
-    "budding",
-    "buddy",
-    "budge",
-    "budged",
-    "budges",
-    "budget",
-    "budgets",
-    "budging",
-    "buds",
-    "buff",
-    "buffalo",
-    "buffed",
-    "buffer",
-    "buffers",
-    "buffet",
-    "buffets",
-    "buffing",
-    "buffoon",
-    "buffs",
-    "bug",
-    "bugbear",
-    "bugeyed",
-    "bugged",
-    "buggies",
-    "bugging",
-    "buggy",
-    "bugle",
-    "bugler",
-    "buglers",
-    "bugles",
-    "bugs",
-    "build",
-    "builder",
-    "builds",
-    "built",
-    "bulb",
-    "bulbar",
-    "bulbous",
-    "bulbs",
-    "bulbuls",
-    "bulge",
-    "bulged",
-    "bulges",
-    "bulging",
-    "bulk",
-    "bulked",
-    "bulkier",
-    "bulks",
-    "bulky",
-    "bull",
-    "bulldog",
-    "bullet",
-    "bullets",
-    "bullied",
-    "bullies",
-    "bullion",
-    "bullish",
-    "bullock",
-    "bulls",
-    "bully",
-    "bulrush",
-    "bulwark",
-    "bum",
-    "bumble",
-    "bumbled",
-    "bumbler",
-    "bumbles",
-    "bummed",
-    "bumming",
-    "bump",
-    "bumped",
-    "bumper",
-    "bumpers",
-    "bumping",
-    "bumpkin",
-    "bumps",
-    "bumpy",
-    "bums",
-    "bun",
-    "bunch",
-    "bunched",
-    "bunches",
-    "bunchy",
-    "bundle",
-    "bundled",
-    "bundles",
-    "bunged",
-    "bunging",
-    "bungle",
-    "bungled",
-    "bungler",
-    "bungles",
-    "bunion",
-    "bunions",
-    "bunk",
-    "bunked",
-    "bunker",
-    "bunkers",
-    "bunking",
-    "bunks",
-    "bunkum",
-    "bunnies",
-    "bunny",
-    "buns",
-    "bunsen",
-    "bunting",
-    "buoy",
-    "buoyant",
-    "buoyed",
-    "buoys",
-    "burden",
-    "burdens",
-    "burdock",
-    "bureau",
-    "bureaus",
-    "burford",
-    "burgeon",
-    "burger",
-    "burgers",
-    "burghs",
-    "burglar",
-    "burgle",
-    "burgled",
-    "burgles",
-    "burial",
-    "burials",
-    "buried",
-    "buries",
-    "burke",
-    "burkina",
-    "burley",
-    "burly",
-    "burma",
-    "burmese",
-    "burn",
-    "burned",
-    "burner",
-    "burners",
-    "burning",
-    "burnish",
-    "burnout",
-    "burns",
-    "burnt",
-    "burp",
-    "burped",
-    "burping",
-    "burps",
-    "burr",
-    "burrito",
-    "burrow",
-    "burrows",
-    "burrs",
-    "bursar",
-    "bursars",
-    "burst",
-    "bursts",
-    "burundi",
-    "bury",
-    "burying",
-    "bus",
-    "busboys",
-    "buses",
-    "bush",
-    "bushed",
-    "bushel",
-    "bushels",
-    "bushes",
-    "bushier",
-    "bushing",
-    "bushy",
-    "busied",
-    "busier",
-    "busies",
-    "busiest",
-    "busily",
-    "busker",
-    "buskers",
-    "bussed",
-    "busses",
-    "bussing",
-    "bust",
-    "bustard",
-    "busted",
-    "buster",
-    "busting",
-    "bustle",
-    "bustled",
-    "bustles",
-    "busts",
-    "busy",
-    "but",
-    "butane",
-    "butanol",
-    "butch",
-    "butcher",
-    "butler",
-    "butlers",
-    "butt",
-    "butte",
-    "butted",
-    "butter",
-    "butters",
-    "buttery",
-    "butting",
-    "buttock",
-    "button",
-    "buttons",
-    "butts",
-    "buxom",
-    "buy",
-    "buyer",
-    "buyers",
-    "buying",
-    "buys",
-    "buzz",
-    "buzzard",
-    "buzzed",
-    "buzzer",
-    "buzzers",
-    "buzzes",
-    "buzzing",
-    "by",
-    "bye",
-    "bygone",
-    "bygones",
-    "bylaw",
-    "bylaws",
-    "byline",
-    "bylines",
-    "bypass",
-    "bypath",
-    "bypaths",
-    "byres",
-    "byron",
-    "byte",
-    "bytes",
-    "byway",
-    "byways",
-    "byword",
-    "bywords",
-    "cab",
-    "cabal",
-    "cabals",
-    "cabaret",
-    "cabbage",
-    "cabbies",
-    "cabby",
-    "cabin",
-    "cabinet",
-    "cabins",
-    "cable",
-    "cabled",
-    "cables",
-    "cabling",
-    "cabs",
-    "cache",
-    "cached",
-    "caches",
-    "cachet",
-    "cachets",
-    "caching",
-    "cackle",
-    "cackled",
-    "cackler",
-    "cackles",
-    "cacti",
-    "cactus",
-    "cad",
-    "cadaver",
-    "cadbury",
-    "caddie",
-    "caddies",
-    "caddis",
-    "caddy",
-    "cadence",
-    "cadenza",
-    "cadet",
-    "cadets",
-    "cadge",
-    "cadged",
-    "cadger",
-    "cadgers",
-    "cadges",
-    "cadging",
-    "cadmic",
-    "cadmium",
-    "cadre",
-    "cadres",
-    "cads",
-    "caesar",
-    "cafe",
-    "cafes",
-    "caftan",
-    "caftans",
-    "cage",
-    "caged",
-    "cages",
-    "cagey",
-    "cagily",
-    "caging",
-    "cagoule",
-    "cahoots",
-    "cain",
-    "cairn",
-    "cairns",
-    "cairo",
-    "caisson",
-    "caitiff",
-    "cajole",
-    "cajoled",
-    "cajoler",
-    "cajoles",
-    "cake",
-    "caked",
-    "cakes",
-    "caking",
-    "calais",
-    "calcify",
-    "calcite",
-    "calcium",
-    "caldron",
-    "calf",
-    "calgary",
-    "caliber",
-    "calico",
-    "caliper",
-    "caliph",
-    "caliphs",
-    "call",
-    "called",
-    "caller",
-    "callers",
-    "calling",
-    "callous",
-    "callow",
-    "calls",
-    "calm",
-    "calmat",
-    "calmed",
-    "calmer",
-    "calmest",
-    "calming",
-    "calmly",
-    "calms",
-    "caloric",
-    "calorie",
-    "calumny",
-    "calvary",
-    "calve",
-    "calved",
-    "calves",
-    "calvin",
-    "calving",
-    "calypso",
-    "cam",
-    "camas",
-    "camber",
-    "cambers",
-    "cambia",
-    "cambric",
-    "came",
-    "camel",
-    "camelot",
-    "camels",
-    "cameo",
-    "cameos",
-    "camera",
-    "cameras",
-    "cameron",
-    "camp",
-    "camped",
-    "camper",
-    "campers",
-    "camphor",
-    "camping",
-    "camps",
-    "campus",
-    "cams",
-    "can",
-    "canada",
-    "canal",
-    "canals",
-    "canape",
-    "canapes",
-    "canard",
-    "canary",
-    "canasta",
-    "cancan",
-    "cancel",
-    "cancels",
-    "cancer",
-    "cancers",
-    "candela",
-    "candid",
-    "candied",
-    "candies",
-    "candle",
-    "candled",
-    "candles",
-    "candor",
-    "candy",
-    "cane",
-    "caned",
-    "canes",
-    "canine",
-    "canines",
-    "caning",
-    "cank",
-    "canker",
-    "cankers",
-    "canna",
-    "canned",
-    "cannery",
-    "cannier",
-    "cannily",
-    "canning",
-    "cannon",
-    "cannons",
-    "cannot",
-    "canny",
-    "canoe",
-    "canoed",
-    "canoes",
-    "canon",
-    "canons",
-    "canopy",
-    "cans",
-    "cant",
-    "cantata",
-    "canted",
-    "canteen",
-    "canter",
-    "canters",
-    "canting",
-    "cantle",
-    "canto",
-    "canton",
-    "cants",
-    "canvas",
-    "canvass",
-    "canyon",
-    "canyons",
-    "cap",
-    "capable",
-    "capably",
-    "cape",
-    "caper",
-    "capered",
-    "capers",
-    "capes",
-    "capita",
-    "capital",
-    "capitol",
-    "capon",
-    "capons",
-    "capped",
-    "capping",
-    "caprice",
-    "caps",
-    "capsize",
-    "capstan",
-    "capsule",
-    "captain",
-    "caption",
-    "captive",
-    "captor",
-    "captors",
-    "capture",
-    "car",
-    "caracas",
-    "carafe",
-    "carafes",
-    "caramel",
-    "carat",
-    "carats",
-    "caravan",
-    "caraway",
-    "carbide",
-    "carbine",
-    "carbon",
-    "carbons",
-    "carboy",
-    "carboys",
-    "carcass",
-    "card",
-    "carded",
-    "cardiac",
-    "cardiff",
-    "cards",
-    "care",
-    "cared",
-    "careen",
-    "careens",
-    "career",
-    "careers",
-    "careful",
-    "cares",
-    "caress",
-    "carew",
-    "carey",
-    "cargill",
-    "cargo",
-    "cargoes",
-    "cargos",
-    "caribou",
-    "caries",
-    "caring",
-    "carload",
-    "carmine",
-    "carnage",
-    "carnal",
-    "carol",
-    "caroled",
-    "caroler",
-    "carols",
-    "carouse",
-    "carp",
-    "carped",
-    "carper",
-    "carpet",
-    "carpets",
-    "carping",
-    "carpool",
-    "carport",
-    "carps",
-    "carried",
-    "carrier",
-    "carries",
-    "carrion",
-    "carrot",
-    "carrots",
-    "carry",
-    "cars",
-    "carsick",
-    "carson",
-    "cart",
-    "cartage",
-    "carted",
-    "cartel",
-    "cartels",
-    "carter",
-    "carting",
-    "carton",
-    "cartons",
-    "cartoon",
-    "carts",
-    "caruso",
-    "carve",
-    "carved",
-    "carver",
-    "carvers",
-    "carves",
-    "carving",
-    "casaba",
-    "cascade",
-    "case",
-    "cased",
-    "casein",
-    "cases",
-    "cash",
-    "cashed",
-    "cashes",
-    "cashew",
-    "cashews",
-    "cashier",
-    "cashing",
-    "casing",
-    "casings",
-    "casino",
-    "casinos",
-    "cask",
-    "casket",
-    "caskets",
-    "casks",
-    "caspian",
-    "cassias",
-    "cassock",
-    "cast",
-    "caste",
-    "caster",
-    "castes",
-    "casting",
-    "castle",
-    "castled",
-    "castles",
-    "castoff",
-    "castor",
-    "castors",
-    "castro",
-    "casts",
-    "casual",
-    "casuals",
-    "casuist",
-    "cat",
-    "catalan",
-    "catarrh",
-    "catcall",
-    "catch",
-    "catcher",
-    "catches",
-    "catchup",
-    "catchy",
-    "cater",
-    "catered",
-    "caterer",
-    "caters",
-    "catfish",
-    "catgut",
-    "cathode",
-    "cathy",
-    "catkin",
-    "catkins",
-    "catnap",
-    "catnaps",
-    "cats",
-    "cattier",
-    "cattily",
-    "cattle",
-    "catty",
-    "catwalk",
-    "caucus",
-    "caught",
-    "caulk",
-    "caulked",
-    "caulker",
-    "caulks",
-    "causal",
-    "cause",
-    "caused",
-    "causes",
-    "causing",
-    "caustic",
-    "caution",
-    "cavalry",
-    "cave",
-    "caveat",
-    "caveats",
-    "caved",
-    "caveman",
-    "cavemen",
-    "cavern",
-    "caverns",
-    "caves",
-    "caviar",
-    "caviare",
-    "cavil",
-    "caviled",
-    "caviler",
-    "cavils",
-    "caving",
-    "cavity",
-    "cavort",
-    "cavorts",
-    "caw",
-    "cawed",
-    "cawing",
-    "caws",
-    "cayenne",
-    "cayman",
-    "cb",
-    "cbi",
-    "cc",
-    "cd",
-    "cease",
-    "ceased",
-    "ceases",
-    "ceasing",
-    "cecil",
-    "cecile",
-    "cecilia",
-    "cedar",
-    "cedars",
-    "cede",
-    "ceded",
-    "cedes",
-    "cedilla",
-    "ceding",
-    "ceiling",
-    "celebes",
-    "celery",
-    "celia",
-    "celiac",
-    "cell",
-    "cellar",
-    "cellars",
-    "cellist",
-    "cello",
-    "cellos",
-    "cells",
-    "celsius",
-    "celt",
-    "celtic",
-    "celts",
-    "cement",
-    "cements",
-    "censor",
-    "censors",
-    "censure",
-    "census",
-    "cent",
-    "centaur",
-    "center",
-    "centers",
-    "centime",
-    "central",
-    "centric",
-    "cents",
-    "century",
-    "ceramic",
-    "cereal",
-    "cereals",
-    "cerise",
-    "cerium",
-    "certain",
-    "certify",
-    "cervix",
-    "cesium",
-    "cesser",
-    "ceylon",
-    "cezanne",
-    "chablis",
-    "chacer",
-    "chad",
-    "chadic",
-    "chafe",
-    "chafed",
-    "chafes",
-    "chaff",
-    "chaffed",
-    "chaffs",
-    "chafing",
-    "chagrin",
-    "chain",
-    "chained",
-    "chains",
-    "chair",
-    "chaired",
-    "chairs",
-    "chalder",
-    "chalet",
-    "chalets",
-    "chalice",
-    "chalk",
-    "chalked",
-    "chalks",
-    "chalky",
-    "chamber",
-    "chamfer",
-    "chamois",
-    "champ",
-    "champed",
-    "champs",
-    "chance",
-    "chanced",
-    "chancel",
-    "chances",
-    "chancre",
-    "chancy",
-    "change",
-    "changed",
-    "changer",
-    "changes",
-    "channel",
-    "chant",
-    "chanted",
-    "chanter",
-    "chantey",
-    "chants",
-    "chaos",
-    "chaotic",
-    "chap",
-    "chapel",
-    "chapels",
-    "chaplet",
-    "chaplin",
-    "chapped",
-    "chaps",
-    "chapter",
-    "char",
-    "charade",
-    "chard",
-    "charge",
-    "charged",
-    "charger",
-    "charges",
-    "charily",
-    "chariot",
-    "charity",
-    "charles",
-    "charley",
-    "charlie",
-    "charm",
-    "charmed",
-    "charmer",
-    "charms",
-    "charnel",
-    "charred",
-    "chars",
-    "chart",
-    "charted",
-    "charter",
-    "charts",
-    "chary",
-    "chase",
-    "chased",
-    "chaser",
-    "chasers",
-    "chases",
-    "chasing",
-    "chasm",
-    "chasms",
-    "chassis",
-    "chaste",
-    "chasten",
-    "chat",
-    "chateau",
-    "chats",
-    "chatted",
-    "chattel",
-    "chatter",
-    "chatty",
-    "cheap",
-    "cheapen",
-    "cheaper",
-    "cheaply",
-    "cheat",
-    "cheated",
-    "cheater",
-    "cheats",
-    "check",
-    "checked",
-    "checker",
-    "checks",
-    "checkup",
-    "cheddar",
-    "cheek",
-    "cheeks",
-    "cheeky",
-    "cheep",
-    "cheeped",
-    "cheeps",
-    "cheer",
-    "cheered",
-    "cheerio",
-    "cheers",
-    "cheery",
-    "cheese",
-    "cheeses",
-    "cheesy",
-    "cheetah",
-    "chef",
-    "chefs",
-    "chemise",
-    "chemist",
-    "cherish",
-    "cheroot",
-    "cherry",
-    "cherub",
-    "cherubs",
-    "chervil",
-    "cheryl",
-    "chess",
-    "chest",
-    "chests",
-    "chesty",
-    "chevron",
-    "chew",
-    "chewed",
-    "chewier",
-    "chewing",
-    "chews",
-    "chewy",
-    "chi",
-    "chianti",
-    "chic",
-    "chicago",
-    "chicane",
-    "chick",
-    "chicken",
-    "chicks",
-    "chicory",
-    "chide",
-    "chided",
-    "chides",
-    "chiding",
-    "chief",
-    "chiefly",
-    "chiefs",
-    "chiffon",
-    "child",
-    "chile",
-    "chilean",
-    "chili",
-    "chill",
-    "chilled",
-    "chills",
-    "chilly",
-    "chime",
-    "chimed",
-    "chimera",
-    "chimes",
-    "chiming",
-    "chimney",
-    "chimp",
-    "chimps",
-    "chin",
-    "china",
-    "chine",
-    "chinese",
-    "chinked",
-    "chinned",
-    "chinook",
-    "chins",
-    "chintz",
-    "chintzy",
-    "chip",
-    "chipped",
-    "chipper",
-    "chips",
-    "chirp",
-    "chirped",
-    "chirps",
-    "chirpy",
-    "chisel",
-    "chisels",
-    "chit",
-    "chits",
-    "chive",
-    "chives",
-    "chivy",
-    "chock",
-    "chocks",
-    "choice",
-    "choices",
-    "choir",
-    "choirs",
-    "choke",
-    "choked",
-    "choker",
-    "chokers",
-    "chokes",
-    "choking",
-    "cholera",
-    "chomp",
-    "chomsky",
-    "choose",
-    "chooses",
-    "choosey",
-    "choosy",
-    "chop",
-    "chopin",
-    "chopped",
-    "chopper",
-    "choppy",
-    "chops",
-    "choral",
-    "chorale",
-    "chord",
-    "chords",
-    "chore",
-    "chorea",
-    "chores",
-    "chorine",
-    "chortle",
-    "chorus",
-    "chose",
-    "chosen",
-    "chow",
-    "chowder",
-    "chows",
-    "chris",
-    "christ",
-    "christi",
-    "chrome",
-    "chromed",
-    "chromic",
-    "chronic",
-    "chubb",
-    "chubby",
-    "chuck",
-    "chucked",
-    "chuckle",
-    "chucks",
-    "chug",
-    "chugged",
-    "chugs",
-    "chukka",
-    "chum",
-    "chummed",
-    "chummy",
-    "chump",
-    "chumps",
-    "chums",
-    "chunk",
-    "chunks",
-    "chunky",
-    "church",
-    "churl",
-    "churn",
-    "churned",
-    "churns",
-    "chute",
-    "chutes",
-    "chutney",
-    "cid",
-    "cider",
-    "ciders",
-    "cigar",
-    "cigars",
-    "cinch",
-    "cinched",
-    "cinches",
-    "cinder",
-    "cinders",
-    "cindy",
-    "cinema",
-    "cinemas",
-    "cinque",
-    "cipher",
-    "ciphers",
-    "circa",
-    "circle",
-    "circled",
-    "circles",
-    "circlet",
-    "circuit",
-    "circus",
-    "cirrus",
-    "cistern",
-    "citadel",
-    "cite",
-    "cited",
-    "cites",
-    "cities",
-    "citify",
-    "citing",
-    "citizen",
-    "citrate",
-    "citric",
-    "citroen",
-    "citrus",
-    "city",
-    "civi",
-    "civic",
-    "civics",
-    "civil",
-    "civilly",
-    "civvies",
-    "clack",
-    "clacked",
-    "clacks",
-    "clad",
-    "claim",
-    "claimed",
-    "claims",
-    "claire",
-    "clam",
-    "clamber",
-    "clammed",
-    "clammy",
-    "clamor",
-    "clamors",
-    "clamp",
-    "clamped",
-    "clamps",
-    "clams",
-    "clan",
-    "clang",
-    "clanged",
-    "clangor",
-    "clangs",
-    "clank",
-    "clanked",
-    "clanks",
-    "clans",
-    "clap",
-    "clapped",
-    "clapper",
-    "claps",
-    "claret",
-    "clarets",
-    "clarify",
-    "clarion",
-    "clarity",
-    "clark",
-    "clarke",
-    "clash",
-    "clashed",
-    "clashes",
-    "clasp",
-    "clasped",
-    "clasps",
-    "class",
-    "classed",
-    "classes",
-    "classic",
-    "classy",
-    "clatter",
-    "claus",
-    "clause",
-    "clauses",
-    "clavier",
-    "claw",
-    "clawed",
-    "clawing",
-    "claws",
-    "clay",
-    "clays",
-    "clayton",
-    "clean",
-    "cleaned",
-    "cleaner",
-    "cleanly",
-    "cleans",
-    "cleanse",
-    "cleanup",
-    "clear",
-    "cleared",
-    "clearer",
-    "clearly",
-    "clears",
-    "cleat",
-    "cleats",
-    "cleave",
-    "cleaved",
-    "cleaver",
-    "cleaves",
-    "clef",
-    "clefs",
-    "cleft",
-    "clefts",
-    "clement",
-    "clench",
-    "clergy",
-    "cleric",
-    "clerics",
-    "clerk",
-    "clerks",
-    "clever",
-    "cliche",
-    "cliched",
-    "cliches",
-    "click",
-    "clicked",
-    "clicks",
-    "client",
-    "clients",
-    "cliff",
-    "cliffs",
-    "clifton",
-    "climate",
-    "climax",
-    "climb",
-    "climbed",
-    "climber",
-    "climbs",
-    "clime",
-    "climes",
-    "clinch",
-    "cling",
-    "clings",
-    "clingy",
-    "clinic",
-    "clinics",
-    "clink",
-    "clinked",
-    "clinker",
-    "clinks",
-    "clint",
-    "clinton",
-    "clip",
-    "clipart",
-    "clipeus",
-    "clipped",
-    "clipper",
-    "clips",
-    "clique",
-    "cliques",
-    "clive",
-    "cloak",
-    "cloaked",
-    "cloaks",
-    "clobber",
-    "cloche",
-    "cloches",
-    "clock",
-    "clocked",
-    "clocks",
-    "clod",
-    "clods",
-    "clog",
-    "clogged",
-    "cloggy",
-    "clogs",
-    "clone",
-    "cloned",
-    "clones",
-    "cloning",
-    "clonk",
-    "clonked",
-    "clonks",
-    "close",
-    "closed",
-    "closely",
-    "closer",
-    "closes",
-    "closest",
-    "closet",
-    "closets",
-    "closeup",
-    "closing",
-    "closure",
-    "clot",
-    "cloth",
-    "clothe",
-    "clothed",
-    "clothes",
-    "cloths",
-    "clots",
-    "clotted",
-    "cloud",
-    "clouded",
-    "clouds",
-    "cloudy",
-    "clough",
-    "clout",
-    "clouted",
-    "clouts",
-    "clove",
-    "cloven",
-    "clover",
-    "clovers",
-    "cloves",
-    "clown",
-    "clowned",
-    "clowns",
-    "cloy",
-    "cloyed",
-    "cloying",
-    "cloys",
-    "club",
-    "clubbed",
-    "clubs",
-    "cluck",
-    "clucked",
-    "clucks",
-    "clue",
-    "clues",
-    "clump",
-    "clumped",
-    "clumps",
-    "clumsy",
-    "clung",
-    "cluster",
-    "clutch",
-    "clutter",
-    "cm",
-    "co",
-    "coach",
-    "coached",
-    "coaches",
-    "coal",
-    "coals",
-    "coarse",
-    "coarsen",
-    "coarser",
-    "coast",
-    "coastal",
-    "coasted",
-    "coaster",
-    "coasts",
-    "coat",
-    "coated",
-    "coating",
-    "coats",
-    "coax",
-    "coaxed",
-    "coaxer",
-    "coaxers",
-    "coaxes",
-    "coaxial",
-    "coaxing",
-    "cob",
-    "cobalt",
-    "cobble",
-    "cobbled",
-    "cobbler",
-    "cobbles",
-    "cobnut",
-    "cobnuts",
-    "cobol",
-    "cobra",
-    "cobras",
-    "cobs",
-    "cobweb",
-    "cobwebs",
-    "coca",
-    "cocaine",
-    "coccyx",
-    "cockade",
-    "cocked",
-    "cockeye",
-    "cockier",
-    "cockily",
-    "cocking",
-    "cockle",
-    "cockled",
-    "cockles",
-    "cockney",
-    "cockpit",
-    "cocky",
-    "cocoa",
-    "coconut",
-    "cocoon",
-    "cocoons",
-    "cod",
-    "coda",
-    "coddle",
-    "coddled",
-    "coddles",
-    "code",
-    "coded",
-    "codeine",
-    "codes",
-    "codfish",
-    "codger",
-    "codgers",
-    "codices",
-    "codicil",
-    "codify",
-    "coding",
-    "codling",
-    "coequal",
-    "coerce",
-    "coerced",
-    "coerces",
-    "coeval",
-    "coexist",
-    "coffee",
-    "coffees",
-    "coffer",
-    "coffers",
-    "coffin",
-    "coffins",
-    "cog",
-    "cogency",
-    "cogent",
-    "cognac",
-    "cognacs",
-    "cognate",
-    "cogs",
-    "cohabit",
-    "coheir",
-    "cohen",
-    "cohere",
-    "cohered",
-    "coherer",
-    "coheres",
-    "cohort",
-    "cohorts",
-    "coil",
-    "coiled",
-    "coiling",
-    "coils",
-    "coin",
-    "coinage",
-    "coined",
-    "coiner",
-    "coining",
-    "coins",
-    "coital",
-    "coitus",
-    "coke",
-    "cokes",
-    "cola",
-    "cold",
-    "colder",
-    "coldest",
-    "colditz",
-    "coldly",
-    "colds",
-    "cole",
-    "coleman",
-    "colic",
-    "colicky",
-    "colin",
-    "colitis",
-    "collage",
-    "collar",
-    "collars",
-    "collate",
-    "collect",
-    "college",
-    "collide",
-    "collie",
-    "collier",
-    "colloid",
-    "collude",
-    "colne",
-    "cologne",
-    "colombo",
-    "colon",
-    "colonel",
-    "colonic",
-    "colons",
-    "colony",
-    "color",
-    "colored",
-    "colors",
-    "colossi",
-    "colt",
-    "coltish",
-    "colts",
-    "column",
-    "columns",
-    "coma",
-    "comas",
-    "comb",
-    "combat",
-    "combats",
-    "combed",
-    "combine",
-    "combing",
-    "combs",
-    "combust",
-    "come",
-    "comedy",
-    "comely",
-    "comer",
-    "comers",
-    "comes",
-    "comet",
-    "comets",
-    "comfier",
-    "comfit",
-    "comfort",
-    "comfy",
-    "comic",
-    "comical",
-    "comics",
-    "coming",
-    "comings",
-    "comity",
-    "comma",
-    "command",
-    "commas",
-    "commend",
-    "comment",
-    "commit",
-    "commits",
-    "commode",
-    "common",
-    "commons",
-    "commune",
-    "commute",
-    "comoros",
-    "compact",
-    "company",
-    "compare",
-    "compass",
-    "compeer",
-    "compel",
-    "compels",
-    "compete",
-    "compile",
-    "complex",
-    "comply",
-    "comport",
-    "compose",
-    "compost",
-    "compote",
-    "compute",
-    "comrade",
-    "con",
-    "conakry",
-    "concave",
-    "conceal",
-    "concede",
-    "conceit",
-    "concept",
-    "concern",
-    "concert",
-    "conch",
-    "conches",
-    "conchs",
-    "concise",
-    "concoct",
-    "concord",
-    "concur",
-    "concurs",
-    "concuss",
-    "condemn",
-    "condign",
-    "condole",
-    "condom",
-    "condoms",
-    "condone",
-    "condor",
-    "condors",
-    "conduce",
-    "conduct",
-    "conduit",
-    "cone",
-    "coned",
-    "cones",
-    "coney",
-    "confer",
-    "confers",
-    "confess",
-    "confide",
-    "confine",
-    "confirm",
-    "conflux",
-    "conform",
-    "confuse",
-    "confute",
-    "conga",
-    "congeal",
-    "conger",
-    "congest",
-    "congo",
-    "conic",
-    "conical",
-    "conies",
-    "conifer",
-    "coning",
-    "conjoin",
-    "conjure",
-    "conk",
-    "conked",
-    "conks",
-    "connate",
-    "connect",
-    "conned",
-    "conning",
-    "connive",
-    "connote",
-    "conquer",
-    "cons",
-    "consent",
-    "consign",
-    "consist",
-    "console",
-    "consort",
-    "constat",
-    "consul",
-    "consuls",
-    "consult",
-    "consume",
-    "contact",
-    "contain",
-    "contemn",
-    "contend",
-    "content",
-    "contest",
-    "context",
-    "contort",
-    "contour",
-    "control",
-    "convect",
-    "convene",
-    "convent",
-    "convert",
-    "convex",
-    "convey",
-    "conveys",
-    "convict",
-    "convoke",
-    "convoy",
-    "convoys",
-    "cony",
-    "coo",
-    "cooed",
-    "cooing",
-    "cook",
-    "cooked",
-    "cooker",
-    "cookers",
-    "cookery",
-    "cookie",
-    "cookies",
-    "cooking",
-    "cooks",
-    "cool",
-    "coolant",
-    "cooled",
-    "cooler",
-    "coolers",
-    "coolest",
-    "cooling",
-    "coolish",
-    "coolly",
-    "cools",
-    "coop",
-    "cooped",
-    "cooper",
-    "coopers",
-    "cooping",
-    "coops",
-    "coot",
-    "cooties",
-    "coots",
-    "cop",
-    "cope",
-    "coped",
-    "copes",
-    "copied",
-    "copier",
-    "copiers",
-    "copies",
-    "copilot",
-    "coping",
-    "copings",
-    "copious",
-    "copout",
-    "copped",
-    "copper",
-    "coppers",
-    "coppery",
-    "coppice",
-    "copping",
-    "cops",
-    "copse",
-    "copses",
-    "copt",
-    "coptic",
-    "copts",
-    "copy",
-    "copycat",
-    "copying",
-    "copyist",
-    "coracle",
-    "coral",
-    "cord",
-    "cordage",
-    "corded",
-    "cordial",
-    "cordite",
-    "cordoba",
-    "cordon",
-    "cordons",
-    "cords",
-    "core",
-    "cored",
-    "corer",
-    "corers",
-    "cores",
-    "corey",
-    "corfu",
-    "corgi",
-    "corgis",
-    "coring",
-    "corinth",
-    "cork",
-    "corkage",
-    "corked",
-    "corker",
-    "corkers",
-    "corking",
-    "corks",
-    "corky",
-    "corn",
-    "corncob",
-    "cornea",
-    "corneal",
-    "corneas",
-    "corned",
-    "corner",
-    "corners",
-    "cornet",
-    "cornets",
-    "cornice",
-    "cornish",
-    "corns",
-    "corny",
-    "corona",
-    "coronas",
-    "coroner",
-    "coronet",
-    "corpora",
-    "corps",
-    "corpse",
-    "corpses",
-    "corpus",
-    "corral",
-    "corrals",
-    "correct",
-    "corrode",
-    "corrupt",
-    "corsage",
-    "corsair",
-    "corset",
-    "corsets",
-    "corsica",
-    "cortege",
-    "cortex",
-    "cos",
-    "cosec",
-    "cosh",
-    "coshed",
-    "cosign",
-    "cosine",
-    "cosines",
-    "cosmic",
-    "cosmos",
-    "cossack",
-    "cosset",
-    "cossets",
-    "cost",
-    "costar",
-    "costed",
-    "costing",
-    "costive",
-    "costly",
-    "costs",
-    "costume",
-    "cot",
-    "cotland",
-    "cots",
-    "cottage",
-    "cotter",
-    "cotters",
-    "cotton",
-    "cottony",
-    "couch",
-    "couched",
-    "coucher",
-    "couches",
-    "cough",
-    "coughed",
-    "cougher",
-    "coughs",
-    "could",
-    "coulomb",
-    "council",
-    "counsel",
-    "count",
-    "counted",
-    "counter",
-    "country",
-    "counts",
-    "county",
-    "coup",
-    "coupe",
-    "couple",
-    "coupled",
-    "coupler",
-    "couples",
-    "couplet",
-    "coupon",
-    "coupons",
-    "coups",
-    "courage",
-    "courier",
-    "course",
-    "courser",
-    "courses",
-    "court",
-    "courted",
-    "courtly",
-    "courts",
-    "cousin",
-    "cousins",
-    "couture",
-    "cove",
-    "coven",
-    "covens",
-    "cover",
-    "covered",
-    "covers",
-    "covert",
-    "coves",
-    "covet",
-    "coveted",
-    "covets",
-    "cow",
-    "coward",
-    "cowards",
-    "cowbell",
-    "cowbird",
-    "cowboy",
-    "cowboys",
-    "cowed",
-    "cower",
-    "cowered",
-    "cowers",
-    "cowhand",
-    "cowherd",
-    "cowhide",
-    "cowing",
-    "cowl",
-    "cowling",
-    "cowls",
-    "cowman",
-    "cowmen",
-    "cowpox",
-    "cows",
-    "cowslip",
-    "cox",
-    "coxcomb",
-    "coy",
-    "coyest",
-    "coyly",
-    "coyness",
-    "coyote",
-    "coyotes",
-    "coypu",
-    "coypus",
-    "cozier",
-    "cozily",
-    "cozy",
-    "crab",
-    "crabbed",
-    "crabby",
-    "crabs",
-    "crack",
-    "cracked",
-    "cracker",
-    "crackle",
-    "crackly",
-    "cracks",
-    "cradle",
-    "cradled",
-    "cradles",
-    "craft",
-    "crafted",
-    "crafter",
-    "crafts",
-    "crafty",
-    "crag",
-    "cragged",
-    "craggy",
-    "crags",
-    "craig",
-    "cram",
-    "crammed",
-    "cramp",
-    "cramped",
-    "crampon",
-    "cramps",
-    "crams",
-    "crane",
-    "craned",
-    "cranes",
-    "crania",
-    "cranial",
-    "craning",
-    "cranium",
-    "crank",
-    "cranked",
-    "cranks",
-    "cranky",
-    "cranny",
-    "crash",
-    "crashed",
-    "crasher",
-    "crashes",
-    "crass",
-    "crassly",
-    "crate",
-    "crated",
-    "crater",
-    "craters",
-    "crates",
-    "crating",
-    "cravat",
-    "cravats",
-    "crave",
-    "craved",
-    "craven",
-    "craves",
-    "craving",
-    "craw",
-    "crawl",
-    "crawled",
-    "crawler",
-    "crawls",
-    "crawly",
-    "craws",
-    "crayon",
-    "crayons",
-    "craze",
-    "crazed",
-    "crazes",
-    "crazier",
-    "crazily",
-    "crazing",
-    "crazy",
-    "creak",
-    "creaked",
-    "creaks",
-    "creaky",
-    "cream",
-    "creamed",
-    "creamer",
-    "creams",
-    "creamy",
-    "crease",
-    "creased",
-    "creases",
-    "create",
-    "created",
-    "creates",
-    "creator",
-    "creche",
-    "creches",
-    "credit",
-    "credits",
-    "credo",
-    "creed",
-    "creeds",
-    "creek",
-    "creeks",
-    "creep",
-    "creeper",
-    "creeps",
-    "creepy",
-    "cremate",
-    "creole",
-    "crepe",
-    "crepes",
-    "crept",
-    "cress",
-    "crest",
-    "crested",
-    "crests",
-    "cretan",
-    "crete",
-    "cretin",
-    "cretins",
-    "crevice",
-    "crew",
-    "crewcut",
-    "crewed",
-    "crewing",
-    "crewman",
-    "crewmen",
-    "crews",
-    "cri",
-    "crib",
-    "cribbed",
-    "cribs",
-    "crick",
-    "cricket",
-    "cricks",
-    "cried",
-    "crier",
-    "criers",
-    "cries",
-    "crime",
-    "crimea",
-    "crimean",
-    "crimes",
-    "crimp",
-    "crimped",
-    "crimper",
-    "crimps",
-    "crimson",
-    "cringe",
-    "cringed",
-    "cringes",
-    "crinkle",
-    "cripple",
-    "crises",
-    "crisis",
-    "crisp",
-    "crisply",
-    "crisps",
-    "crispy",
-    "critic",
-    "critics",
-    "critter",
-    "croak",
-    "croaked",
-    "croaks",
-    "croats",
-    "crochet",
-    "crock",
-    "crocks",
-    "crocus",
-    "crofter",
-    "crone",
-    "crones",
-    "cronies",
-    "crony",
-    "crook",
-    "crooked",
-    "crooks",
-    "croon",
-    "crooned",
-    "crooner",
-    "croons",
-    "crop",
-    "cropped",
-    "cropper",
-    "crops",
-    "croquet",
-    "crosier",
-    "cross",
-    "crossed",
-    "crosses",
-    "crossly",
-    "crotch",
-    "crouch",
-    "crouton",
-    "crow",
-    "crowbar",
-    "crowd",
-    "crowded",
-    "crowds",
-    "crowed",
-    "crowing",
-    "crown",
-    "crowned",
-    "crowns",
-    "crows",
-    "crucial",
-    "crucify",
-    "crude",
-    "crudely",
-    "cruder",
-    "crudest",
-    "crudity",
-    "cruel",
-    "crueler",
-    "cruelly",
-    "cruelty",
-    "cruet",
-    "cruise",
-    "cruised",
-    "cruiser",
-    "cruises",
-    "crumb",
-    "crumble",
-    "crumbly",
-    "crumbs",
-    "crummy",
-    "crumpet",
-    "crumple",
-    "crunch",
-    "crunchy",
-    "crusade",
-    "crush",
-    "crushed",
-    "crusher",
-    "crushes",
-    "crusoe",
-    "crust",
-    "crusted",
-    "crusts",
-    "crusty",
-    "crutch",
-    "crux",
-    "cruxes",
-    "cry",
-    "crybaby",
-    "crying",
-    "crypt",
-    "cryptic",
-    "crypto",
-    "crypts",
-    "crystal",
-    "cub",
-    "cuba",
-    "cuban",
-    "cubans",
-    "cube",
-    "cubed",
-    "cubes",
-    "cubic",
-    "cubical",
-    "cubicle",
-    "cubing",
-    "cubism",
-    "cubist",
-    "cubists",
-    "cubit",
-    "cubits",
-    "cuboid",
-    "cuboids",
-    "cubs",
-    "cuckoo",
-    "cuckoos",
-    "cud",
-    "cuddle",
-    "cuddled",
-    "cuddles",
-    "cuddly",
-    "cudgel",
-    "cudgels",
-    "cudweed",
-    "cue",
-    "cued",
-    "cueing",
-    "cues",
-    "cuff",
-    "cuffed",
-    "cuffing",
-    "cuffs",
-    "cuisine",
-    "cull",
-    "culled",
-    "culling",
-    "culls",
-    "culprit",
-    "cult",
-    "cultist",
-    "cults",
-    "culture",
-    "culvert",
-    "cumin",
-    "cummins",
-    "cumulus",
-    "cunning",
-    "cup",
-    "cupcake",
-    "cupful",
-    "cupfuls",
-    "cupid",
-    "cupids",
-    "cupola",
-    "cupped",
-    "cupping",
-    "cups",
-    "cur",
-    "curable",
-    "curably",
-    "curacy",
-    "curae",
-    "curate",
-    "curates",
-    "curator",
-    "curb",
-    "curbed",
-    "curbing",
-    "curbs",
-    "curd",
-    "curdle",
-    "curdled",
-    "curdles",
-    "curds",
-    "cure",
-    "cured",
-    "cures",
-    "curfew",
-    "curfews",
-    "curia",
-    "curie",
-    "curing",
-    "curio",
-    "curios",
-    "curious",
-    "curium",
-    "curl",
-    "curled",
-    "curler",
-    "curlers",
-    "curlew",
-    "curlews",
-    "curlier",
-    "curling",
-    "curls",
-    "curly",
-    "curnock",
-    "currant",
-    "current",
-    "curried",
-    "curries",
-    "curry",
-    "curs",
-    "curse",
-    "cursed",
-    "curses",
-    "cursing",
-    "cursive",
-    "cursor",
-    "cursors",
-    "cursory",
-    "curst",
-    "curt",
-    "curtail",
-    "curtain",
-    "curtly",
-    "curtsey",
-    "curtsy",
-    "curve",
-    "curved",
-    "curves",
-    "curvets",
-    "curving",
-    "cushion",
-    "cushy",
-    "cusp",
-    "cusps",
-    "cuss",
-    "cussed",
-    "cussing",
-    "custard",
-    "custer",
-    "custody",
-    "custom",
-    "customs",
-    "cut",
-    "cutback",
-    "cute",
-    "cutely",
-    "cuter",
-    "cutest",
-    "cuticle",
-    "cutlass",
-    "cutler",
-    "cutlers",
-    "cutlery",
-    "cutlet",
-    "cutlets",
-    "cutoff",
-    "cutout",
-    "cutouts",
-    "cuts",
-    "cutter",
-    "cutters",
-    "cutting",
-    "cutworm",
-    "cwt",
-    "cyan",
-    "cyanate",
-    "cyanic",
-    "cyanide",
-    "cycle",
-    "cycled",
-    "cycles",
-    "cyclic",
-    "cycling",
-    "cyclist",
-    "cyclone",
-    "cyclops",
-    "cygnet",
-    "cygnets",
-    "cymbal",
-    "cymbalo",
-    "cymbals",
-    "cynic",
-    "cynical",
-    "cynics",
-    "cynthia",
-    "cypher",
-    "cyphers",
-    "cypress",
-    "cypriot",
-    "cyprus",
-    "cyril",
-    "cyst",
-    "cystic",
-    "cysts",
-    "czar",
-    "czarina",
-    "czarist",
-    "czars",
-    "czech",
-    "dab",
-    "dabbed",
-    "dabbing",
-    "dabble",
-    "dabbled",
-    "dabbler",
-    "dabbles",
-    "dabs",
-    "dacca",
-    "dace",
-    "dacha",
-    "dactyl",
-    "dad",
-    "daddies",
-    "daddy",
-    "dads",
-    "daemon",
-    "daffy",
-    "daft",
-    "daftly",
-    "dagger",
-    "daggers",
-    "dahlia",
-    "dahlias",
-    "dailies",
-    "daily",
-    "daimler",
-    "dainty",
-    "dairies",
-    "dairy",
-    "dais",
-    "daises",
-    "daisies",
-    "daisy",
-    "dakar",
-    "dakota",
-    "dal",
-    "dale",
-    "dales",
-    "dallas",
-    "dallied",
-    "dallier",
-    "dallies",
-    "dally",
-    "dam",
-    "damage",
-    "damaged",
-    "damages",
-    "damask",
-    "dame",
-    "dames",
-    "dammed",
-    "damming",
-    "damn",
-    "damned",
-    "damning",
-    "damns",
-    "damp",
-    "damped",
-    "dampen",
-    "dampens",
-    "damper",
-    "dampers",
-    "damping",
-    "dampish",
-    "damply",
-    "damps",
-    "dams",
-    "damsel",
-    "damsels",
-    "damson",
-    "damsons",
-    "dan",
-    "dance",
-    "danced",
-    "dancer",
-    "dancers",
-    "dances",
-    "dancing",
-    "dandify",
-    "dandle",
-    "dandy",
-    "dane",
-    "danger",
-    "dangers",
-    "dangle",
-    "dangled",
-    "dangles",
-    "daniel",
-    "danish",
-    "dank",
-    "dankish",
-    "dankly",
-    "danny",
-    "dante",
-    "danube",
-    "danzig",
-    "daphne",
-    "daphnes",
-    "daphnia",
-    "dapper",
-    "dapple",
-    "dappled",
-    "dapples",
-    "dare",
-    "dared",
-    "dares",
-    "daring",
-    "dark",
-    "darken",
-    "darkens",
-    "darker",
-    "darkest",
-    "darkly",
-    "darling",
-    "darn",
-    "darned",
-    "darner",
-    "darners",
-    "darning",
-    "darns",
-    "dart",
-    "darted",
-    "darting",
-    "darts",
-    "darwin",
-    "dash",
-    "dashed",
-    "dasher",
-    "dashes",
-    "dashing",
-    "dastard",
-    "data",
-    "datable",
-    "date",
-    "dated",
-    "dater",
-    "dates",
-    "dating",
-    "dative",
-    "datum",
-    "daub",
-    "daubed",
-    "dauber",
-    "daubers",
-    "daubing",
-    "daubs",
-    "daunt",
-    "daunted",
-    "daunts",
-    "dauphin",
-    "dave",
-    "david",
-    "davies",
-    "davis",
-    "davit",
-    "davits",
-    "davy",
-    "dawdle",
-    "dawdled",
-    "dawdler",
-    "dawdles",
-    "dawn",
-    "dawned",
-    "dawning",
-    "dawns",
-    "day",
-    "daybook",
-    "daylong",
-    "days",
-    "daytime",
-    "dayton",
-    "daze",
-    "dazed",
-    "dazedly",
-    "dazes",
-    "dazing",
-    "dazy",
-    "dazzle",
-    "dazzled",
-    "dazzler",
-    "dazzles",
-    "ddt",
-    "deacon",
-    "deacons",
-    "dead",
-    "deaden",
-    "deadens",
-    "deadly",
-    "deadpan",
-    "deaf",
-    "deafen",
-    "deafens",
-    "deafer",
-    "deafest",
-    "deal",
-    "dealer",
-    "dealers",
-    "dealing",
-    "deals",
-    "dealt",
-    "dean",
-    "deanery",
-    "deans",
-    "dear",
-    "dearer",
-    "dearest",
-    "dearly",
-    "dears",
-    "dearth",
-    "death",
-    "deathly",
-    "deaths",
-    "deb",
-    "debacle",
-    "debar",
-    "debark",
-    "debarks",
-    "debase",
-    "debased",
-    "debases",
-    "debate",
-    "debated",
-    "debater",
-    "debates",
-    "debauch",
-    "debit",
-    "debited",
-    "debitor",
-    "debits",
-    "deborah",
-    "debra",
-    "debrief",
-    "debris",
-    "debt",
-    "debtor",
-    "debtors",
-    "debts",
-    "debug",
-    "debunk",
-    "debunks",
-    "debussy",
-    "debut",
-    "debuts",
-    "decade",
-    "decades",
-    "decamp",
-    "decamps",
-    "decant",
-    "decants",
-    "decay",
-    "decayed",
-    "decays",
-    "decease",
-    "deceit",
-    "deceive",
-    "decency",
-    "decent",
-    "decibel",
-    "decide",
-    "decided",
-    "decider",
-    "decides",
-    "decimal",
-    "deck",
-    "decked",
-    "decker",
-    "deckers",
-    "decking",
-    "deckle",
-    "decks",
-    "declaim",
-    "declare",
-    "decline",
-    "deco",
-    "decode",
-    "decoded",
-    "decoder",
-    "decodes",
-    "decor",
-    "decors",
-    "decorum",
-    "decoy",
-    "decoyed",
-    "decoys",
-    "decree",
-    "decreed",
-    "decrees",
-    "decried",
-    "decries",
-    "decry",
-    "decrypt",
-    "deduce",
-    "deduced",
-    "deduces",
-    "deduct",
-    "deducts",
-    "deed",
-    "deedful",
-    "deedily",
-    "deeds",
-    "deem",
-    "deemed",
-    "deeming",
-    "deems",
-    "deep",
-    "deepen",
-    "deepens",
-    "deeper",
-    "deepest",
-    "deeply",
-    "deer",
-    "deere",
-    "deface",
-    "defaced",
-    "defaces",
-    "defalk",
-    "defame",
-    "defamed",
-    "defames",
-    "default",
-    "defeat",
-    "defeats",
-    "defect",
-    "defects",
-    "defend",
-    "defends",
-    "defense",
-    "defer",
-    "defers",
-    "defiant",
-    "deficit",
-    "defied",
-    "defies",
-    "defile",
-    "defiled",
-    "defiles",
-    "define",
-    "defined",
-    "definer",
-    "defines",
-    "deflate",
-    "deflect",
-    "defocus",
-    "defog",
-    "deform",
-    "deforms",
-    "defraud",
-    "defray",
-    "defrays",
-    "defrock",
-    "defrost",
-    "deft",
-    "deftly",
-    "defunct",
-    "defuse",
-    "defused",
-    "defuses",
-    "defy",
-    "defying",
-    "degas",
-    "degauss",
-    "degrade",
-    "degree",
-    "degrees",
-    "deify",
-    "deign",
-    "deigned",
-    "deigns",
-    "deism",
-    "deist",
-    "deistic",
-    "deities",
-    "deity",
-    "delay",
-    "delayed",
-    "delayer",
-    "delays",
-    "delete",
-    "deleted",
-    "deletes",
-    "delft",
-    "delhi",
-    "delict",
-    "delight",
-    "delilah",
-    "delimit",
-    "deliria",
-    "deliver",
-    "dell",
-    "delores",
-    "delouse",
-    "delphi",
-    "delphic",
-    "delta",
-    "deltas",
-    "deltoid",
-    "delude",
-    "deluded",
-    "deludes",
-    "deluge",
-    "deluged",
-    "deluges",
-    "deluxe",
-    "delve",
-    "delved",
-    "delves",
-    "delving",
-    "demand",
-    "demands",
-    "demean",
-    "demeans",
-    "dement",
-    "demerit",
-    "demerol",
-    "demi",
-    "demigod",
-    "demise",
-    "demised",
-    "demises",
-    "demo",
-    "demon",
-    "demonic",
-    "demons",
-    "demote",
-    "demoted",
-    "demotes",
-    "demur",
-    "demure",
-    "demurs",
-    "den",
-    "denial",
-    "denials",
-    "denied",
-    "denier",
-    "deniers",
-    "denies",
-    "denim",
-    "denims",
-    "denis",
-    "denise",
-    "denizen",
-    "denmark",
-    "dennis",
-    "denote",
-    "denoted",
-    "denotes",
-    "dens",
-    "dense",
-    "densely",
-    "denser",
-    "densest",
-    "density",
-    "dent",
-    "dental",
-    "dentate",
-    "dented",
-    "dentine",
-    "denting",
-    "dentist",
-    "dents",
-    "denture",
-    "denude",
-    "denuded",
-    "denudes",
-    "denver",
-    "deny",
-    "denying",
-    "depart",
-    "departs",
-    "depend",
-    "depends",
-    "depict",
-    "depicts",
-    "deplete",
-    "deplore",
-    "deploy",
-    "deploys",
-    "deport",
-    "deports",
-    "deposal",
-    "depose",
-    "deposed",
-    "deposes",
-    "deposit",
-    "depot",
-    "depots",
-    "deprave",
-    "depress",
-    "deprive",
-    "dept",
-    "depth",
-    "depths",
-    "depute",
-    "deputed",
-    "deputes",
-    "deputy",
-    "derail",
-    "derails",
-    "derange",
-    "derate",
-    "derek",
-    "deride",
-    "derided",
-    "derides",
-    "derive",
-    "derived",
-    "derives",
-    "derrick",
-    "dervish",
-    "descant",
-    "descend",
-    "descent",
-    "descry",
-    "desert",
-    "deserts",
-    "deserve",
-    "design",
-    "designs",
-    "desire",
-    "desired",
-    "desires",
-    "desist",
-    "desists",
-    "desk",
-    "desks",
-    "desktop",
-    "desmond",
-    "despair",
-    "despise",
-    "despite",
-    "despoil",
-    "despond",
-    "despot",
-    "despots",
-    "dessert",
-    "destine",
-    "destiny",
-    "destroy",
-    "detach",
-    "detail",
-    "details",
-    "detain",
-    "detains",
-    "detect",
-    "detects",
-    "detente",
-    "deter",
-    "deters",
-    "detest",
-    "detests",
-    "detinet",
-    "detour",
-    "detours",
-    "detract",
-    "detrain",
-    "detroit",
-    "deuce",
-    "deuces",
-    "devalue",
-    "develop",
-    "deviant",
-    "deviate",
-    "device",
-    "devices",
-    "devil",
-    "deviled",
-    "devils",
-    "devious",
-    "devise",
-    "devised",
-    "devises",
-    "devisor",
-    "devoid",
-    "devolve",
-    "devote",
-    "devoted",
-    "devotee",
-    "devotes",
-    "devour",
-    "devours",
-    "devout",
-    "dew",
-    "dewdrop",
-    "dewed",
-    "dewier",
-    "dewlap",
-    "dewy",
-    "dexter",
-    "dfc",
-    "dhabi",
-    "diadem",
-    "diadems",
-    "diagram",
-    "dial",
-    "dialect",
-    "dialed",
-    "dialer",
-    "dialing",
-    "dialog",
-    "dials",
-    "diamond",
-    "diana",
-    "diane",
-    "diaper",
-    "diapers",
-    "diaries",
-    "diarist",
-    "diary",
-    "diatom",
-    "dibble",
-    "dice",
-    "diced",
-    "dices",
-    "dicey",
-    "dicier",
-    "diciest",
-    "dicing",
-    "dickens",
-    "dicker",
-    "dickers",
-    "dickey",
-    "dicta",
-    "dictate",
-    "diction",
-    "dictum",
-    "dictums",
-    "did",
-    "diddle",
-    "diddled",
-    "diddler",
-    "diddles",
-    "die",
-    "died",
-    "diehard",
-    "dieppe",
-    "dies",
-    "diesel",
-    "diet",
-    "dietary",
-    "dieted",
-    "dieter",
-    "dieters",
-    "dieting",
-    "diets",
-    "differ",
-    "differs",
-    "diffuse",
-    "dig",
-    "digest",
-    "digests",
-    "digger",
-    "diggers",
-    "digging",
-    "digit",
-    "digital",
-    "digits",
-    "dignify",
-    "dignity",
-    "digress",
-    "digs",
-    "dijon",
-    "dike",
-    "dikes",
-    "dilate",
-    "dilated",
-    "dilates",
-    "dilator",
-    "dilemma",
-    "dill",
-    "dilute",
-    "diluted",
-    "dilutes",
-    "dim",
-    "dime",
-    "dimes",
-    "dimly",
-    "dimmed",
-    "dimmer",
-    "dimmers",
-    "dimmest",
-    "dimming",
-    "dimmish",
-    "dimness",
-    "dimple",
-    "dimpled",
-    "dimples",
-    "dims",
-    "din",
-    "dinar",
-    "dine",
-    "dined",
-    "diner",
-    "diners",
-    "dines",
-    "dinette",
-    "ding",
-    "dinged",
-    "dinghy",
-    "dingier",
-    "dinging",
-    "dingle",
-    "dingo",
-    "dingoes",
-    "dings",
-    "dingy",
-    "dining",
-    "dinky",
-    "dinned",
-    "dinner",
-    "dinners",
-    "dinning",
-    "dint",
-    "diocese",
-    "diode",
-    "diodes",
-    "diorama",
-    "dioxide",
-    "dip",
-    "diploma",
-    "dipolar",
-    "dipole",
-    "dipoles",
-    "dipped",
-    "dipper",
-    "dippers",
-    "dipping",
-    "dips",
-    "dire",
-    "direct",
-    "directs",
-    "direful",
-    "direly",
-    "direst",
-    "dirge",
-    "dirges",
-    "dirt",
-    "dirtied",
-    "dirtier",
-    "dirties",
-    "dirtily",
-    "dirty",
-    "disable",
-    "disarm",
-    "disarms",
-    "disavow",
-    "disband",
-    "disbar",
-    "disbars",
-    "disc",
-    "discard",
-    "discern",
-    "disco",
-    "discoid",
-    "discord",
-    "discos",
-    "discs",
-    "discus",
-    "discuss",
-    "disdain",
-    "disease",
-    "disgust",
-    "dish",
-    "dished",
-    "dishes",
-    "dishing",
-    "dishrag",
-    "disjoin",
-    "disk",
-    "disks",
-    "dislike",
-    "dismal",
-    "dismask",
-    "dismay",
-    "dismays",
-    "dismiss",
-    "disney",
-    "disobey",
-    "disown",
-    "disowns",
-    "dispel",
-    "dispels",
-    "display",
-    "disport",
-    "dispose",
-    "dispute",
-    "disrate",
-    "disrobe",
-    "disrupt",
-    "dissect",
-    "dissent",
-    "distal",
-    "distant",
-    "distend",
-    "distill",
-    "distort",
-    "disturb",
-    "disuse",
-    "disused",
-    "ditch",
-    "ditched",
-    "ditcher",
-    "ditches",
-    "dither",
-    "dithers",
-    "ditties",
-    "ditto",
-    "dittos",
-    "ditty",
-    "diurnal",
-    "diva",
-    "divan",
-    "divans",
-    "divas",
-    "dive",
-    "dived",
-    "diver",
-    "diverge",
-    "divers",
-    "diverse",
-    "divert",
-    "diverts",
-    "dives",
-    "divest",
-    "divests",
-    "divide",
-    "divided",
-    "divider",
-    "divides",
-    "divine",
-    "divined",
-    "diviner",
-    "divines",
-    "diving",
-    "divisor",
-    "divorce",
-    "divulge",
-    "dixie",
-    "dixon",
-    "dizzily",
-    "dizzy",
-    "djinn",
-    "dl",
-    "dna",
-    "do",
-    "doc",
-    "docile",
-    "dock",
-    "dockage",
-    "docked",
-    "docker",
-    "dockers",
-    "docket",
-    "dockets",
-    "docking",
-    "docks",
-    "doctor",
-    "doctors",
-    "dodder",
-    "dodders",
-    "doddery",
-    "dodge",
-    "dodged",
-    "dodger",
-    "dodgers",
-    "dodges",
-    "dodging",
-    "dodo",
-    "dodos",
-    "doe",
-    "doer",
-    "doers",
-    "does",
-    "doeskin",
-    "doff",
-    "doffed",
-    "doffing",
-    "doffs",
-    "dog",
-    "dogfish",
-    "dogged",
-    "doggie",
-    "dogging",
-    "doggone",
-    "doggy",
-    "dogma",
-    "dogmas",
-    "dogs",
-    "dogwood",
-    "doilies",
-    "doily",
-    "doing",
-    "doings",
-    "dole",
-    "doled",
-    "doleful",
-    "doles",
-    "doling",
-    "doll",
-    "dollar",
-    "dollars",
-    "dollies",
-    "dollop",
-    "dolls",
-    "dolly",
-    "dolmen",
-    "dolphin",
-    "dolt",
-    "doltish",
-    "dolts",
-    "domain",
-    "domains",
-    "dome",
-    "domed",
-    "domes",
-    "domingo",
-    "domino",
-    "dominus",
-    "don",
-    "donald",
-    "donate",
-    "donated",
-    "donates",
-    "donator",
-    "done",
-    "donee",
-    "dong",
-    "dongle",
-    "doni",
-    "donkey",
-    "donkeys",
-    "donna",
-    "donned",
-    "donning",
-    "donor",
-    "donors",
-    "dons",
-    "doodle",
-    "doodled",
-    "doodler",
-    "doodles",
-    "doom",
-    "doomed",
-    "dooming",
-    "dooms",
-    "door",
-    "doorman",
-    "doormat",
-    "doormen",
-    "doors",
-    "doorway",
-    "dope",
-    "doped",
-    "doper",
-    "dopers",
-    "dopes",
-    "dopey",
-    "doping",
-    "doppler",
-    "dora",
-    "doric",
-    "doris",
-    "dorm",
-    "dormant",
-    "dormer",
-    "dormers",
-    "dormice",
-    "dorothy",
-    "dorsa",
-    "dorsal",
-    "dory",
-    "dosage",
-    "dosages",
-    "dose",
-    "dosed",
-    "doses",
-    "dosing",
-    "doss",
-    "dossier",
-    "dot",
-    "dotage",
-    "dotard",
-    "dote",
-    "doted",
-    "dotes",
-    "doting",
-    "dots",
-    "dotted",
-    "dottier",
-    "dotting",
-    "dotty",
-    "double",
-    "doubled",
-    "doubles",
-    "doublet",
-    "doubly",
-    "doubt",
-    "doubted",
-    "doubter",
-    "doubts",
-    "douche",
-    "doug",
-    "dough",
-    "doughty",
-    "doughy",
-    "douglas",
-    "dour",
-    "dourest",
-    "dourly",
-    "douse",
-    "doused",
-    "douses",
-    "dousing",
-    "dove",
-    "dover",
-    "doves",
-    "dow",
-    "dowager",
-    "dowdily",
-    "dowdy",
-    "dowel",
-    "doweled",
-    "dowels",
-    "dower",
-    "down",
-    "downed",
-    "downing",
-    "downs",
-    "downy",
-    "dowries",
-    "dowry",
-    "dowse",
-    "dowsed",
-    "dowser",
-    "dowsers",
-    "dowses",
-    "dowsing",
-    "doyle",
-    "doze",
-    "dozed",
-    "dozen",
-    "dozens",
-    "dozes",
-    "dozing",
-    "dozy",
-    "dr",
-    "drab",
-    "drably",
-    "drachma",
-    "dracula",
-    "draft",
-    "drafted",
-    "draftee",
-    "drafts",
-    "drag",
-    "dragged",
-    "dragger",
-    "dragnet",
-    "dragon",
-    "dragons",
-    "dragoon",
-    "drags",
-    "drain",
-    "drained",
-    "drainer",
-    "drains",
-    "drake",
-    "drakes",
-    "dram",
-    "drama",
-    "dramas",
-    "drank",
-    "drape",
-    "draped",
-    "draper",
-    "drapers",
-    "drapery",
-    "drapes",
-    "draping",
-    "drastic",
-    "drat",
-    "draught",
-    "draw",
-    "drawer",
-    "drawers",
-    "drawing",
-    "drawl",
-    "drawled",
-    "drawls",
-    "drawn",
-    "draws",
-    "dray",
-    "dread",
-    "dreaded",
-    "dreads",
-    "dream",
-    "dreamed",
-    "dreamer",
-    "dreams",
-    "dreamt",
-    "dreamy",
-    "dreary",
-    "dredge",
-    "dredged",
-    "dredger",
-    "dredges",
-    "dregs",
-    "drench",
-    "dresden",
-    "dress",
-    "dressed",
-    "dresser",
-    "dresses",
-    "dressy",
-    "drew",
-    "dribble",
-    "dried",
-    "drier",
-    "dries",
-    "driest",
-    "drift",
-    "drifted",
-    "drifter",
-    "drifts",
-    "drill",
-    "drilled",
-    "driller",
-    "drills",
-    "drily",
-    "drink",
-    "drinker",
-    "drinks",
-    "drip",
-    "dripped",
-    "drippy",
-    "drips",
-    "drive",
-    "drivel",
-    "drivels",
-    "driven",
-    "driver",
-    "drivers",
-    "drives",
-    "driving",
-    "drizzle",
-    "drizzly",
-    "droll",
-    "drolly",
-    "drone",
-    "droned",
-    "drones",
-    "droning",
-    "dronish",
-    "drool",
-    "drooled",
-    "drools",
-    "droop",
-    "drooped",
-    "droops",
-    "droopy",
-    "drop",
-    "droplet",
-    "dropout",
-    "dropped",
-    "dropper",
-    "drops",
-    "dropsy",
-    "dross",
-    "drossy",
-    "drought",
-    "drove",
-    "drover",
-    "drovers",
-    "droves",
-    "drown",
-    "drowned",
-    "drowns",
-    "drowse",
-    "drowsed",
-    "drowses",
-    "drowsy",
-    "drub",
-    "drubbed",
-    "drudge",
-    "drudged",
-    "drudges",
-    "drug",
-    "drugged",
-    "drugger",
-    "drugs",
-    "druid",
-    "druids",
-    "drum",
-    "drummed",
-    "drummer",
-    "drums",
-    "drunk",
-    "drunken",
-    "drunker",
-    "drunks",
-    "dry",
-    "dryden",
-    "dryer",
-    "dryers",
-    "drying",
-    "dryish",
-    "dryly",
-    "dryness",
-    "dsc",
-    "dual",
-    "dualism",
-    "dualist",
-    "dually",
-    "dub",
-    "dubbed",
-    "dubbin",
-    "dubbing",
-    "dubiety",
-    "dubious",
-    "dublin",
-    "dubs",
-    "ducal",
-    "ducat",
-    "duchess",
-    "duchies",
-    "duchy",
-    "duck",
-    "ducked",
-    "ducking",
-    "ducks",
-    "duct",
-    "ductile",
-    "ducts",
-    "dud",
-    "dude",
-    "dudgeon",
-    "duds",
-    "due",
-    "duel",
-    "dueled",
-    "dueler",
-    "duelers",
-    "dueling",
-    "duelist",
-    "duels",
-    "dues",
-    "duet",
-    "duets",
-    "duff",
-    "duffel",
-    "duffer",
-    "duffers",
-    "dug",
-    "dugout",
-    "dugouts",
-    "duke",
-    "dukedom",
-    "dukes",
-    "dulcet",
-    "dull",
-    "dullard",
-    "dulled",
-    "duller",
-    "dullest",
-    "dully",
-    "duluth",
-    "duly",
-    "dumb",
-    "dumbly",
-    "dumdum",
-    "dummies",
-    "dummy",
-    "dump",
-    "dumped",
-    "dumping",
-    "dumps",
-    "dumpy",
-    "dun",
-    "dunce",
-    "dunces",
-    "dune",
-    "dunes",
-    "dung",
-    "dungeon",
-    "dunk",
-    "dunked",
-    "dunking",
-    "dunkirk",
-    "dunks",
-    "dunlop",
-    "dunned",
-    "dunning",
-    "duns",
-    "duo",
-    "duopoly",
-    "dupe",
-    "duped",
-    "duper",
-    "dupers",
-    "dupes",
-    "duping",
-    "duple",
-    "duplex",
-    "durable",
-    "durably",
-    "durance",
-    "durban",
-    "duress",
-    "durham",
-    "during",
-    "dusk",
-    "duskily",
-    "dusky",
-    "dust",
-    "dustbin",
-    "dusted",
-    "duster",
-    "dusters",
-    "dustin",
-    "dusting",
-    "dustpan",
-    "dusts",
-    "dusty",
-    "dutch",
-    "duties",
-    "dutiful",
-    "duty",
-    "dwarf",
-    "dwarfed",
-    "dwarfs",
-    "dwarves",
-    "dwell",
-    "dwelled",
-    "dweller",
-    "dwells",
-    "dwelt",
-    "dwight",
-    "dwindle",
-    "dye",
-    "dyed",
-    "dyeing",
-    "dyer",
-    "dyers",
-    "dyes",
-    "dying",
-    "dyingly",
-    "dylan",
-    "dynamic",
-    "dynamo",
-    "dynamos",
-    "dynast",
-    "dynasty",
-    "each",
-    "eager",
-    "eagerly",
-    "eagle",
-    "eagles",
-    "eaglet",
-    "ear",
-    "earache",
-    "eardrum",
-    "eared",
-    "earful",
-    "earl",
-    "earldom",
-    "earlier",
-    "earlobe",
-    "earls",
-    "early",
-    "earmark",
-    "earmuff",
-    "earn",
-    "earned",
-    "earner",
-    "earners",
-    "earnest",
-    "earning",
-    "earns",
-    "earplug",
-    "earring",
-    "ears",
-    "earshot",
-    "earth",
-    "earthed",
-    "earthen",
-    "earthly",
-    "earths",
-    "earthy",
-    "earwig",
-    "earwigs",
-    "ease",
-    "eased",
-    "easel",
-    "easels",
-    "eases",
-    "easier",
-    "easiest",
-    "easily",
-    "easing",
-    "east",
-    "easter",
-    "eastern",
-    "easy",
-    "eat",
-    "eatable",
-    "eaten",
-    "eater",
-    "eaters",
-    "eating",
-    "eatings",
-    "eaton",
-    "eats",
-    "eave",
-    "eaves",
-    "ebb",
-    "ebba",
-    "ebbed",
-    "ebbing",
-    "ebbs",
-    "ebony",
-    "echelon",
-    "echo",
-    "echoed",
-    "echoes",
-    "echoing",
-    "eclair",
-    "eclairs",
-    "eclat",
-    "eclipse",
-    "ecology",
-    "economy",
-    "ecru",
-    "ecstasy",
-    "ecuador",
-    "eczema",
-    "ed",
-    "edam",
-    "eddies",
-    "eddy",
-    "edema",
-    "eden",
-    "edgar",
-    "edge",
-    "edged",
-    "edges",
-    "edgily",
-    "edging",
-    "edgy",
-    "edible",
-    "edibly",
-    "edict",
-    "edicts",
-    "edifice",
-    "edified",
-    "edifies",
-    "edify",
-    "edison",
-    "edit",
-    "edited",
-    "edith",
-    "editing",
-    "edition",
-    "editor",
-    "editors",
-    "edits",
-    "edmund",
-    "edna",
-    "educate",
-    "educe",
-    "educed",
-    "educes",
-    "edward",
-    "edwards",
-    "edwin",
-    "edwina",
-    "eel",
-    "eels",
-    "eerie",
-    "eerily",
-    "efface",
-    "effaced",
-    "effaces",
-    "effect",
-    "effects",
-    "effigy",
-    "effort",
-    "efforts",
-    "effuse",
-    "effused",
-    "effuses",
-    "eg",
-    "egg",
-    "egged",
-    "egghead",
-    "egging",
-    "eggnog",
-    "eggs",
-    "ego",
-    "egoism",
-    "egoist",
-    "egoists",
-    "egos",
-    "egotism",
-    "egotist",
-    "egress",
-    "egret",
-    "egrets",
-    "egypt",
-    "eh",
-    "eider",
-    "eight",
-    "eighth",
-    "eighths",
-    "eighty",
-    "eileen",
-    "eire",
-    "either",
-    "eject",
-    "ejected",
-    "ejector",
-    "ejects",
-    "eke",
-    "eked",
-    "ekes",
-    "eking",
-    "elaine",
-    "elan",
-    "eland",
-    "elapse",
-    "elapsed",
-    "elapses",
-    "elastic",
-    "elate",
-    "elated",
-    "elates",
-    "elating",
-    "elation",
-    "elba",
-    "elbe",
-    "elbow",
-    "elbowed",
-    "elbows",
-    "elder",
-    "elderly",
-    "elders",
-    "eldest",
-    "eleanor",
-    "elect",
-    "elected",
-    "elector",
-    "electra",
-    "electro",
-    "elects",
-    "elegant",
-    "elegiac",
-    "elegies",
-    "elegy",
-    "element",
-    "elevate",
-    "eleven",
-    "elf",
-    "elfin",
-    "elfish",
-    "eli",
-    "elias",
-    "elicit",
-    "elicits",
-    "elijah",
-    "elise",
-    "elisha",
-    "elite",
-    "elitism",
-    "elitist",
-    "elixir",
-    "elixirs",
-    "elk",
-    "elks",
-    "ell",
-    "ella",
-    "ellen",
-    "ellipse",
-    "elm",
-    "elms",
-    "elope",
-    "eloped",
-    "eloper",
-    "elopes",
-    "eloping",
-    "else",
-    "elsie",
-    "elude",
-    "eluded",
-    "eludes",
-    "eluding",
-    "elusion",
-    "elusive",
-    "elusory",
-    "elves",
-    "elvis",
-    "elysian",
-    "elysium",
-    "em",
-    "emacs",
-    "emanate",
-    "emanuel",
-    "embalm",
-    "embalms",
-    "embank",
-    "embargo",
-    "embark",
-    "embarks",
-    "embassy",
-    "embed",
-    "ember",
-    "embers",
-    "emblem",
-    "emblems",
-    "embody",
-    "emboss",
-    "embower",
-    "embrace",
-    "embroil",
-    "embryo",
-    "embryos",
-    "emend",
-    "emended",
-    "emends",
-    "emerald",
-    "emerge",
-    "emerged",
-    "emerges",
-    "emery",
-    "emetic",
-    "emetics",
-    "emigre",
-    "emil",
-    "emily",
-    "eminent",
-    "emir",
-    "emirate",
-    "emit",
-    "emits",
-    "emitted",
-    "emitter",
-    "emma",
-    "emotion",
-    "emotive",
-    "empathy",
-    "emperor",
-    "empire",
-    "empires",
-    "empiric",
-    "employ",
-    "employs",
-    "emporia",
-    "empower",
-    "empress",
-    "emptied",
-    "emptier",
-    "empties",
-    "empty",
-    "emu",
-    "emulate",
-    "emulous",
-    "emus",
-    "enable",
-    "enabled",
-    "enables",
-    "enact",
-    "enacted",
-    "enacts",
-    "enamel",
-    "enamels",
-    "enamor",
-    "enamors",
-    "encamp",
-    "encamps",
-    "encase",
-    "encased",
-    "encases",
-    "enchain",
-    "enchant",
-    "enclave",
-    "enclose",
-    "encode",
-    "encoded",
-    "encoder",
-    "encodes",
-    "encore",
-    "encores",
-    "encrust",
-    "encrypt",
-    "end",
-    "endear",
-    "endears",
-    "ended",
-    "endemic",
-    "endgame",
-    "ending",
-    "endings",
-    "endive",
-    "endless",
-    "endmost",
-    "endorse",
-    "endow",
-    "endowed",
-    "endows",
-    "ends",
-    "endue",
-    "endure",
-    "endured",
-    "endures",
-    "endways",
-    "endwise",
-    "ene",
-    "enema",
-    "enemas",
-    "enemies",
-    "enemy",
-    "energy",
-    "enfold",
-    "enfolds",
-    "enforce",
-    "engage",
-    "engaged",
-    "engages",
-    "engine",
-    "engines",
-    "england",
-    "english",
-    "engraft",
-    "engrave",
-    "engross",
-    "engulf",
-    "engulfs",
-    "enhance",
-    "enid",
-    "enigma",
-    "enigmas",
-    "enjoin",
-    "enjoins",
-    "enjoy",
-    "enjoyed",
-    "enjoys",
-    "enlarge",
-    "enlist",
-    "enlists",
-    "enliven",
-    "enmesh",
-    "enmity",
-    "ennoble",
-    "ennui",
-    "enoch",
-    "enough",
-    "enquire",
-    "enrage",
-    "enraged",
-    "enrages",
-    "enrapt",
-    "enrich",
-    "enroll",
-    "enrolls",
-    "ens",
-    "ensign",
-    "ensigns",
-    "enslave",
-    "ensnare",
-    "ensue",
-    "ensued",
-    "ensues",
-    "ensuing",
-    "ensure",
-    "ensured",
-    "ensures",
-    "entail",
-    "entails",
-    "entente",
-    "enter",
-    "entered",
-    "enters",
-    "enthuse",
-    "entice",
-    "enticed",
-    "entices",
-    "entire",
-    "entitle",
-    "entity",
-    "entomb",
-    "entombs",
-    "entrain",
-    "entrant",
-    "entrap",
-    "entreat",
-    "entree",
-    "entries",
-    "entropy",
-    "entrust",
-    "entry",
-    "entwine",
-    "envelop",
-    "envenom",
-    "envied",
-    "envies",
-    "envious",
-    "envoy",
-    "envoys",
-    "envy",
-    "envying",
-    "enzyme",
-    "enzymes",
-    "eocene",
-    "eon",
-    "eons",
-    "epee",
-    "epees",
-    "ephesus",
-    "ephraim",
-    "epic",
-    "epicene",
-    "epics",
-    "epicure",
-    "epigram",
-    "episode",
-    "epistle",
-    "epitaph",
-    "epithet",
-    "epitome",
-    "epoch",
-    "epochal",
-    "epochs",
-    "eponym",
-    "epoxy",
-    "epsilon",
-    "epsom",
-    "equable",
-    "equably",
-    "equal",
-    "equaled",
-    "equally",
-    "equals",
-    "equate",
-    "equated",
-    "equates",
-    "equator",
-    "equerry",
-    "equine",
-    "equines",
-    "equinox",
-    "equip",
-    "equips",
-    "equity",
-    "er",
-    "era",
-    "eras",
-    "erase",
-    "erased",
-    "eraser",
-    "erasers",
-    "erases",
-    "erasing",
-    "erasure",
-    "erbium",
-    "erect",
-    "erected",
-    "erectly",
-    "erector",
-    "erects",
-    "erg",
-    "ergo",
-    "ergs",
-    "eric",
-    "erie",
-    "erin",
-    "ermine",
-    "ernst",
-    "erode",
-    "eroded",
-    "erodes",
-    "eroding",
-    "eros",
-    "erosion",
-    "erosive",
-    "erotic",
-    "erotica",
-    "err",
-    "errancy",
-    "errand",
-    "errands",
-    "errant",
-    "errata",
-    "erratic",
-    "erratum",
-    "erred",
-    "erring",
-    "errol",
-    "error",
-    "errors",
-    "errs",
-    "ersatz",
-    "erudite",
-    "erupt",
-    "erupted",
-    "erupts",
-    "esau",
-    "esc",
-    "escape",
-    "escaped",
-    "escapee",
-    "escapes",
-    "eschew",
-    "eschews",
-    "escort",
-    "escorts",
-    "escudo",
-    "ese",
-    "esker",
-    "eskimo",
-    "eskimos",
-    "espied",
-    "espies",
-    "espouse",
-    "esprit",
-    "espy",
-    "espying",
-    "esquire",
-    "essay",
-    "essayed",
-    "essays",
-    "esse",
-    "essence",
-    "essoin",
-    "estate",
-    "estates",
-    "esteem",
-    "esteems",
-    "ester",
-    "estonia",
-    "estop",
-    "estuary",
-    "eta",
-    "etc",
-    "etch",
-    "etched",
-    "etcher",
-    "etches",
-    "etching",
-    "eternal",
-    "ethane",
-    "ethanol",
-    "ethel",
-    "ether",
-    "ethers",
-    "ethic",
-    "ethical",
-    "ethics",
-    "ethnic",
-    "ethos",
-    "etna",
-    "etui",
-    "etymon",
-    "etymons",
-    "euchre",
-    "euclid",
-    "eugene",
-    "eugenic",
-    "eulogic",
-    "eulogy",
-    "eunuch",
-    "eunuchs",
-    "euphony",
-    "eurasia",
-    "eureka",
-    "europe",
-    "evacuee",
-    "evade",
-    "evaded",
-    "evades",
-    "evading",
-    "evan",
-    "evangel",
-    "evasion",
-    "evasive",
-    "eve",
-    "even",
-    "evened",
-    "evening",
-    "evenly",
-    "evens",
-    "event",
-    "events",
-    "ever",
-    "everest",
-    "every",
-    "evict",
-    "evicted",
-    "evicts",
-    "evident",
-    "evil",
-    "evilly",
-    "evils",
-    "evince",
-    "evinced",
-    "evinces",
-    "evocate",
-    "evoke",
-    "evoked",
-    "evokes",
-    "evoking",
-    "evolve",
-    "evolved",
-    "evolves",
-    "ewe",
-    "ewer",
-    "ewers",
-    "ewes",
-    "ex",
-    "exact",
-    "exacted",
-    "exactly",
-    "exacts",
-    "exalt",
-    "exalted",
-    "exalts",
-    "exam",
-    "examine",
-    "example",
-    "exams",
-    "exceed",
-    "exceeds",
-    "excel",
-    "excels",
-    "except",
-    "excepts",
-    "excerpt",
-    "excess",
-    "excise",
-    "excised",
-    "excises",
-    "excite",
-    "excited",
-    "excites",
-    "exclaim",
-    "exclude",
-    "excreta",
-    "excrete",
-    "excuse",
-    "excused",
-    "excuses",
-    "exe",
-    "exec",
-    "execute",
-    "exempt",
-    "exempts",
-    "exert",
-    "exerted",
-    "exerts",
-    "exhale",
-    "exhaled",
-    "exhales",
-    "exhaust",
-    "exhibit",
-    "exhort",
-    "exhorts",
-    "exhume",
-    "exhumed",
-    "exhumes",
-    "exigent",
-    "exile",
-    "exiled",
-    "exiles",
-    "exiling",
-    "exist",
-    "existed",
-    "exists",
-    "exit",
-    "exited",
-    "exiting",
-    "exits",
-    "exodus",
-    "exotic",
-    "exotics",
-    "expand",
-    "expands",
-    "expanse",
-    "expect",
-    "expects",
-    "expel",
-    "expels",
-    "expend",
-    "expends",
-    "expense",
-    "expert",
-    "experts",
-    "expiate",
-    "expire",
-    "expired",
-    "expires",
-    "expiry",
-    "explain",
-    "explode",
-    "exploit",
-    "explore",
-    "export",
-    "exports",
-    "exposal",
-    "expose",
-    "exposed",
-    "exposes",
-    "exposit",
-    "expound",
-    "express",
-    "expunge",
-    "extant",
-    "extend",
-    "extends",
-    "extent",
-    "extents",
-    "extern",
-    "extinct",
-    "extol",
-    "extoll",
-    "extolls",
-    "extols",
-    "extort",
-    "extorts",
-    "extra",
-    "extract",
-    "extras",
-    "extrema",
-    "extreme",
-    "extrude",
-    "exude",
-    "exuded",
-    "exudes",
-    "exuding",
-    "exult",
-    "exulted",
-    "exults",
-    "exxon",
-    "eye",
-    "eyeball",
-    "eyebrow",
-    "eyed",
-    "eyeful",
-    "eyeing",
-    "eyelash",
-    "eyelet",
-    "eyelets",
-    "eyelid",
-    "eyelids",
-    "eyes",
-    "eyesore",
-    "eyewash",
-    "eyre",
-    "ezekiel",
-    "ezra",
-    "fa",
-    "faber",
-    "fable",
-    "fabled",
-    "fables",
-    "fabric",
-    "fabrics",
-    "facade",
-    "facades",
-    "face",
-    "faced",
-    "facere",
-    "faces",
-    "facet",
-    "faceted",
-    "facets",
-    "facial",
-    "facile",
-    "facing",
-    "fact",
-    "faction",
-    "factor",
-    "factors",
-    "factory",
-    "facts",
-    "factual",
-    "faculty",
-    "fad",
-    "faddy",
-    "fade",
-    "faded",
-    "fadeout",
-    "fades",
-    "fading",
-    "fads",
-    "fail",
-    "failed",
-    "failing",
-    "fails",
-    "failure",
-    "fain",
-    "faint",
-    "fainted",
-    "faintly",
-    "faints",
-    "fair",
-    "fairer",
-    "fairest",
-    "fairies",
-    "fairly",
-    "fairs",
-    "fairway",
-    "fairy",
-    "faith",
-    "faiths",
-    "fake",
-    "faked",
-    "faker",
-    "fakers",
-    "fakes",
-    "faking",
-    "fakir",
-    "fakirs",
-    "falcon",
-    "falcons",
-    "fall",
-    "fallacy",
-    "fallen",
-    "falling",
-    "falloff",
-    "fallout",
-    "fallow",
-    "falls",
-    "false",
-    "falsely",
-    "falsify",
-    "falsity",
-    "falter",
-    "falters",
-    "fame",
-    "famed",
-    "family",
-    "famine",
-    "famines",
-    "famish",
-    "famous",
-    "fan",
-    "fanatic",
-    "fancied",
-    "fancier",
-    "fancies",
-    "fancily",
-    "fancy",
-    "fanfare",
-    "fanfold",
-    "fang",
-    "fanged",
-    "fangled",
-    "fangs",
-    "fanned",
-    "fanning",
-    "fanny",
-    "fans",
-    "fantail",
-    "fantasy",
-    "far",
-    "farad",
-    "faraday",
-    "farads",
-    "faraway",
-    "farce",
-    "farces",
-    "fare",
-    "fared",
-    "fares",
-    "farina",
-    "faring",
-    "farm",
-    "farmed",
-    "farmer",
-    "farmers",
-    "farming",
-    "farmost",
-    "farms",
-    "faro",
-    "faros",
-    "farrier",
-    "farrow",
-    "farther",
-    "fascia",
-    "fascist",
-    "fashion",
-    "fast",
-    "fasted",
-    "fasten",
-    "fastens",
-    "faster",
-    "fastest",
-    "fasting",
-    "fasts",
-    "fat",
-    "fatal",
-    "fatally",
-    "fate",
-    "fated",
-    "fateful",
-    "fates",
-    "father",
-    "fathers",
-    "fathom",
-    "fathoms",
-    "fatigue",
-    "fatness",
-    "fats",
-    "fatten",
-    "fattens",
-    "fatter",
-    "fattest",
-    "fattish",
-    "fatty",
-    "fatuity",
-    "fatuous",
-    "fatuum",
-    "fault",
-    "faulted",
-    "faults",
-    "faulty",
-    "fauna",
-    "faunae",
-    "faunal",
-    "faunas",
-    "faust",
-    "favor",
-    "favored",
-    "favors",
-    "fawn",
-    "fawned",
-    "fawning",
-    "fawns",
-    "fax",
-    "faxed",
-    "faxes",
-    "faxing",
-    "fay",
-    "faze",
-    "fear",
-    "feared",
-    "fearful",
-    "fearing",
-    "fears",
-    "feast",
-    "feasted",
-    "feasts",
-    "feat",
-    "feather",
-    "feats",
-    "feature",
-    "fecal",
-    "feces",
-    "fecund",
-    "fed",
-    "federal",
-    "fedora",
-    "fee",
-    "feeble",
-    "feebly",
-    "feed",
-    "feeder",
-    "feeders",
-    "feeding",
-    "feeds",
-    "feel",
-    "feeler",
-    "feelers",
-    "feeling",
-    "feels",
-    "fees",
-    "feet",
-    "feign",
-    "feigned",
-    "feigns",
-    "feint",
-    "feinted",
-    "feints",
-    "feline",
-    "felines",
-    "fell",
-    "felled",
-    "felling",
-    "fellow",
-    "fellows",
-    "fells",
-    "felo",
-    "felon",
-    "felons",
-    "felony",
-    "felt",
-    "female",
-    "females",
-    "femur",
-    "femurs",
-    "fen",
-    "fence",
-    "fenced",
-    "fencer",
-    "fences",
-    "fencing",
-    "fend",
-    "fended",
-    "fender",
-    "fenders",
-    "fending",
-    "fends",
-    "fenian",
-    "fenians",
-    "fennel",
-    "fens",
-    "feral",
-    "ferarum",
-    "ferment",
-    "fermi",
-    "fermium",
-    "fern",
-    "fernery",
-    "ferns",
-    "ferret",
-    "ferrets",
-    "ferric",
-    "ferried",
-    "ferries",
-    "ferris",
-    "ferrite",
-    "ferrous",
-    "ferrule",
-    "ferry",
-    "fertile",
-    "ferule",
-    "fervent",
-    "fervid",
-    "fervor",
-    "festal",
-    "fester",
-    "festers",
-    "festive",
-    "festoon",
-    "fetal",
-    "fetch",
-    "fetched",
-    "fetches",
-    "fete",
-    "feted",
-    "fetes",
-    "fetid",
-    "fetish",
-    "fetlock",
-    "fetter",
-    "fetters",
-    "fettle",
-    "fettled",
-    "fetus",
-    "feud",
-    "feudal",
-    "feuded",
-    "feuding",
-    "feuds",
-    "fever",
-    "fevered",
-    "fevers",
-    "few",
-    "fewer",
-    "fewest",
-    "fewness",
-    "fey",
-    "fez",
-    "fezzes",
-    "fiance",
-    "fiancee",
-    "fiances",
-    "fiasco",
-    "fiat",
-    "fiats",
-    "fib",
-    "fibbed",
-    "fibber",
-    "fibbers",
-    "fibbing",
-    "fiber",
-    "fibers",
-    "fibroid",
-    "fibroma",
-    "fibrous",
-    "fibs",
-    "fibula",
-    "fickle",
-    "fiction",
-    "fictive",
-    "fiddle",
-    "fiddled",
-    "fiddler",
-    "fiddles",
-    "fidget",
-    "fidgets",
-    "fidgety",
-    "fief",
-    "fiefdom",
-    "field",
-    "fielded",
-    "fielder",
-    "fields",
-    "fiend",
-    "fiends",
-    "fierce",
-    "fiery",
-    "fiesta",
-    "fife",
-    "fifes",
-    "fifteen",
-    "fifth",
-    "fifths",
-    "fifties",
-    "fifty",
-    "fig",
-    "figaro",
-    "fight",
-    "fighter",
-    "fights",
-    "figment",
-    "figs",
-    "figural",
-    "figure",
-    "figured",
-    "figures",
-    "figwort",
-    "fiji",
-    "fijian",
-    "filbert",
-    "filch",
-    "filched",
-    "filches",
-    "file",
-    "filed",
-    "filer",
-    "files",
-    "filet",
-    "filets",
-    "filial",
-    "filing",
-    "filings",
-    "fill",
-    "filled",
-    "filler",
-    "fillers",
-    "fillet",
-    "fillets",
-    "fillies",
-    "filling",
-    "fillip",
-    "fillips",
-    "fills",
-    "filly",
-    "film",
-    "filmdom",
-    "filmed",
-    "filmier",
-    "filming",
-    "films",
-    "filmy",
-    "filofax",
-    "filter",
-    "filters",
-    "filth",
-    "filthy",
-    "fin",
-    "final",
-    "finale",
-    "finales",
-    "finally",
-    "finals",
-    "finance",
-    "finch",
-    "finches",
-    "find",
-    "finder",
-    "finders",
-    "finding",
-    "finds",
-    "fine",
-    "fined",
-    "finely",
-    "finer",
-    "finery",
-    "fines",
-    "finesse",
-    "finest",
-    "finger",
-    "fingers",
-    "finicky",
-    "fining",
-    "finish",
-    "finite",
-    "finland",
-    "finn",
-    "finnish",
-    "fins",
-    "fir",
-    "fire",
-    "firearm",
-    "firebug",
-    "fired",
-    "firefly",
-    "fireman",
-    "firemen",
-    "fires",
-    "firing",
-    "firkin",
-    "firkins",
-    "firm",
-    "firmed",
-    "firmer",
-    "firmest",
-    "firming",
-    "firmly",
-    "firms",
-    "firs",
-    "first",
-    "firstly",
-    "firth",
-    "fiscal",
-    "fish",
-    "fished",
-    "fisher",
-    "fishers",
-    "fishery",
-    "fishes",
-    "fishing",
-    "fishy",
-    "fissile",
-    "fission",
-    "fissure",
-    "fist",
-    "fisted",
-    "fistful",
-    "fists",
-    "fistula",
-    "fit",
-    "fitch",
-    "fitful",
-    "fitly",
-    "fitment",
-    "fitness",
-    "fits",
-    "fitted",
-    "fitter",
-    "fitters",
-    "fittest",
-    "fitting",
-    "five",
-    "fives",
-    "fix",
-    "fixable",
-    "fixate",
-    "fixated",
-    "fixed",
-    "fixedly",
-    "fixer",
-    "fixers",
-    "fixes",
-    "fixing",
-    "fixity",
-    "fixture",
-    "fizz",
-    "fizzed",
-    "fizzes",
-    "fizzing",
-    "fizzle",
-    "fizzled",
-    "fizzles",
-    "fizzy",
-    "fjord",
-    "fjords",
-    "flabby",
-    "flaccid",
-    "flacon",
-    "flag",
-    "flagged",
-    "flagon",
-    "flagons",
-    "flags",
-    "flail",
-    "flailed",
-    "flails",
-    "flair",
-    "flairs",
-    "flak",
-    "flake",
-    "flaked",
-    "flakes",
-    "flakier",
-    "flaking",
-    "flaky",
-    "flame",
-    "flamed",
-    "flames",
-    "flaming",
-    "flan",
-    "flange",
-    "flanged",
-    "flanges",
-    "flank",
-    "flanked",
-    "flanker",
-    "flanks",
-    "flannel",
-    "flap",
-    "flapped",
-    "flapper",
-    "flaps",
-    "flare",
-    "flared",
-    "flares",
-    "flaring",
-    "flash",
-    "flashed",
-    "flasher",
-    "flashes",
-    "flashy",
-    "flask",
-    "flasks",
-    "flat",
-    "flatbed",
-    "flatcar",
-    "flatly",
-    "flats",
-    "flatted",
-    "flatten",
-    "flatter",
-    "flaunt",
-    "flaunts",
-    "flavor",
-    "flavors",
-    "flaw",
-    "flawed",
-    "flaws",
-    "flax",
-    "flaxen",
-    "flay",
-    "flayed",
-    "flayer",
-    "flaying",
-    "flays",
-    "flea",
-    "fleas",
-    "fleck",
-    "flecked",
-    "flecks",
-    "fled",
-    "fledge",
-    "fledged",
-    "fledges",
-    "flee",
-    "fleece",
-    "fleeced",
-    "fleeces",
-    "fleecy",
-    "fleeing",
-    "flees",
-    "fleet",
-    "fleets",
-    "flemish",
-    "flesh",
-    "fleshed",
-    "fleshes",
-    "fleshly",
-    "fleshy",
-    "fletch",
-    "flew",
-    "flex",
-    "flexed",
-    "flexes",
-    "flexing",
-    "flick",
-    "flicked",
-    "flicker",
-    "flicks",
-    "flier",
-    "fliers",
-    "flies",
-    "flight",
-    "flights",
-    "flighty",
-    "flimsy",
-    "flinch",
-    "fling",
-    "flings",
-    "flint",
-    "flints",
-    "flinty",
-    "flip",
-    "flipped",
-    "flipper",
-    "flips",
-    "flirt",
-    "flirted",
-    "flirts",
-    "flit",
-    "flitch",
-    "flits",
-    "flitted",
-    "float",
-    "floated",
-    "floater",
-    "floats",
-    "flock",
-    "flocked",
-    "flocks",
-    "floe",
-    "floes",
-    "flog",
-    "flogged",
-    "flogger",
-    "flogs",
-    "flood",
-    "flooded",
-    "floods",
-    "floor",
-    "floored",
-    "floors",
-    "floozy",
-    "flop",
-    "flopped",
-    "floppy",
-    "flops",
-    "flora",
-    "florae",
-    "floral",
-    "floras",
-    "florid",
-    "florida",
-    "florin",
-    "florins",
-    "florist",
-    "floss",
-    "flossy",
-    "flotsam",
-    "flounce",
-    "flour",
-    "floured",
-    "flours",
-    "floury",
-    "flout",
-    "flouted",
-    "flouts",
-    "flow",
-    "flowed",
-    "flower",
-    "flowers",
-    "flowery",
-    "flowing",
-    "flown",
-    "flows",
-    "flp",
-    "flu",
-    "flue",
-    "fluency",
-    "fluent",
-    "flues",
-    "fluff",
-    "fluffed",
-    "fluffs",
-    "fluffy",
-    "fluid",
-    "fluids",
-    "fluke",
-    "flukes",
-    "flung",
-    "flunk",
-    "flunked",
-    "flunky",
-    "fluor",
-    "flurry",
-    "flush",
-    "flushed",
-    "flushes",
-    "fluster",
-    "flute",
-    "fluted",
-    "flutes",
-    "fluting",
-    "flutist",
-    "flutter",
-    "flux",
-    "fluxes",
-    "fluxion",
-    "fluxum",
-    "fly",
-    "flyable",
-    "flyer",
-    "flyers",
-    "flying",
-    "flyleaf",
-    "flyway",
-    "flyways",
-    "foal",
-    "foaled",
-    "foaling",
-    "foals",
-    "foam",
-    "foamed",
-    "foaming",
-    "foams",
-    "foamy",
-    "fob",
-    "fobbed",
-    "fobbing",
-    "fobs",
-    "focal",
-    "focally",
-    "foci",
-    "focus",
-    "focused",
-    "focuses",
-    "fodder",
-    "foe",
-    "foes",
-    "fog",
-    "fogey",
-    "fogged",
-    "fogging",
-    "foggy",
-    "foghorn",
-    "fogies",
-    "fogs",
-    "fogy",
-    "foible",
-    "foibles",
-    "foil",
-    "foiled",
-    "foiling",
-    "foils",
-    "foist",
-    "foisted",
-    "foists",
-    "fold",
-    "folded",
-    "folder",
-    "folders",
-    "folding",
-    "foldout",
-    "folds",
-    "foliage",
-    "folio",
-    "folios",
-    "folk",
-    "folks",
-    "folksy",
-    "folkway",
-    "follies",
-    "follow",
-    "follows",
-    "folly",
-    "foment",
-    "foments",
-    "fond",
-    "fondant",
-    "fonder",
-    "fondest",
-    "fondle",
-    "fondled",
-    "fondles",
-    "fondly",
-    "fondue",
-    "font",
-    "fonts",
-    "food",
-    "foods",
-    "fool",
-    "fooled",
-    "foolery",
-    "fooling",
-    "foolish",
-    "fools",
-    "foot",
-    "footage",
-    "footed",
-    "footer",
-    "footers",
-    "footing",
-    "footman",
-    "footmen",
-    "footpad",
-    "fop",
-    "foppery",
-    "foppish",
-    "for",
-    "forage",
-    "foraged",
-    "forages",
-    "foray",
-    "forayed",
-    "forays",
-    "forbad",
-    "forbade",
-    "forbear",
-    "forbes",
-    "forbid",
-    "forbids",
-    "forbore",
-    "force",
-    "forced",
-    "forceps",
-    "forces",
-    "forcing",
-    "ford",
-    "forded",
-    "fording",
-    "fords",
-    "fore",
-    "forearm",
-    "forego",
-    "foreign",
-    "foreleg",
-    "foreman",
-    "foremen",
-    "foresaw",
-    "foresee",
-    "forest",
-    "forests",
-    "forever",
-    "forfeit",
-    "forgave",
-    "forge",
-    "forged",
-    "forger",
-    "forgers",
-    "forgery",
-    "forges",
-    "forget",
-    "forgets",
-    "forging",
-    "forgive",
-    "forgo",
-    "forgoes",
-    "forgone",
-    "forgot",
-    "forint",
-    "fork",
-    "forked",
-    "forking",
-    "forks",
-    "forlorn",
-    "form",
-    "formal",
-    "formant",
-    "format",
-    "formate",
-    "formats",
-    "formed",
-    "former",
-    "formic",
-    "formica",
-    "forming",
-    "formosa",
-    "forms",
-    "formula",
-    "forsake",
-    "forsook",
-    "fort",
-    "forte",
-    "fortes",
-    "forth",
-    "forties",
-    "fortify",
-    "fortran",
-    "forts",
-    "fortune",
-    "forty",
-    "forum",
-    "forums",
-    "forward",
-    "forwent",
-    "fossil",
-    "fossils",
-    "foster",
-    "fosters",
-    "fought",
-    "foul",
-    "fouled",
-    "fouler",
-    "foulest",
-    "fouling",
-    "foully",
-    "fouls",
-    "found",
-    "founded",
-    "founder",
-    "foundry",
-    "founds",
-    "fount",
-    "founts",
-    "four",
-    "fourier",
-    "fours",
-    "fourth",
-    "fowl",
-    "fowls",
-    "fox",
-    "foxed",
-    "foxes",
-    "foxhole",
-    "foxing",
-    "foxtail",
-    "foxtrot",
-    "foxy",
-    "foyer",
-    "foyers",
-    "fracas",
-    "fragile",
-    "frail",
-    "frailer",
-    "frailty",
-    "frame",
-    "framed",
-    "framer",
-    "frames",
-    "framing",
-    "franc",
-    "france",
-    "frances",
-    "francis",
-    "francs",
-    "frank",
-    "franked",
-    "franker",
-    "frankly",
-    "franks",
-    "frantic",
-    "fraud",
-    "frauds",
-    "fraught",
-    "fray",
-    "frayed",
-    "fraying",
-    "frays",
-    "frazzle",
-    "freak",
-    "freaked",
-    "freaks",
-    "freaky",
-    "freckle",
-    "fred",
-    "freda",
-    "freddie",
-    "free",
-    "freed",
-    "freedom",
-    "freeing",
-    "freely",
-    "freeman",
-    "freemen",
-    "frees",
-    "freeway",
-    "freeze",
-    "freezer",
-    "freezes",
-    "freight",
-    "french",
-    "frenzy",
-    "freon",
-    "freons",
-    "fresco",
-    "frescos",
-    "fresh",
-    "freshen",
-    "fresher",
-    "freshly",
-    "fresnel",
-    "fret",
-    "fretful",
-    "frets",
-    "fretsaw",
-    "fretted",
-    "freud",
-    "friable",
-    "friar",
-    "friars",
-    "friary",
-    "friday",
-    "fridays",
-    "fridge",
-    "fridges",
-    "fried",
-    "friend",
-    "friends",
-    "fries",
-    "frieze",
-    "friezes",
-    "frigate",
-    "fright",
-    "frights",
-    "frigid",
-    "frill",
-    "frills",
-    "frilly",
-    "fringe",
-    "fringed",
-    "fringes",
-    "frisca",
-    "frisk",
-    "frisked",
-    "frisks",
-    "frisky",
-    "fritter",
-    "frizz",
-    "frizzed",
-    "frizzle",
-    "frizzy",
-    "fro",
-    "frock",
-    "frocked",
-    "frocks",
-    "frog",
-    "frogman",
-    "frogmen",
-    "frogs",
-    "frolic",
-    "frolics",
-    "from",
-    "frond",
-    "fronds",
-    "front",
-    "frontal",
-    "fronted",
-    "fronts",
-    "frost",
-    "frosted",
-    "frosts",
-    "frosty",
-    "froth",
-    "frothed",
-    "froths",
-    "frothy",
-    "frown",
-    "frowned",
-    "frowns",
-    "froze",
-    "frozen",
-    "frs",
-    "frugal",
-    "fruit",
-    "fruited",
-    "fruits",
-    "fruity",
-    "frump",
-    "frumps",
-    "fry",
-    "frying",
-    "ft",
-    "fuchsia",
-    "fuddle",
-    "fudge",
-    "fudged",
-    "fudges",
-    "fudging",
-    "fuel",
-    "fueled",
-    "fueling",
-    "fuels",
-    "fugal",
-    "fugue",
-    "fugues",
-    "fuji",
-    "fulcra",
-    "fulcrum",
-    "fulfill",
-    "full",
-    "fuller",
-    "fullest",
-    "fully",
-    "fulsome",
-    "fumble",
-    "fumbled",
-    "fumbles",
-    "fume",
-    "fumed",
-    "fumes",
-    "fuming",
-    "fun",
-    "fund",
-    "funded",
-    "funding",
-    "funds",
-    "funeral",
-    "fungal",
-    "fungi",
-    "fungoid",
-    "fungous",
-    "fungus",
-    "funk",
-    "funks",
-    "funky",
-    "funnel",
-    "funnels",
-    "funnier",
-    "funnily",
-    "funning",
-    "funny",
-    "fur",
-    "furbish",
-    "furies",
-    "furious",
-    "furl",
-    "furled",
-    "furling",
-    "furlong",
-    "furnace",
-    "furnish",
-    "furor",
-    "furred",
-    "furrier",
-    "furring",
-    "furrow",
-    "furrows",
-    "furry",
-    "furs",
-    "further",
-    "furtive",
-    "fury",
-    "furze",
-    "fuse",
-    "fused",
-    "fuses",
-    "fusible",
-    "fusing",
-    "fusion",
-    "fusions",
-    "fuss",
-    "fussed",
-    "fusses",
-    "fussily",
-    "fussing",
-    "fusspot",
-    "fussy",
-    "fustis",
-    "fusty",
-    "futile",
-    "futon",
-    "future",
-    "futures",
-    "fuzz",
-    "fuzzed",
-    "fuzzily",
-    "fuzzy",
-    "gab",
-    "gabble",
-    "gabbled",
-    "gabbles",
-    "gable",
-    "gabled",
-    "gables",
-    "gabon",
-    "gabriel",
-    "gad",
-    "gadded",
-    "gadfly",
-    "gadget",
-    "gadgets",
-    "gael",
-    "gaelic",
-    "gaffe",
-    "gaffer",
-    "gaffers",
-    "gaffes",
-    "gag",
-    "gage",
-    "gages",
-    "gagged",
-    "gagging",
-    "gaggle",
-    "gaggles",
-    "gagman",
-    "gagmen",
-    "gags",
-    "gaiety",
-    "gail",
-    "gaily",
-    "gain",
-    "gained",
-    "gainer",
-    "gainers",
-    "gainful",
-    "gaining",
-    "gains",
-    "gainsay",
-    "gait",
-    "gaiter",
-    "gaiters",
-    "gaits",
-    "gal",
-    "gala",
-    "galas",
-    "galaxy",
-    "gale",
-    "gales",
-    "galilee",
-    "galileo",
-    "gall",
-    "gallant",
-    "galled",
-    "galleon",
-    "gallery",
-    "galley",
-    "galleys",
-    "gallic",
-    "galling",
-    "gallium",
-    "gallon",
-    "gallons",
-    "galloon",
-    "gallop",
-    "gallops",
-    "gallows",
-    "galls",
-    "gallup",
-    "galore",
-    "gals",
-    "gambia",
-    "gambit",
-    "gambits",
-    "gamble",
-    "gambled",
-    "gambler",
-    "gambles",
-    "gambol",
-    "gambols",
-    "game",
-    "gamely",
-    "games",
-    "gamin",
-    "gaming",
-    "gamma",
-    "gammon",
-    "gammons",
-    "gamp",
-    "gamut",
-    "gander",
-    "ganders",
-    "gandhi",
-    "gang",
-    "ganged",
-    "ganges",
-    "ganging",
-    "gangly",
-    "gangs",
-    "gangue",
-    "gangues",
-    "gangway",
-    "gannet",
-    "gannets",
-    "gannett",
-    "gantry",
-    "gap",
-    "gape",
-    "gaped",
-    "gapes",
-    "gaping",
-    "gaps",
-    "garage",
-    "garaged",
-    "garages",
-    "garb",
-    "garbage",
-    "garbed",
-    "garble",
-    "garbled",
-    "garbler",
-    "garbles",
-    "gardein",
-    "garden",
-    "gardens",
-    "garfish",
-    "gargle",
-    "gargled",
-    "gargles",
-    "garish",
-    "garland",
-    "garlic",
-    "garment",
-    "garner",
-    "garners",
-    "garnet",
-    "garnets",
-    "garnish",
-    "garret",
-    "garrets",
-    "garrote",
-    "garter",
-    "garters",
-    "gary",
-    "gas",
-    "gaseous",
-    "gases",
-    "gash",
-    "gashes",
-    "gashing",
-    "gasify",
-    "gasket",
-    "gaskets",
-    "gasp",
-    "gasped",
-    "gasping",
-    "gasps",
-    "gassed",
-    "gasser",
-    "gasses",
-    "gassing",
-    "gassy",
-    "gastric",
-    "gate",
-    "gateau",
-    "gateaus",
-    "gateaux",
-    "gated",
-    "gates",
-    "gateway",
-    "gather",
-    "gathers",
-    "gating",
-    "gatt",
-    "gauche",
-    "gaudier",
-    "gaudily",
-    "gaudy",
-    "gauge",
-    "gauged",
-    "gauges",
-    "gauging",
-    "gaul",
-    "gaunt",
-    "gaunter",
-    "gauntly",
-    "gauss",
-    "gauze",
-    "gauzes",
-    "gauzy",
-    "gave",
-    "gavel",
-    "gavels",
-    "gavin",
-    "gavotte",
-    "gawk",
-    "gawked",
-    "gawking",
-    "gawkish",
-    "gawks",
-    "gawky",
-    "gay",
-    "gaylord",
-    "gays",
-    "gaze",
-    "gazebo",
-    "gazebos",
-    "gazed",
-    "gazelle",
-    "gazer",
-    "gazers",
-    "gazes",
-    "gazette",
-    "gazing",
-    "gazon",
-    "gazump",
-    "gazumps",
-    "gb",
-    "gear",
-    "gearbox",
-    "geared",
-    "gearing",
-    "gears",
-    "gee",
-    "geese",
-    "geezer",
-    "geezers",
-    "geiger",
-    "geisha",
-    "geishas",
-    "gel",
-    "gelatin",
-    "geld",
-    "gelding",
-    "gem",
-    "gemini",
-    "gemlike",
-    "gems",
-    "gender",
-    "genders",
-    "gene",
-    "genera",
-    "general",
-    "generic",
-    "genes",
-    "geneses",
-    "genesis",
-    "genet",
-    "genetic",
-    "geneva",
-    "genial",
-    "genie",
-    "genii",
-    "genital",
-    "genius",
-    "genoa",
-    "genre",
-    "genres",
-    "genteel",
-    "gentian",
-    "gentile",
-    "gentle",
-    "gentler",
-    "gently",
-    "gentry",
-    "genuine",
-    "genus",
-    "geodesy",
-    "geoff",
-    "geology",
-    "george",
-    "georgia",
-    "gerald",
-    "gerard",
-    "gerbil",
-    "gerbils",
-    "germ",
-    "german",
-    "germane",
-    "germans",
-    "germany",
-    "germs",
-    "gerund",
-    "gestalt",
-    "gestapo",
-    "gesture",
-    "get",
-    "getaway",
-    "gets",
-    "getting",
-    "getup",
-    "geyser",
-    "geysers",
-    "ghana",
-    "ghastly",
-    "ghent",
-    "gherkin",
-    "ghetto",
-    "ghettos",
-    "ghost",
-    "ghosted",
-    "ghostly",
-    "ghosts",
-    "ghoul",
-    "ghouls",
-    "giant",
-    "giants",
-    "gibber",
-    "gibbers",
-    "gibbet",
-    "gibbets",
-    "gibbon",
-    "gibbons",
-    "gibe",
-    "gibed",
-    "gibes",
-    "gibing",
-    "giblet",
-    "giblets",
-    "giddily",
-    "giddy",
-    "gideon",
-    "gift",
-    "gifted",
-    "gifts",
-    "gig",
-    "giggle",
-    "giggled",
-    "giggles",
-    "giggly",
-    "gigolo",
-    "gigolos",
-    "gigs",
-    "gild",
-    "gilded",
-    "gilding",
-    "gilds",
-    "gill",
-    "gills",
-    "gilt",
-    "gimlet",
-    "gimlets",
-    "gimmick",
-    "gin",
-    "ginger",
-    "gingers",
-    "gingham",
-    "gins",
-    "ginseng",
-    "gipsies",
-    "gipsy",
-    "giraffe",
-    "gird",
-    "girded",
-    "girder",
-    "girders",
-    "girding",
-    "girdle",
-    "girdled",
-    "girdles",
-    "girds",
-    "girl",
-    "girlie",
-    "girlish",
-    "girls",
-    "giro",
-    "giros",
-    "girth",
-    "girths",
-    "gist",
-    "give",
-    "given",
-    "giver",
-    "givers",
-    "gives",
-    "giveth",
-    "giving",
-    "gizmo",
-    "gizzard",
-    "glace",
-    "glacial",
-    "glacier",
-    "glad",
-    "gladden",
-    "glade",
-    "glades",
-    "gladly",
-    "glamour",
-    "glance",
-    "glanced",
-    "glances",
-    "gland",
-    "glands",
-    "glare",
-    "glared",
-    "glares",
-    "glaring",
-    "glasgow",
-    "glass",
-    "glasses",
-    "glassy",
-    "glaze",
-    "glazed",
-    "glazes",
-    "glazier",
-    "glazing",
-    "gleam",
-    "gleamed",
-    "gleams",
-    "glean",
-    "gleaned",
-    "gleaner",
-    "gleans",
-    "glee",
-    "gleeful",
-    "glen",
-    "glens",
-    "glib",
-    "glibly",
-    "glide",
-    "glided",
-    "glider",
-    "gliders",
-    "glides",
-    "gliding",
-    "glimmer",
-    "glimpse",
-    "glint",
-    "glinted",
-    "glints",
-    "glisten",
-    "glister",
-    "glitch",
-    "glitter",
-    "gloat",
-    "gloated",
-    "gloater",
-    "gloats",
-    "global",
-    "globe",
-    "globes",
-    "globule",
-    "gloms",
-    "gloom",
-    "gloomy",
-    "glories",
-    "glorify",
-    "glory",
-    "gloss",
-    "glossae",
-    "glossed",
-    "glosses",
-    "glossy",
-    "glottal",
-    "glottis",
-    "glove",
-    "gloved",
-    "gloves",
-    "glow",
-    "glowed",
-    "glower",
-    "glowers",
-    "glowing",
-    "glows",
-    "glucose",
-    "glue",
-    "glued",
-    "glues",
-    "gluey",
-    "gluing",
-    "glum",
-    "glumly",
-    "glummer",
-    "glut",
-    "gluten",
-    "gluts",
-    "glutted",
-    "glutton",
-    "glycol",
-    "glycols",
-    "gm",
-    "gmt",
-    "gnarl",
-    "gnarled",
-    "gnarls",
-    "gnash",
-    "gnashed",
-    "gnashes",
-    "gnat",
-    "gnats",
-    "gnaw",
-    "gnawed",
-    "gnawing",
-    "gnaws",
-    "gneiss",
-    "gnocchi",
-    "gnome",
-    "gnomes",
-    "gnomish",
-    "gnostic",
-    "gnu",
-    "gnus",
-    "go",
-    "goad",
-    "goaded",
-    "goading",
-    "goads",
-    "goal",
-    "goalie",
-    "goals",
-    "goat",
-    "goatee",
-    "goats",
-    "gob",
-    "gobble",
-    "gobbled",
-    "gobbler",
-    "gobbles",
-    "gobi",
-    "goblet",
-    "goblets",
-    "goblin",
-    "goblins",
-    "god",
-    "goddess",
-    "godfrey",
-    "godhead",
-    "godless",
-    "godlike",
-    "godly",
-    "gods",
-    "godsend",
-    "godson",
-    "godsons",
-    "goes",
-    "goethe",
-    "gofer",
-    "goggle",
-    "goggled",
-    "goggles",
-    "going",
-    "goings",
-    "goiter",
-    "gold",
-    "golden",
-    "golf",
-    "golfer",
-    "golfers",
-    "golfing",
-    "goliath",
-    "golly",
-    "gonad",
-    "gondola",
-    "gone",
-    "goner",
-    "goners",
-    "gong",
-    "gongs",
-    "goo",
-    "good",
-    "goodbye",
-    "goodie",
-    "goodies",
-    "goodish",
-    "goodly",
-    "goodman",
-    "goods",
-    "goody",
-    "goof",
-    "goofed",
-    "goofs",
-    "goofy",
-    "googol",
-    "goon",
-    "goose",
-    "gopher",
-    "gore",
-    "gored",
-    "gores",
-    "gorge",
-    "gorged",
-    "gorges",
-    "gorging",
-    "gorilla",
-    "goring",
-    "gorse",
-    "gorton",
-    "gory",
-    "gosh",
-    "goshawk",
-    "gosling",
-    "gospel",
-    "gospels",
-    "gossip",
-    "gossips",
-    "gossipy",
-    "got",
-    "goth",
-    "gothic",
-    "gotten",
-    "gouache",
-    "gouda",
-    "gouge",
-    "gouged",
-    "gouges",
-    "gouging",
-    "goulash",
-    "gourd",
-    "gourds",
-    "gourmet",
-    "gout",
-    "gouty",
-    "govern",
-    "governs",
-    "gown",
-    "gowned",
-    "gowning",
-    "gowns",
-    "goya",
-    "grab",
-    "grabbed",
-    "grabber",
-    "grabby",
-    "grabs",
-    "grace",
-    "graced",
-    "graces",
-    "gracing",
-    "grad",
-    "gradate",
-    "grade",
-    "graded",
-    "grader",
-    "grades",
-    "grading",
-    "gradual",
-    "graft",
-    "grafted",
-    "grafts",
-    "graham",
-    "grail",
-    "grain",
-    "grained",
-    "grains",
-    "grainy",
-    "gram",
-    "grammar",
-    "grams",
-    "granary",
-    "grand",
-    "grandee",
-    "grandly",
-    "grandma",
-    "grandpa",
-    "grange",
-    "granges",
-    "granite",
-    "granny",
-    "granola",
-    "grant",
-    "granted",
-    "granter",
-    "grants",
-    "granule",
-    "grape",
-    "grapes",
-    "graph",
-    "graphed",
-    "graphic",
-    "graphs",
-    "grapnel",
-    "grapple",
-    "grasp",
-    "grasped",
-    "grasps",
-    "grass",
-    "grassed",
-    "grasser",
-    "grasses",
-    "grassy",
-    "grate",
-    "grated",
-    "grater",
-    "graters",
-    "grates",
-    "gratiae",
-    "gratify",
-    "gratin",
-    "grating",
-    "gratis",
-    "grave",
-    "gravel",
-    "gravels",
-    "gravely",
-    "graven",
-    "graver",
-    "graves",
-    "gravest",
-    "gravity",
-    "gravy",
-    "gray",
-    "grayed",
-    "grayer",
-    "graying",
-    "grayish",
-    "grays",
-    "graze",
-    "grazed",
-    "grazer",
-    "grazers",
-    "grazes",
-    "grazing",
-    "grease",
-    "greased",
-    "greaser",
-    "greases",
-    "greasy",
-    "great",
-    "greater",
-    "greatly",
-    "grebe",
-    "grebes",
-    "grecian",
-    "greece",
-    "greed",
-    "greedy",
-    "greek",
-    "greeks",
-    "green",
-    "greened",
-    "greens",
-    "greet",
-    "greeted",
-    "greets",
-    "gregory",
-    "gremlin",
-    "grenada",
-    "grenade",
-    "grew",
-    "grid",
-    "griddle",
-    "grids",
-    "grief",
-    "grieg",
-    "grieve",
-    "grieved",
-    "grieves",
-    "griffin",
-    "grill",
-    "grille",
-    "grilled",
-    "grilles",
-    "grills",
-    "grim",
-    "grimace",
-    "grime",
-    "grimed",
-    "grimes",
-    "grimily",
-    "grimly",
-    "grimmer",
-    "grimy",
-    "grin",
-    "grind",
-    "grinder",
-    "grinds",
-    "grinned",
-    "grins",
-    "grip",
-    "gripe",
-    "griped",
-    "gripes",
-    "griping",
-    "gripped",
-    "grips",
-    "grisly",
-    "grist",
-    "gristle",
-    "gristly",
-    "grit",
-    "grits",
-    "gritted",
-    "gritty",
-    "grizzle",
-    "grizzly",
-    "groan",
-    "groaned",
-    "groaner",
-    "groans",
-    "groat",
-    "groats",
-    "grocer",
-    "grocers",
-    "grocery",
-    "grog",
-    "groggy",
-    "groin",
-    "groins",
-    "grommet",
-    "groom",
-    "groomed",
-    "grooms",
-    "groove",
-    "grooved",
-    "grooves",
-    "groovy",
-    "grope",
-    "groped",
-    "gropes",
-    "groping",
-    "gross",
-    "grosser",
-    "grossly",
-    "grotto",
-    "grouch",
-    "grouchy",
-    "ground",
-    "grounds",
-    "group",
-    "grouped",
-    "grouper",
-    "groups",
-    "grouse",
-    "groused",
-    "grouses",
-    "grout",
-    "grouted",
-    "grouts",
-    "grove",
-    "grovel",
-    "grovels",
-    "groves",
-    "grow",
-    "grower",
-    "growers",
-    "growing",
-    "growl",
-    "growled",
-    "growler",
-    "growls",
-    "grown",
-    "grownup",
-    "grows",
-    "growth",
-    "growths",
-    "grub",
-    "grubbed",
-    "grubby",
-    "grubs",
-    "grudge",
-    "grudged",
-    "grudger",
-    "grudges",
-    "gruel",
-    "gruff",
-    "gruffly",
-    "grumble",
-    "grumbly",
-    "grump",
-    "grumps",
-    "grumpy",
-    "grunt",
-    "grunted",
-    "grunts",
-    "gruyere",
-    "guam",
-    "guano",
-    "guard",
-    "guarded",
-    "guards",
-    "guava",
-    "gudgeon",
-    "guess",
-    "guessed",
-    "guesses",
-    "guest",
-    "guests",
-    "guffaw",
-    "guffaws",
-    "guide",
-    "guided",
-    "guides",
-    "guiding",
-    "guild",
-    "guilder",
-    "guilds",
-    "guile",
-    "guilt",
-    "guilty",
-    "guinea",
-    "guineas",
-    "guise",
-    "guises",
-    "guitar",
-    "guitars",
-    "gulf",
-    "gulfs",
-    "gull",
-    "gulled",
-    "gullet",
-    "gullets",
-    "gullies",
-    "gulls",
-    "gully",
-    "gulp",
-    "gulped",
-    "gulping",
-    "gulps",
-    "gum",
-    "gumbo",
-    "gumboil",
-    "gumbos",
-    "gumdrop",
-    "gummed",
-    "gummier",
-    "gumming",
-    "gummy",
-    "gums",
-    "gumshoe",
-    "gun",
-    "gunboat",
-    "gunfire",
-    "gunk",
-    "gunman",
-    "gunmen",
-    "gunned",
-    "gunner",
-    "gunners",
-    "gunnery",
-    "gunning",
-    "gunny",
-    "gunplay",
-    "guns",
-    "gunshot",
-    "gunwale",
-    "guppies",
-    "guppy",
-    "gurgle",
-    "gurgled",
-    "gurgles",
-    "guru",
-    "gurus",
-    "gus",
-    "gush",
-    "gushed",
-    "gusher",
-    "gushes",
-    "gushing",
-    "gushy",
-    "gusset",
-    "gussets",
-    "gust",
-    "gusted",
-    "gustier",
-    "gusting",
-    "gusto",
-    "gusts",
-    "gusty",
-    "gut",
-    "gutless",
-    "guts",
-    "gutsy",
-    "gutted",
-    "gutter",
-    "gutters",
-    "gutting",
-    "guy",
-    "guyana",
-    "guying",
-    "guys",
-    "guzzle",
-    "guzzled",
-    "guzzler",
-    "guzzles",
-    "gym",
-    "gymnast",
-    "gyms",
-    "gypsies",
-    "gypsite",
-    "gypsum",
-    "gypsy",
-    "gyrate",
-    "gyrated",
-    "gyrates",
-    "gyro",
-    "gyros",
-    "ha",
-    "habet",
-    "habit",
-    "habitat",
-    "habits",
-    "habitue",
-    "hack",
-    "hacked",
-    "hacker",
-    "hackers",
-    "hacking",
-    "hackle",
-    "hackles",
-    "hackney",
-    "hacks",
-    "hacksaw",
-    "had",
-    "haddock",
-    "hades",
-    "hafnes",
-    "hafnium",
-    "hag",
-    "haggai",
-    "haggard",
-    "haggis",
-    "haggle",
-    "haggled",
-    "haggler",
-    "haggles",
-    "hags",
-    "hague",
-    "haifa",
-    "haiku",
-    "hail",
-    "hailed",
-    "hailers",
-    "hailing",
-    "hails",
-    "hair",
-    "haircut",
-    "hairdo",
-    "hairdos",
-    "haired",
-    "hairier",
-    "hairpin",
-    "hairs",
-    "hairy",
-    "haiti",
-    "haitian",
-    "hake",
-    "halberd",
-    "halcyon",
-    "hale",
-    "haley",
-    "half",
-    "halfway",
-    "halibut",
-    "halifax",
-    "hall",
-    "halloo",
-    "hallow",
-    "halls",
-    "hallway",
-    "halo",
-    "haloes",
-    "halogen",
-    "halos",
-    "halt",
-    "halted",
-    "halter",
-    "halters",
-    "halting",
-    "halts",
-    "halve",
-    "halved",
-    "halves",
-    "halving",
-    "halyard",
-    "ham",
-    "hamburg",
-    "hamlet",
-    "hamlets",
-    "hammed",
-    "hammer",
-    "hammers",
-    "hammier",
-    "hamming",
-    "hammock",
-    "hammy",
-    "hamper",
-    "hampers",
-    "hams",
-    "hamster",
-    "hancock",
-    "hand",
-    "handbag",
-    "handcar",
-    "handed",
-    "handel",
-    "handful",
-    "handgun",
-    "handier",
-    "handily",
-    "handing",
-    "handle",
-    "handled",
-    "handler",
-    "handles",
-    "handout",
-    "hands",
-    "handsaw",
-    "handsel",
-    "handset",
-    "handy",
-    "hang",
-    "hangar",
-    "hangars",
-    "hangdog",
-    "hanged",
-    "hanger",
-    "hangers",
-    "hanging",
-    "hangman",
-    "hangmen",
-    "hangout",
-    "hangs",
-    "hangup",
-    "hangups",
-    "hank",
-    "hanker",
-    "hankers",
-    "hanks",
-    "hanky",
-    "hanna",
-    "hannah",
-    "hanoi",
-    "hanover",
-    "hansard",
-    "hanse",
-    "hapless",
-    "haply",
-    "happen",
-    "happens",
-    "happier",
-    "happily",
-    "happy",
-    "harare",
-    "harass",
-    "harbor",
-    "harbors",
-    "hard",
-    "harden",
-    "hardens",
-    "harder",
-    "hardest",
-    "hardhat",
-    "hardier",
-    "hardily",
-    "hardly",
-    "hardtop",
-    "hardy",
-    "hare",
-    "harelip",
-    "harem",
-    "harems",
-    "hares",
-    "haricot",
-    "haring",
-    "hark",
-    "harken",
-    "harking",
-    "harks",
-    "harlem",
-    "harlot",
-    "harlots",
-    "harm",
-    "harmed",
-    "harmful",
-    "harming",
-    "harmony",
-    "harms",
-    "harness",
-    "harold",
-    "harp",
-    "harped",
-    "harpies",
-    "harping",
-    "harpist",
-    "harpoon",
-    "harps",
-    "harpy",
-    "harried",
-    "harrier",
-    "harries",
-    "harriet",
-    "harris",
-    "harrow",
-    "harrows",
-    "harry",
-    "harsh",
-    "harshen",
-    "harsher",
-    "harshly",
-    "hart",
-    "harts",
-    "harvard",
-    "harvest",
-    "harvey",
-    "has",
-    "hash",
-    "hashed",
-    "hasher",
-    "hashes",
-    "hashing",
-    "hashish",
-    "hasp",
-    "hasps",
-    "hassle",
-    "hassled",
-    "hassles",
-    "hassock",
-    "haste",
-    "hasted",
-    "hasten",
-    "hastens",
-    "hastes",
-    "hastier",
-    "hastily",
-    "hasting",
-    "hasty",
-    "hat",
-    "hatband",
-    "hatbox",
-    "hatch",
-    "hatched",
-    "hatches",
-    "hatchet",
-    "hate",
-    "hated",
-    "hateful",
-    "hater",
-    "haters",
-    "hates",
-    "hatful",
-    "hatfuls",
-    "hating",
-    "hatless",
-    "hatpin",
-    "hatpins",
-    "hatred",
-    "hats",
-    "hatted",
-    "hatter",
-    "hatters",
-    "haugh",
-    "haughty",
-    "haul",
-    "haulage",
-    "hauled",
-    "hauler",
-    "haulers",
-    "hauling",
-    "hauls",
-    "haunch",
-    "haunt",
-    "haunted",
-    "haunter",
-    "haunts",
-    "hausa",
-    "havana",
-    "have",
-    "haven",
-    "havens",
-    "haver",
-    "havered",
-    "havers",
-    "having",
-    "havoc",
-    "hawaii",
-    "hawk",
-    "hawkbit",
-    "hawked",
-    "hawker",
-    "hawkers",
-    "hawking",
-    "hawks",
-    "hawse",
-    "hawser",
-    "hay",
-    "haydn",
-    "hayed",
-    "hayfork",
-    "hayling",
-    "hayloft",
-    "hayrack",
-    "hays",
-    "hayseed",
-    "haywire",
-    "hazard",
-    "hazards",
-    "haze",
-    "hazel",
-    "hazes",
-    "hazier",
-    "hazily",
-    "hazy",
-    "he",
-    "head",
-    "headed",
-    "header",
-    "headers",
-    "headily",
-    "heading",
-    "headman",
-    "headpin",
-    "heads",
-    "headset",
-    "headway",
-    "heady",
-    "heal",
-    "healed",
-    "healer",
-    "healers",
-    "healing",
-    "heals",
-    "health",
-    "healthy",
-    "heap",
-    "heaped",
-    "heaping",
-    "heaps",
-    "hear",
-    "heard",
-    "hearer",
-    "hearers",
-    "hearing",
-    "hearken",
-    "hears",
-    "hearsay",
-    "hearse",
-    "hearses",
-    "heart",
-    "hearted",
-    "hearten",
-    "hearth",
-    "hearths",
-    "hearts",
-    "hearty",
-    "heat",
-    "heated",
-    "heater",
-    "heaters",
-    "heath",
-    "heathen",
-    "heather",
-    "heathy",
-    "heating",
-    "heats",
-    "heave",
-    "heaved",
-    "heaven",
-    "heavens",
-    "heaves",
-    "heavier",
-    "heavily",
-    "heaving",
-    "heavy",
-    "hebrew",
-    "hebrews",
-    "heck",
-    "heckle",
-    "heckled",
-    "heckler",
-    "heckles",
-    "hectare",
-    "hectic",
-    "hector",
-    "hedge",
-    "hedged",
-    "hedger",
-    "hedges",
-    "hedging",
-    "hedonic",
-    "heed",
-    "heeded",
-    "heedful",
-    "heeding",
-    "heeds",
-    "heehaw",
-    "heel",
-    "heeled",
-    "heelers",
-    "heeling",
-    "heels",
-    "heft",
-    "hefted",
-    "hefty",
-    "heifer",
-    "heifers",
-    "height",
-    "heights",
-    "heinous",
-    "heinz",
-    "heir",
-    "heiress",
-    "heirs",
-    "heist",
-    "held",
-    "helen",
-    "helena",
-    "helical",
-    "helices",
-    "helium",
-    "helix",
-    "helixes",
-    "hello",
-    "helm",
-    "helmet",
-    "helmets",
-    "helms",
-    "helot",
-    "help",
-    "helped",
-    "helper",
-    "helpers",
-    "helpful",
-    "helping",
-    "helps",
-    "hem",
-    "hemline",
-    "hemlock",
-    "hemmed",
-    "hemming",
-    "hemp",
-    "hems",
-    "hen",
-    "henbane",
-    "hence",
-    "henley",
-    "henpeck",
-    "henries",
-    "henry",
-    "hens",
-    "hepatic",
-    "hepburn",
-    "her",
-    "herald",
-    "heralds",
-    "herb",
-    "herbage",
-    "herbal",
-    "herbert",
-    "herbs",
-    "herd",
-    "herded",
-    "herder",
-    "herding",
-    "herds",
-    "here",
-    "hereby",
-    "herein",
-    "hereof",
-    "hereon",
-    "heresy",
-    "heretic",
-    "hereto",
-    "herman",
-    "hermes",
-    "hermit",
-    "hermits",
-    "hernia",
-    "hernias",
-    "hero",
-    "heroes",
-    "heroic",
-    "heroics",
-    "heroin",
-    "heroine",
-    "heroism",
-    "heron",
-    "herons",
-    "herpes",
-    "herring",
-    "hers",
-    "herself",
-    "hertz",
-    "hess",
-    "hessian",
-    "hetero",
-    "hew",
-    "hewed",
-    "hewer",
-    "hewers",
-    "hewing",
-    "hewlett",
-    "hewn",
-    "hews",
-    "hex",
-    "hexagon",
-    "hey",
-    "heyday",
-    "heydays",
-    "hi",
-    "hiatus",
-    "hiccup",
-    "hiccups",
-    "hick",
-    "hickory",
-    "hid",
-    "hidden",
-    "hide",
-    "hideous",
-    "hideout",
-    "hides",
-    "hiding",
-    "hifi",
-    "high",
-    "higher",
-    "highest",
-    "highly",
-    "highs",
-    "highway",
-    "hijack",
-    "hijacks",
-    "hike",
-    "hiked",
-    "hiker",
-    "hikers",
-    "hikes",
-    "hiking",
-    "hill",
-    "hillary",
-    "hillman",
-    "hillmen",
-    "hillock",
-    "hills",
-    "hilltop",
-    "hilly",
-    "hilt",
-    "hilton",
-    "hilts",
-    "him",
-    "himself",
-    "hind",
-    "hinder",
-    "hinders",
-    "hindi",
-    "hinds",
-    "hindu",
-    "hindus",
-    "hinge",
-    "hinged",
-    "hinges",
-    "hinging",
-    "hint",
-    "hinted",
-    "hinting",
-    "hints",
-    "hip",
-    "hippie",
-    "hippies",
-    "hippy",
-    "hips",
-    "hipster",
-    "hire",
-    "hired",
-    "hirer",
-    "hires",
-    "hiring",
-    "hirsute",
-    "his",
-    "hiss",
-    "hissed",
-    "hisses",
-    "hissing",
-    "history",
-    "hit",
-    "hitachi",
-    "hitch",
-    "hitched",
-    "hitches",
-    "hither",
-    "hitless",
-    "hits",
-    "hitter",
-    "hitters",
-    "hitting",
-    "hive",
-    "hived",
-    "hives",
-    "hiving",
-    "hmos",
-    "ho",
-    "hoard",
-    "hoarded",
-    "hoarder",
-    "hoards",
-    "hoarse",
-    "hoary",
-    "hoax",
-    "hoaxed",
-    "hoaxer",
-    "hoaxers",
-    "hoaxes",
-    "hoaxing",
-    "hob",
-    "hobbies",
-    "hobbit",
-    "hobble",
-    "hobbled",
-    "hobbles",
-    "hobby",
-    "hobnail",
-    "hobnob",
-    "hobnobs",
-    "hobo",
-    "hobs",
-    "hoc",
-    "hock",
-    "hockey",
-    "hocking",
-    "hocks",
-    "hod",
-    "hods",
-    "hoe",
-    "hoed",
-    "hoeing",
-    "hoes",
-    "hog",
-    "hogged",
-    "hogging",
-    "hoggish",
-    "hogs",
-    "hogwash",
-    "hogweed",
-    "hoist",
-    "hoisted",
-    "hoists",
-    "holbein",
-    "hold",
-    "holder",
-    "holders",
-    "holding",
-    "holds",
-    "holdup",
-    "holdups",
-    "hole",
-    "holed",
-    "holes",
-    "holiday",
-    "holier",
-    "holies",
-    "holing",
-    "holism",
-    "holland",
-    "holler",
-    "hollow",
-    "hollows",
-    "holly",
-    "holm",
-    "holmium",
-    "holst",
-    "holster",
-    "holy",
-    "homage",
-    "home",
-    "homed",
-    "homely",
-    "homer",
-    "homeric",
-    "homers",
-    "homes",
-    "homily",
-    "homing",
-    "hominy",
-    "hommes",
-    "homonym",
-    "honda",
-    "honest",
-    "honesty",
-    "honey",
-    "honeys",
-    "honiara",
-    "honk",
-    "honked",
-    "honking",
-    "honks",
-    "honor",
-    "honored",
-    "honors",
-    "honshu",
-    "hooch",
-    "hood",
-    "hooded",
-    "hooding",
-    "hoodlum",
-    "hoods",
-    "hooey",
-    "hoof",
-    "hoofed",
-    "hoofers",
-    "hoofs",
-    "hook",
-    "hookah",
-    "hooked",
-    "hooker",
-    "hookers",
-    "hooking",
-    "hooks",
-    "hookup",
-    "hookups",
-    "hooky",
-    "hoop",
-    "hoopla",
-    "hoops",
-    "hooray",
-    "hoosier",
-    "hoot",
-    "hooted",
-    "hooter",
-    "hooting",
-    "hoots",
-    "hoover",
-    "hooves",
-    "hop",
-    "hope",
-    "hoped",
-    "hopeful",
-    "hopes",
-    "hoping",
-    "hopped",
-    "hopper",
-    "hoppers",
-    "hopping",
-    "hops",
-    "horace",
-    "horde",
-    "hordes",
-    "horizon",
-    "hormone",
-    "horn",
-    "horned",
-    "hornet",
-    "hornets",
-    "horning",
-    "horns",
-    "horny",
-    "horrid",
-    "horrify",
-    "horror",
-    "horrors",
-    "horse",
-    "horses",
-    "horsey",
-    "hosanna",
-    "hose",
-    "hosea",
-    "hosed",
-    "hoses",
-    "hosiery",
-    "hosing",
-    "hospice",
-    "host",
-    "hostage",
-    "hosted",
-    "hostel",
-    "hostels",
-    "hostess",
-    "hostile",
-    "hosting",
-    "hostler",
-    "hosts",
-    "hot",
-    "hotbed",
-    "hotbeds",
-    "hotbox",
-    "hotch",
-    "hotdog",
-    "hotdogs",
-    "hotel",
-    "hotels",
-    "hotfoot",
-    "hothead",
-    "hotkey",
-    "hotkeys",
-    "hotline",
-    "hotly",
-    "hotness",
-    "hotrod",
-    "hotshot",
-    "hotter",
-    "hottest",
-    "hound",
-    "hounded",
-    "hounds",
-    "hour",
-    "hourly",
-    "hours",
-    "house",
-    "housed",
-    "houses",
-    "housing",
-    "houston",
-    "hove",
-    "hovel",
-    "hovels",
-    "hover",
-    "hovered",
-    "hovers",
-    "how",
-    "howard",
-    "howdy",
-    "howell",
-    "however",
-    "howl",
-    "howled",
-    "howler",
-    "howlers",
-    "howling",
-    "howls",
-    "hoy",
-    "hoyman",
-    "hub",
-    "hubbard",
-    "hubbub",
-    "hubby",
-    "hubris",
-    "hubs",
-    "huddle",
-    "huddled",
-    "huddles",
-    "hudson",
-    "hue",
-    "hued",
-    "hues",
-    "huff",
-    "huffed",
-    "huffier",
-    "huffing",
-    "huffs",
-    "huffy",
-    "hug",
-    "huge",
-    "hugely",
-    "hugged",
-    "hugging",
-    "hugh",
-    "hughes",
-    "hugs",
-    "huh",
-    "hula",
-    "hulk",
-    "hulking",
-    "hulks",
-    "hull",
-    "hulled",
-    "hulling",
-    "hulls",
-    "hum",
-    "human",
-    "humane",
-    "humanly",
-    "humans",
-    "humble",
-    "humbled",
-    "humbler",
-    "humbles",
-    "humbly",
-    "humbug",
-    "humbugs",
-    "humdrum",
-    "humid",
-    "humidor",
-    "hummed",
-    "hummer",
-    "humming",
-    "hummock",
-    "humor",
-    "humored",
-    "humors",
-    "hump",
-    "humped",
-    "humping",
-    "humps",
-    "humpy",
-    "hums",
-    "humus",
-    "hun",
-    "hunch",
-    "hunched",
-    "hunches",
-    "hundred",
-    "hung",
-    "hungary",
-    "hunger",
-    "hungers",
-    "hungry",
-    "hunk",
-    "hunt",
-    "hunted",
-    "hunter",
-    "hunters",
-    "hunting",
-    "hunts",
-    "hurdle",
-    "hurdled",
-    "hurdles",
-    "hurl",
-    "hurled",
-    "hurler",
-    "hurling",
-    "hurls",
-    "huron",
-    "hurrah",
-    "hurrahs",
-    "hurray",
-    "hurrays",
-    "hurried",
-    "hurries",
-    "hurry",
-    "hurt",
-    "hurtful",
-    "hurting",
-    "hurtle",
-    "hurtled",
-    "hurtles",
-    "hurts",
-    "husband",
-    "hush",
-    "hushed",
-    "hushes",
-    "hushing",
-    "husk",
-    "huskies",
-    "huskily",
-    "husking",
-    "husks",
-    "husky",
-    "hussar",
-    "hussars",
-    "hustle",
-    "hustled",
-    "hustler",
-    "hustles",
-    "hut",
-    "hutch",
-    "hutches",
-    "hutment",
-    "huts",
-    "hyaline",
-    "hybrid",
-    "hybrids",
-    "hydra",
-    "hydrant",
-    "hydras",
-    "hydrate",
-    "hydro",
-    "hydroid",
-    "hydrous",
-    "hyena",
-    "hyenas",
-    "hygiene",
-    "hymen",
-    "hymens",
-    "hymn",
-    "hymnal",
-    "hymnals",
-    "hymnody",
-    "hymns",
-    "hype",
-    "hyped",
-    "hyper",
-    "hypes",
-    "hyphen",
-    "hyphens",
-    "hyping",
-    "hypo",
-    "hypoxia",
-    "hyrax",
-    "hyraxes",
-    "hyssop",
-    "iamb",
-    "iambic",
-    "ian",
-    "iata",
-    "iberian",
-    "ibex",
-    "ibi",
-    "ibid",
-    "ibidem",
-    "ibis",
-    "ibsen",
-    "icarus",
-    "ice",
-    "iceberg",
-    "iceboat",
-    "icebox",
-    "iced",
-    "iceland",
-    "iceman",
-    "ices",
-    "icicle",
-    "icicles",
-    "icily",
-    "iciness",
-    "icing",
-    "icon",
-    "icons",
-    "icy",
-    "ida",
-    "idaho",
-    "idea",
-    "ideal",
-    "ideally",
-    "ideals",
-    "ideas",
-    "ideate",
-    "idem",
-    "ides",
-    "idiocy",
-    "idiom",
-    "idioms",
-    "idiot",
-    "idiotic",
-    "idiots",
-    "idle",
-    "idled",
-    "idler",
-    "idlers",
-    "idles",
-    "idling",
-    "idly",
-    "idol",
-    "idolize",
-    "idols",
-    "idyl",
-    "idyll",
-    "idyllic",
-    "idylls",
-    "ie",
-    "if",
-    "igloo",
-    "igloos",
-    "igneous",
-    "ignite",
-    "ignited",
-    "igniter",
-    "ignites",
-    "ignoble",
-    "ignobly",
-    "ignore",
-    "ignored",
-    "ignores",
-    "iguana",
-    "ii",
-    "iii",
-    "ikon",
-    "iliad",
-    "ilk",
-    "ill",
-    "illegal",
-    "illicit",
-    "illness",
-    "illogic",
-    "ills",
-    "ilo",
-    "image",
-    "imaged",
-    "imagery",
-    "images",
-    "imagine",
-    "imaging",
-    "imagism",
-    "imagist",
-    "imago",
-    "imagoes",
-    "imam",
-    "imams",
-    "imbed",
-    "imbibe",
-    "imbibed",
-    "imbiber",
-    "imbibes",
-    "imbue",
-    "imbued",
-    "imbues",
-    "imf",
-    "imitate",
-    "immense",
-    "immerse",
-    "immoral",
-    "immune",
-    "immure",
-    "imp",
-    "impact",
-    "impacts",
-    "impair",
-    "impairs",
-    "impale",
-    "impaled",
-    "impales",
-    "impanel",
-    "impart",
-    "imparts",
-    "impasse",
-    "impeach",
-    "impede",
-    "impeded",
-    "impedes",
-    "impel",
-    "impels",
-    "impend",
-    "imperil",
-    "impetus",
-    "impiety",
-    "impinge",
-    "impious",
-    "impish",
-    "implant",
-    "implied",
-    "implies",
-    "implode",
-    "implore",
-    "imply",
-    "import",
-    "imports",
-    "impose",
-    "imposed",
-    "imposes",
-    "impost",
-    "impound",
-    "impress",
-    "imprint",
-    "improve",
-    "imps",
-    "impugn",
-    "impugns",
-    "impulse",
-    "impure",
-    "impurer",
-    "impute",
-    "imputed",
-    "in",
-    "ina",
-    "inane",
-    "inanely",
-    "inanity",
-    "inapt",
-    "inborn",
-    "inbred",
-    "inbreed",
-    "inca",
-    "incaged",
-    "incant",
-    "incants",
-    "incense",
-    "incest",
-    "inch",
-    "inched",
-    "inches",
-    "inching",
-    "incise",
-    "incisor",
-    "incite",
-    "incited",
-    "incites",
-    "incline",
-    "inclose",
-    "include",
-    "income",
-    "incomes",
-    "incubi",
-    "incubus",
-    "incur",
-    "incurs",
-    "indeed",
-    "indent",
-    "indents",
-    "index",
-    "indexed",
-    "indexes",
-    "india",
-    "indian",
-    "indiana",
-    "indians",
-    "indices",
-    "indict",
-    "indicts",
-    "indies",
-    "indigo",
-    "indium",
-    "indoor",
-    "indoors",
-    "induce",
-    "induced",
-    "inducer",
-    "induces",
-    "induct",
-    "inducts",
-    "indulge",
-    "indus",
-    "inept",
-    "ineptly",
-    "inert",
-    "inertia",
-    "inertly",
-    "inexact",
-    "infamy",
-    "infancy",
-    "infant",
-    "infants",
-    "infarct",
-    "infect",
-    "infects",
-    "infer",
-    "inferno",
-    "infers",
-    "infest",
-    "infests",
-    "infidel",
-    "infield",
-    "infirm",
-    "inflame",
-    "inflate",
-    "inflect",
-    "inflict",
-    "inflow",
-    "influx",
-    "info",
-    "infold",
-    "inform",
-    "informs",
-    "infra",
-    "infuse",
-    "infused",
-    "infuses",
-    "ingest",
-    "ingests",
-    "ingot",
-    "ingots",
-    "ingrate",
-    "ingress",
-    "ingrid",
-    "ingrown",
-    "inhabit",
-    "inhale",
-    "inhaled",
-    "inhaler",
-    "inhales",
-    "inherit",
-    "inhibit",
-    "inhuman",
-    "initial",
-    "inject",
-    "injects",
-    "injunct",
-    "injure",
-    "injured",
-    "injures",
-    "injury",
-    "ink",
-    "inkblot",
-    "inked",
-    "inking",
-    "inkjet",
-    "inkling",
-    "inks",
-    "inkwell",
-    "inky",
-    "inlaid",
-    "inland",
-    "inlaws",
-    "inlay",
-    "inlays",
-    "inlet",
-    "inlets",
-    "inmate",
-    "inmates",
-    "inmost",
-    "inn",
-    "innards",
-    "innate",
-    "inner",
-    "inning",
-    "innings",
-    "inns",
-    "input",
-    "inputs",
-    "inquest",
-    "inquire",
-    "inquiry",
-    "inroad",
-    "inroads",
-    "inrush",
-    "insane",
-    "insect",
-    "insects",
-    "insert",
-    "inserts",
-    "inset",
-    "inshore",
-    "inside",
-    "insider",
-    "insides",
-    "insight",
-    "insipid",
-    "insist",
-    "insists",
-    "insofar",
-    "insole",
-    "insoles",
-    "inspect",
-    "inspire",
-    "instal",
-    "install",
-    "instant",
-    "instead",
-    "instep",
-    "instill",
-    "insular",
-    "insulin",
-    "insult",
-    "insults",
-    "insure",
-    "insured",
-    "insurer",
-    "insures",
-    "intact",
-    "intake",
-    "intakes",
-    "integer",
-    "intend",
-    "intends",
-    "intense",
-    "intent",
-    "intents",
-    "inter",
-    "interim",
-    "intern",
-    "interns",
-    "intimal",
-    "into",
-    "intone",
-    "intoned",
-    "intones",
-    "introit",
-    "intrude",
-    "inure",
-    "inured",
-    "inures",
-    "inuring",
-    "invade",
-    "invaded",
-    "invader",
-    "invades",
-    "invalid",
-    "inveigh",
-    "invent",
-    "invents",
-    "inverse",
-    "invert",
-    "inverts",
-    "invest",
-    "invests",
-    "invite",
-    "invited",
-    "invitee",
-    "invites",
-    "invoice",
-    "invoke",
-    "invoked",
-    "invokes",
-    "involve",
-    "inward",
-    "inwards",
-    "iodide",
-    "iodine",
-    "ion",
-    "ionesco",
-    "ionic",
-    "ionize",
-    "ionized",
-    "ionizes",
-    "ions",
-    "iota",
-    "iowa",
-    "ira",
-    "iran",
-    "iranian",
-    "iraq",
-    "iraqi",
-    "irate",
-    "irately",
-    "ire",
-    "ireful",
-    "ireland",
-    "irene",
-    "iridium",
-    "iris",
-    "irises",
-    "irish",
-    "irk",
-    "irked",
-    "irking",
-    "irks",
-    "irksome",
-    "iron",
-    "ironed",
-    "ironic",
-    "ironies",
-    "ironing",
-    "irons",
-    "irony",
-    "irrupt",
-    "is",
-    "isaac",
-    "isaiah",
-    "isbn",
-    "isfahan",
-    "isis",
-    "islam",
-    "islamic",
-    "island",
-    "islands",
-    "isle",
-    "isles",
-    "islet",
-    "islets",
-    "isobar",
-    "isobars",
-    "isolate",
-    "isomer",
-    "isotope",
-    "israel",
-    "israeli",
-    "issue",
-    "issued",
-    "issuer",
-    "issues",
-    "issuing",
-    "isthmus",
-    "it",
-    "italian",
-    "italic",
-    "italics",
-    "italy",
-    "itch",
-    "itched",
-    "itches",
-    "itching",
-    "itchy",
-    "item",
-    "itemize",
-    "items",
-    "iterate",
-    "its",
-    "itself",
-    "iv",
-    "ivory",
-    "ivy",
-    "ix",
-    "jab",
-    "jabbed",
-    "jabber",
-    "jabbers",
-    "jabbing",
-    "jabs",
-    "jacinth",
-    "jack",
-    "jackal",
-    "jackals",
-    "jackass",
-    "jackdaw",
-    "jacket",
-    "jackets",
-    "jackpot",
-    "jacks",
-    "jackson",
-    "jaclyn",
-    "jacob",
-    "jacobs",
-    "jactus",
-    "jade",
-    "jaded",
-    "jadedly",
-    "jades",
-    "jaffa",
-    "jag",
-    "jagged",
-    "jagger",
-    "jagging",
-    "jags",
-    "jaguar",
-    "jaguars",
-    "jail",
-    "jailed",
-    "jailer",
-    "jailers",
-    "jailing",
-    "jailor",
-    "jailors",
-    "jails",
-    "jaipur",
-    "jakarta",
-    "jake",
-    "jalopy",
-    "jam",
-    "jamaica",
-    "jamb",
-    "james",
-    "jamey",
-    "jammed",
-    "jamming",
-    "jams",
-    "jan",
-    "jane",
-    "janet",
-    "jangle",
-    "jangled",
-    "jangles",
-    "janice",
-    "janitor",
-    "january",
-    "janus",
-    "japan",
-    "jape",
-    "jar",
-    "jargon",
-    "jarred",
-    "jarring",
-    "jars",
-    "jasmine",
-    "jason",
-    "jasper",
-    "jaunt",
-    "jaunts",
-    "jaunty",
-    "java",
-    "javelin",
-    "jaw",
-    "jawbone",
-    "jawed",
-    "jawing",
-    "jaws",
-    "jay",
-    "jays",
-    "jaywalk",
-    "jazz",
-    "jazzily",
-    "jazzy",
-    "jealous",
-    "jean",
-    "jeans",
-    "jeep",
-    "jeeps",
-    "jeer",
-    "jeered",
-    "jeering",
-    "jeers",
-    "jeff",
-    "jeffrey",
-    "jehovah",
-    "jellied",
-    "jellies",
-    "jelly",
-    "jenny",
-    "jeremy",
-    "jericho",
-    "jerk",
-    "jerked",
-    "jerkily",
-    "jerkin",
-    "jerking",
-    "jerkins",
-    "jerks",
-    "jerky",
-    "jerome",
-    "jerry",
-    "jersey",
-    "jerseys",
-    "jesse",
-    "jessica",
-    "jest",
-    "jested",
-    "jester",
-    "jesters",
-    "jesting",
-    "jests",
-    "jesuit",
-    "jesuits",
-    "jesus",
-    "jet",
-    "jets",
-    "jetsam",
-    "jetset",
-    "jetted",
-    "jetties",
-    "jetting",
-    "jetty",
-    "jew",
-    "jewel",
-    "jeweler",
-    "jewelry",
-    "jewels",
-    "jewish",
-    "jewry",
-    "jews",
-    "jib",
-    "jibbed",
-    "jibbing",
-    "jibe",
-    "jibed",
-    "jibes",
-    "jibing",
-    "jibs",
-    "jiffy",
-    "jig",
-    "jigged",
-    "jiggers",
-    "jigging",
-    "jiggle",
-    "jigs",
-    "jigsaw",
-    "jigsaws",
-    "jill",
-    "jilt",
-    "jilted",
-    "jilting",
-    "jilts",
-    "jim",
-    "jimmies",
-    "jimmy",
-    "jingle",
-    "jingled",
-    "jingles",
-    "jinn",
-    "jinx",
-    "jinxed",
-    "jinxes",
-    "jinxing",
-    "jitters",
-    "jittery",
-    "jive",
-    "jived",
-    "jives",
-    "jiving",
-    "joan",
-    "job",
-    "jobbed",
-    "jobber",
-    "jobbers",
-    "jobbing",
-    "jobless",
-    "jobs",
-    "jock",
-    "jockey",
-    "jockeys",
-    "jocose",
-    "jocular",
-    "jocund",
-    "jodhpur",
-    "joe",
-    "joey",
-    "jog",
-    "jogged",
-    "jogger",
-    "joggers",
-    "jogging",
-    "joggle",
-    "joggled",
-    "joggles",
-    "jogs",
-    "john",
-    "johnny",
-    "johnson",
-    "join",
-    "joined",
-    "joiner",
-    "joiners",
-    "joinery",
-    "joining",
-    "joins",
-    "joint",
-    "jointed",
-    "jointly",
-    "joints",
-    "joist",
-    "joists",
-    "joke",
-    "joked",
-    "joker",
-    "jokers",
-    "jokes",
-    "joking",
-    "jollier",
-    "jollity",
-    "jolly",
-    "jolt",
-    "jolted",
-    "jolting",
-    "jolts",
-    "jones",
-    "jordan",
-    "joseph",
-    "joshua",
-    "josiah",
-    "jostle",
-    "jostled",
-    "jostler",
-    "jostles",
-    "jot",
-    "jots",
-    "jotted",
-    "jotter",
-    "jotters",
-    "jotting",
-    "joule",
-    "joules",
-    "journal",
-    "journey",
-    "jours",
-    "joust",
-    "jousted",
-    "jousts",
-    "jove",
-    "jovial",
-    "jovian",
-    "jowl",
-    "jowls",
-    "jowly",
-    "joy",
-    "joyce",
-    "joyful",
-    "joyless",
-    "joyous",
-    "joyride",
-    "joys",
-    "jp",
-    "jr",
-    "jubilee",
-    "judaic",
-    "judaism",
-    "judas",
-    "judea",
-    "judge",
-    "judged",
-    "judges",
-    "judging",
-    "judith",
-    "judo",
-    "judy",
-    "jug",
-    "jugful",
-    "jugfuls",
-    "jugged",
-    "juggle",
-    "juggled",
-    "juggler",
-    "juggles",
-    "jugs",
-    "jugular",
-    "juice",
-    "juices",
-    "juicy",
-    "jujitsu",
-    "juju",
-    "jukebox",
-    "juleps",
-    "julia",
-    "julian",
-    "julie",
-    "juliet",
-    "july",
-    "julys",
-    "jumble",
-    "jumbled",
-    "jumbles",
-    "jumbo",
-    "jump",
-    "jumped",
-    "jumper",
-    "jumpers",
-    "jumping",
-    "jumps",
-    "jumpy",
-    "june",
-    "junes",
-    "jung",
-    "jungian",
-    "jungle",
-    "jungles",
-    "junior",
-    "juniors",
-    "juniper",
-    "junk",
-    "junket",
-    "junkets",
-    "junkie",
-    "junkies",
-    "junks",
-    "junta",
-    "juntas",
-    "jupiter",
-    "jura",
-    "juries",
-    "jurist",
-    "jurists",
-    "juror",
-    "jurors",
-    "jury",
-    "juryman",
-    "just",
-    "justice",
-    "justify",
-    "justine",
-    "justly",
-    "jut",
-    "jute",
-    "juts",
-    "jutted",
-    "jutting",
-    "kabul",
-    "kafka",
-    "kaiser",
-    "kaisers",
-    "kale",
-    "kaman",
-    "kampala",
-    "kansas",
-    "kaolin",
-    "kapok",
-    "kaput",
-    "karachi",
-    "karat",
-    "karate",
-    "karen",
-    "karma",
-    "kate",
-    "kathy",
-    "katie",
-    "kay",
-    "kayak",
-    "kayaks",
-    "kb",
-    "kbyte",
-    "kbytes",
-    "kebab",
-    "kebabs",
-    "keel",
-    "keeled",
-    "keeler",
-    "keeling",
-    "keels",
-    "keen",
-    "keenly",
-    "keep",
-    "keeper",
-    "keepers",
-    "keeping",
-    "keeps",
-    "keg",
-    "kegful",
-    "kegs",
-    "keith",
-    "kellogg",
-    "kelly",
-    "kelp",
-    "kelvin",
-    "ken",
-    "kennedy",
-    "kennel",
-    "kennels",
-    "kenneth",
-    "kenya",
-    "kenyan",
-    "kepi",
-    "kept",
-    "kerf",
-    "kernel",
-    "kernels",
-    "kernes",
-    "kerning",
-    "kestrel",
-    "ketch",
-    "ketches",
-    "ketchup",
-    "kettle",
-    "kettles",
-    "kevin",
-    "key",
-    "keyed",
-    "keyhole",
-    "keying",
-    "keynote",
-    "keypad",
-    "keys",
-    "keyword",
-    "kg",
-    "khaki",
-    "khan",
-    "kibbutz",
-    "kick",
-    "kicked",
-    "kicker",
-    "kicking",
-    "kickoff",
-    "kicks",
-    "kid",
-    "kidded",
-    "kiddies",
-    "kidding",
-    "kidnap",
-    "kidnaps",
-    "kidney",
-    "kidneys",
-    "kids",
-    "kidskin",
-    "kiev",
-    "kigali",
-    "kilketh",
-    "kill",
-    "killed",
-    "killer",
-    "killers",
-    "killing",
-    "killjoy",
-    "kills",
-    "kiln",
-    "kilns",
-    "kilo",
-    "kilohm",
-    "kilos",
-    "kiloton",
-    "kilt",
-    "kilts",
-    "kim",
-    "kimono",
-    "kimonos",
-    "kin",
-    "kind",
-    "kinder",
-    "kindest",
-    "kindle",
-    "kindled",
-    "kindles",
-    "kindly",
-    "kindred",
-    "kinds",
-    "kinetic",
-    "king",
-    "kingdom",
-    "kinglet",
-    "kingly",
-    "kingpin",
-    "kings",
-    "kink",
-    "kinks",
-    "kinky",
-    "kinship",
-    "kinsman",
-    "kinsmen",
-    "kiosk",
-    "kiosks",
-    "kipper",
-    "kippers",
-    "kips",
-    "kirk",
-    "kirsch",
-    "kismet",
-    "kiss",
-    "kissed",
-    "kisses",
-    "kissing",
-    "kit",
-    "kitchen",
-    "kite",
-    "kited",
-    "kites",
-    "kith",
-    "kiting",
-    "kits",
-    "kitsch",
-    "kitten",
-    "kittens",
-    "kitties",
-    "kitty",
-    "kiwi",
-    "kiwis",
-    "klaxon",
-    "klaxons",
-    "kleenex",
-    "klieg",
-    "km",
-    "knack",
-    "knacker",
-    "knave",
-    "knavery",
-    "knaves",
-    "knavish",
-    "knead",
-    "kneaded",
-    "kneader",
-    "kneads",
-    "knee",
-    "kneecap",
-    "kneed",
-    "kneeing",
-    "kneel",
-    "kneeled",
-    "kneels",
-    "knees",
-    "knell",
-    "knelled",
-    "knells",
-    "knelt",
-    "knew",
-    "knicker",
-    "knife",
-    "knifed",
-    "knifes",
-    "knifing",
-    "knight",
-    "knights",
-    "knit",
-    "knits",
-    "knitted",
-    "knitter",
-    "knives",
-    "knob",
-    "knobbed",
-    "knobby",
-    "knobs",
-    "knock",
-    "knocked",
-    "knocker",
-    "knocks",
-    "knoll",
-    "knolls",
-    "knot",
-    "knots",
-    "knotted",
-    "knotty",
-    "know",
-    "knowhow",
-    "knowing",
-    "known",
-    "knows",
-    "knox",
-    "knuckle",
-    "knurl",
-    "knurled",
-    "knurls",
-    "koala",
-    "kobe",
-    "kodak",
-    "koran",
-    "korea",
-    "korean",
-    "koreans",
-    "kosher",
-    "kowtow",
-    "kraal",
-    "kraft",
-    "krakow",
-    "kraut",
-    "krauts",
-    "kremlin",
-    "krishna",
-    "krone",
-    "kroner",
-    "kruger",
-    "krypton",
-    "kudos",
-    "kumquat",
-    "kurdish",
-    "kuwait",
-    "kyoto",
-    "kyushu",
-    "lab",
-    "label",
-    "labeled",
-    "labeler",
-    "labels",
-    "labial",
-    "labile",
-    "labor",
-    "labored",
-    "laborer",
-    "labors",
-    "labs",
-    "lace",
-    "laced",
-    "lacer",
-    "lacers",
-    "laces",
-    "lacing",
-    "lack",
-    "lacked",
-    "lackey",
-    "lackeys",
-    "lacking",
-    "lacks",
-    "laconic",
-    "lacquer",
-    "lactate",
-    "lacteal",
-    "lactic",
-    "lactose",
-    "lacuna",
-    "lacunae",
-    "lacunas",
-    "lad",
-    "ladder",
-    "ladders",
-    "lade",
-    "laden",
-    "ladies",
-    "ladle",
-    "ladled",
-    "ladles",
-    "ladling",
-    "lads",
-    "lady",
-    "lag",
-    "lager",
-    "lagers",
-    "laggard",
-    "lagged",
-    "lagging",
-    "lagoon",
-    "lagoons",
-    "lagos",
-    "lags",
-    "lahore",
-    "laid",
-    "lain",
-    "lair",
-    "lairs",
-    "laity",
-    "lake",
-    "lakes",
-    "lamb",
-    "lambent",
-    "lambs",
-    "lame",
-    "lamely",
-    "lament",
-    "laments",
-    "lamp",
-    "lampoon",
-    "lamprey",
-    "lamps",
-    "lance",
-    "lanced",
-    "lancer",
-    "lancers",
-    "lances",
-    "lancet",
-    "lancets",
-    "lancing",
-    "land",
-    "landau",
-    "landaus",
-    "landed",
-    "landing",
-    "lands",
-    "lane",
-    "lanes",
-    "languid",
-    "languor",
-    "lank",
-    "lanky",
-    "lanolin",
-    "lantern",
-    "lanyard",
-    "laos",
-    "laotian",
-    "lap",
-    "lapdog",
-    "lapdogs",
-    "lapel",
-    "lapels",
-    "lapful",
-    "lapfuls",
-    "lapland",
-    "lapped",
-    "lapping",
-    "laps",
-    "lapse",
-    "lapsed",
-    "lapses",
-    "lapsing",
-    "laptop",
-    "laptops",
-    "lapwing",
-    "laramie",
-    "larceny",
-    "larch",
-    "larches",
-    "lard",
-    "larder",
-    "larders",
-    "larding",
-    "lards",
-    "large",
-    "largely",
-    "larger",
-    "largess",
-    "largest",
-    "largish",
-    "lariat",
-    "lariats",
-    "lark",
-    "larked",
-    "larking",
-    "larks",
-    "larry",
-    "larva",
-    "larvae",
-    "larval",
-    "larynx",
-    "lasagna",
-    "laser",
-    "lasers",
-    "lash",
-    "lashed",
-    "lashes",
-    "lashing",
-    "lass",
-    "lasses",
-    "lassie",
-    "lasso",
-    "lassoes",
-    "lassos",
-    "last",
-    "lasted",
-    "lasting",
-    "lastly",
-    "lasts",
-    "latch",
-    "latched",
-    "latches",
-    "late",
-    "lately",
-    "latency",
-    "latent",
-    "later",
-    "lateral",
-    "latest",
-    "latex",
-    "lath",
-    "lathe",
-    "lather",
-    "lathers",
-    "lathes",
-    "laths",
-    "latin",
-    "latrine",
-    "latter",
-    "lattice",
-    "latvia",
-    "latvian",
-    "laud",
-    "lauded",
-    "lauding",
-    "lauds",
-    "laugh",
-    "laughed",
-    "laughs",
-    "launch",
-    "launder",
-    "laundry",
-    "laura",
-    "laurel",
-    "laurels",
-    "lauren",
-    "laurie",
-    "lava",
-    "lavish",
-    "law",
-    "lawful",
-    "lawless",
-    "lawman",
-    "lawmen",
-    "lawn",
-    "lawned",
-    "lawns",
-    "laws",
-    "lawsuit",
-    "lawyer",
-    "lawyers",
-    "lax",
-    "laxity",
-    "laxly",
-    "laxness",
-    "lay",
-    "laye",
-    "layer",
-    "layered",
-    "layers",
-    "layette",
-    "laying",
-    "layman",
-    "laymen",
-    "layoff",
-    "layoffs",
-    "layout",
-    "layouts",
-    "lays",
-    "layup",
-    "lazarus",
-    "laze",
-    "lazed",
-    "lazes",
-    "lazier",
-    "laziest",
-    "lazily",
-    "lazing",
-    "lazy",
-    "lc",
-    "lea",
-    "lead",
-    "leaded",
-    "leaden",
-    "leader",
-    "leaders",
-    "leading",
-    "leads",
-    "leaf",
-    "leafage",
-    "leafed",
-    "leafing",
-    "leaflet",
-    "leafs",
-    "leafy",
-    "league",
-    "leaguer",
-    "leagues",
-    "leak",
-    "leakage",
-    "leaked",
-    "leaking",
-    "leaks",
-    "leaky",
-    "lean",
-    "leaned",
-    "leaning",
-    "leans",
-    "leant",
-    "leap",
-    "leaped",
-    "leaping",
-    "leaps",
-    "leapt",
-    "learn",
-    "learned",
-    "learner",
-    "learns",
-    "learnt",
-    "leas",
-    "lease",
-    "leased",
-    "leaser",
-    "leasers",
-    "leases",
-    "leash",
-    "leashed",
-    "leashes",
-    "leasing",
-    "least",
-    "leather",
-    "leave",
-    "leaven",
-    "leavens",
-    "leaver",
-    "leavers",
-    "leaves",
-    "leaving",
-    "lebanon",
-    "lecher",
-    "lechers",
-    "lechery",
-    "lectern",
-    "lector",
-    "lecture",
-    "led",
-    "ledge",
-    "ledger",
-    "ledgers",
-    "ledges",
-    "lee",
-    "leech",
-    "leeched",
-    "leeches",
-    "leeds",
-    "leek",
-    "leeks",
-    "leer",
-    "leered",
-    "leerier",
-    "leering",
-    "leers",
-    "leery",
-    "lees",
-    "leeward",
-    "leeway",
-    "left",
-    "lefties",
-    "leftist",
-    "lefty",
-    "leg",
-    "legacy",
-    "legal",
-    "legally",
-    "legare",
-    "legate",
-    "legatee",
-    "legates",
-    "legato",
-    "legend",
-    "legends",
-    "leges",
-    "legged",
-    "legging",
-    "leggy",
-    "legible",
-    "legibly",
-    "legion",
-    "legions",
-    "legless",
-    "legs",
-    "legume",
-    "leigh",
-    "leipzig",
-    "leisure",
-    "lemming",
-    "lemon",
-    "lemons",
-    "lemony",
-    "lemur",
-    "lemurs",
-    "len",
-    "lend",
-    "lender",
-    "lenders",
-    "lending",
-    "lends",
-    "length",
-    "lengths",
-    "lengthy",
-    "lenient",
-    "lenin",
-    "lens",
-    "lenses",
-    "lent",
-    "lentil",
-    "lentils",
-    "lento",
-    "leo",
-    "leon",
-    "leonard",
-    "leopard",
-    "leotard",
-    "leper",
-    "lepers",
-    "leprosy",
-    "leprous",
-    "lepton",
-    "lesbian",
-    "lesion",
-    "lesions",
-    "leslie",
-    "lesotho",
-    "less",
-    "lessee",
-    "lessees",
-    "lessen",
-    "lessens",
-    "lesser",
-    "lesson",
-    "lessons",
-    "lessor",
-    "lessors",
-    "lest",
-    "let",
-    "letdown",
-    "lethal",
-    "lets",
-    "letted",
-    "letter",
-    "letters",
-    "letting",
-    "lettuce",
-    "letup",
-    "levee",
-    "level",
-    "leveled",
-    "leveler",
-    "levelly",
-    "levels",
-    "lever",
-    "levered",
-    "leveret",
-    "levers",
-    "levi",
-    "levied",
-    "levies",
-    "levity",
-    "levy",
-    "levying",
-    "lewd",
-    "lewdly",
-    "lexical",
-    "lexicon",
-    "ley",
-    "leyland",
-    "lhasa",
-    "liable",
-    "liaise",
-    "liaised",
-    "liaises",
-    "liaison",
-    "liar",
-    "liars",
-    "libel",
-    "libeled",
-    "libeler",
-    "libels",
-    "liberal",
-    "liberia",
-    "liberty",
-    "libido",
-    "libidos",
-    "libra",
-    "library",
-    "libya",
-    "libyan",
-    "lice",
-    "license",
-    "lichen",
-    "lichens",
-    "lick",
-    "licked",
-    "licking",
-    "licks",
-    "lid",
-    "lids",
-    "lie",
-    "lied",
-    "liege",
-    "lien",
-    "liens",
-    "lies",
-    "lieu",
-    "life",
-    "lifer",
-    "lifers",
-    "lift",
-    "lifted",
-    "lifter",
-    "lifters",
-    "lifting",
-    "lifts",
-    "light",
-    "lighted",
-    "lighten",
-    "lighter",
-    "lightly",
-    "lights",
-    "lignite",
-    "likable",
-    "like",
-    "liked",
-    "likely",
-    "liken",
-    "likened",
-    "likens",
-    "likes",
-    "liking",
-    "likings",
-    "lilac",
-    "lilacs",
-    "lilies",
-    "lilly",
-    "lilt",
-    "lilted",
-    "lilting",
-    "lilts",
-    "lily",
-    "lima",
-    "limb",
-    "limbed",
-    "limber",
-    "limbers",
-    "limbo",
-    "limbs",
-    "lime",
-    "limeade",
-    "limed",
-    "limes",
-    "limey",
-    "limit",
-    "limited",
-    "limits",
-    "limning",
-    "limo",
-    "limp",
-    "limped",
-    "limper",
-    "limpet",
-    "limpets",
-    "limpid",
-    "limping",
-    "limply",
-    "limps",
-    "limy",
-    "lincoln",
-    "linctus",
-    "linda",
-    "line",
-    "lineage",
-    "lineal",
-    "linear",
-    "lined",
-    "linen",
-    "linens",
-    "liner",
-    "liners",
-    "lines",
-    "lineup",
-    "linger",
-    "lingers",
-    "lingo",
-    "lingual",
-    "lining",
-    "linings",
-    "link",
-    "linkage",
-    "linked",
-    "linker",
-    "linkers",
-    "linking",
-    "links",
-    "linkup",
-    "linseed",
-    "lint",
-    "lintel",
-    "lintels",
-    "lion",
-    "lioness",
-    "lionize",
-    "lions",
-    "lip",
-    "lipid",
-    "lipless",
-    "lipped",
-    "lips",
-    "lipton",
-    "liquefy",
-    "liqueur",
-    "liquid",
-    "liquids",
-    "liquor",
-    "liquors",
-    "lira",
-    "lisa",
-    "lisbon",
-    "lisp",
-    "lisped",
-    "lisping",
-    "lisps",
-    "lissome",
-    "list",
-    "listed",
-    "listen",
-    "listens",
-    "lister",
-    "listers",
-    "listing",
-    "lists",
-    "liszt",
-    "lit",
-    "litany",
-    "litchi",
-    "liter",
-    "litera",
-    "literal",
-    "liters",
-    "lithe",
-    "lithium",
-    "litmus",
-    "litter",
-    "litters",
-    "little",
-    "litton",
-    "liturgy",
-    "livable",
-    "live",
-    "lived",
-    "lively",
-    "liven",
-    "livened",
-    "livens",
-    "liver",
-    "livers",
-    "livery",
-    "lives",
-    "livid",
-    "lividly",
-    "living",
-    "livings",
-    "liz",
-    "lizard",
-    "lizards",
-    "llama",
-    "llamas",
-    "lo",
-    "load",
-    "loaded",
-    "loader",
-    "loaders",
-    "loading",
-    "loads",
-    "loaf",
-    "loafed",
-    "loafer",
-    "loafers",
-    "loafing",
-    "loafs",
-    "loam",
-    "loamy",
-    "loan",
-    "loaned",
-    "loaner",
-    "loaners",
-    "loaning",
-    "loans",
-    "loath",
-    "loathe",
-    "loathed",
-    "loathes",
-    "loathly",
-    "loaves",
-    "lob",
-    "lobbed",
-    "lobbied",
-    "lobbies",
-    "lobbing",
-    "lobby",
-    "lobe",
-    "lobes",
-    "lobs",
-    "lobster",
-    "local",
-    "locale",
-    "locales",
-    "locally",
-    "locals",
-    "locate",
-    "located",
-    "locates",
-    "locator",
-    "loch",
-    "lochs",
-    "lock",
-    "locked",
-    "locker",
-    "lockers",
-    "locket",
-    "lockets",
-    "locking",
-    "lockjaw",
-    "locknut",
-    "lockout",
-    "locks",
-    "lockup",
-    "lockups",
-    "locum",
-    "locus",
-    "locust",
-    "locusts",
-    "lode",
-    "lodge",
-    "lodged",
-    "lodger",
-    "lodgers",
-    "lodges",
-    "lodging",
-    "loft",
-    "lofted",
-    "loftier",
-    "loftily",
-    "lofting",
-    "lofts",
-    "lofty",
-    "log",
-    "logbook",
-    "logged",
-    "logger",
-    "loggers",
-    "logging",
-    "logic",
-    "logical",
-    "logjam",
-    "logo",
-    "logos",
-    "logs",
-    "loin",
-    "loins",
-    "loire",
-    "loiter",
-    "loiters",
-    "loll",
-    "lolled",
-    "lolling",
-    "lolls",
-    "lombard",
-    "london",
-    "lone",
-    "lonely",
-    "loner",
-    "loners",
-    "long",
-    "longbow",
-    "longed",
-    "longer",
-    "longest",
-    "longing",
-    "longish",
-    "longs",
-    "loofah",
-    "look",
-    "looked",
-    "looker",
-    "lookers",
-    "looking",
-    "lookout",
-    "looks",
-    "lookup",
-    "loom",
-    "loomed",
-    "looming",
-    "looms",
-    "loon",
-    "loony",
-    "loop",
-    "looped",
-    "loopier",
-    "looping",
-    "loops",
-    "loopy",
-    "loose",
-    "loosed",
-    "loosely",
-    "loosen",
-    "loosens",
-    "looser",
-    "loosest",
-    "loot",
-    "looted",
-    "looter",
-    "looters",
-    "looting",
-    "loots",
-    "lop",
-    "lope",
-    "loped",
-    "lopes",
-    "loping",
-    "lopped",
-    "lopping",
-    "lops",
-    "loral",
-    "loran",
-    "lord",
-    "lorded",
-    "lording",
-    "lordly",
-    "lords",
-    "lore",
-    "lorenz",
-    "lorries",
-    "lorry",
-    "lose",
-    "loser",
-    "losers",
-    "loses",
-    "losing",
-    "loss",
-    "losses",
-    "lost",
-    "lot",
-    "loth",
-    "lotion",
-    "lotions",
-    "lots",
-    "lottery",
-    "lotus",
-    "loud",
-    "loudens",
-    "louder",
-    "loudest",
-    "loudish",
-    "loudly",
-    "louis",
-    "lounge",
-    "lounged",
-    "lounger",
-    "lounges",
-    "lourdes",
-    "louse",
-    "lousily",
-    "lousing",
-    "lousy",
-    "lout",
-    "loutish",
-    "louts",
-    "louvre",
-    "lovable",
-    "lovably",
-    "lovage",
-    "love",
-    "loved",
-    "lovely",
-    "lover",
-    "lovers",
-    "loves",
-    "loving",
-    "low",
-    "lowbrow",
-    "lowdown",
-    "lower",
-    "lowered",
-    "lowers",
-    "lowest",
-    "lowland",
-    "lowly",
-    "lowness",
-    "loyal",
-    "loyally",
-    "loyalty",
-    "lozenge",
-    "lp",
-    "lrun",
-    "ltd",
-    "luanda",
-    "lucas",
-    "lucerne",
-    "lucian",
-    "lucid",
-    "lucidly",
-    "lucifer",
-    "lucite",
-    "luck",
-    "lucked",
-    "luckier",
-    "luckily",
-    "lucks",
-    "lucky",
-    "lucre",
-    "ludic",
-    "ludlum",
-    "lug",
-    "luggage",
-    "lugged",
-    "lugger",
-    "luggers",
-    "lugging",
-    "lugs",
-    "luis",
-    "luke",
-    "lull",
-    "lullaby",
-    "lulled",
-    "lulling",
-    "lulls",
-    "lulu",
-    "lumbago",
-    "lumbar",
-    "lumber",
-    "lumbers",
-    "lumen",
-    "lump",
-    "lumped",
-    "lumping",
-    "lumpish",
-    "lumps",
-    "lumpy",
-    "lunacy",
-    "lunar",
-    "lunatic",
-    "lunch",
-    "lunched",
-    "lunches",
-    "lung",
-    "lunge",
-    "lunged",
-    "lunges",
-    "lunging",
-    "lungs",
-    "lupin",
-    "lupins",
-    "lurch",
-    "lurched",
-    "lurcher",
-    "lurches",
-    "lure",
-    "lured",
-    "lures",
-    "lurid",
-    "luridly",
-    "luring",
-    "lurk",
-    "lurked",
-    "lurking",
-    "lurks",
-    "lusaka",
-    "lush",
-    "lust",
-    "lusted",
-    "luster",
-    "lustful",
-    "lustily",
-    "lusting",
-    "lustral",
-    "lustrum",
-    "lusts",
-    "lusty",
-    "lute",
-    "lutes",
-    "luther",
-    "luxe",
-    "luxury",
-    "luzon",
-    "lyceum",
-    "lychee",
-    "lychees",
-    "lye",
-    "lying",
-    "lymph",
-    "lynch",
-    "lynched",
-    "lyncher",
-    "lynches",
-    "lynn",
-    "lynx",
-    "lynxes",
-    "lyon",
-    "lyons",
-    "lyre",
-    "lyric",
-    "lyrical",
-    "lyrics",
-    "ma",
-    "mac",
-    "macabre",
-    "macadam",
-    "macao",
-    "macaw",
-    "macbeth",
-    "mace",
-    "maced",
-    "maces",
-    "mach",
-    "machete",
-    "machine",
-    "macho",
-    "macro",
-    "macros",
-    "macular",
-    "mad",
-    "madam",
-    "madame",
-    "madams",
-    "madcap",
-    "madden",
-    "maddens",
-    "madder",
-    "maddest",
-    "made",
-    "madeira",
-    "madison",
-    "madly",
-    "madman",
-    "madmen",
-    "madness",
-    "madonna",
-    "madras",
-    "madrid",
-    "mae",
-    "maestro",
-    "mafia",
-    "magenta",
-    "maggot",
-    "maggots",
-    "maggoty",
-    "magi",
-    "magic",
-    "magical",
-    "magna",
-    "magnate",
-    "magnet",
-    "magneto",
-    "magnets",
-    "magnify",
-    "magnum",
-    "magnums",
-    "magpie",
-    "magpies",
-    "mahatma",
-    "mahler",
-    "maid",
-    "maiden",
-    "maidens",
-    "maidish",
-    "maids",
-    "mail",
-    "mailbag",
-    "mailbox",
-    "mailed",
-    "mailing",
-    "mails",
-    "maim",
-    "maimed",
-    "maiming",
-    "maims",
-    "main",
-    "maine",
-    "mainly",
-    "mains",
-    "maize",
-    "majesty",
-    "major",
-    "majored",
-    "majors",
-    "make",
-    "maker",
-    "makers",
-    "makes",
-    "makeup",
-    "making",
-    "makings",
-    "malachi",
-    "malady",
-    "malaga",
-    "malaise",
-    "malaria",
-    "malawi",
-    "malay",
-    "malayan",
-    "malcolm",
-    "male",
-    "males",
-    "mali",
-    "malian",
-    "malice",
-    "malign",
-    "maligns",
-    "mall",
-    "mallard",
-    "mallet",
-    "mallets",
-    "mallory",
-    "mallow",
-    "malls",
-    "malt",
-    "malta",
-    "malted",
-    "maltese",
-    "malthus",
-    "malts",
-    "malty",
-    "malum",
-    "mama",
-    "mamas",
-    "mambo",
-    "mamma",
-    "mammal",
-    "mammals",
-    "mammary",
-    "mammas",
-    "mammon",
-    "mammoth",
-    "mammy",
-    "man",
-    "manacle",
-    "manage",
-    "managed",
-    "manager",
-    "manages",
-    "managua",
-    "mandate",
-    "mane",
-    "manes",
-    "manful",
-    "mange",
-    "manger",
-    "mangers",
-    "mangle",
-    "mangled",
-    "mangler",
-    "mangles",
-    "mango",
-    "mangos",
-    "mangy",
-    "manhole",
-    "manhood",
-    "manhunt",
-    "mania",
-    "maniac",
-    "maniacs",
-    "manic",
-    "manila",
-    "manilla",
-    "mankind",
-    "manlike",
-    "manly",
-    "manmade",
-    "mann",
-    "manna",
-    "manned",
-    "manner",
-    "manners",
-    "manning",
-    "mannish",
-    "manor",
-    "manors",
-    "mans",
-    "manse",
-    "mansion",
-    "mantel",
-    "mantels",
-    "mantis",
-    "mantle",
-    "mantles",
-    "manual",
-    "manuals",
-    "manure",
-    "manx",
-    "many",
-    "mao",
-    "maoism",
-    "maori",
-    "map",
-    "maple",
-    "maples",
-    "mapless",
-    "mapped",
-    "mapping",
-    "maps",
-    "maputo",
-    "mar",
-    "maraca",
-    "maraud",
-    "marauds",
-    "marble",
-    "marbled",
-    "marbles",
-    "marbury",
-    "march",
-    "marched",
-    "marcher",
-    "marches",
-    "marco",
-    "marcus",
-    "mare",
-    "mares",
-    "margin",
-    "margins",
-    "maria",
-    "marian",
-    "marie",
-    "marilyn",
-    "marina",
-    "marinas",
-    "marine",
-    "mariner",
-    "marines",
-    "mario",
-    "marion",
-    "marital",
-    "mark",
-    "marked",
-    "marker",
-    "markers",
-    "market",
-    "markets",
-    "marking",
-    "marks",
-    "markup",
-    "marline",
-    "marmot",
-    "maroon",
-    "maroons",
-    "marque",
-    "marquee",
-    "marquis",
-    "marred",
-    "married",
-    "marries",
-    "marring",
-    "marrow",
-    "marrows",
-    "marry",
-    "mars",
-    "marsh",
-    "marshal",
-    "marshes",
-    "marshy",
-    "mart",
-    "marten",
-    "martha",
-    "martial",
-    "martian",
-    "martin",
-    "martini",
-    "martins",
-    "marts",
-    "martyr",
-    "martyrs",
-    "marvel",
-    "marvels",
-    "marx",
-    "marxism",
-    "marxist",
-    "mary",
-    "mascara",
-    "mascot",
-    "mascots",
-    "maser",
-    "masers",
-    "maseru",
-    "mash",
-    "mashed",
-    "masher",
-    "mashes",
-    "mashing",
-    "mask",
-    "masked",
-    "masker",
-    "masking",
-    "masks",
-    "mason",
-    "masonic",
-    "masonry",
-    "masons",
-    "masque",
-    "masques",
-    "mass",
-    "massage",
-    "massed",
-    "masses",
-    "masseur",
-    "massif",
-    "massifs",
-    "massing",
-    "massive",
-    "massy",
-    "mast",
-    "master",
-    "masters",
-    "mastery",
-    "mastic",
-    "mastiff",
-    "mastoid",
-    "masts",
-    "mat",
-    "matador",
-    "match",
-    "matched",
-    "matches",
-    "mate",
-    "mated",
-    "mater",
-    "materia",
-    "mates",
-    "maths",
-    "matilda",
-    "matima",
-    "matinee",
-    "mating",
-    "matins",
-    "matrix",
-    "matron",
-    "matrons",
-    "mats",
-    "matte",
-    "matted",
-    "matter",
-    "matters",
-    "mattes",
-    "matthew",
-    "matting",
-    "mattock",
-    "mature",
-    "matured",
-    "maturer",
-    "matures",
-    "matzo",
-    "maudlin",
-    "maui",
-    "maul",
-    "mauled",
-    "mauler",
-    "maulers",
-    "mauling",
-    "mauls",
-    "maunder",
-    "maundy",
-    "mauve",
-    "mauves",
-    "maw",
-    "mawkish",
-    "maxi",
-    "maxim",
-    "maxima",
-    "maximal",
-    "maxims",
-    "maximum",
-    "maxwell",
-    "may",
-    "maybe",
-    "mayday",
-    "mayfair",
-    "mayfly",
-    "mayhap",
-    "mayhem",
-    "mayor",
-    "mayoral",
-    "mayors",
-    "maypole",
-    "mays",
-    "mayweed",
-    "maze",
-    "mazes",
-    "mb",
-    "mbabane",
-    "md",
-    "mdv",
-    "me",
-    "mead",
-    "meadow",
-    "meadows",
-    "meadowy",
-    "meager",
-    "meal",
-    "mealier",
-    "meals",
-    "mealy",
-    "mean",
-    "meander",
-    "meanest",
-    "meaning",
-    "meanly",
-    "means",
-    "meant",
-    "measles",
-    "measly",
-    "measure",
-    "meat",
-    "meats",
-    "meaty",
-    "mecca",
-    "medal",
-    "medals",
-    "meddle",
-    "meddled",
-    "meddler",
-    "meddles",
-    "media",
-    "medial",
-    "median",
-    "medians",
-    "mediate",
-    "medic",
-    "medical",
-    "medico",
-    "medics",
-    "medium",
-    "mediums",
-    "medley",
-    "medleys",
-    "medusa",
-    "meek",
-    "meeker",
-    "meekest",
-    "meekly",
-    "meet",
-    "meeting",
-    "meetly",
-    "meets",
-    "mega",
-    "megaton",
-    "megohm",
-    "megohms",
-    "mekong",
-    "mel",
-    "melange",
-    "melanin",
-    "melba",
-    "melilot",
-    "mellow",
-    "mellows",
-    "melodic",
-    "melody",
-    "melon",
-    "melons",
-    "melt",
-    "melted",
-    "melting",
-    "melts",
-    "member",
-    "members",
-    "membra",
-    "memento",
-    "memo",
-    "memoir",
-    "memoirs",
-    "memory",
-    "memos",
-    "memphis",
-    "men",
-    "menace",
-    "menaced",
-    "menaces",
-    "menage",
-    "mend",
-    "mended",
-    "mender",
-    "menders",
-    "mending",
-    "mends",
-    "menfolk",
-    "menial",
-    "menials",
-    "menisci",
-    "mensae",
-    "mensaes",
-    "mental",
-    "mente",
-    "menthol",
-    "mention",
-    "mentor",
-    "mentors",
-    "menu",
-    "menus",
-    "meow",
-    "meowed",
-    "meowing",
-    "meows",
-    "mercian",
-    "mercies",
-    "mercury",
-    "mercy",
-    "mere",
-    "merely",
-    "merest",
-    "merge",
-    "merged",
-    "merger",
-    "mergers",
-    "merges",
-    "merging",
-    "merit",
-    "merited",
-    "merits",
-    "merles",
-    "merlin",
-    "merlons",
-    "mermaid",
-    "merman",
-    "merrier",
-    "merrily",
-    "merry",
-    "mers",
-    "mesh",
-    "meshed",
-    "meshes",
-    "meshing",
-    "mess",
-    "message",
-    "messed",
-    "messes",
-    "messiah",
-    "messier",
-    "messily",
-    "messing",
-    "messy",
-    "met",
-    "metal",
-    "metals",
-    "metcalf",
-    "meted",
-    "meteor",
-    "meteors",
-    "meter",
-    "metered",
-    "meters",
-    "meth",
-    "methane",
-    "methil",
-    "method",
-    "methods",
-    "meths",
-    "methyl",
-    "metier",
-    "metiers",
-    "metric",
-    "metro",
-    "mettle",
-    "mew",
-    "mewed",
-    "mews",
-    "mexican",
-    "mexico",
-    "mezzo",
-    "mg",
-    "mho",
-    "mi",
-    "miami",
-    "miasma",
-    "miasmal",
-    "miasmas",
-    "miasmic",
-    "mica",
-    "micah",
-    "mice",
-    "michael",
-    "mickey",
-    "micro",
-    "microbe",
-    "micron",
-    "microns",
-    "micros",
-    "mid",
-    "midair",
-    "midas",
-    "midday",
-    "middle",
-    "middles",
-    "midge",
-    "midges",
-    "midget",
-    "midgets",
-    "midland",
-    "midriff",
-    "midship",
-    "midspan",
-    "midst",
-    "midway",
-    "midweek",
-    "midwest",
-    "midwife",
-    "midyear",
-    "mien",
-    "miens",
-    "miff",
-    "miffed",
-    "miffs",
-    "mig",
-    "might",
-    "mighty",
-    "migrant",
-    "migrate",
-    "mikado",
-    "mike",
-    "mil",
-    "milan",
-    "mild",
-    "milder",
-    "mildest",
-    "mildew",
-    "mildews",
-    "mildly",
-    "mile",
-    "mileage",
-    "miles",
-    "milfoil",
-    "milieu",
-    "militia",
-    "milk",
-    "milked",
-    "milkier",
-    "milking",
-    "milkman",
-    "milkmen",
-    "milks",
-    "milksop",
-    "milky",
-    "mill",
-    "milled",
-    "miller",
-    "millers",
-    "millet",
-    "milli",
-    "milling",
-    "million",
-    "mills",
-    "milord",
-    "mils",
-    "milt",
-    "milting",
-    "mime",
-    "mimed",
-    "mimer",
-    "mimers",
-    "mimes",
-    "mimi",
-    "mimic",
-    "mimicry",
-    "mimics",
-    "miming",
-    "mimosa",
-    "minaret",
-    "mince",
-    "minced",
-    "mincer",
-    "mincers",
-    "minces",
-    "mincing",
-    "mind",
-    "minded",
-    "minder",
-    "minders",
-    "mindful",
-    "minding",
-    "minds",
-    "mine",
-    "mined",
-    "miner",
-    "mineral",
-    "miners",
-    "minerva",
-    "mines",
-    "mingle",
-    "mingled",
-    "mingler",
-    "mingles",
-    "mini",
-    "minibus",
-    "minicab",
-    "minim",
-    "minimal",
-    "minims",
-    "minimum",
-    "mining",
-    "minion",
-    "minions",
-    "mink",
-    "minks",
-    "minnow",
-    "minnows",
-    "minor",
-    "minors",
-    "minster",
-    "mint",
-    "minted",
-    "minter",
-    "minting",
-    "mints",
-    "minty",
-    "minuet",
-    "minuets",
-    "minus",
-    "minuses",
-    "minute",
-    "minuted",
-    "minutes",
-    "minutia",
-    "minx",
-    "miocene",
-    "miracle",
-    "mirage",
-    "mirages",
-    "miranda",
-    "mirror",
-    "mirrors",
-    "mirth",
-    "miscall",
-    "misdeed",
-    "misdoer",
-    "miser",
-    "miserly",
-    "misers",
-    "misery",
-    "misfile",
-    "misfire",
-    "misfit",
-    "misfits",
-    "mishap",
-    "mishaps",
-    "mislaid",
-    "mislay",
-    "mislays",
-    "mislead",
-    "misled",
-    "mislike",
-    "misname",
-    "misplay",
-    "misread",
-    "misrule",
-    "miss",
-    "missal",
-    "missals",
-    "missed",
-    "misses",
-    "missile",
-    "missing",
-    "mission",
-    "missive",
-    "misstep",
-    "missy",
-    "mist",
-    "mistake",
-    "misted",
-    "mister",
-    "mistily",
-    "misting",
-    "mistook",
-    "mistral",
-    "mists",
-    "misty",
-    "mistype",
-    "misuse",
-    "misused",
-    "misuses",
-    "mite",
-    "miter",
-    "mitered",
-    "miters",
-    "mites",
-    "mitosis",
-    "mitt",
-    "mitten",
-    "mittens",
-    "mix",
-    "mixable",
-    "mixed",
-    "mixer",
-    "mixers",
-    "mixes",
-    "mixing",
-    "mixture",
-    "mixup",
-    "mixups",
-    "ml",
-    "mm",
-    "moan",
-    "moaned",
-    "moaner",
-    "moaners",
-    "moaning",
-    "moans",
-    "moat",
-    "moats",
-    "mob",
-    "mobbed",
-    "mobbing",
-    "mobil",
-    "mobile",
-    "mobiles",
-    "mobs",
-    "mobster",
-    "mocha",
-    "mock",
-    "mocked",
-    "mocker",
-    "mockers",
-    "mockery",
-    "mocking",
-    "mocks",
-    "mockup",
-    "mod",
-    "modal",
-    "mode",
-    "model",
-    "modeled",
-    "models",
-    "modem",
-    "modems",
-    "modern",
-    "moderns",
-    "modes",
-    "modest",
-    "modesty",
-    "modi",
-    "modicum",
-    "modify",
-    "modish",
-    "modular",
-    "module",
-    "modules",
-    "moduli",
-    "modulo",
-    "modulus",
-    "modus",
-    "mogul",
-    "moguls",
-    "mohair",
-    "mohawk",
-    "moines",
-    "moist",
-    "moisten",
-    "moister",
-    "moistly",
-    "molar",
-    "molars",
-    "mold",
-    "molded",
-    "molder",
-    "molders",
-    "moldier",
-    "molding",
-    "molds",
-    "moldy",
-    "mole",
-    "moles",
-    "molest",
-    "molests",
-    "moll",
-    "mollify",
-    "molls",
-    "mollusk",
-    "molly",
-    "molt",
-    "molted",
-    "molten",
-    "molting",
-    "molts",
-    "mombasa",
-    "moment",
-    "moments",
-    "momma",
-    "mommy",
-    "monaco",
-    "monarch",
-    "monday",
-    "mondays",
-    "monet",
-    "money",
-    "moneyed",
-    "moneys",
-    "monger",
-    "mongers",
-    "mongol",
-    "mongrel",
-    "moniker",
-    "monitor",
-    "monk",
-    "monkey",
-    "monkeys",
-    "monkish",
-    "monks",
-    "mono",
-    "monocle",
-    "monroe",
-    "monsoon",
-    "monster",
-    "montage",
-    "montana",
-    "month",
-    "monthly",
-    "months",
-    "moo",
-    "mooch",
-    "mood",
-    "moodier",
-    "moodily",
-    "moods",
-    "moody",
-    "mooed",
-    "mooing",
-    "moon",
-    "mooned",
-    "moonlit",
-    "moons",
-    "moor",
-    "moored",
-    "moorhen",
-    "mooring",
-    "moorish",
-    "moors",
-    "moos",
-    "moose",
-    "moot",
-    "mooted",
-    "mooting",
-    "moots",
-    "mop",
-    "mope",
-    "moped",
-    "mopeds",
-    "mopes",
-    "moping",
-    "mopped",
-    "moppet",
-    "moppets",
-    "mopping",
-    "mops",
-    "moral",
-    "morale",
-    "morally",
-    "morals",
-    "morass",
-    "moray",
-    "morbid",
-    "more",
-    "mores",
-    "morgan",
-    "morgue",
-    "morgues",
-    "mormon",
-    "mormons",
-    "morn",
-    "morning",
-    "morocco",
-    "moron",
-    "moroni",
-    "moronic",
-    "morons",
-    "morose",
-    "morris",
-    "morrow",
-    "morse",
-    "morsel",
-    "morsels",
-    "mort",
-    "mortal",
-    "mortals",
-    "mortar",
-    "mortars",
-    "mortem",
-    "mortify",
-    "mortise",
-    "mosaic",
-    "mosaics",
-    "moscow",
-    "moses",
-    "moslem",
-    "moslems",
-    "mosque",
-    "mosques",
-    "moss",
-    "mosses",
-    "mossy",
-    "most",
-    "mostly",
-    "mote",
-    "motel",
-    "motels",
-    "motes",
-    "motet",
-    "moth",
-    "mother",
-    "mothers",
-    "moths",
-    "motif",
-    "motifs",
-    "motion",
-    "motions",
-    "motive",
-    "motives",
-    "motley",
-    "motor",
-    "motored",
-    "motors",
-    "mottle",
-    "mottled",
-    "mottles",
-    "motto",
-    "mottoes",
-    "mottos",
-    "mound",
-    "mounded",
-    "mounds",
-    "mount",
-    "mounted",
-    "mountie",
-    "mounts",
-    "mourn",
-    "mourned",
-    "mourner",
-    "mourns",
-    "mouse",
-    "mouser",
-    "mousse",
-    "mousses",
-    "mousy",
-    "mouth",
-    "mouthed",
-    "mouths",
-    "movable",
-    "movably",
-    "move",
-    "moved",
-    "mover",
-    "movers",
-    "moves",
-    "movie",
-    "movies",
-    "moving",
-    "mow",
-    "mowed",
-    "mower",
-    "mowers",
-    "mowing",
-    "mown",
-    "mows",
-    "mozart",
-    "mr",
-    "mrs",
-    "ms",
-    "much",
-    "muck",
-    "mucked",
-    "mucking",
-    "mucks",
-    "mucky",
-    "mucous",
-    "mucus",
-    "mud",
-    "muddied",
-    "muddier",
-    "muddily",
-    "muddle",
-    "muddled",
-    "muddler",
-    "muddles",
-    "muddy",
-    "mudflat",
-    "muesli",
-    "muff",
-    "muffin",
-    "muffins",
-    "muffle",
-    "muffled",
-    "muffler",
-    "muffles",
-    "muffs",
-    "mufti",
-    "mug",
-    "mugged",
-    "mugger",
-    "muggers",
-    "mugging",
-    "muggy",
-    "mugs",
-    "mugwort",
-    "mugwump",
-    "mulatto",
-    "mulch",
-    "mulched",
-    "mule",
-    "mules",
-    "mulier",
-    "mulish",
-    "mull",
-    "mullah",
-    "mullahs",
-    "mulled",
-    "mullet",
-    "mulling",
-    "mulls",
-    "multi",
-    "mum",
-    "mumble",
-    "mumbled",
-    "mumbler",
-    "mumbles",
-    "mummer",
-    "mummery",
-    "mummies",
-    "mummify",
-    "mummy",
-    "mumps",
-    "mums",
-    "munch",
-    "munched",
-    "muncher",
-    "munches",
-    "mundane",
-    "munich",
-    "mural",
-    "murals",
-    "murder",
-    "murders",
-    "murdoch",
-    "murkier",
-    "murkily",
-    "murky",
-    "murmur",
-    "murmurs",
-    "murphy",
-    "muscat",
-    "muscle",
-    "muscled",
-    "muscles",
-    "muse",
-    "mused",
-    "muses",
-    "museum",
-    "museums",
-    "mush",
-    "mushy",
-    "music",
-    "musical",
-    "musing",
-    "musings",
-    "musk",
-    "musket",
-    "muskets",
-    "muskrat",
-    "musky",
-    "muslim",
-    "muslin",
-    "mussel",
-    "mussels",
-    "must",
-    "mustang",
-    "mustard",
-    "muster",
-    "musters",
-    "mustily",
-    "musts",
-    "musty",
-    "mutable",
-    "mutably",
-    "mutant",
-    "mutants",
-    "mutate",
-    "mutated",
-    "mutates",
-    "mute",
-    "muted",
-    "mutely",
-    "mutes",
-    "muting",
-    "mutiny",
-    "mutter",
-    "mutters",
-    "mutton",
-    "mutual",
-    "muzak",
-    "muzzle",
-    "muzzled",
-    "muzzles",
-    "mx",
-    "my",
-    "myna",
-    "mynah",
-    "myopia",
-    "myopic",
-    "myriad",
-    "myrrh",
-    "myrtle",
-    "myself",
-    "mystery",
-    "mystic",
-    "mystics",
-    "mystify",
-    "myth",
-    "mythic",
-    "myths",
-    "nab",
-    "nabbed",
-    "nabbing",
-    "nabisco",
-    "nabob",
-    "nabs",
-    "nadir",
-    "naf",
-    "nag",
-    "nagged",
-    "nagger",
-    "naggers",
-    "nagging",
-    "nagoya",
-    "nags",
-    "nail",
-    "nailed",
-    "nailer",
-    "nailers",
-    "nailing",
-    "nails",
-    "nairobi",
-    "naive",
-    "naively",
-    "naivete",
-    "naivety",
-    "naked",
-    "nakedly",
-    "namable",
-    "name",
-    "named",
-    "namely",
-    "names",
-    "namibia",
-    "naming",
-    "nancy",
-    "nankeen",
-    "nannies",
-    "nanny",
-    "nap",
-    "napalm",
-    "napes",
-    "naphtha",
-    "napkin",
-    "napkins",
-    "naples",
-    "napless",
-    "napped",
-    "napping",
-    "nappy",
-    "naps",
-    "narrate",
-    "narrow",
-    "narrows",
-    "nasal",
-    "nasally",
-    "nascent",
-    "nassau",
-    "nastier",
-    "nasties",
-    "nastily",
-    "nasty",
-    "natal",
-    "nathan",
-    "nation",
-    "nations",
-    "native",
-    "natives",
-    "nato",
-    "natter",
-    "natters",
-    "nattily",
-    "natty",
-    "natura",
-    "natural",
-    "nature",
-    "natured",
-    "natures",
-    "naught",
-    "naughty",
-    "nausea",
-    "nautili",
-    "naval",
-    "nave",
-    "navel",
-    "navels",
-    "naves",
-    "navies",
-    "navy",
-    "nay",
-    "nco",
-    "ne",
-    "neap",
-    "near",
-    "nearby",
-    "neared",
-    "nearer",
-    "nearest",
-    "nearing",
-    "nearish",
-    "nearly",
-    "nears",
-    "neat",
-    "neaten",
-    "neatens",
-    "neater",
-    "neatest",
-    "neatly",
-    "nebula",
-    "nebulae",
-    "nebular",
-    "nebulas",
-    "neck",
-    "necked",
-    "necking",
-    "necks",
-    "necktie",
-    "nectar",
-    "nectars",
-    "nee",
-    "need",
-    "needed",
-    "needful",
-    "needier",
-    "needing",
-    "needle",
-    "needled",
-    "needles",
-    "needs",
-    "needy",
-    "negate",
-    "negated",
-    "negates",
-    "neglect",
-    "nehru",
-    "neigh",
-    "neighed",
-    "neighs",
-    "neil",
-    "neither",
-    "nekton",
-    "nelson",
-    "nemesis",
-    "neo",
-    "neon",
-    "neonate",
-    "nepal",
-    "nephew",
-    "nephews",
-    "neptune",
-    "nero",
-    "nerve",
-    "nerved",
-    "nerves",
-    "nervous",
-    "nervy",
-    "nest",
-    "nested",
-    "nesting",
-    "nestle",
-    "nestled",
-    "nestles",
-    "nests",
-    "net",
-    "nether",
-    "nets",
-    "netted",
-    "netting",
-    "nettle",
-    "nettled",
-    "nettles",
-    "network",
-    "neural",
-    "neuron",
-    "neurons",
-    "neuter",
-    "neuters",
-    "neutral",
-    "neutron",
-    "nevada",
-    "never",
-    "nevil",
-    "new",
-    "newark",
-    "newborn",
-    "newer",
-    "newest",
-    "newish",
-    "newly",
-    "newness",
-    "news",
-    "newsboy",
-    "newsman",
-    "newsmen",
-    "newsy",
-    "newt",
-    "newton",
-    "newts",
-    "next",
-    "niagara",
-    "nib",
-    "nibble",
-    "nibbled",
-    "nibbles",
-    "nibs",
-    "nice",
-    "nicely",
-    "nicer",
-    "nicest",
-    "nicety",
-    "niche",
-    "niches",
-    "nick",
-    "nicked",
-    "nickel",
-    "nickels",
-    "nicking",
-    "nicks",
-    "nicosia",
-    "niece",
-    "nieces",
-    "nifty",
-    "nigel",
-    "niger",
-    "nigeria",
-    "niggler",
-    "nigh",
-    "night",
-    "nightie",
-    "nightly",
-    "nights",
-    "nil",
-    "nile",
-    "nimble",
-    "nimbler",
-    "nimbly",
-    "nimbus",
-    "nimrod",
-    "nine",
-    "nines",
-    "ninety",
-    "nineveh",
-    "ninny",
-    "ninth",
-    "niobium",
-    "nip",
-    "nipped",
-    "nipper",
-    "nippers",
-    "nippily",
-    "nipping",
-    "nipple",
-    "nipples",
-    "nippy",
-    "nips",
-    "nirvana",
-    "nissan",
-    "nit",
-    "niter",
-    "nitpick",
-    "nitrate",
-    "nitric",
-    "nitride",
-    "nitrite",
-    "nitro",
-    "nitrous",
-    "nits",
-    "nitwit",
-    "nitwits",
-    "nixon",
-    "nne",
-    "nnw",
-    "no",
-    "noah",
-    "nobel",
-    "noble",
-    "nobler",
-    "nobles",
-    "noblest",
-    "nobly",
-    "nobody",
-    "nocuous",
-    "nod",
-    "nodal",
-    "nodded",
-    "nodding",
-    "node",
-    "nodes",
-    "nods",
-    "nodular",
-    "nodule",
-    "nodules",
-    "noel",
-    "noes",
-    "noggin",
-    "noggins",
-    "noise",
-    "noises",
-    "noisier",
-    "noisily",
-    "noisome",
-    "noisy",
-    "nomad",
-    "nomadic",
-    "nomads",
-    "nominal",
-    "nominee",
-    "non",
-    "none",
-    "nonplus",
-    "nonskid",
-    "nonstop",
-    "nonuse",
-    "nonuser",
-    "noodle",
-    "noodles",
-    "nook",
-    "nooks",
-    "noon",
-    "noonday",
-    "noose",
-    "nooses",
-    "nor",
-    "nordic",
-    "norfolk",
-    "norm",
-    "normal",
-    "normals",
-    "norman",
-    "normans",
-    "norms",
-    "norse",
-    "north",
-    "norway",
-    "nose",
-    "nosebag",
-    "nosed",
-    "nosegay",
-    "noses",
-    "nosey",
-    "nosily",
-    "nosing",
-    "nostril",
-    "nostrum",
-    "nosy",
-    "not",
-    "notable",
-    "notably",
-    "notae",
-    "notary",
-    "notch",
-    "notched",
-    "notches",
-    "note",
-    "noted",
-    "notedly",
-    "notes",
-    "nothing",
-    "notice",
-    "noticed",
-    "notices",
-    "notify",
-    "noting",
-    "notion",
-    "notions",
-    "nougat",
-    "nought",
-    "noughts",
-    "noun",
-    "nouns",
-    "nourish",
-    "nova",
-    "novae",
-    "novel",
-    "novels",
-    "novelty",
-    "novice",
-    "novices",
-    "now",
-    "nowaday",
-    "nowhere",
-    "nowise",
-    "noxious",
-    "nozzle",
-    "nozzles",
-    "nuance",
-    "nuances",
-    "nubile",
-    "nuclear",
-    "nuclei",
-    "nucleic",
-    "nucleus",
-    "nuclide",
-    "nude",
-    "nudes",
-    "nudge",
-    "nudged",
-    "nudges",
-    "nudging",
-    "nudism",
-    "nudist",
-    "nudists",
-    "nudity",
-    "nugget",
-    "nuggets",
-    "nul",
-    "null",
-    "nullify",
-    "nullity",
-    "numb",
-    "numbed",
-    "number",
-    "numbers",
-    "numbing",
-    "numbly",
-    "numbs",
-    "numeral",
-    "numeric",
-    "nun",
-    "nuncio",
-    "nunnery",
-    "nuns",
-    "nuptial",
-    "nurse",
-    "nursed",
-    "nursery",
-    "nurses",
-    "nursing",
-    "nurture",
-    "nut",
-    "nutmeg",
-    "nuts",
-    "nutty",
-    "nuzzle",
-    "nuzzled",
-    "nuzzles",
-    "nw",
-    "nylon",
-    "nylons",
-    "nymph",
-    "nymphal",
-    "nymphs",
-    "oaf",
-    "oafish",
-    "oafs",
-    "oak",
-    "oaks",
-    "oakum",
-    "oar",
-    "oarlock",
-    "oars",
-    "oarsman",
-    "oarsmen",
-    "oases",
-    "oasis",
-    "oat",
-    "oatcake",
-    "oath",
-    "oaths",
-    "oatmeal",
-    "oats",
-    "obadiah",
-    "obelisk",
-    "obese",
-    "obesity",
-    "obey",
-    "obeyed",
-    "obeying",
-    "obeys",
-    "object",
-    "objects",
-    "oblige",
-    "obliged",
-    "obliges",
-    "oblique",
-    "oblong",
-    "oblongs",
-    "obloquy",
-    "oboe",
-    "oboes",
-    "oboist",
-    "obscene",
-    "obscure",
-    "observe",
-    "obsess",
-    "obtain",
-    "obtains",
-    "obtrude",
-    "obtuse",
-    "obverse",
-    "obviate",
-    "obvious",
-    "occlude",
-    "occult",
-    "occults",
-    "occupy",
-    "occur",
-    "occurs",
-    "ocean",
-    "oceania",
-    "oceanic",
-    "oceans",
-    "ocelot",
-    "ocelots",
-    "ochre",
-    "octagon",
-    "octal",
-    "octane",
-    "octant",
-    "octants",
-    "octave",
-    "octaves",
-    "octavo",
-    "octavos",
-    "octet",
-    "octets",
-    "october",
-    "octopi",
-    "octopod",
-    "octopus",
-    "octuple",
-    "ocular",
-    "oculars",
-    "oculist",
-    "odd",
-    "oddball",
-    "odder",
-    "oddest",
-    "oddish",
-    "oddity",
-    "oddly",
-    "oddment",
-    "oddness",
-    "odds",
-    "ode",
-    "odes",
-    "odious",
-    "odium",
-    "odor",
-    "odorous",
-    "odyssey",
-    "oed",
-    "oedipal",
-    "oedipus",
-    "oems",
-    "of",
-    "off",
-    "offal",
-    "offbeat",
-    "offend",
-    "offends",
-    "offense",
-    "offer",
-    "offered",
-    "offers",
-    "offhand",
-    "office",
-    "officer",
-    "offices",
-    "officio",
-    "offing",
-    "offish",
-    "offline",
-    "offload",
-    "offpeak",
-    "offset",
-    "offsets",
-    "offside",
-    "oft",
-    "often",
-    "oftener",
-    "ogle",
-    "ogled",
-    "ogles",
-    "ogling",
-    "ogre",
-    "ogres",
-    "ogress",
-    "oh",
-    "ohio",
-    "ohm",
-    "ohmic",
-    "ohms",
-    "oil",
-    "oilcake",
-    "oilcan",
-    "oilcans",
-    "oiled",
-    "oiler",
-    "oilers",
-    "oilier",
-    "oiliest",
-    "oiling",
-    "oilman",
-    "oilmen",
-    "oils",
-    "oilseed",
-    "oilskin",
-    "oily",
-    "ok",
-    "okapi",
-    "okapis",
-    "okay",
-    "okayed",
-    "okaying",
-    "okinawa",
-    "okra",
-    "old",
-    "olden",
-    "older",
-    "oldest",
-    "oldie",
-    "oldies",
-    "oldish",
-    "olds",
-    "oldster",
-    "oleron",
-    "olive",
-    "olives",
-    "olympia",
-    "olympic",
-    "olympus",
-    "omaha",
-    "oman",
-    "omega",
-    "omelet",
-    "omelets",
-    "omen",
-    "omened",
-    "omens",
-    "omicron",
-    "ominous",
-    "omissis",
-    "omit",
-    "omits",
-    "omitted",
-    "omnibus",
-    "on",
-    "onanism",
-    "once",
-    "one",
-    "oneness",
-    "onerous",
-    "ones",
-    "oneself",
-    "onetime",
-    "ongoing",
-    "onion",
-    "onions",
-    "online",
-    "only",
-    "onrush",
-    "onset",
-    "onsets",
-    "onshore",
-    "onside",
-    "ontario",
-    "onto",
-    "onus",
-    "onward",
-    "onwards",
-    "onyx",
-    "oodles",
-    "oops",
-    "ooze",
-    "oozed",
-    "oozes",
-    "oozier",
-    "ooziest",
-    "oozily",
-    "oozing",
-    "oozy",
-    "opacity",
-    "opal",
-    "opaque",
-    "opec",
-    "open",
-    "opened",
-    "opener",
-    "openers",
-    "opening",
-    "openly",
-    "opens",
-    "opera",
-    "operand",
-    "operant",
-    "operas",
-    "operate",
-    "opiate",
-    "opiates",
-    "opine",
-    "opined",
-    "opines",
-    "opining",
-    "opinion",
-    "opium",
-    "oppose",
-    "opposed",
-    "opposer",
-    "opposes",
-    "oppress",
-    "opt",
-    "opted",
-    "optic",
-    "optical",
-    "optics",
-    "optima",
-    "optimal",
-    "optimum",
-    "opting",
-    "option",
-    "options",
-    "opts",
-    "opulent",
-    "opus",
-    "or",
-    "oracle",
-    "oracles",
-    "oral",
-    "orally",
-    "orals",
-    "orange",
-    "oranges",
-    "orate",
-    "orated",
-    "orates",
-    "orating",
-    "oration",
-    "orator",
-    "orators",
-    "oratory",
-    "orb",
-    "orbed",
-    "orbit",
-    "orbital",
-    "orbited",
-    "orbits",
-    "orbs",
-    "orchard",
-    "orchid",
-    "orchids",
-    "ordain",
-    "ordains",
-    "ordeal",
-    "ordeals",
-    "order",
-    "ordered",
-    "orderly",
-    "orders",
-    "ordinal",
-    "ordure",
-    "ore",
-    "oregano",
-    "oregon",
-    "ores",
-    "organ",
-    "organdy",
-    "organic",
-    "organs",
-    "organza",
-    "orgasm",
-    "orgasms",
-    "orgies",
-    "orgy",
-    "orient",
-    "orients",
-    "orifice",
-    "origami",
-    "origin",
-    "origins",
-    "orinoco",
-    "orion",
-    "orkney",
-    "orlando",
-    "orleans",
-    "ormolu",
-    "ornate",
-    "ornery",
-    "orphan",
-    "orphans",
-    "orpheus",
-    "ortolan",
-    "osaka",
-    "oscar",
-    "oscine",
-    "oscular",
-    "osier",
-    "osiers",
-    "oslo",
-    "osmium",
-    "osmosis",
-    "osmotic",
-    "osprey",
-    "ospreys",
-    "osseous",
-    "ossify",
-    "ossuary",
-    "ostend",
-    "ostrich",
-    "oswald",
-    "othello",
-    "other",
-    "others",
-    "otiose",
-    "otitis",
-    "ottawa",
-    "otter",
-    "otters",
-    "ottoman",
-    "ouch",
-    "ought",
-    "ounce",
-    "ounces",
-    "our",
-    "ours",
-    "oust",
-    "ousted",
-    "ouster",
-    "ousters",
-    "ousting",
-    "ousts",
-    "out",
-    "outback",
-    "outbid",
-    "outbids",
-    "outcast",
-    "outcome",
-    "outcrop",
-    "outcry",
-    "outdid",
-    "outdo",
-    "outdoes",
-    "outdone",
-    "outdoor",
-    "outer",
-    "outface",
-    "outfall",
-    "outfit",
-    "outfits",
-    "outflew",
-    "outflow",
-    "outfly",
-    "outflys",
-    "outfox",
-    "outgrew",
-    "outgrow",
-    "outgun",
-    "outguns",
-    "outing",
-    "outings",
-    "outlast",
-    "outlaw",
-    "outlaws",
-    "outlay",
-    "outlays",
-    "outlet",
-    "outlets",
-    "outline",
-    "outlive",
-    "outlook",
-    "outmost",
-    "outmove",
-    "outpace",
-    "outplay",
-    "outpost",
-    "outpour",
-    "output",
-    "outputs",
-    "outrage",
-    "outrank",
-    "outre",
-    "outride",
-    "outrode",
-    "outrush",
-    "outs",
-    "outsell",
-    "outset",
-    "outside",
-    "outsize",
-    "outsold",
-    "outstay",
-    "outvote",
-    "outward",
-    "outwit",
-    "outwits",
-    "outwore",
-    "outworn",
-    "ouzel",
-    "ova",
-    "oval",
-    "ovals",
-    "ovarian",
-    "ovaries",
-    "ovary",
-    "ovate",
-    "ovation",
-    "oven",
-    "ovens",
-    "over",
-    "overact",
-    "overage",
-    "overall",
-    "overarm",
-    "overawe",
-    "overbid",
-    "overdid",
-    "overdo",
-    "overdue",
-    "overeat",
-    "overfly",
-    "overjoy",
-    "overlap",
-    "overlay",
-    "overly",
-    "overran",
-    "overrun",
-    "overs",
-    "oversaw",
-    "oversee",
-    "overt",
-    "overtly",
-    "overtop",
-    "oviform",
-    "ovine",
-    "ovoid",
-    "ovum",
-    "ow",
-    "owe",
-    "owed",
-    "owes",
-    "owing",
-    "owl",
-    "owlet",
-    "owlets",
-    "owlish",
-    "owls",
-    "owly",
-    "own",
-    "owned",
-    "owner",
-    "owners",
-    "owning",
-    "owns",
-    "ox",
-    "oxalate",
-    "oxalic",
-    "oxblood",
-    "oxcart",
-    "oxcarts",
-    "oxen",
-    "oxford",
-    "oxidant",
-    "oxide",
-    "oxides",
-    "oxidize",
-    "oxlip",
-    "oxtail",
-    "oxygen",
-    "oyster",
-    "oysters",
-    "oz",
-    "ozone",
-    "pa",
-    "pace",
-    "paced",
-    "pacer",
-    "pacers",
-    "paces",
-    "pacific",
-    "pacify",
-    "pacing",
-    "pack",
-    "package",
-    "packed",
-    "packer",
-    "packers",
-    "packet",
-    "packets",
-    "packing",
-    "packs",
-    "pact",
-    "pacts",
-    "pad",
-    "padded",
-    "paddies",
-    "padding",
-    "paddle",
-    "paddled",
-    "paddles",
-    "paddock",
-    "paddy",
-    "padlock",
-    "padre",
-    "padres",
-    "pads",
-    "paella",
-    "pagan",
-    "pagans",
-    "page",
-    "pageant",
-    "pageboy",
-    "paged",
-    "pages",
-    "paging",
-    "pagoda",
-    "pagodas",
-    "paid",
-    "pail",
-    "pails",
-    "pain",
-    "pained",
-    "painful",
-    "pains",
-    "paint",
-    "painted",
-    "painter",
-    "paints",
-    "pair",
-    "paired",
-    "pairing",
-    "pairs",
-    "paisley",
-    "pajama",
-    "pajamas",
-    "pal",
-    "palace",
-    "palaces",
-    "paladin",
-    "palatal",
-    "palate",
-    "palates",
-    "palaver",
-    "pale",
-    "paled",
-    "palely",
-    "paler",
-    "palermo",
-    "pales",
-    "palest",
-    "palette",
-    "palfrey",
-    "paling",
-    "pall",
-    "palled",
-    "pallet",
-    "pallets",
-    "pallid",
-    "palling",
-    "pallor",
-    "palls",
-    "palm",
-    "palmed",
-    "palming",
-    "palmist",
-    "palms",
-    "palo",
-    "pals",
-    "palsied",
-    "palsy",
-    "paltry",
-    "pam",
-    "pamela",
-    "pamper",
-    "pampers",
-    "pan",
-    "panacea",
-    "panache",
-    "panama",
-    "pancake",
-    "panda",
-    "pandas",
-    "pander",
-    "panders",
-    "pandora",
-    "pane",
-    "panel",
-    "paneled",
-    "panels",
-    "panes",
-    "pang",
-    "pangs",
-    "panic",
-    "panicky",
-    "panicle",
-    "panics",
-    "panned",
-    "pannier",
-    "panning",
-    "panoply",
-    "pans",
-    "pansies",
-    "pansy",
-    "pant",
-    "panted",
-    "panther",
-    "panties",
-    "panting",
-    "pantry",
-    "pants",
-    "panty",
-    "pap",
-    "papa",
-    "papacy",
-    "papal",
-    "papaya",
-    "paper",
-    "papered",
-    "papers",
-    "papery",
-    "papist",
-    "papists",
-    "papoose",
-    "paprika",
-    "papua",
-    "papyri",
-    "papyrus",
-    "par",
-    "parable",
-    "parade",
-    "paraded",
-    "parades",
-    "paradox",
-    "paragon",
-    "parapet",
-    "parasol",
-    "parboil",
-    "parcel",
-    "parcels",
-    "parch",
-    "parched",
-    "parches",
-    "pardon",
-    "pardons",
-    "pare",
-    "pared",
-    "parent",
-    "parents",
-    "parfait",
-    "pariah",
-    "pariahs",
-    "paring",
-    "parings",
-    "paris",
-    "parish",
-    "parity",
-    "park",
-    "parka",
-    "parkas",
-    "parked",
-    "parker",
-    "parking",
-    "parks",
-    "parkway",
-    "parlay",
-    "parley",
-    "parleys",
-    "parlor",
-    "parlors",
-    "parlous",
-    "parody",
-    "parole",
-    "paroled",
-    "parolee",
-    "paroles",
-    "parquet",
-    "parried",
-    "parries",
-    "parrot",
-    "parrots",
-    "parry",
-    "parse",
-    "parsed",
-    "parser",
-    "parses",
-    "parsing",
-    "parsley",
-    "parsnip",
-    "parson",
-    "parsons",
-    "part",
-    "partake",
-    "parted",
-    "partial",
-    "parties",
-    "parting",
-    "partly",
-    "partner",
-    "partook",
-    "parts",
-    "party",
-    "parva",
-    "parvenu",
-    "pascal",
-    "pass",
-    "passage",
-    "passed",
-    "passer",
-    "passes",
-    "passing",
-    "passion",
-    "passive",
-    "past",
-    "pasta",
-    "paste",
-    "pasted",
-    "pastel",
-    "pastels",
-    "pastern",
-    "pastes",
-    "pasteup",
-    "pasteur",
-    "pasties",
-    "pastime",
-    "pasting",
-    "pastor",
-    "pastors",
-    "pastry",
-    "pasture",
-    "pasty",
-    "pat",
-    "patch",
-    "patched",
-    "patches",
-    "patchy",
-    "pate",
-    "paten",
-    "patent",
-    "patents",
-    "pater",
-    "path",
-    "pathed",
-    "pathos",
-    "paths",
-    "pathway",
-    "patient",
-    "patio",
-    "patios",
-    "patna",
-    "patois",
-    "patrick",
-    "patriot",
-    "patrol",
-    "patrols",
-    "patron",
-    "patrons",
-    "pats",
-    "patsy",
-    "patted",
-    "patter",
-    "pattern",
-    "patters",
-    "patties",
-    "patting",
-    "patty",
-    "paucity",
-    "paul",
-    "paula",
-    "paunch",
-    "paunchy",
-    "pauper",
-    "paupers",
-    "pause",
-    "paused",
-    "pauses",
-    "pausing",
-    "pave",
-    "paved",
-    "paves",
-    "paving",
-    "pavlov",
-    "paw",
-    "pawed",
-    "pawing",
-    "pawn",
-    "pawned",
-    "pawning",
-    "pawns",
-    "paws",
-    "pax",
-    "pay",
-    "payable",
-    "payday",
-    "payee",
-    "payees",
-    "payer",
-    "payers",
-    "paying",
-    "payment",
-    "payoff",
-    "payroll",
-    "pays",
-    "pc",
-    "pea",
-    "peace",
-    "peach",
-    "peaches",
-    "peacock",
-    "peafowl",
-    "peahen",
-    "peak",
-    "peaked",
-    "peaking",
-    "peaks",
-    "peaky",
-    "peal",
-    "pealed",
-    "pealing",
-    "peals",
-    "peanut",
-    "peanuts",
-    "pear",
-    "pearl",
-    "pearls",
-    "pearly",
-    "pears",
-    "peas",
-    "peasant",
-    "peat",
-    "peaty",
-    "pebble",
-    "pebbled",
-    "pebbles",
-    "pebbly",
-    "pecan",
-    "pecans",
-    "peccary",
-    "peck",
-    "pecked",
-    "pecking",
-    "pecks",
-    "pectin",
-    "pedal",
-    "pedaled",
-    "pedals",
-    "pedant",
-    "pedants",
-    "peddle",
-    "peddled",
-    "peddler",
-    "peddles",
-    "pee",
-    "peed",
-    "peek",
-    "peeked",
-    "peeking",
-    "peeks",
-    "peel",
-    "peeled",
-    "peeler",
-    "peelers",
-    "peeling",
-    "peels",
-    "peep",
-    "peeped",
-    "peeper",
-    "peeping",
-    "peeps",
-    "peer",
-    "peerage",
-    "peered",
-    "peeress",
-    "peering",
-    "peers",
-    "pees",
-    "peeve",
-    "peeved",
-    "peeves",
-    "peeving",
-    "peevish",
-    "peewee",
-    "peg",
-    "pegasus",
-    "pegged",
-    "pegging",
-    "pegs",
-    "peking",
-    "pelican",
-    "pellet",
-    "pellets",
-    "pelt",
-    "pelted",
-    "pelting",
-    "pelts",
-    "pelvic",
-    "pelvis",
-    "pen",
-    "penal",
-    "penalty",
-    "penance",
-    "pence",
-    "pencil",
-    "pencils",
-    "pend",
-    "pendant",
-    "pended",
-    "pendent",
-    "pending",
-    "pends",
-    "penguin",
-    "penile",
-    "penman",
-    "penmen",
-    "penn",
-    "pennant",
-    "penned",
-    "pennies",
-    "penning",
-    "pennon",
-    "pennons",
-    "penny",
-    "pens",
-    "pension",
-    "pensive",
-    "pent",
-    "pentair",
-    "pentane",
-    "penury",
-    "peonage",
-    "peonies",
-    "peony",
-    "people",
-    "peopled",
-    "peoples",
-    "pep",
-    "pepped",
-    "pepper",
-    "peppers",
-    "peppery",
-    "pepping",
-    "peppy",
-    "peps",
-    "pepsi",
-    "peptic",
-    "peptide",
-    "per",
-    "percale",
-    "percent",
-    "perch",
-    "perched",
-    "perches",
-    "perfect",
-    "perfidy",
-    "perform",
-    "perfume",
-    "perhaps",
-    "perigee",
-    "peril",
-    "perils",
-    "period",
-    "periods",
-    "perish",
-    "perjure",
-    "perjury",
-    "perk",
-    "perked",
-    "perking",
-    "perks",
-    "perky",
-    "perm",
-    "permed",
-    "permian",
-    "permit",
-    "permits",
-    "perms",
-    "permute",
-    "perplex",
-    "persia",
-    "persian",
-    "persist",
-    "person",
-    "persona",
-    "persons",
-    "perspex",
-    "pert",
-    "pertain",
-    "perth",
-    "pertly",
-    "perturb",
-    "peru",
-    "perusal",
-    "peruse",
-    "perused",
-    "peruses",
-    "pervade",
-    "pervert",
-    "peseta",
-    "pesky",
-    "peso",
-    "pest",
-    "pester",
-    "pesters",
-    "pestle",
-    "pestles",
-    "pests",
-    "pet",
-    "petal",
-    "petals",
-    "petard",
-    "petards",
-    "pete",
-    "peter",
-    "petered",
-    "peters",
-    "petrel",
-    "petrels",
-    "petrify",
-    "petro",
-    "petrol",
-    "pets",
-    "petted",
-    "petting",
-    "pettish",
-    "petty",
-    "petunia",
-    "peugeot",
-    "pew",
-    "pewee",
-    "pews",
-    "pewter",
-    "pfennig",
-    "phalanx",
-    "phalli",
-    "phallic",
-    "phallus",
-    "phantom",
-    "pharaoh",
-    "phase",
-    "phased",
-    "phases",
-    "phasing",
-    "phd",
-    "phenol",
-    "phenyl",
-    "phial",
-    "phil",
-    "philip",
-    "phlegm",
-    "phobia",
-    "phobias",
-    "phobic",
-    "phoebe",
-    "phoenix",
-    "phone",
-    "phoned",
-    "phoneme",
-    "phones",
-    "phonic",
-    "phonies",
-    "phoning",
-    "phony",
-    "photo",
-    "photon",
-    "photons",
-    "photos",
-    "phrasal",
-    "phrase",
-    "phrased",
-    "phrases",
-    "phyla",
-    "physic",
-    "physics",
-    "pi",
-    "pianist",
-    "piano",
-    "pianola",
-    "pianos",
-    "piazza",
-    "pica",
-    "picador",
-    "picasso",
-    "piccolo",
-    "pick",
-    "pickax",
-    "picked",
-    "picker",
-    "pickers",
-    "picket",
-    "pickets",
-    "picking",
-    "pickle",
-    "pickled",
-    "pickles",
-    "picks",
-    "pickup",
-    "picnic",
-    "picnics",
-    "picture",
-    "piddle",
-    "piddled",
-    "piddles",
-    "pidgin",
-    "pie",
-    "piebald",
-    "piece",
-    "pieced",
-    "pieces",
-    "piecing",
-    "pied",
-    "pier",
-    "pierce",
-    "pierced",
-    "pierces",
-    "pierre",
-    "piers",
-    "pies",
-    "pietism",
-    "piety",
-    "piffle",
-    "pig",
-    "pigeon",
-    "pigeons",
-    "pigging",
-    "piggish",
-    "piggy",
-    "piglet",
-    "piglets",
-    "pigment",
-    "pigmies",
-    "pigmy",
-    "pigs",
-    "pigskin",
-    "pigsty",
-    "pigtail",
-    "pike",
-    "pikemen",
-    "piker",
-    "pikes",
-    "pilaf",
-    "pilate",
-    "pile",
-    "piled",
-    "piles",
-    "pilfer",
-    "pilfers",
-    "pilgrim",
-    "piling",
-    "pill",
-    "pillage",
-    "pillar",
-    "pillars",
-    "pillbox",
-    "pillion",
-    "pillory",
-    "pillow",
-    "pillows",
-    "pills",
-    "pilot",
-    "piloted",
-    "pilots",
-    "pimento",
-    "pimp",
-    "pimple",
-    "pimpled",
-    "pimples",
-    "pimply",
-    "pimps",
-    "pin",
-    "pinball",
-    "pincer",
-    "pincers",
-    "pinch",
-    "pinched",
-    "pinches",
-    "pine",
-    "pined",
-    "pines",
-    "ping",
-    "pinged",
-    "pinging",
-    "pings",
-    "pinhead",
-    "pinhole",
-    "pining",
-    "pinion",
-    "pinions",
-    "pink",
-    "pinked",
-    "pinkie",
-    "pinking",
-    "pinkish",
-    "pinks",
-    "pinned",
-    "pinning",
-    "pins",
-    "pint",
-    "pintail",
-    "pints",
-    "pinup",
-    "pioneer",
-    "pious",
-    "piously",
-    "pip",
-    "pipe",
-    "piped",
-    "piper",
-    "pipers",
-    "pipes",
-    "pipette",
-    "piping",
-    "pips",
-    "piquant",
-    "pique",
-    "piqued",
-    "piques",
-    "piracy",
-    "piraeus",
-    "pirate",
-    "pirated",
-    "pirates",
-    "pisa",
-    "pisces",
-    "piss",
-    "pissed",
-    "pisses",
-    "pissing",
-    "piste",
-    "pistol",
-    "pistols",
-    "piston",
-    "pistons",
-    "pit",
-    "pitch",
-    "pitched",
-    "pitcher",
-    "pitches",
-    "pitchy",
-    "piteous",
-    "pitfall",
-    "pith",
-    "pithily",
-    "pithy",
-    "pitied",
-    "pities",
-    "pitiful",
-    "pitman",
-    "pitmen",
-    "piton",
-    "pitons",
-    "pits",
-    "pitt",
-    "pitta",
-    "pitted",
-    "pitting",
-    "pity",
-    "pitying",
-    "pivot",
-    "pivotal",
-    "pivoted",
-    "pivots",
-    "pixel",
-    "pixels",
-    "pixie",
-    "pixies",
-    "pixy",
-    "pizza",
-    "pizzas",
-    "placard",
-    "placate",
-    "place",
-    "placebo",
-    "placed",
-    "places",
-    "placid",
-    "placing",
-    "placita",
-    "plague",
-    "plagued",
-    "plagues",
-    "plaice",
-    "plaid",
-    "plaids",
-    "plain",
-    "plainer",
-    "plainly",
-    "plains",
-    "plaint",
-    "plait",
-    "plaited",
-    "plaits",
-    "plan",
-    "planar",
-    "plane",
-    "planed",
-    "planes",
-    "planet",
-    "planets",
-    "planing",
-    "plank",
-    "planked",
-    "planks",
-    "planned",
-    "planner",
-    "plans",
-    "plant",
-    "planted",
-    "planter",
-    "plants",
-    "plaque",
-    "plaques",
-    "plasma",
-    "plaster",
-    "plastic",
-    "plate",
-    "plateau",
-    "plated",
-    "platen",
-    "platens",
-    "plates",
-    "plating",
-    "plato",
-    "platoon",
-    "platted",
-    "platter",
-    "plaudit",
-    "play",
-    "playboy",
-    "played",
-    "player",
-    "players",
-    "playful",
-    "playing",
-    "playoff",
-    "playpen",
-    "plays",
-    "plaza",
-    "plazas",
-    "plea",
-    "plead",
-    "pleaded",
-    "pleader",
-    "pleads",
-    "pleas",
-    "please",
-    "pleased",
-    "pleases",
-    "pleat",
-    "pleated",
-    "pleats",
-    "plebs",
-    "pledge",
-    "pledged",
-    "pledges",
-    "plenary",
-    "plenty",
-    "plenum",
-    "pleural",
-    "plexus",
-    "pliable",
-    "pliancy",
-    "pliant",
-    "plied",
-    "pliers",
-    "plies",
-    "plight",
-    "plights",
-    "plinth",
-    "plinths",
-    "pliny",
-    "plod",
-    "plodded",
-    "plodder",
-    "plods",
-    "plop",
-    "plopped",
-    "plops",
-    "plot",
-    "plots",
-    "plotted",
-    "plotter",
-    "plover",
-    "plovers",
-    "ploy",
-    "ploys",
-    "pluck",
-    "plucked",
-    "plucks",
-    "plucky",
-    "plug",
-    "plugged",
-    "plugs",
-    "plum",
-    "plumage",
-    "plumb",
-    "plumbed",
-    "plumber",
-    "plumbs",
-    "plume",
-    "plumed",
-    "plumes",
-    "pluming",
-    "plummet",
-    "plummy",
-    "plump",
-    "plumped",
-    "plumper",
-    "plumps",
-    "plums",
-    "plumy",
-    "plunder",
-    "plunge",
-    "plunged",
-    "plunger",
-    "plunges",
-    "plunk",
-    "plunked",
-    "plunks",
-    "plural",
-    "plurals",
-    "plus",
-    "plush",
-    "plushly",
-    "plushy",
-    "pluto",
-    "ply",
-    "plying",
-    "plywood",
-    "pm",
-    "po",
-    "poach",
-    "poached",
-    "poacher",
-    "poaches",
-    "pocket",
-    "pockets",
-    "pod",
-    "podia",
-    "podium",
-    "pods",
-    "poe",
-    "poem",
-    "poems",
-    "poet",
-    "poetess",
-    "poetic",
-    "poetics",
-    "poetry",
-    "poets",
-    "pogrom",
-    "pogroms",
-    "point",
-    "pointed",
-    "pointer",
-    "points",
-    "poise",
-    "poised",
-    "poises",
-    "poising",
-    "poison",
-    "poisons",
-    "poke",
-    "poked",
-    "poker",
-    "pokers",
-    "pokes",
-    "poking",
-    "poky",
-    "poland",
-    "polar",
-    "polaris",
-    "pole",
-    "poleax",
-    "polecat",
-    "poled",
-    "polemic",
-    "poles",
-    "police",
-    "policed",
-    "policy",
-    "polio",
-    "polish",
-    "polite",
-    "politic",
-    "polka",
-    "polkas",
-    "poll",
-    "polled",
-    "pollen",
-    "polling",
-    "polls",
-    "pollute",
-    "polo",
-    "poly",
-    "polygon",
-    "polymer",
-    "polyp",
-    "pomade",
-    "pommel",
-    "pomp",
-    "pompeii",
-    "pompous",
-    "poncho",
-    "ponchos",
-    "pond",
-    "ponder",
-    "ponders",
-    "ponds",
-    "pongee",
-    "ponies",
-    "pontiff",
-    "pontoon",
-    "pony",
-    "pooch",
-    "poodle",
-    "poodles",
-    "pooh",
-    "pool",
-    "pooled",
-    "pooling",
-    "pools",
-    "poona",
-    "poop",
-    "poor",
-    "poorer",
-    "poorest",
-    "poorly",
-    "pop",
-    "popcorn",
-    "pope",
-    "popery",
-    "popes",
-    "popeye",
-    "popish",
-    "poplar",
-    "poplars",
-    "poplin",
-    "poplins",
-    "popped",
-    "popper",
-    "poppers",
-    "poppies",
-    "popping",
-    "poppy",
-    "pops",
-    "popular",
-    "porch",
-    "porches",
-    "pore",
-    "pored",
-    "pores",
-    "porgy",
-    "poring",
-    "pork",
-    "porno",
-    "porous",
-    "port",
-    "portage",
-    "portal",
-    "portals",
-    "ported",
-    "portend",
-    "portent",
-    "porter",
-    "porters",
-    "portico",
-    "porting",
-    "portion",
-    "portly",
-    "portray",
-    "ports",
-    "pose",
-    "posed",
-    "poser",
-    "posers",
-    "poses",
-    "posh",
-    "poshest",
-    "posies",
-    "posing",
-    "posit",
-    "posse",
-    "posses",
-    "possess",
-    "possum",
-    "post",
-    "postage",
-    "postal",
-    "postbox",
-    "posted",
-    "poster",
-    "postern",
-    "posters",
-    "posting",
-    "postman",
-    "postmen",
-    "posts",
-    "posture",
-    "postwar",
-    "posy",
-    "pot",
-    "potable",
-    "potash",
-    "potato",
-    "potboi",
-    "potency",
-    "potent",
-    "pothole",
-    "potion",
-    "potions",
-    "potluck",
-    "potomac",
-    "potpie",
-    "pots",
-    "potshot",
-    "pottage",
-    "potted",
-    "potter",
-    "potters",
-    "pottery",
-    "potting",
-    "potty",
-    "pouch",
-    "pouched",
-    "pouches",
-    "poultry",
-    "pounce",
-    "pounced",
-    "pounces",
-    "pound",
-    "pounded",
-    "pounder",
-    "pounds",
-    "pour",
-    "poured",
-    "pourer",
-    "pourers",
-    "pouring",
-    "pours",
-    "pout",
-    "pouted",
-    "pouting",
-    "pouts",
-    "poverty",
-    "pow",
-    "powder",
-    "powders",
-    "powdery",
-    "power",
-    "powered",
-    "powers",
-    "powwow",
-    "powwows",
-    "pps",
-    "prague",
-    "prairie",
-    "praise",
-    "praised",
-    "praiser",
-    "praises",
-    "praline",
-    "pram",
-    "prams",
-    "prance",
-    "pranced",
-    "prancer",
-    "prances",
-    "prank",
-    "pranks",
-    "prat",
-    "prattle",
-    "prawn",
-    "prawns",
-    "praxis",
-    "pray",
-    "prayed",
-    "prayer",
-    "prayers",
-    "praying",
-    "prays",
-    "pre",
-    "preach",
-    "preachy",
-    "prebend",
-    "precast",
-    "precede",
-    "precept",
-    "precess",
-    "precis",
-    "precise",
-    "precook",
-    "precut",
-    "predate",
-    "predict",
-    "preempt",
-    "preen",
-    "preened",
-    "preens",
-    "prefab",
-    "prefabs",
-    "preface",
-    "prefect",
-    "prefer",
-    "prefers",
-    "prefix",
-    "preform",
-    "preheat",
-    "prelate",
-    "prelude",
-    "premier",
-    "premise",
-    "premium",
-    "premix",
-    "prep",
-    "prepaid",
-    "prepare",
-    "prepay",
-    "prepays",
-    "prequel",
-    "presage",
-    "present",
-    "preset",
-    "presets",
-    "preside",
-    "press",
-    "pressed",
-    "presses",
-    "presto",
-    "presume",
-    "pretend",
-    "pretext",
-    "pretty",
-    "prevail",
-    "prevent",
-    "preview",
-    "prewar",
-    "prey",
-    "preyed",
-    "preying",
-    "preys",
-    "price",
-    "priced",
-    "prices",
-    "pricing",
-    "prick",
-    "pricked",
-    "prickle",
-    "prickly",
-    "pricks",
-    "pride",
-    "prided",
-    "prides",
-    "priding",
-    "pried",
-    "pries",
-    "priest",
-    "priests",
-    "prig",
-    "prim",
-    "primacy",
-    "primal",
-    "primary",
-    "primate",
-    "prime",
-    "primed",
-    "primer",
-    "primers",
-    "primes",
-    "priming",
-    "primly",
-    "prince",
-    "princes",
-    "print",
-    "printed",
-    "printer",
-    "prints",
-    "prior",
-    "priory",
-    "pris",
-    "prism",
-    "prisms",
-    "prison",
-    "prisons",
-    "prissy",
-    "privacy",
-    "private",
-    "privet",
-    "privity",
-    "privy",
-    "prize",
-    "prized",
-    "prizes",
-    "prizing",
-    "pro",
-    "probate",
-    "probe",
-    "probed",
-    "probes",
-    "probing",
-    "probity",
-    "problem",
-    "proceed",
-    "process",
-    "procter",
-    "proctor",
-    "procure",
-    "prod",
-    "prodded",
-    "prodigy",
-    "prods",
-    "produce",
-    "product",
-    "prof",
-    "profane",
-    "profess",
-    "proffer",
-    "profile",
-    "profit",
-    "profits",
-    "profuse",
-    "progeny",
-    "program",
-    "project",
-    "prolix",
-    "prolong",
-    "prom",
-    "promise",
-    "promote",
-    "prompt",
-    "prompts",
-    "prone",
-    "prong",
-    "pronged",
-    "prongs",
-    "pronoun",
-    "pronto",
-    "proof",
-    "proofed",
-    "proofs",
-    "prop",
-    "propane",
-    "propel",
-    "propels",
-    "proper",
-    "prophet",
-    "propose",
-    "propped",
-    "props",
-    "propyl",
-    "prorate",
-    "pros",
-    "prosaic",
-    "prose",
-    "prosper",
-    "protect",
-    "protege",
-    "protein",
-    "protest",
-    "proton",
-    "protons",
-    "proud",
-    "prouder",
-    "proudly",
-    "proust",
-    "prove",
-    "proved",
-    "proven",
-    "proverb",
-    "proves",
-    "provide",
-    "proving",
-    "proviso",
-    "provo",
-    "provoke",
-    "provost",
-    "prow",
-    "prowess",
-    "prowl",
-    "prowled",
-    "prowler",
-    "prowls",
-    "prows",
-    "proximo",
-    "proxy",
-    "prude",
-    "prudent",
-    "prudery",
-    "prudes",
-    "prudish",
-    "prune",
-    "pruned",
-    "prunes",
-    "pruning",
-    "prussia",
-    "pry",
-    "prying",
-    "ps",
-    "psalm",
-    "psalms",
-    "psalter",
-    "pseudo",
-    "psion",
-    "psych",
-    "psyche",
-    "psyches",
-    "psychic",
-    "pub",
-    "puberty",
-    "public",
-    "publish",
-    "pubs",
-    "puccini",
-    "puck",
-    "pucker",
-    "puckish",
-    "pucks",
-    "pudding",
-    "puddle",
-    "puddles",
-    "pudgier",
-    "pudgy",
-    "pueblo",
-    "puerile",
-    "puff",
-    "puffed",
-    "puffery",
-    "puffin",
-    "puffing",
-    "puffins",
-    "puffs",
-    "puffy",
-    "pug",
-    "puis",
-    "puke",
-    "puked",
-    "pukes",
-    "puking",
-    "puling",
-    "pull",
-    "pulled",
-    "puller",
-    "pullet",
-    "pulley",
-    "pulleys",
-    "pulling",
-    "pullman",
-    "pulls",
-    "pulp",
-    "pulped",
-    "pulping",
-    "pulpit",
-    "pulpits",
-    "pulps",
-    "pulpy",
-    "pulsar",
-    "pulsars",
-    "pulsate",
-    "pulse",
-    "pulsed",
-    "pulses",
-    "pulsing",
-    "puma",
-    "pumice",
-    "pummel",
-    "pummels",
-    "pump",
-    "pumped",
-    "pumping",
-    "pumpkin",
-    "pumps",
-    "pun",
-    "punch",
-    "punched",
-    "puncher",
-    "punches",
-    "punchy",
-    "pundit",
-    "pundits",
-    "pungent",
-    "punic",
-    "puniest",
-    "punish",
-    "punk",
-    "punks",
-    "punning",
-    "puns",
-    "punt",
-    "punted",
-    "punter",
-    "punters",
-    "punting",
-    "punts",
-    "puny",
-    "pup",
-    "pupae",
-    "pupil",
-    "pupils",
-    "puppet",
-    "puppets",
-    "puppies",
-    "puppy",
-    "pups",
-    "purcell",
-    "purdah",
-    "pure",
-    "puree",
-    "purely",
-    "purer",
-    "purest",
-    "purge",
-    "purged",
-    "purges",
-    "purging",
-    "purify",
-    "purism",
-    "purist",
-    "purists",
-    "puritan",
-    "purity",
-    "purl",
-    "purled",
-    "purlieu",
-    "purling",
-    "purloin",
-    "purls",
-    "purple",
-    "purpled",
-    "purples",
-    "purport",
-    "purpose",
-    "purr",
-    "purred",
-    "purring",
-    "purrs",
-    "purse",
-    "pursed",
-    "purser",
-    "pursers",
-    "purses",
-    "pursing",
-    "pursue",
-    "pursued",
-    "pursuer",
-    "pursues",
-    "pursuit",
-    "purvey",
-    "purveys",
-    "purview",
-    "pus",
-    "push",
-    "pushed",
-    "pusher",
-    "pushers",
-    "pushes",
-    "pushing",
-    "pushkin",
-    "pushup",
-    "pushups",
-    "pushy",
-    "puss",
-    "pusses",
-    "pussies",
-    "pustule",
-    "put",
-    "putrefy",
-    "putrid",
-    "puts",
-    "putsch",
-    "putt",
-    "putted",
-    "puttee",
-    "putter",
-    "putters",
-    "putting",
-    "putts",
-    "putty",
-    "puzzle",
-    "puzzled",
-    "puzzler",
-    "puzzles",
-    "pygmies",
-    "pygmy",
-    "pyhrric",
-    "pylon",
-    "pylons",
-    "pyramid",
-    "pyre",
-    "pyres",
-    "pyrexia",
-    "pyrite",
-    "pyrites",
-    "python",
-    "pythons",
-    "qatar",
-    "qdos",
-    "qed",
-    "qimi",
-    "qjump",
-    "ql",
-    "qls",
-    "qmon",
-    "qpac",
-    "qptr",
-    "qram",
-    "qtyp",
-    "quack",
-    "quacked",
-    "quacks",
-    "quad",
-    "quads",
-    "quae",
-    "quaeres",
-    "quaff",
-    "quaffed",
-    "quaffs",
-    "quail",
-    "quailed",
-    "quails",
-    "quaint",
-    "quake",
-    "quaked",
-    "quaker",
-    "quakers",
-    "quakes",
-    "quaking",
-    "quaky",
-    "qualify",
-    "quality",
-    "qualm",
-    "qualms",
-    "quanta",
-    "quantum",
-    "quark",
-    "quarks",
-    "quarrel",
-    "quarry",
-    "quart",
-    "quarter",
-    "quartet",
-    "quarto",
-    "quartos",
-    "quarts",
-    "quartz",
-    "quasar",
-    "quasars",
-    "quash",
-    "quashed",
-    "quashes",
-    "quasi",
-    "quaver",
-    "quavers",
-    "quay",
-    "quays",
-    "queasy",
-    "quebec",
-    "queen",
-    "queenly",
-    "queens",
-    "queer",
-    "queered",
-    "queerer",
-    "queerly",
-    "queers",
-    "quell",
-    "quelled",
-    "quells",
-    "quench",
-    "queried",
-    "queries",
-    "query",
-    "quest",
-    "quested",
-    "quests",
-    "queue",
-    "queued",
-    "queues",
-    "queuing",
-    "quibble",
-    "quiche",
-    "quiches",
-    "quick",
-    "quicken",
-    "quicker",
-    "quickie",
-    "quickly",
-    "quid",
-    "quiet",
-    "quieted",
-    "quieten",
-    "quieter",
-    "quietly",
-    "quiff",
-    "quiffs",
-    "quill",
-    "quilled",
-    "quills",
-    "quilt",
-    "quilted",
-    "quilts",
-    "quince",
-    "quinces",
-    "quinine",
-    "quintet",
-    "quip",
-    "quipped",
-    "quips",
-    "quire",
-    "quires",
-    "quirk",
-    "quirks",
-    "quirky",
-    "quit",
-    "quite",
-    "quito",
-    "quits",
-    "quitted",
-    "quitter",
-    "quiver",
-    "quivers",
-    "quivery",
-    "quixote",
-    "quiz",
-    "quizzed",
-    "quizzes",
-    "quoit",
-    "quoits",
-    "quorate",
-    "quorum",
-    "quota",
-    "quotas",
-    "quote",
-    "quoted",
-    "quotes",
-    "quoting",
-    "ra",
-    "rabat",
-    "rabbet",
-    "rabbets",
-    "rabbi",
-    "rabbis",
-    "rabbit",
-    "rabbits",
-    "rabble",
-    "rabbles",
-    "rabid",
-    "rabidly",
-    "rabies",
-    "raccoon",
-    "race",
-    "raced",
-    "racer",
-    "racers",
-    "races",
-    "raceway",
-    "rachel",
-    "racial",
-    "racily",
-    "racing",
-    "racism",
-    "racist",
-    "racists",
-    "rack",
-    "racked",
-    "racket",
-    "rackets",
-    "rackety",
-    "racking",
-    "racks",
-    "racquet",
-    "racy",
-    "radar",
-    "radial",
-    "radian",
-    "radians",
-    "radiant",
-    "radiate",
-    "radical",
-    "radices",
-    "radii",
-    "radio",
-    "radioed",
-    "radios",
-    "radish",
-    "radium",
-    "radius",
-    "radix",
-    "radon",
-    "raffia",
-    "raffish",
-    "raffle",
-    "raffled",
-    "raffles",
-    "raft",
-    "rafted",
-    "rafter",
-    "rafters",
-    "rafting",
-    "rafts",
-    "rag",
-    "ragbag",
-    "rage",
-    "raged",
-    "rages",
-    "ragged",
-    "raggedy",
-    "ragging",
-    "raging",
-    "ragout",
-    "rags",
-    "ragtime",
-    "ragweed",
-    "ragwort",
-    "raid",
-    "raided",
-    "raider",
-    "raiders",
-    "raiding",
-    "raids",
-    "rail",
-    "railed",
-    "railing",
-    "rails",
-    "railway",
-    "raiment",
-    "rain",
-    "rainbow",
-    "rained",
-    "raining",
-    "rains",
-    "rainy",
-    "raise",
-    "raised",
-    "raiser",
-    "raises",
-    "raisin",
-    "raising",
-    "raisins",
-    "raja",
-    "rajah",
-    "rake",
-    "raked",
-    "rakes",
-    "raking",
-    "rakish",
-    "raleigh",
-    "rallied",
-    "rallies",
-    "rally",
-    "ralph",
-    "ram",
-    "ramadan",
-    "ramble",
-    "rambled",
-    "rambler",
-    "rambles",
-    "ramdisk",
-    "ramekin",
-    "ramify",
-    "rammed",
-    "rammer",
-    "rammers",
-    "ramming",
-    "ramona",
-    "ramose",
-    "ramp",
-    "rampage",
-    "rampant",
-    "rampart",
-    "ramps",
-    "ramrod",
-    "ramrods",
-    "rams",
-    "ran",
-    "ranch",
-    "rancher",
-    "ranches",
-    "rancid",
-    "rancor",
-    "rand",
-    "randier",
-    "random",
-    "randy",
-    "rang",
-    "range",
-    "ranged",
-    "ranger",
-    "rangers",
-    "ranges",
-    "ranging",
-    "rangoon",
-    "rangy",
-    "rank",
-    "ranked",
-    "ranker",
-    "rankest",
-    "ranking",
-    "rankle",
-    "rankled",
-    "rankles",
-    "rankly",
-    "ranks",
-    "ransack",
-    "ransom",
-    "ransoms",
-    "rant",
-    "ranted",
-    "ranting",
-    "rants",
-    "rap",
-    "rapid",
-    "rapidly",
-    "rapids",
-    "rapier",
-    "rapiers",
-    "raping",
-    "rapped",
-    "rappel",
-    "rapper",
-    "rappers",
-    "rapping",
-    "rapport",
-    "raps",
-    "rapt",
-    "raptly",
-    "rapture",
-    "rare",
-    "rarebit",
-    "rarefy",
-    "rarely",
-    "rarer",
-    "rarest",
-    "raring",
-    "rarity",
-    "rascal",
-    "rascals",
-    "rash",
-    "rasher",
-    "rashers",
-    "rashes",
-    "rashly",
-    "rasp",
-    "rasped",
-    "rasping",
-    "rasps",
-    "raster",
-    "rat",
-    "ratable",
-    "ratchet",
-    "rate",
-    "rated",
-    "rates",
-    "rather",
-    "ratify",
-    "rating",
-    "ratings",
-    "ratio",
-    "ration",
-    "rations",
-    "ratios",
-    "ratline",
-    "rats",
-    "rattail",
-    "ratted",
-    "ratting",
-    "rattle",
-    "rattled",
-    "rattler",
-    "rattles",
-    "rattrap",
-    "raucous",
-    "ravage",
-    "ravaged",
-    "ravager",
-    "ravages",
-    "rave",
-    "raved",
-    "ravel",
-    "raveled",
-    "ravels",
-    "raven",
-    "ravens",
-    "raver",
-    "ravers",
-    "raves",
-    "ravine",
-    "ravines",
-    "raving",
-    "ravioli",
-    "ravish",
-    "raw",
-    "rawhide",
-    "rawness",
-    "ray",
-    "rayed",
-    "raymond",
-    "rayon",
-    "rays",
-    "raze",
-    "razed",
-    "razes",
-    "razing",
-    "razor",
-    "razors",
-    "re",
-    "reach",
-    "reached",
-    "reaches",
-    "react",
-    "reacted",
-    "reactor",
-    "reacts",
-    "read",
-    "reader",
-    "readers",
-    "readied",
-    "readier",
-    "readies",
-    "readily",
-    "reading",
-    "readmit",
-    "reads",
-    "ready",
-    "reagan",
-    "reagent",
-    "real",
-    "realer",
-    "realign",
-    "realism",
-    "realist",
-    "reality",
-    "realize",
-    "really",
-    "realm",
-    "realms",
-    "ream",
-    "reams",
-    "reap",
-    "reaped",
-    "reaper",
-    "reapers",
-    "reaping",
-    "reapply",
-    "reaps",
-    "rear",
-    "reared",
-    "rearer",
-    "rearers",
-    "rearing",
-    "rearmed",
-    "rears",
-    "reason",
-    "reasons",
-    "rebate",
-    "rebated",
-    "rebates",
-    "rebecca",
-    "rebekah",
-    "rebel",
-    "rebels",
-    "rebirth",
-    "reborn",
-    "rebound",
-    "rebuff",
-    "rebuffs",
-    "rebuild",
-    "rebuilt",
-    "rebuke",
-    "rebuked",
-    "rebukes",
-    "rebus",
-    "rebut",
-    "rebuts",
-    "recall",
-    "recalls",
-    "recant",
-    "recants",
-    "recap",
-    "recaps",
-    "recede",
-    "receded",
-    "recedes",
-    "receipt",
-    "receive",
-    "recent",
-    "recess",
-    "recheck",
-    "recipe",
-    "recipes",
-    "recital",
-    "recite",
-    "recited",
-    "recites",
-    "reckon",
-    "reckons",
-    "reclaim",
-    "recline",
-    "recluse",
-    "recoil",
-    "recoils",
-    "recolor",
-    "record",
-    "records",
-    "recount",
-    "recoup",
-    "recoups",
-    "recover",
-    "recruit",
-    "rectal",
-    "rectify",
-    "rector",
-    "rectors",
-    "rectory",
-    "rectum",
-    "recur",
-    "recurs",
-    "recycle",
-    "red",
-    "redbird",
-    "redcap",
-    "redcoat",
-    "redden",
-    "reddens",
-    "redder",
-    "reddest",
-    "reddish",
-    "redeem",
-    "redeems",
-    "redhead",
-    "redneck",
-    "redness",
-    "redo",
-    "redoubt",
-    "redound",
-    "redraft",
-    "redraw",
-    "redrawn",
-    "redraws",
-    "redress",
-    "reds",
-    "redskin",
-    "reduce",
-    "reduced",
-    "reducer",
-    "reduces",
-    "redwood",
-    "reed",
-    "reeds",
-    "reedy",
-    "reef",
-    "reefer",
-    "reefers",
-    "reefs",
-    "reek",
-    "reeked",
-    "reeking",
-    "reeks",
-    "reel",
-    "reelect",
-    "reeled",
-    "reeling",
-    "reels",
-    "reenact",
-    "reenter",
-    "reentry",
-    "reeves",
-    "ref",
-    "refer",
-    "referee",
-    "refers",
-    "refill",
-    "refills",
-    "refine",
-    "refined",
-    "refiner",
-    "refines",
-    "refit",
-    "refits",
-    "reflect",
-    "reflex",
-    "reform",
-    "reforms",
-    "refract",
-    "refrain",
-    "refresh",
-    "refuel",
-    "refuels",
-    "refuge",
-    "refugee",
-    "refuges",
-    "refund",
-    "refunds",
-    "refusal",
-    "refuse",
-    "refused",
-    "refuses",
-    "refute",
-    "refuted",
-    "refuter",
-    "refutes",
-    "regain",
-    "regains",
-    "regal",
-    "regale",
-    "regaled",
-    "regales",
-    "regalia",
-    "regally",
-    "regard",
-    "regards",
-    "regatta",
-    "regency",
-    "regent",
-    "regents",
-    "regime",
-    "regimen",
-    "regimes",
-    "regina",
-    "region",
-    "regions",
-    "regnal",
-    "regress",
-    "regret",
-    "regrets",
-    "regroup",
-    "regular",
-    "rehash",
-    "reheat",
-    "reheats",
-    "rehouse",
-    "reign",
-    "reigned",
-    "reigns",
-    "rein",
-    "reined",
-    "reining",
-    "reins",
-    "reissue",
-    "reject",
-    "rejects",
-    "rejoice",
-    "rejoin",
-    "rejoins",
-    "relapse",
-    "relate",
-    "related",
-    "relater",
-    "relates",
-    "relator",
-    "relax",
-    "relaxed",
-    "relaxes",
-    "relay",
-    "relayed",
-    "relays",
-    "release",
-    "relent",
-    "relents",
-    "reliant",
-    "relic",
-    "relics",
-    "relied",
-    "relief",
-    "relies",
-    "relieve",
-    "relish",
-    "relive",
-    "relived",
-    "relives",
-    "reload",
-    "reloads",
-    "rely",
-    "relying",
-    "remade",
-    "remain",
-    "remains",
-    "remake",
-    "remakes",
-    "remand",
-    "remands",
-    "remark",
-    "remarks",
-    "remarry",
-    "remedy",
-    "remind",
-    "reminds",
-    "remiss",
-    "remit",
-    "remits",
-    "remnant",
-    "remodel",
-    "remorse",
-    "remote",
-    "remoter",
-    "remount",
-    "removal",
-    "remove",
-    "removed",
-    "remover",
-    "removes",
-    "renal",
-    "rename",
-    "renamed",
-    "renames",
-    "renault",
-    "rend",
-    "rended",
-    "render",
-    "renders",
-    "rending",
-    "rends",
-    "renee",
-    "renew",
-    "renewal",
-    "renewed",
-    "renewer",
-    "renews",
-    "rennet",
-    "renoir",
-    "renown",
-    "rent",
-    "rental",
-    "rentals",
-    "rented",
-    "renter",
-    "renters",
-    "renting",
-    "rents",
-    "reopen",
-    "reopens",
-    "reorder",
-    "rep",
-    "repaid",
-    "repaint",
-    "repair",
-    "repairs",
-    "repast",
-    "repasts",
-    "repay",
-    "repays",
-    "repeal",
-    "repeals",
-    "repeat",
-    "repeats",
-    "repel",
-    "repels",
-    "repent",
-    "repents",
-    "repine",
-    "replace",
-    "replant",
-    "replay",
-    "replays",
-    "replete",
-    "replica",
-    "replied",
-    "replier",
-    "replies",
-    "reply",
-    "report",
-    "reports",
-    "repose",
-    "reposed",
-    "reposes",
-    "repress",
-    "reprint",
-    "reprise",
-    "reproof",
-    "reprove",
-    "reptant",
-    "reptile",
-    "repulse",
-    "repute",
-    "reputed",
-    "reputes",
-    "request",
-    "requiem",
-    "require",
-    "requite",
-    "reread",
-    "rereads",
-    "reroute",
-    "rerun",
-    "reruns",
-    "resale",
-    "resat",
-    "rescale",
-    "rescind",
-    "rescue",
-    "rescued",
-    "rescuer",
-    "rescues",
-    "reseals",
-    "resell",
-    "resent",
-    "resents",
-    "reserve",
-    "reset",
-    "resets",
-    "reside",
-    "resided",
-    "resides",
-    "residue",
-    "resign",
-    "resigns",
-    "resin",
-    "resins",
-    "resiny",
-    "resist",
-    "resists",
-    "resit",
-    "resits",
-    "resize",
-    "resized",
-    "resizes",
-    "resolve",
-    "resort",
-    "resorts",
-    "resound",
-    "respect",
-    "respire",
-    "respite",
-    "respond",
-    "rest",
-    "restart",
-    "restate",
-    "rested",
-    "restful",
-    "resting",
-    "restive",
-    "restock",
-    "restore",
-    "rests",
-    "restudy",
-    "result",
-    "results",
-    "resume",
-    "resumed",
-    "resumes",
-    "resurge",
-    "retail",
-    "retails",
-    "retain",
-    "retains",
-    "retake",
-    "retaken",
-    "retakes",
-    "retch",
-    "retell",
-    "retells",
-    "rethink",
-    "retied",
-    "retina",
-    "retinal",
-    "retinas",
-    "retinue",
-    "retire",
-    "retired",
-    "retiree",
-    "retires",
-    "retold",
-    "retook",
-    "retort",
-    "retorts",
-    "retouch",
-    "retrace",
-    "retract",
-    "retrain",
-    "retread",
-    "retreat",
-    "retried",
-    "retries",
-    "retry",
-    "retsina",
-    "return",
-    "returns",
-    "retype",
-    "retyped",
-    "retypes",
-    "reunion",
-    "reunite",
-    "reuse",
-    "reused",
-    "reuses",
-    "reusing",
-    "reuters",
-    "rev",
-    "revalue",
-    "revamp",
-    "revamps",
-    "reveal",
-    "reveals",
-    "revel",
-    "reveled",
-    "reveler",
-    "revelry",
-    "revels",
-    "revenge",
-    "revenue",
-    "revere",
-    "revered",
-    "reveres",
-    "reverie",
-    "revers",
-    "reverse",
-    "revert",
-    "reverts",
-    "review",
-    "reviews",
-    "revile",
-    "reviled",
-    "reviler",
-    "reviles",
-    "revisal",
-    "revise",
-    "revised",
-    "reviser",
-    "revises",
-    "revisit",
-    "revisor",
-    "revival",
-    "revive",
-    "revived",
-    "reviver",
-    "revives",
-    "revoke",
-    "revoked",
-    "revoker",
-    "revokes",
-    "revolt",
-    "revolts",
-    "revolve",
-    "revs",
-    "revue",
-    "revved",
-    "revving",
-    "reward",
-    "rewards",
-    "rewind",
-    "rewinds",
-    "rewire",
-    "rewired",
-    "rewires",
-    "reword",
-    "rewords",
-    "rework",
-    "rewound",
-    "rewrite",
-    "rewrote",
-    "rex",
-    "rhenium",
-    "rhesus",
-    "rheumy",
-    "rhine",
-    "rhino",
-    "rhinos",
-    "rhode",
-    "rhodes",
-    "rhodium",
-    "rhombi",
-    "rhombic",
-    "rhombus",
-    "rhone",
-    "rhubarb",
-    "rhyme",
-    "rhymed",
-    "rhymes",
-    "rhyming",
-    "rhythm",
-    "rhythms",
-    "rial",
-    "rib",
-    "ribald",
-    "ribaud",
-    "ribbed",
-    "ribbing",
-    "ribbon",
-    "ribbons",
-    "ribs",
-    "ribwort",
-    "rice",
-    "rices",
-    "rich",
-    "richard",
-    "richer",
-    "riches",
-    "richest",
-    "richly",
-    "richter",
-    "rick",
-    "rickets",
-    "rickety",
-    "ricky",
-    "ricotta",
-    "rid",
-    "ridded",
-    "ridden",
-    "ridding",
-    "riddle",
-    "riddled",
-    "riddles",
-    "ride",
-    "rider",
-    "riders",
-    "rides",
-    "ridge",
-    "ridged",
-    "ridges",
-    "ridging",
-    "riding",
-    "rids",
-    "rife",
-    "rifer",
-    "riffle",
-    "riffled",
-    "riffles",
-    "rifle",
-    "rifled",
-    "rifles",
-    "rifling",
-    "rift",
-    "rifts",
-    "rig",
-    "riga",
-    "rigged",
-    "rigger",
-    "riggers",
-    "rigging",
-    "right",
-    "righter",
-    "rightly",
-    "rights",
-    "rigid",
-    "rigidly",
-    "rigor",
-    "rigors",
-    "rigs",
-    "rile",
-    "rim",
-    "rimless",
-    "rimmed",
-    "rimming",
-    "rims",
-    "rind",
-    "rinds",
-    "ring",
-    "ringed",
-    "ringer",
-    "ringers",
-    "ringing",
-    "ringlet",
-    "rings",
-    "rink",
-    "rinks",
-    "rinse",
-    "rinsed",
-    "rinses",
-    "rinsing",
-    "rio",
-    "riot",
-    "rioted",
-    "rioter",
-    "rioters",
-    "rioting",
-    "riotous",
-    "riots",
-    "rip",
-    "ripe",
-    "ripely",
-    "ripen",
-    "ripened",
-    "ripens",
-    "ripoff",
-    "ripoffs",
-    "riposte",
-    "ripped",
-    "ripper",
-    "rippers",
-    "ripping",
-    "ripple",
-    "rippled",
-    "ripples",
-    "rips",
-    "ripsaw",
-    "rise",
-    "risen",
-    "riser",
-    "risers",
-    "rises",
-    "risible",
-    "risibly",
-    "rising",
-    "risk",
-    "risked",
-    "riskful",
-    "risking",
-    "risks",
-    "risky",
-    "risotto",
-    "risque",
-    "rissole",
-    "rite",
-    "rites",
-    "ritual",
-    "rituals",
-    "ritz",
-    "rival",
-    "rivaled",
-    "rivalry",
-    "rivals",
-    "riven",
-    "river",
-    "rivers",
-    "rivet",
-    "riveted",
-    "riveter",
-    "rivets",
-    "riviera",
-    "riving",
-    "rivulet",
-    "riyadh",
-    "riyal",
-    "roach",
-    "roaches",
-    "road",
-    "roadbed",
-    "roads",
-    "roadway",
-    "roam",
-    "roamed",
-    "roaming",
-    "roams",
-    "roan",
-    "roar",
-    "roared",
-    "roarer",
-    "roaring",
-    "roars",
-    "roast",
-    "roasted",
-    "roaster",
-    "roasts",
-    "rob",
-    "robbed",
-    "robber",
-    "robbers",
-    "robbery",
-    "robbing",
-    "robe",
-    "robed",
-    "robert",
-    "robes",
-    "robin",
-    "robing",
-    "robins",
-    "robot",
-    "robots",
-    "robs",
-    "robust",
-    "roc",
-    "rock",
-    "rocked",
-    "rocker",
-    "rockers",
-    "rockery",
-    "rocket",
-    "rockets",
-    "rockier",
-    "rockies",
-    "rocking",
-    "rocks",
-    "rocky",
-    "rococo",
-    "rod",
-    "rode",
-    "rodent",
-    "rodents",
-    "rodeo",
-    "rodeos",
-    "rods",
-    "roe",
-    "roebuck",
-    "roes",
-    "roger",
-    "rogue",
-    "roguery",
-    "rogues",
-    "roguish",
-    "rohr",
-    "roland",
-    "role",
-    "roles",
-    "roll",
-    "rolled",
-    "roller",
-    "rollers",
-    "rollick",
-    "rolling",
-    "rolls",
-    "rom",
-    "romaine",
-    "roman",
-    "romana",
-    "romance",
-    "romania",
-    "romans",
-    "romany",
-    "rome",
-    "romeo",
-    "romp",
-    "romped",
-    "romper",
-    "rompers",
-    "romping",
-    "romps",
-    "ronald",
-    "roof",
-    "roofed",
-    "roofer",
-    "roofing",
-    "roofs",
-    "rooftop",
-    "rook",
-    "rooked",
-    "rookery",
-    "rookie",
-    "rookies",
-    "rooking",
-    "rooks",
-    "room",
-    "roomed",
-    "roomer",
-    "roomful",
-    "roomier",
-    "rooming",
-    "rooms",
-    "roomy",
-    "roost",
-    "roosted",
-    "rooster",
-    "roosts",
-    "root",
-    "rooted",
-    "rooter",
-    "rooting",
-    "rootlet",
-    "roots",
-    "rope",
-    "roped",
-    "ropers",
-    "ropes",
-    "roping",
-    "ropy",
-    "rosary",
-    "rose",
-    "rosebud",
-    "roses",
-    "rosette",
-    "rosier",
-    "rosiest",
-    "rossini",
-    "roster",
-    "rosters",
-    "rostrum",
-    "rosy",
-    "rot",
-    "rota",
-    "rotary",
-    "rotate",
-    "rotated",
-    "rotates",
-    "rotator",
-    "rote",
-    "rotor",
-    "rotors",
-    "rots",
-    "rotted",
-    "rotten",
-    "rotting",
-    "rotund",
-    "rotunda",
-    "rouble",
-    "rouen",
-    "rouge",
-    "rough",
-    "roughed",
-    "roughen",
-    "rougher",
-    "roughly",
-    "roughs",
-    "round",
-    "rounded",
-    "rounder",
-    "roundly",
-    "rounds",
-    "roundup",
-    "rouse",
-    "roused",
-    "rouses",
-    "rousing",
-    "rout",
-    "route",
-    "routed",
-    "routes",
-    "routine",
-    "routing",
-    "routs",
-    "rove",
-    "roved",
-    "rover",
-    "rovers",
-    "roves",
-    "roving",
-    "row",
-    "rowan",
-    "rowboat",
-    "rowdily",
-    "rowdy",
-    "rowed",
-    "rower",
-    "rowers",
-    "rowing",
-    "rows",
-    "roy",
-    "royal",
-    "royally",
-    "royalty",
-    "rub",
-    "rubbed",
-    "rubber",
-    "rubbers",
-    "rubbery",
-    "rubbing",
-    "rubbish",
-    "rubble",
-    "rubbly",
-    "rubdown",
-    "rubella",
-    "rubens",
-    "rubicon",
-    "rubies",
-    "rubric",
-    "rubs",
-    "ruby",
-    "ruck",
-    "rucked",
-    "rucking",
-    "rucks",
-    "ruckus",
-    "ruction",
-    "rudder",
-    "rudders",
-    "ruddier",
-    "ruddy",
-    "rude",
-    "rudely",
-    "ruder",
-    "rudest",
-    "rue",
-    "rued",
-    "rueful",
-    "rues",
-    "ruff",
-    "ruffian",
-    "ruffle",
-    "ruffled",
-    "ruffles",
-    "ruffs",
-    "rug",
-    "rugby",
-    "rugged",
-    "rugs",
-    "ruin",
-    "ruined",
-    "ruing",
-    "ruining",
-    "ruinous",
-    "ruins",
-    "rule",
-    "ruled",
-    "ruler",
-    "rulers",
-    "rules",
-    "ruling",
-    "rulings",
-    "rum",
-    "rumba",
-    "rumble",
-    "rumbled",
-    "rumbles",
-    "rummage",
-    "rummy",
-    "rumor",
-    "rumored",
-    "rumors",
-    "rump",
-    "rumple",
-    "rumpled",
-    "rumples",
-    "rumps",
-    "rumpus",
-    "run",
-    "runaway",
-    "rundown",
-    "rune",
-    "runes",
-    "rung",
-    "rungs",
-    "runic",
-    "runner",
-    "runners",
-    "running",
-    "runny",
-    "runoff",
-    "runs",
-    "runtime",
-    "runway",
-    "runways",
-    "rupee",
-    "rupees",
-    "rupture",
-    "rural",
-    "ruse",
-    "ruses",
-    "rush",
-    "rushed",
-    "rusher",
-    "rushes",
-    "rushing",
-    "rusk",
-    "rusks",
-    "russell",
-    "russet",
-    "russia",
-    "russian",
-    "rust",
-    "rusted",
-    "rustic",
-    "rustier",
-    "rusting",
-    "rustle",
-    "rustled",
-    "rustler",
-    "rustles",
-    "rusts",
-    "rusty",
-    "rut",
-    "ruth",
-    "ruts",
-    "rutted",
-    "rutting",
-    "rutty",
-    "rwanda",
-    "ryan",
-    "rye",
-    "sabbath",
-    "saber",
-    "sabers",
-    "sable",
-    "sables",
-    "sabot",
-    "sacci",
-    "sachet",
-    "sachets",
-    "sack",
-    "sacked",
-    "sackful",
-    "sacking",
-    "sacks",
-    "sacral",
-    "sacred",
-    "sad",
-    "sadden",
-    "saddens",
-    "sadder",
-    "saddest",
-    "saddle",
-    "saddled",
-    "saddler",
-    "saddles",
-    "sadism",
-    "sadist",
-    "sadists",
-    "sadly",
-    "sadness",
-    "safari",
-    "safaris",
-    "safe",
-    "safely",
-    "safer",
-    "safes",
-    "safest",
-    "safety",
-    "saffron",
-    "sag",
-    "saga",
-    "sagas",
-    "sage",
-    "sagely",
-    "sages",
-    "sagged",
-    "sagging",
-    "sago",
-    "sags",
-    "sahara",
-    "said",
-    "saigon",
-    "sail",
-    "sailed",
-    "sailing",
-    "sailor",
-    "sailors",
-    "sails",
-    "saint",
-    "sainted",
-    "saintly",
-    "saints",
-    "sake",
-    "sakes",
-    "salable",
-    "salad",
-    "salads",
-    "salami",
-    "salary",
-    "sale",
-    "sales",
-    "salic",
-    "salient",
-    "saline",
-    "saliva",
-    "sallie",
-    "sallied",
-    "sallies",
-    "sallow",
-    "sallowy",
-    "sally",
-    "salmon",
-    "salmons",
-    "salon",
-    "salons",
-    "saloon",
-    "saloons",
-    "salsify",
-    "salt",
-    "salted",
-    "saltier",
-    "salting",
-    "salts",
-    "salty",
-    "salute",
-    "saluted",
-    "salutes",
-    "salvage",
-    "salve",
-    "salved",
-    "salver",
-    "salves",
-    "salvia",
-    "salving",
-    "salvo",
-    "salvoes",
-    "salvos",
-    "sam",
-    "samaria",
-    "samba",
-    "same",
-    "samely",
-    "samoa",
-    "samovar",
-    "sample",
-    "sampled",
-    "sampler",
-    "samples",
-    "samson",
-    "samuel",
-    "sanctum",
-    "sand",
-    "sandal",
-    "sandals",
-    "sandbag",
-    "sanded",
-    "sander",
-    "sanders",
-    "sandhog",
-    "sanding",
-    "sandman",
-    "sandpit",
-    "sandra",
-    "sands",
-    "sandy",
-    "sane",
-    "sanely",
-    "saner",
-    "sanest",
-    "sang",
-    "sanity",
-    "sank",
-    "santa",
-    "sap",
-    "sapient",
-    "sapless",
-    "sapling",
-    "sapped",
-    "sapper",
-    "sappers",
-    "sapping",
-    "sapporo",
-    "sappy",
-    "saps",
-    "sapwood",
-    "sara",
-    "saracen",
-    "sarah",
-    "sarcasm",
-    "sarcoma",
-    "sardine",
-    "sari",
-    "saris",
-    "sartre",
-    "sash",
-    "sashed",
-    "sashes",
-    "sat",
-    "satan",
-    "satanic",
-    "satchel",
-    "sate",
-    "sated",
-    "sates",
-    "satiate",
-    "satiety",
-    "satin",
-    "satiny",
-    "satire",
-    "satires",
-    "satiric",
-    "satisfy",
-    "satsuma",
-    "saturn",
-    "sauce",
-    "saucer",
-    "saucers",
-    "sauces",
-    "saucily",
-    "saucy",
-    "saudi",
-    "saul",
-    "sauna",
-    "saunas",
-    "saunter",
-    "sausage",
-    "saute",
-    "sauteed",
-    "sautes",
-    "savable",
-    "savage",
-    "savaged",
-    "savages",
-    "savant",
-    "savants",
-    "save",
-    "saved",
-    "saver",
-    "savers",
-    "saves",
-    "saving",
-    "savings",
-    "savior",
-    "saviors",
-    "savor",
-    "savored",
-    "savors",
-    "savory",
-    "savoy",
-    "savvy",
-    "saw",
-    "sawdust",
-    "sawed",
-    "sawfish",
-    "sawfly",
-    "sawing",
-    "sawmill",
-    "sawn",
-    "saws",
-    "sawyer",
-    "sawyers",
-    "saxon",
-    "saxons",
-    "saxony",
-    "say",
-    "saying",
-    "sayings",
-    "says",
-    "scab",
-    "scabbed",
-    "scabby",
-    "scabs",
-    "scalar",
-    "scald",
-    "scalded",
-    "scalds",
-    "scale",
-    "scaled",
-    "scalene",
-    "scales",
-    "scaling",
-    "scallop",
-    "scalp",
-    "scalped",
-    "scalpel",
-    "scalper",
-    "scalps",
-    "scaly",
-    "scam",
-    "scamp",
-    "scamper",
-    "scampi",
-    "scamps",
-    "scams",
-    "scan",
-    "scandal",
-    "scanned",
-    "scanner",
-    "scans",
-    "scant",
-    "scantly",
-    "scanty",
-    "scapula",
-    "scar",
-    "scarab",
-    "scarce",
-    "scare",
-    "scared",
-    "scares",
-    "scarf",
-    "scarfs",
-    "scarify",
-    "scaring",
-    "scarlet",
-    "scarred",
-    "scars",
-    "scarves",
-    "scary",
-    "scathe",
-    "scatter",
-    "scene",
-    "scenery",
-    "scenes",
-    "scenic",
-    "scent",
-    "scented",
-    "scents",
-    "scepter",
-    "schema",
-    "schemas",
-    "scheme",
-    "schemed",
-    "schemes",
-    "schism",
-    "schisms",
-    "scholar",
-    "school",
-    "schools",
-    "science",
-    "scion",
-    "scions",
-    "scire",
-    "scissor",
-    "scoff",
-    "scoffed",
-    "scoffer",
-    "scoffs",
-    "scold",
-    "scolded",
-    "scolds",
-    "scone",
-    "scones",
-    "scoop",
-    "scooped",
-    "scoops",
-    "scoot",
-    "scooted",
-    "scooter",
-    "scoots",
-    "scope",
-    "scorch",
-    "score",
-    "scored",
-    "scorer",
-    "scores",
-    "scoring",
-    "scorn",
-    "scorned",
-    "scorns",
-    "scorpio",
-    "scot",
-    "scotch",
-    "scots",
-    "scott",
-    "scotty",
-    "scour",
-    "scoured",
-    "scourer",
-    "scourge",
-    "scours",
-    "scout",
-    "scouted",
-    "scouts",
-    "scow",
-    "scowl",
-    "scowled",
-    "scowls",
-    "scows",
-    "scraggy",
-    "scram",
-    "scrap",
-    "scrape",
-    "scraped",
-    "scraper",
-    "scrapes",
-    "scrappy",
-    "scraps",
-    "scratch",
-    "scrawl",
-    "scrawls",
-    "scrawly",
-    "scrawny",
-    "scream",
-    "screams",
-    "screech",
-    "screed",
-    "screeds",
-    "screen",
-    "screens",
-    "screw",
-    "screwed",
-    "screws",
-    "screwy",
-    "scribe",
-    "scribes",
-    "scrimp",
-    "scrimps",
-    "scrimpy",
-    "scrip",
-    "script",
-    "scripts",
-    "scroll",
-    "scrolls",
-    "scrooge",
-    "scrotum",
-    "scrub",
-    "scrubby",
-    "scrubs",
-    "scruff",
-    "scruffs",
-    "scruffy",
-    "scrum",
-    "scruple",
-    "scuba",
-    "scud",
-    "scuff",
-    "scuffed",
-    "scuffle",
-    "scuffs",
-    "scull",
-    "sculls",
-    "sculpt",
-    "sculpts",
-    "scum",
-    "scup",
-    "scupper",
-    "scurf",
-    "scurvy",
-    "scut",
-    "scutter",
-    "scuttle",
-    "scythe",
-    "scythed",
-    "scyther",
-    "scythes",
-    "se",
-    "sea",
-    "seabee",
-    "seabird",
-    "seafare",
-    "seafood",
-    "seagull",
-    "seal",
-    "sealant",
-    "sealed",
-    "sealer",
-    "sealing",
-    "seals",
-    "seam",
-    "seaman",
-    "seamed",
-    "seamen",
-    "seaming",
-    "seams",
-    "seamy",
-    "sean",
-    "seance",
-    "seances",
-    "seaport",
-    "sear",
-    "search",
-    "seared",
-    "searing",
-    "sears",
-    "seas",
-    "seasick",
-    "seaside",
-    "season",
-    "seasons",
-    "seat",
-    "seated",
-    "seater",
-    "seating",
-    "seato",
-    "seats",
-    "seattle",
-    "seawall",
-    "seaward",
-    "seaweed",
-    "sec",
-    "secede",
-    "seceded",
-    "secedes",
-    "seclude",
-    "second",
-    "seconds",
-    "secrecy",
-    "secret",
-    "secrete",
-    "secrets",
-    "sect",
-    "section",
-    "sector",
-    "sectors",
-    "sects",
-    "secular",
-    "secure",
-    "secured",
-    "secures",
-    "sedan",
-    "sedans",
-    "sedate",
-    "sedated",
-    "sedates",
-    "seder",
-    "seduce",
-    "seduced",
-    "seducer",
-    "seduces",
-    "see",
-    "seed",
-    "seedbed",
-    "seeded",
-    "seeding",
-    "seeds",
-    "seedy",
-    "seeing",
-    "seek",
-    "seeker",
-    "seekers",
-    "seeking",
-    "seeks",
-    "seem",
-    "seemed",
-    "seeming",
-    "seemly",
-    "seems",
-    "seen",
-    "seep",
-    "seepage",
-    "seeped",
-    "seeping",
-    "seeps",
-    "seer",
-    "seers",
-    "sees",
-    "seesaw",
-    "seesaws",
-    "seethe",
-    "seethed",
-    "seethes",
-    "segment",
-    "seine",
-    "seismic",
-    "seize",
-    "seized",
-    "seizes",
-    "seizing",
-    "seizure",
-    "seldom",
-    "select",
-    "selects",
-    "self",
-    "selfish",
-    "sell",
-    "seller",
-    "sellers",
-    "selling",
-    "sellout",
-    "sells",
-    "semi",
-    "seminal",
-    "seminar",
-    "semite",
-    "semitic",
-    "senate",
-    "senates",
-    "senator",
-    "send",
-    "sender",
-    "senders",
-    "sending",
-    "sends",
-    "senegal",
-    "senile",
-    "senior",
-    "seniors",
-    "sense",
-    "sensed",
-    "senses",
-    "sensing",
-    "sensor",
-    "sensors",
-    "sensory",
-    "sensual",
-    "sent",
-    "sentry",
-    "seoul",
-    "sepal",
-    "sepia",
-    "sepsis",
-    "septic",
-    "sequel",
-    "sequels",
-    "sequin",
-    "sequins",
-    "seraph",
-    "seraphs",
-    "serbian",
-    "sere",
-    "serene",
-    "serf",
-    "serfdom",
-    "serfs",
-    "serge",
-    "serial",
-    "serials",
-    "series",
-    "serif",
-    "serious",
-    "sermon",
-    "sermons",
-    "serpent",
-    "serrate",
-    "serried",
-    "serum",
-    "serums",
-    "servant",
-    "serve",
-    "served",
-    "server",
-    "servers",
-    "serves",
-    "service",
-    "servile",
-    "serving",
-    "servo",
-    "sesame",
-    "session",
-    "set",
-    "setback",
-    "seth",
-    "sets",
-    "settee",
-    "settees",
-    "setter",
-    "setting",
-    "settle",
-    "settled",
-    "settler",
-    "settles",
-    "setup",
-    "setups",
-    "seven",
-    "sevens",
-    "seventh",
-    "seventy",
-    "sever",
-    "several",
-    "severe",
-    "severed",
-    "severer",
-    "severs",
-    "seville",
-    "sew",
-    "sewage",
-    "sewed",
-    "sewer",
-    "sewers",
-    "sewing",
-    "sewn",
-    "sews",
-    "sex",
-    "sexed",
-    "sexes",
-    "sexing",
-    "sexism",
-    "sexist",
-    "sexists",
-    "sexless",
-    "sextant",
-    "sextet",
-    "sextets",
-    "sexton",
-    "sextons",
-    "sexual",
-    "sexy",
-    "shabby",
-    "shack",
-    "shacked",
-    "shackle",
-    "shacks",
-    "shade",
-    "shaded",
-    "shades",
-    "shading",
-    "shadow",
-    "shadows",
-    "shadowy",
-    "shady",
-    "shaft",
-    "shafts",
-    "shag",
-    "shaggy",
-    "shah",
-    "shake",
-    "shaken",
-    "shaker",
-    "shakers",
-    "shakes",
-    "shakier",
-    "shakily",
-    "shaking",
-    "shaky",
-    "shall",
-    "shallot",
-    "shallow",
-    "shalom",
-    "sham",
-    "shamble",
-    "shame",
-    "shamed",
-    "shames",
-    "shaming",
-    "shammed",
-    "shammer",
-    "shammy",
-    "shampoo",
-    "shams",
-    "shandy",
-    "shane",
-    "shank",
-    "shanks",
-    "shanty",
-    "shape",
-    "shaped",
-    "shapely",
-    "shaper",
-    "shapes",
-    "shaping",
-    "shard",
-    "shards",
-    "share",
-    "shared",
-    "sharer",
-    "sharers",
-    "shares",
-    "sharing",
-    "shark",
-    "sharks",
-    "sharon",
-    "sharp",
-    "sharpen",
-    "sharper",
-    "sharply",
-    "shatter",
-    "shave",
-    "shaved",
-    "shaven",
-    "shaver",
-    "shavers",
-    "shaves",
-    "shaving",
-    "shaw",
-    "shawl",
-    "shawls",
-    "she",
-    "sheaf",
-    "sheafs",
-    "shear",
-    "sheared",
-    "shears",
-    "sheath",
-    "sheathe",
-    "sheaths",
-    "sheaves",
-    "shed",
-    "sheds",
-    "sheen",
-    "sheep",
-    "sheer",
-    "sheered",
-    "sheerer",
-    "sheerly",
-    "sheet",
-    "sheeted",
-    "sheets",
-    "sheik",
-    "sheiks",
-    "sheila",
-    "shekel",
-    "shelby",
-    "shelf",
-    "shell",
-    "shellac",
-    "shelled",
-    "shelley",
-    "shells",
-    "shelly",
-    "shelter",
-    "shelve",
-    "shelved",
-    "shelves",
-    "sherbet",
-    "sheriff",
-    "sherman",
-    "sherry",
-    "shied",
-    "shield",
-    "shields",
-    "shier",
-    "shies",
-    "shift",
-    "shifted",
-    "shifter",
-    "shifts",
-    "shifty",
-    "shim",
-    "shimmer",
-    "shimmy",
-    "shin",
-    "shindig",
-    "shine",
-    "shined",
-    "shiner",
-    "shines",
-    "shingle",
-    "shining",
-    "shinned",
-    "shins",
-    "shinto",
-    "shiny",
-    "ship",
-    "shipful",
-    "shipped",
-    "shipper",
-    "ships",
-    "shire",
-    "shires",
-    "shirk",
-    "shirked",
-    "shirker",
-    "shirks",
-    "shirt",
-    "shirts",
-    "shirty",
-    "shiver",
-    "shivers",
-    "shivery",
-    "shoal",
-    "shoals",
-    "shock",
-    "shocked",
-    "shocker",
-    "shocks",
-    "shod",
-    "shoddy",
-    "shoe",
-    "shoeing",
-    "shoes",
-    "shone",
-    "shoo",
-    "shooing",
-    "shook",
-    "shoot",
-    "shooter",
-    "shoots",
-    "shop",
-    "shopped",
-    "shopper",
-    "shops",
-    "shore",
-    "shores",
-    "shoring",
-    "shorn",
-    "short",
-    "shorted",
-    "shorten",
-    "shorter",
-    "shortly",
-    "shorts",
-    "shot",
-    "shotgun",
-    "shots",
-    "should",
-    "shout",
-    "shouted",
-    "shouts",
-    "shove",
-    "shoved",
-    "shovel",
-    "shovels",
-    "shoves",
-    "shoving",
-    "show",
-    "showed",
-    "shower",
-    "showers",
-    "showery",
-    "showily",
-    "showing",
-    "showman",
-    "showmen",
-    "shown",
-    "shows",
-    "showy",
-    "shrank",
-    "shred",
-    "shreds",
-    "shrew",
-    "shrewd",
-    "shrews",
-    "shriek",
-    "shrieks",
-    "shrift",
-    "shrill",
-    "shrilly",
-    "shrimp",
-    "shrimps",
-    "shrine",
-    "shrines",
-    "shrink",
-    "shrinks",
-    "shrive",
-    "shrived",
-    "shrivel",
-    "shriven",
-    "shroud",
-    "shrouds",
-    "shrove",
-    "shrub",
-    "shrubby",
-    "shrubs",
-    "shrug",
-    "shrugs",
-    "shrunk",
-    "shucks",
-    "shudder",
-    "shuffle",
-    "shun",
-    "shunned",
-    "shuns",
-    "shunt",
-    "shunted",
-    "shunts",
-    "shut",
-    "shutoff",
-    "shutout",
-    "shuts",
-    "shutter",
-    "shuttle",
-    "shy",
-    "shyer",
-    "shyest",
-    "shying",
-    "shyly",
-    "shyness",
-    "shyster",
-    "siamese",
-    "siberia",
-    "sibling",
-    "sibyl",
-    "sic",
-    "sicily",
-    "sick",
-    "sicken",
-    "sickens",
-    "sicker",
-    "sickish",
-    "sickle",
-    "sickles",
-    "sickly",
-    "side",
-    "sidearm",
-    "sidecar",
-    "sided",
-    "sideman",
-    "sidemen",
-    "sides",
-    "sideway",
-    "siding",
-    "sidings",
-    "sidle",
-    "sidled",
-    "sidles",
-    "sidling",
-    "sidney",
-    "siege",
-    "sieges",
-    "siesta",
-    "sieve",
-    "sieved",
-    "sieves",
-    "sieving",
-    "sift",
-    "sifted",
-    "sifter",
-    "sifting",
-    "sifts",
-    "sigh",
-    "sighed",
-    "sighing",
-    "sighs",
-    "sight",
-    "sighted",
-    "sightly",
-    "sights",
-    "sigma",
-    "sign",
-    "signal",
-    "signals",
-    "signed",
-    "signer",
-    "signers",
-    "signet",
-    "signify",
-    "signing",
-    "signs",
-    "signum",
-    "sikh",
-    "sikhism",
-    "sikhs",
-    "silage",
-    "silence",
-    "silent",
-    "silica",
-    "silicic",
-    "silicon",
-    "silk",
-    "silken",
-    "silkily",
-    "silks",
-    "silky",
-    "sill",
-    "sillier",
-    "sillies",
-    "sills",
-    "silly",
-    "silo",
-    "silos",
-    "silt",
-    "silted",
-    "silting",
-    "silts",
-    "silty",
-    "silver",
-    "silvers",
-    "silvery",
-    "simians",
-    "similar",
-    "simile",
-    "similes",
-    "simmer",
-    "simmers",
-    "simon",
-    "simony",
-    "simple",
-    "simpler",
-    "simplex",
-    "simply",
-    "sin",
-    "sinai",
-    "since",
-    "sincere",
-    "sine",
-    "sinew",
-    "sinews",
-    "sinewy",
-    "sinful",
-    "sing",
-    "singe",
-    "singed",
-    "singer",
-    "singers",
-    "singes",
-    "singh",
-    "singing",
-    "single",
-    "singled",
-    "singles",
-    "singlet",
-    "singly",
-    "sings",
-    "sink",
-    "sinker",
-    "sinkers",
-    "sinking",
-    "sinks",
-    "sinless",
-    "sinned",
-    "sinner",
-    "sinners",
-    "sinning",
-    "sins",
-    "sinuous",
-    "sinus",
-    "sinuses",
-    "sioux",
-    "sip",
-    "siphon",
-    "siphons",
-    "sipped",
-    "sippers",
-    "sipping",
-    "sips",
-    "sir",
-    "sire",
-    "sired",
-    "siren",
-    "sirens",
-    "sires",
-    "siring",
-    "sirius",
-    "sirloin",
-    "sirs",
-    "sisal",
-    "sissies",
-    "sissy",
-    "sister",
-    "sisters",
-    "sistine",
-    "sit",
-    "site",
-    "sited",
-    "sites",
-    "siting",
-    "sits",
-    "sitter",
-    "sitters",
-    "sitting",
-    "situ",
-    "situate",
-    "six",
-    "sixes",
-    "sixfold",
-    "sixgun",
-    "sixteen",
-    "sixth",
-    "sixties",
-    "sixty",
-    "sizable",
-    "sizably",
-    "size",
-    "sized",
-    "sizes",
-    "sizing",
-    "sizzle",
-    "sizzled",
-    "sizzles",
-    "skate",
-    "skated",
-    "skater",
-    "skaters",
-    "skates",
-    "skating",
-    "skeet",
-    "skein",
-    "skeins",
-    "skeptic",
-    "sketch",
-    "sketchy",
-    "skew",
-    "skewed",
-    "skewer",
-    "skewers",
-    "skewing",
-    "skews",
-    "ski",
-    "skid",
-    "skidded",
-    "skiddy",
-    "skids",
-    "skied",
-    "skier",
-    "skiers",
-    "skies",
-    "skiff",
-    "skiffs",
-    "skiing",
-    "skill",
-    "skilled",
-    "skillet",
-    "skills",
-    "skim",
-    "skimmed",
-    "skimp",
-    "skimped",
-    "skimps",
-    "skimpy",
-    "skims",
-    "skin",
-    "skinned",
-    "skinner",
-    "skinny",
-    "skins",
-    "skip",
-    "skipped",
-    "skipper",
-    "skippy",
-    "skips",
-    "skirt",
-    "skirted",
-    "skirts",
-    "skis",
-    "skit",
-    "skits",
-    "skittle",
-    "skive",
-    "skived",
-    "skiver",
-    "skivers",
-    "skiving",
-    "skulk",
-    "skulked",
-    "skulker",
-    "skulks",
-    "skull",
-    "skulls",
-    "skunk",
-    "skunks",
-    "sky",
-    "skylark",
-    "skyline",
-    "skyward",
-    "skyway",
-    "skyways",
-    "slab",
-    "slabs",
-    "slack",
-    "slacked",
-    "slacken",
-    "slacker",
-    "slackly",
-    "slacks",
-    "slag",
-    "slags",
-    "slain",
-    "slake",
-    "slaked",
-    "slakes",
-    "slaking",
-    "slalom",
-    "slam",
-    "slammed",
-    "slams",
-    "slander",
-    "slang",
-    "slant",
-    "slanted",
-    "slants",
-    "slap",
-    "slapped",
-    "slaps",
-    "slash",
-    "slashed",
-    "slashes",
-    "slat",
-    "slate",
-    "slated",
-    "slates",
-    "slating",
-    "slats",
-    "slatted",
-    "slav",
-    "slave",
-    "slaved",
-    "slaver",
-    "slavers",
-    "slavery",
-    "slaves",
-    "slavic",
-    "slaving",
-    "slavish",
-    "slay",
-    "slayer",
-    "slaying",
-    "slays",
-    "sleazy",
-    "sled",
-    "sledge",
-    "sledges",
-    "sleds",
-    "sleek",
-    "sleeker",
-    "sleekly",
-    "sleep",
-    "sleeper",
-    "sleeps",
-    "sleepy",
-    "sleet",
-    "sleety",
-    "sleeve",
-    "sleeves",
-    "sleigh",
-    "sleighs",
-    "sleight",
-    "slender",
-    "slept",
-    "sleuth",
-    "sleuths",
-    "slew",
-    "slice",
-    "sliced",
-    "slices",
-    "slicing",
-    "slick",
-    "slicked",
-    "slicker",
-    "slicks",
-    "slid",
-    "slide",
-    "slider",
-    "slides",
-    "sliding",
-    "slight",
-    "slights",
-    "slim",
-    "slime",
-    "slimly",
-    "slimmed",
-    "slimmer",
-    "slims",
-    "slimy",
-    "sling",
-    "slings",
-    "slink",
-    "slinks",
-    "slip",
-    "slipped",
-    "slipper",
-    "slips",
-    "slit",
-    "slither",
-    "slits",
-    "sliver",
-    "slivers",
-    "slob",
-    "slobber",
-    "sloe",
-    "slog",
-    "slogan",
-    "slogans",
-    "slogged",
-    "slogger",
-    "slogs",
-    "sloop",
-    "slop",
-    "slope",
-    "sloped",
-    "slopes",
-    "sloping",
-    "slopped",
-    "sloppy",
-    "slops",
-    "slosh",
-    "sloshed",
-    "slot",
-    "sloth",
-    "sloths",
-    "slots",
-    "slotted",
-    "slouch",
-    "sloughs",
-    "slovak",
-    "slovene",
-    "slow",
-    "slowed",
-    "slower",
-    "slowest",
-    "slowing",
-    "slowly",
-    "slows",
-    "sludge",
-    "slug",
-    "slugged",
-    "slugger",
-    "slugs",
-    "sluice",
-    "sluiced",
-    "sluices",
-    "slum",
-    "slumber",
-    "slummed",
-    "slump",
-    "slumped",
-    "slumps",
-    "slums",
-    "slung",
-    "slunk",
-    "slur",
-    "slurp",
-    "slurped",
-    "slurps",
-    "slurred",
-    "slurry",
-    "slurs",
-    "slush",
-    "slushy",
-    "sly",
-    "slyer",
-    "slyest",
-    "slyly",
-    "slyness",
-    "smack",
-    "smacked",
-    "smacks",
-    "small",
-    "smaller",
-    "smalls",
-    "smarmy",
-    "smart",
-    "smarted",
-    "smarten",
-    "smarter",
-    "smartly",
-    "smarts",
-    "smash",
-    "smashed",
-    "smashes",
-    "smear",
-    "smeared",
-    "smears",
-    "smeary",
-    "smell",
-    "smelled",
-    "smells",
-    "smelly",
-    "smelt",
-    "smelted",
-    "smelter",
-    "smelts",
-    "smetana",
-    "smile",
-    "smiled",
-    "smiles",
-    "smiling",
-    "smirch",
-    "smirk",
-    "smirked",
-    "smirks",
-    "smite",
-    "smites",
-    "smith",
-    "smiths",
-    "smithy",
-    "smiting",
-    "smitten",
-    "smock",
-    "smocks",
-    "smog",
-    "smoke",
-    "smoked",
-    "smoker",
-    "smokers",
-    "smokes",
-    "smoking",
-    "smoky",
-    "smolder",
-    "smooch",
-    "smooth",
-    "smote",
-    "smother",
-    "smudge",
-    "smudged",
-    "smudges",
-    "smudgy",
-    "smug",
-    "smuggle",
-    "smugly",
-    "smut",
-    "smutty",
-    "snack",
-    "snacks",
-    "snaffle",
-    "snag",
-    "snagged",
-    "snags",
-    "snail",
-    "snails",
-    "snake",
-    "snaked",
-    "snakes",
-    "snaking",
-    "snaky",
-    "snap",
-    "snapped",
-    "snapper",
-    "snappy",
-    "snaps",
-    "snare",
-    "snared",
-    "snares",
-    "snaring",
-    "snark",
-    "snarl",
-    "snarled",
-    "snarls",
-    "snatch",
-    "snazzy",
-    "sneak",
-    "sneaked",
-    "sneaker",
-    "sneaks",
-    "sneaky",
-    "sneer",
-    "sneered",
-    "sneers",
-    "sneeze",
-    "sneezed",
-    "sneezes",
-    "snick",
-    "snicker",
-    "snide",
-    "snider",
-    "sniff",
-    "sniffed",
-    "sniffle",
-    "sniffly",
-    "sniffs",
-    "sniffy",
-    "snifter",
-    "snifty",
-    "snip",
-    "snipe",
-    "sniped",
-    "sniper",
-    "snipers",
-    "snipes",
-    "sniping",
-    "snipped",
-    "snippet",
-    "snippy",
-    "snips",
-    "snitch",
-    "snivel",
-    "snivels",
-    "snob",
-    "snobs",
-    "snood",
-    "snooker",
-    "snoop",
-    "snooped",
-    "snoops",
-    "snoopy",
-    "snooty",
-    "snooze",
-    "snoozed",
-    "snoozes",
-    "snore",
-    "snored",
-    "snorer",
-    "snorers",
-    "snores",
-    "snoring",
-    "snorkel",
-    "snort",
-    "snorted",
-    "snorts",
-    "snotty",
-    "snout",
-    "snouted",
-    "snouts",
-    "snow",
-    "snowed",
-    "snowing",
-    "snowman",
-    "snowmen",
-    "snows",
-    "snowy",
-    "snub",
-    "snubbed",
-    "snubs",
-    "snuff",
-    "snuffed",
-    "snuffle",
-    "snuffly",
-    "snuffs",
-    "snug",
-    "snuggle",
-    "snuggly",
-    "snugly",
-    "so",
-    "soak",
-    "soaked",
-    "soaking",
-    "soaks",
-    "soap",
-    "soapbox",
-    "soaped",
-    "soaping",
-    "soaps",
-    "soapsud",
-    "soapy",
-    "soar",
-    "soared",
-    "soaring",
-    "soars",
-    "sob",
-    "sobbed",
-    "sobbing",
-    "sober",
-    "sobered",
-    "soberly",
-    "sobers",
-    "sobs",
-    "soccer",
-    "social",
-    "socials",
-    "society",
-    "sock",
-    "socked",
-    "socket",
-    "sockets",
-    "sockeye",
-    "socks",
-    "sod",
-    "soda",
-    "sodded",
-    "sodden",
-    "sodding",
-    "sodium",
-    "sodomy",
-    "sods",
-    "sofa",
-    "sofas",
-    "sofia",
-    "soft",
-    "soften",
-    "softens",
-    "softer",
-    "softest",
-    "softies",
-    "softish",
-    "softly",
-    "soggily",
-    "soggy",
-    "soigne",
-    "soil",
-    "soiled",
-    "soiling",
-    "soils",
-    "soiree",
-    "soirees",
-    "sojourn",
-    "solace",
-    "solaced",
-    "solar",
-    "solaria",
-    "sold",
-    "solder",
-    "solders",
-    "soldier",
-    "sole",
-    "solely",
-    "solemn",
-    "soles",
-    "solet",
-    "solicit",
-    "solid",
-    "solidly",
-    "solids",
-    "solo",
-    "soloist",
-    "solomon",
-    "solos",
-    "soluble",
-    "solvate",
-    "solve",
-    "solved",
-    "solvent",
-    "solver",
-    "solvers",
-    "solves",
-    "solving",
-    "somali",
-    "somalia",
-    "somatic",
-    "somber",
-    "some",
-    "someday",
-    "somehow",
-    "someone",
-    "someway",
-    "somme",
-    "son",
-    "sonar",
-    "sonata",
-    "sonatas",
-    "song",
-    "songful",
-    "songs",
-    "sonic",
-    "sonnet",
-    "sonnets",
-    "sonny",
-    "sons",
-    "sony",
-    "soon",
-    "sooner",
-    "soonest",
-    "soot",
-    "soothe",
-    "soothed",
-    "soother",
-    "soothes",
-    "sooty",
-    "sop",
-    "sophism",
-    "sophist",
-    "sopped",
-    "sopping",
-    "soppy",
-    "soprano",
-    "sops",
-    "sorbet",
-    "sorbets",
-    "sorcery",
-    "sordid",
-    "sore",
-    "sorely",
-    "sorer",
-    "sores",
-    "sorest",
-    "sorghum",
-    "sorrel",
-    "sorrier",
-    "sorrow",
-    "sorrows",
-    "sorry",
-    "sort",
-    "sorted",
-    "sorter",
-    "sorters",
-    "sortie",
-    "sorting",
-    "sorts",
-    "sot",
-    "souffle",
-    "sought",
-    "soul",
-    "soulful",
-    "souls",
-    "sound",
-    "sounded",
-    "sounder",
-    "soundly",
-    "sounds",
-    "soup",
-    "soupcon",
-    "soups",
-    "soupy",
-    "sour",
-    "source",
-    "sources",
-    "soured",
-    "souring",
-    "sourish",
-    "sourly",
-    "sours",
-    "souse",
-    "soutane",
-    "south",
-    "soviet",
-    "soviets",
-    "sow",
-    "sowed",
-    "sower",
-    "sowing",
-    "sown",
-    "sows",
-    "soy",
-    "soya",
-    "soybean",
-    "spa",
-    "space",
-    "spaced",
-    "spacer",
-    "spacers",
-    "spaces",
-    "spacing",
-    "spade",
-    "spades",
-    "spading",
-    "spain",
-    "span",
-    "spangle",
-    "spaniel",
-    "spanish",
-    "spank",
-    "spanked",
-    "spanks",
-    "spanned",
-    "spanner",
-    "spans",
-    "spar",
-    "spare",
-    "spared",
-    "spares",
-    "sparing",
-    "spark",
-    "sparked",
-    "sparkle",
-    "sparkly",
-    "sparks",
-    "sparred",
-    "sparrow",
-    "spars",
-    "sparse",
-    "spartan",
-    "spas",
-    "spasm",
-    "spasms",
-    "spat",
-    "spate",
-    "spatial",
-    "spats",
-    "spatter",
-    "spatula",
-    "spawn",
-    "spawned",
-    "spawns",
-    "speak",
-    "speaker",
-    "speaks",
-    "spear",
-    "speared",
-    "spears",
-    "spec",
-    "special",
-    "species",
-    "specify",
-    "speck",
-    "specked",
-    "speckle",
-    "specks",
-    "specter",
-    "spectra",
-    "specula",
-    "sped",
-    "speech",
-    "speed",
-    "speeded",
-    "speeds",
-    "speedup",
-    "speedy",
-    "spell",
-    "spelled",
-    "speller",
-    "spells",
-    "spelt",
-    "spend",
-    "spender",
-    "spends",
-    "spent",
-    "sperm",
-    "spew",
-    "spewed",
-    "spewing",
-    "spews",
-    "sphere",
-    "spheres",
-    "spheric",
-    "sphinx",
-    "spice",
-    "spiced",
-    "spices",
-    "spicy",
-    "spider",
-    "spiders",
-    "spidery",
-    "spied",
-    "spies",
-    "spiffy",
-    "spike",
-    "spiked",
-    "spikes",
-    "spiking",
-    "spiky",
-    "spill",
-    "spilled",
-    "spills",
-    "spilt",
-    "spin",
-    "spinach",
-    "spinal",
-    "spindle",
-    "spindly",
-    "spine",
-    "spined",
-    "spines",
-    "spinet",
-    "spinner",
-    "spinoff",
-    "spinoza",
-    "spins",
-    "spiny",
-    "spiral",
-    "spirals",
-    "spire",
-    "spires",
-    "spirit",
-    "spirits",
-    "spit",
-    "spite",
-    "spits",
-    "spitted",
-    "spittle",
-    "splash",
-    "splashy",
-    "splay",
-    "splayed",
-    "splays",
-    "spleen",
-    "spleens",
-    "splice",
-    "spliced",
-    "splicer",
-    "splices",
-    "splint",
-    "splints",
-    "split",
-    "splits",
-    "splotch",
-    "splurge",
-    "spoil",
-    "spoiled",
-    "spoiler",
-    "spoils",
-    "spoilt",
-    "spoke",
-    "spoken",
-    "spokes",
-    "sponge",
-    "sponged",
-    "sponger",
-    "sponges",
-    "spongy",
-    "sponsor",
-    "spoof",
-    "spook",
-    "spooks",
-    "spooky",
-    "spool",
-    "spooled",
-    "spooler",
-    "spools",
-    "spoon",
-    "spooned",
-    "spoons",
-    "spoor",
-    "spoors",
-    "spore",
-    "spores",
-    "sport",
-    "sported",
-    "sports",
-    "sporty",
-    "spot",
-    "spots",
-    "spotted",
-    "spotter",
-    "spotty",
-    "spouse",
-    "spouses",
-    "spout",
-    "spouted",
-    "spouts",
-    "sprain",
-    "sprains",
-    "sprang",
-    "sprat",
-    "sprats",
-    "sprawl",
-    "sprawls",
-    "sprawly",
-    "spray",
-    "sprayed",
-    "sprayer",
-    "sprays",
-    "spread",
-    "spreads",
-    "spree",
-    "sprees",
-    "sprig",
-    "spring",
-    "springs",
-    "springy",
-    "sprint",
-    "sprints",
-    "sprite",
-    "sprites",
-    "sprout",
-    "sprouts",
-    "spruce",
-    "spruced",
-    "spruces",
-    "sprung",
-    "spry",
-    "spryer",
-    "spryest",
-    "spryly",
-    "spud",
-    "spuds",
-    "spun",
-    "spunk",
-    "spunky",
-    "spur",
-    "spurge",
-    "spurn",
-    "spurned",
-    "spurns",
-    "spurred",
-    "spurs",
-    "spurt",
-    "spurted",
-    "spurts",
-    "sputnik",
-    "sputter",
-    "sputum",
-    "spy",
-    "spying",
-    "squab",
-    "squad",
-    "squads",
-    "squalid",
-    "squall",
-    "squalls",
-    "squally",
-    "squalor",
-    "square",
-    "squared",
-    "squares",
-    "squash",
-    "squashy",
-    "squat",
-    "squats",
-    "squaw",
-    "squawk",
-    "squawks",
-    "squeak",
-    "squeaks",
-    "squeaky",
-    "squeal",
-    "squeals",
-    "squeeze",
-    "squelch",
-    "squib",
-    "squibb",
-    "squid",
-    "squids",
-    "squint",
-    "squints",
-    "squire",
-    "squires",
-    "squirm",
-    "squirms",
-    "squirmy",
-    "squirt",
-    "squirts",
-    "squishy",
-    "sse",
-    "ssw",
-    "st",
-    "stab",
-    "stabbed",
-    "stabile",
-    "stable",
-    "stabled",
-    "stables",
-    "stably",
-    "stabs",
-    "stacey",
-    "stack",
-    "stacked",
-    "stacker",
-    "stacks",
-    "stadia",
-    "stadion",
-    "stadium",
-    "staff",
-    "staffed",
-    "staffs",
-    "stag",
-    "stage",
-    "staged",
-    "stager",
-    "stagers",
-    "stages",
-    "stagger",
-    "staging",
-    "stagna",
-    "stags",
-    "staid",
-    "stain",
-    "stained",
-    "stains",
-    "stair",
-    "stairs",
-    "stake",
-    "staked",
-    "stakes",
-    "staking",
-    "stale",
-    "stalin",
-    "stalk",
-    "stalked",
-    "stalker",
-    "stalks",
-    "stall",
-    "stalled",
-    "stalls",
-    "stamen",
-    "stamens",
-    "stamina",
-    "stammer",
-    "stamp",
-    "stamped",
-    "stamps",
-    "stan",
-    "stance",
-    "stances",
-    "stand",
-    "standby",
-    "stands",
-    "stank",
-    "stanley",
-    "stannic",
-    "stanza",
-    "stanzas",
-    "staple",
-    "stapled",
-    "stapler",
-    "staples",
-    "star",
-    "starch",
-    "starchy",
-    "stardom",
-    "stare",
-    "stared",
-    "starer",
-    "stares",
-    "staring",
-    "stark",
-    "starkly",
-    "starlet",
-    "starred",
-    "starry",
-    "stars",
-    "start",
-    "started",
-    "starter",
-    "startle",
-    "starts",
-    "starve",
-    "starved",
-    "starves",
-    "stary",
-    "stash",
-    "stashed",
-    "stashes",
-    "state",
-    "stated",
-    "stately",
-    "states",
-    "static",
-    "statics",
-    "stating",
-    "station",
-    "statue",
-    "statues",
-    "stature",
-    "status",
-    "statute",
-    "staunch",
-    "stave",
-    "staved",
-    "staves",
-    "staving",
-    "stay",
-    "stayed",
-    "stayer",
-    "stayers",
-    "staying",
-    "stays",
-    "std",
-    "stead",
-    "steady",
-    "steak",
-    "steaks",
-    "steal",
-    "stealer",
-    "steals",
-    "stealth",
-    "steam",
-    "steamed",
-    "steamer",
-    "steams",
-    "steamy",
-    "steed",
-    "steel",
-    "steeled",
-    "steels",
-    "steely",
-    "steep",
-    "steeped",
-    "steepen",
-    "steeper",
-    "steeple",
-    "steeply",
-    "steeps",
-    "steer",
-    "steered",
-    "steers",
-    "stele",
-    "stellar",
-    "stem",
-    "stemmed",
-    "stems",
-    "stench",
-    "stencil",
-    "step",
-    "stephen",
-    "steppe",
-    "stepped",
-    "steppes",
-    "steps",
-    "stepson",
-    "stereo",
-    "stereos",
-    "sterile",
-    "stern",
-    "sterna",
-    "sterner",
-    "sternly",
-    "steroid",
-    "stet",
-    "stetson",
-    "steve",
-    "steven",
-    "stew",
-    "steward",
-    "stewed",
-    "stewing",
-    "stews",
-    "stick",
-    "sticker",
-    "sticks",
-    "sticky",
-    "sties",
-    "stiff",
-    "stiffen",
-    "stiffer",
-    "stiffly",
-    "stiffs",
-    "stifle",
-    "stifled",
-    "stifles",
-    "stigma",
-    "stigmas",
-    "stile",
-    "stiles",
-    "still",
-    "stilled",
-    "stills",
-    "stilt",
-    "stilted",
-    "stilton",
-    "stilts",
-    "stimuli",
-    "sting",
-    "stings",
-    "stingy",
-    "stink",
-    "stinks",
-    "stinky",
-    "stint",
-    "stinted",
-    "stints",
-    "stipend",
-    "stipple",
-    "stir",
-    "stirred",
-    "stirrer",
-    "stirrup",
-    "stirs",
-    "stitch",
-    "stoat",
-    "stoats",
-    "stock",
-    "stocked",
-    "stocks",
-    "stocky",
-    "stodgy",
-    "stoic",
-    "stoical",
-    "stoics",
-    "stoke",
-    "stoked",
-    "stoker",
-    "stokers",
-    "stokes",
-    "stoking",
-    "stole",
-    "stolen",
-    "stoles",
-    "stolid",
-    "stomach",
-    "stomp",
-    "stomped",
-    "stomps",
-    "stone",
-    "stoned",
-    "stones",
-    "stonily",
-    "stoning",
-    "stony",
-    "stood",
-    "stooge",
-    "stooged",
-    "stooges",
-    "stool",
-    "stools",
-    "stoop",
-    "stooped",
-    "stoops",
-    "stop",
-    "stopgap",
-    "stopped",
-    "stopper",
-    "stops",
-    "storage",
-    "store",
-    "stored",
-    "stores",
-    "storied",
-    "stories",
-    "storing",
-    "stork",
-    "storks",
-    "storm",
-    "stormed",
-    "storms",
-    "stormy",
-    "story",
-    "stout",
-    "stoutly",
-    "stove",
-    "stoved",
-    "stoves",
-    "stoving",
-    "stow",
-    "stowage",
-    "stowed",
-    "stowing",
-    "stows",
-    "strafe",
-    "strafed",
-    "strafes",
-    "strain",
-    "strains",
-    "strait",
-    "straits",
-    "strand",
-    "strands",
-    "strange",
-    "strap",
-    "straps",
-    "strata",
-    "stratum",
-    "strauss",
-    "straw",
-    "straws",
-    "stray",
-    "strayed",
-    "strays",
-    "streak",
-    "streaks",
-    "stream",
-    "streams",
-    "street",
-    "streets",
-    "stress",
-    "stretch",
-    "strew",
-    "strewed",
-    "strewn",
-    "strews",
-    "striate",
-    "strict",
-    "stride",
-    "strider",
-    "strides",
-    "strife",
-    "strike",
-    "striker",
-    "strikes",
-    "string",
-    "strings",
-    "stringy",
-    "strip",
-    "stripe",
-    "striped",
-    "stripes",
-    "strips",
-    "stripy",
-    "strive",
-    "strived",
-    "striven",
-    "strives",
-    "strobe",
-    "strobed",
-    "strobes",
-    "strode",
-    "stroke",
-    "stroked",
-    "strokes",
-    "stroll",
-    "strolls",
-    "strong",
-    "strop",
-    "strove",
-    "struck",
-    "strudel",
-    "strum",
-    "strung",
-    "strut",
-    "struts",
-    "stub",
-    "stubbed",
-    "stubble",
-    "stubby",
-    "stubs",
-    "stucco",
-    "stuck",
-    "stud",
-    "studded",
-    "student",
-    "studied",
-    "studies",
-    "studio",
-    "studios",
-    "studs",
-    "study",
-    "stuff",
-    "stuffed",
-    "stuffs",
-    "stuffy",
-    "stumble",
-    "stump",
-    "stumped",
-    "stumps",
-    "stumpy",
-    "stun",
-    "stung",
-    "stunk",
-    "stunned",
-    "stuns",
-    "stunt",
-    "stunted",
-    "stunts",
-    "stupefy",
-    "stupid",
-    "stupor",
-    "sturdy",
-    "stutter",
-    "sty",
-    "style",
-    "styled",
-    "styles",
-    "styli",
-    "styling",
-    "stylish",
-    "stylist",
-    "stylize",
-    "stylus",
-    "stymie",
-    "stymied",
-    "stymies",
-    "styptic",
-    "styrene",
-    "styx",
-    "sua",
-    "suave",
-    "suavely",
-    "suavity",
-    "sub",
-    "subbing",
-    "subdue",
-    "subdued",
-    "subdues",
-    "subfusc",
-    "subject",
-    "subjoin",
-    "sublet",
-    "sublets",
-    "sublime",
-    "submenu",
-    "submit",
-    "submits",
-    "suborn",
-    "suborns",
-    "subs",
-    "subset",
-    "subsets",
-    "subside",
-    "subsidy",
-    "subsist",
-    "subsoil",
-    "subsume",
-    "subtend",
-    "subtle",
-    "subtler",
-    "subtly",
-    "subunit",
-    "suburb",
-    "suburbs",
-    "subvert",
-    "subway",
-    "subways",
-    "succeed",
-    "success",
-    "succor",
-    "succors",
-    "succumb",
-    "such",
-    "suck",
-    "sucked",
-    "sucker",
-    "suckers",
-    "sucking",
-    "suckle",
-    "suckled",
-    "suckles",
-    "sucks",
-    "sucrose",
-    "suction",
-    "sudan",
-    "sudbury",
-    "sudden",
-    "suds",
-    "sue",
-    "sued",
-    "suede",
-    "sues",
-    "suet",
-    "suez",
-    "suffer",
-    "suffers",
-    "suffice",
-    "suffix",
-    "suffolk",
-    "suffuse",
-    "sugar",
-    "sugared",
-    "sugars",
-    "sugary",
-    "suggest",
-    "suicide",
-    "suing",
-    "suit",
-    "suite",
-    "suited",
-    "suites",
-    "suiting",
-    "suitor",
-    "suitors",
-    "suits",
-    "sulfa",
-    "sulfate",
-    "sulfide",
-    "sulfite",
-    "sulfur",
-    "sulk",
-    "sulked",
-    "sulkier",
-    "sulkies",
-    "sulkily",
-    "sulking",
-    "sulks",
-    "sulky",
-    "sullen",
-    "sully",
-    "sultan",
-    "sultana",
-    "sultans",
-    "sultry",
-    "sum",
-    "sumatra",
-    "summary",
-    "summed",
-    "summer",
-    "summers",
-    "summing",
-    "summit",
-    "summits",
-    "summon",
-    "summons",
-    "sums",
-    "sun",
-    "sunbeam",
-    "sunburn",
-    "sundae",
-    "sundaes",
-    "sunday",
-    "sundays",
-    "sunder",
-    "sundial",
-    "sundown",
-    "sundry",
-    "sunfish",
-    "sung",
-    "sunk",
-    "sunken",
-    "sunless",
-    "sunlit",
-    "sunned",
-    "sunnily",
-    "sunning",
-    "sunny",
-    "sunrise",
-    "suns",
-    "sunset",
-    "sunsets",
-    "sunspot",
-    "suntan",
-    "suntans",
-    "sunup",
-    "sup",
-    "super",
-    "superb",
-    "supine",
-    "supped",
-    "supper",
-    "suppers",
-    "supping",
-    "supple",
-    "supply",
-    "support",
-    "suppose",
-    "supra",
-    "supreme",
-    "sups",
-    "sure",
-    "surely",
-    "surest",
-    "surety",
-    "surf",
-    "surface",
-    "surfeit",
-    "surfer",
-    "surfers",
-    "surfing",
-    "surge",
-    "surged",
-    "surgeon",
-    "surgery",
-    "surges",
-    "surging",
-    "surinam",
-    "surly",
-    "surmise",
-    "surname",
-    "surpass",
-    "surplus",
-    "surreal",
-    "surrey",
-    "surtax",
-    "survey",
-    "surveys",
-    "survive",
-    "susan",
-    "sushi",
-    "suspect",
-    "suspend",
-    "sustain",
-    "suture",
-    "sutures",
-    "suus",
-    "sw",
-    "swab",
-    "swabbed",
-    "swabs",
-    "swag",
-    "swagger",
-    "swahili",
-    "swain",
-    "swallow",
-    "swam",
-    "swamp",
-    "swamped",
-    "swamps",
-    "swampy",
-    "swan",
-    "swank",
-    "swanks",
-    "swanky",
-    "swanned",
-    "swans",
-    "swansea",
-    "swap",
-    "swapped",
-    "swaps",
-    "swarm",
-    "swarmed",
-    "swarms",
-    "swat",
-    "swatch",
-    "swath",
-    "swathe",
-    "swathed",
-    "swathes",
-    "swats",
-    "swatted",
-    "swatter",
-    "sway",
-    "swayed",
-    "swaying",
-    "sways",
-    "swear",
-    "swearer",
-    "swears",
-    "sweat",
-    "sweated",
-    "sweater",
-    "sweats",
-    "sweaty",
-    "swede",
-    "sweden",
-    "swedes",
-    "swedish",
-    "sweep",
-    "sweeper",
-    "sweeps",
-    "sweet",
-    "sweeten",
-    "sweeter",
-    "sweetly",
-    "sweets",
-    "swell",
-    "swelled",
-    "swells",
-    "swelt",
-    "swelter",
-    "swept",
-    "swerve",
-    "swerved",
-    "swerves",
-    "swift",
-    "swifter",
-    "swiftly",
-    "swifts",
-    "swig",
-    "swigged",
-    "swill",
-    "swim",
-    "swimmer",
-    "swims",
-    "swindle",
-    "swine",
-    "swing",
-    "swinged",
-    "swings",
-    "swingy",
-    "swinish",
-    "swipe",
-    "swiped",
-    "swipes",
-    "swiping",
-    "swirl",
-    "swirled",
-    "swirls",
-    "swirly",
-    "swish",
-    "swished",
-    "swishes",
-    "swishy",
-    "swiss",
-    "switch",
-    "swivel",
-    "swivels",
-    "swizzle",
-    "swollen",
-    "swoon",
-    "swooned",
-    "swoons",
-    "swoop",
-    "swooped",
-    "swoops",
-    "swop",
-    "swopped",
-    "swops",
-    "sword",
-    "swords",
-    "swore",
-    "sworn",
-    "swum",
-    "swung",
-    "sydney",
-    "syllabi",
-    "sylph",
-    "symbol",
-    "symbols",
-    "symptom",
-    "synapse",
-    "sync",
-    "synergy",
-    "synod",
-    "synodal",
-    "synods",
-    "synonym",
-    "syntax",
-    "syphon",
-    "syria",
-    "syrian",
-    "syringe",
-    "syrup",
-    "syrups",
-    "syrupy",
-    "system",
-    "systems",
-    "ta",
-    "tab",
-    "tabasco",
-    "tabbed",
-    "tabbing",
-    "tabby",
-    "table",
-    "tableau",
-    "tabled",
-    "tables",
-    "tablet",
-    "tablets",
-    "tabling",
-    "tabloid",
-    "taboo",
-    "taboos",
-    "tabs",
-    "tabula",
-    "tabular",
-    "tacit",
-    "tacitly",
-    "tack",
-    "tacked",
-    "tacking",
-    "tackle",
-    "tackled",
-    "tackles",
-    "tacks",
-    "tacky",
-    "tact",
-    "tactful",
-    "tactic",
-    "tactics",
-    "tactile",
-    "tacts",
-    "tactual",
-    "tadpole",
-    "taffeta",
-    "taffy",
-    "tag",
-    "tagged",
-    "tagging",
-    "tags",
-    "tahiti",
-    "taiga",
-    "tail",
-    "tailed",
-    "tailing",
-    "tailor",
-    "tailors",
-    "tails",
-    "taint",
-    "tainted",
-    "taints",
-    "taipei",
-    "taiwan",
-    "take",
-    "taken",
-    "takeoff",
-    "taker",
-    "takers",
-    "takes",
-    "taking",
-    "takings",
-    "talas",
-    "talc",
-    "talcum",
-    "tale",
-    "talent",
-    "talents",
-    "tales",
-    "talk",
-    "talked",
-    "talker",
-    "talkers",
-    "talkie",
-    "talkies",
-    "talking",
-    "talks",
-    "talky",
-    "tall",
-    "tallboy",
-    "taller",
-    "tallest",
-    "tallied",
-    "tallies",
-    "tallinn",
-    "tallow",
-    "tally",
-    "tallyho",
-    "talmud",
-    "talon",
-    "talons",
-    "tam",
-    "tamable",
-    "tamale",
-    "tame",
-    "tamed",
-    "tamely",
-    "tamer",
-    "tamers",
-    "tames",
-    "tamil",
-    "tamils",
-    "taming",
-    "tamp",
-    "tampa",
-    "tamped",
-    "tamper",
-    "tampers",
-    "tamping",
-    "tampon",
-    "tampons",
-    "tamps",
-    "tan",
-    "tandem",
-    "tandems",
-    "tang",
-    "tangent",
-    "tangier",
-    "tangle",
-    "tangled",
-    "tangles",
-    "tango",
-    "tangos",
-    "tangs",
-    "tangy",
-    "tank",
-    "tankage",
-    "tankard",
-    "tanked",
-    "tanker",
-    "tankers",
-    "tankful",
-    "tanking",
-    "tanks",
-    "tanned",
-    "tanner",
-    "tanners",
-    "tannery",
-    "tannic",
-    "tannin",
-    "tanning",
-    "tans",
-    "tansy",
-    "tantrum",
-    "taoism",
-    "taoist",
-    "taos",
-    "tap",
-    "tape",
-    "taped",
-    "taper",
-    "tapered",
-    "tapers",
-    "tapes",
-    "taping",
-    "tapioca",
-    "tapir",
-    "tapped",
-    "tapper",
-    "tappers",
-    "tappet",
-    "tappets",
-    "tapping",
-    "taproom",
-    "taproot",
-    "taps",
-    "tar",
-    "tardily",
-    "tardy",
-    "target",
-    "targets",
-    "tariff",
-    "tariffs",
-    "tarmac",
-    "tarnish",
-    "tarns",
-    "taro",
-    "tarred",
-    "tarried",
-    "tarries",
-    "tarring",
-    "tarry",
-    "tars",
-    "tarsal",
-    "tart",
-    "tartan",
-    "tartans",
-    "tartar",
-    "tarted",
-    "tartlet",
-    "tartly",
-    "tarts",
-    "tarzan",
-    "task",
-    "tasked",
-    "tasking",
-    "tasks",
-    "tassel",
-    "tassels",
-    "taste",
-    "tasted",
-    "taster",
-    "tasters",
-    "tastes",
-    "tastily",
-    "tasting",
-    "tasty",
-    "tat",
-    "tatted",
-    "tatter",
-    "tatters",
-    "tattily",
-    "tatting",
-    "tattle",
-    "tattler",
-    "tattles",
-    "tattoo",
-    "tattoos",
-    "tatty",
-    "taught",
-    "taunt",
-    "taunted",
-    "taunter",
-    "taunts",
-    "taurus",
-    "taut",
-    "tauter",
-    "tautly",
-    "tavern",
-    "taverns",
-    "tawdry",
-    "tawny",
-    "tax",
-    "taxable",
-    "taxed",
-    "taxes",
-    "taxi",
-    "taxicab",
-    "taxied",
-    "taxies",
-    "taxiing",
-    "taxing",
-    "taxis",
-    "taylor",
-    "tb",
-    "te",
-    "tea",
-    "teacake",
-    "teacart",
-    "teach",
-    "teacher",
-    "teaches",
-    "teacup",
-    "teacups",
-    "teak",
-    "teal",
-    "teals",
-    "team",
-    "teamed",
-    "teaming",
-    "teams",
-    "teapot",
-    "teapots",
-    "tear",
-    "teared",
-    "tearful",
-    "teargas",
-    "tearing",
-    "tears",
-    "teas",
-    "tease",
-    "teased",
-    "teasel",
-    "teaser",
-    "teasers",
-    "teases",
-    "teashop",
-    "teasing",
-    "teat",
-    "teats",
-    "technic",
-    "ted",
-    "teddies",
-    "teddy",
-    "tedious",
-    "tedium",
-    "tee",
-    "teeing",
-    "teem",
-    "teemed",
-    "teeming",
-    "teems",
-    "teen",
-    "teenage",
-    "teens",
-    "teensy",
-    "teeny",
-    "teepee",
-    "teepees",
-    "tees",
-    "teet",
-    "teeter",
-    "teeters",
-    "teeth",
-    "teethe",
-    "teethes",
-    "teflon",
-    "teheran",
-    "tehran",
-    "tel",
-    "tele",
-    "telefax",
-    "telex",
-    "telexed",
-    "telexes",
-    "tell",
-    "teller",
-    "tellers",
-    "telling",
-    "tells",
-    "temp",
-    "temper",
-    "tempers",
-    "tempest",
-    "temple",
-    "templed",
-    "temples",
-    "templet",
-    "tempo",
-    "tempos",
-    "temps",
-    "tempt",
-    "tempted",
-    "tempter",
-    "tempts",
-    "ten",
-    "tenable",
-    "tenancy",
-    "tenant",
-    "tenants",
-    "tench",
-    "tencon",
-    "tend",
-    "tended",
-    "tender",
-    "tenders",
-    "tending",
-    "tendon",
-    "tendons",
-    "tendril",
-    "tends",
-    "tenens",
-    "tenere",
-    "tenet",
-    "tenets",
-    "tenfold",
-    "tennis",
-    "tenor",
-    "tenors",
-    "tenpin",
-    "tens",
-    "tense",
-    "tensed",
-    "tensely",
-    "tenses",
-    "tensile",
-    "tensing",
-    "tension",
-    "tensor",
-    "tent",
-    "tenter",
-    "tenth",
-    "tenths",
-    "tenting",
-    "tents",
-    "tenuit",
-    "tenuous",
-    "tenure",
-    "tenures",
-    "tepid",
-    "tequila",
-    "terbium",
-    "term",
-    "termed",
-    "terming",
-    "termini",
-    "termite",
-    "terms",
-    "tern",
-    "ternary",
-    "terns",
-    "terra",
-    "terrace",
-    "terrain",
-    "terrier",
-    "terrify",
-    "terrine",
-    "terror",
-    "terrors",
-    "terry",
-    "terse",
-    "tersely",
-    "tertian",
-    "test",
-    "testate",
-    "tested",
-    "tester",
-    "testers",
-    "testes",
-    "testify",
-    "testily",
-    "testing",
-    "tests",
-    "testy",
-    "tetanus",
-    "tether",
-    "tethers",
-    "texaco",
-    "texan",
-    "texans",
-    "texas",
-    "text",
-    "textile",
-    "texts",
-    "textual",
-    "texture",
-    "thai",
-    "thalami",
-    "than",
-    "thane",
-    "thank",
-    "thanked",
-    "thanks",
-    "that",
-    "thatch",
-    "thaw",
-    "thawed",
-    "thawing",
-    "thaws",
-    "the",
-    "theater",
-    "theca",
-    "theft",
-    "thefts",
-    "their",
-    "theirs",
-    "theism",
-    "theist",
-    "them",
-    "theme",
-    "themes",
-    "then",
-    "thence",
-    "theorem",
-    "theory",
-    "therapy",
-    "there",
-    "thereat",
-    "thereby",
-    "therein",
-    "thereof",
-    "thereon",
-    "theresa",
-    "thereto",
-    "thermal",
-    "thermos",
-    "these",
-    "theses",
-    "thesis",
-    "theta",
-    "they",
-    "thiamin",
-    "thick",
-    "thicken",
-    "thicker",
-    "thicket",
-    "thickly",
-    "thief",
-    "thieve",
-    "thieved",
-    "thieves",
-    "thigh",
-    "thighs",
-    "thimble",
-    "thin",
-    "thing",
-    "things",
-    "think",
-    "thinker",
-    "thinks",
-    "thinly",
-    "thinned",
-    "thinner",
-    "third",
-    "thirdly",
-    "thirds",
-    "thirst",
-    "thirsts",
-    "thirsty",
-    "thirty",
-    "this",
-    "thisbe",
-    "thistle",
-    "thistly",
-    "thither",
-    "thomas",
-    "thong",
-    "thonged",
-    "thongs",
-    "thorax",
-    "thorium",
-    "thorn",
-    "thorns",
-    "thorny",
-    "those",
-    "though",
-    "thought",
-    "thrall",
-    "thrash",
-    "thread",
-    "threads",
-    "thready",
-    "threat",
-    "threats",
-    "three",
-    "threes",
-    "thresh",
-    "threw",
-    "thrice",
-    "thrift",
-    "thrifty",
-    "thrill",
-    "thrills",
-    "thrive",
-    "thrived",
-    "thrives",
-    "throat",
-    "throats",
-    "throaty",
-    "throb",
-    "throbs",
-    "throe",
-    "throes",
-    "throne",
-    "thrones",
-    "throng",
-    "throngs",
-    "through",
-    "throve",
-    "throw",
-    "thrower",
-    "thrown",
-    "throws",
-    "thrush",
-    "thrust",
-    "thrusts",
-    "thud",
-    "thudded",
-    "thuds",
-    "thug",
-    "thugs",
-    "thulium",
-    "thumb",
-    "thumbed",
-    "thumbs",
-    "thump",
-    "thumped",
-    "thumper",
-    "thumps",
-    "thunder",
-    "thus",
-    "thwack",
-    "thwart",
-    "thwarts",
-    "thyme",
-    "thymus",
-    "thyroid",
-    "thyself",
-    "tiara",
-    "tiaras",
-    "tiber",
-    "tibet",
-    "tibetan",
-    "tibia",
-    "tibiae",
-    "tibial",
-    "tic",
-    "tick",
-    "ticked",
-    "ticker",
-    "tickers",
-    "ticket",
-    "tickets",
-    "ticking",
-    "tickle",
-    "tickled",
-    "tickler",
-    "tickles",
-    "tickly",
-    "ticks",
-    "tics",
-    "tidal",
-    "tidbit",
-    "tidbits",
-    "tiddler",
-    "tide",
-    "tides",
-    "tidied",
-    "tidier",
-    "tidies",
-    "tidiest",
-    "tidily",
-    "tiding",
-    "tidings",
-    "tidy",
-    "tidying",
-    "tie",
-    "tied",
-    "tier",
-    "tiered",
-    "tiers",
-    "ties",
-    "tiff",
-    "tiffany",
-    "tiffs",
-    "tiger",
-    "tigers",
-    "tight",
-    "tighten",
-    "tighter",
-    "tightly",
-    "tights",
-    "tigress",
-    "tigris",
-    "tilde",
-    "tile",
-    "tiled",
-    "tiler",
-    "tilers",
-    "tiles",
-    "tiling",
-    "till",
-    "tillage",
-    "tilled",
-    "tiller",
-    "tillers",
-    "tilling",
-    "tills",
-    "tilt",
-    "tilted",
-    "tilter",
-    "tilters",
-    "tilth",
-    "tilting",
-    "tilts",
-    "tim",
-    "timbale",
-    "timber",
-    "timbers",
-    "timbre",
-    "time",
-    "timed",
-    "timely",
-    "timeout",
-    "timer",
-    "timers",
-    "times",
-    "timex",
-    "timid",
-    "timidly",
-    "timing",
-    "timings",
-    "timor",
-    "timothy",
-    "timpani",
-    "tin",
-    "tina",
-    "tinder",
-    "tine",
-    "tinfoil",
-    "tinful",
-    "tinfuls",
-    "tinge",
-    "tinged",
-    "tinges",
-    "tingle",
-    "tingled",
-    "tingles",
-    "tingly",
-    "tinier",
-    "tiniest",
-    "tinker",
-    "tinkers",
-    "tinkle",
-    "tinkled",
-    "tinkles",
-    "tinned",
-    "tinning",
-    "tinny",
-    "tins",
-    "tinsel",
-    "tint",
-    "tintack",
-    "tinted",
-    "tinting",
-    "tints",
-    "tintype",
-    "tinware",
-    "tiny",
-    "tip",
-    "tipoff",
-    "tipped",
-    "tippee",
-    "tipper",
-    "tippers",
-    "tipping",
-    "tipple",
-    "tippler",
-    "tips",
-    "tipster",
-    "tipsy",
-    "tiptoe",
-    "tiptoed",
-    "tiptoes",
-    "tiptop",
-    "tirade",
-    "tirades",
-    "tirana",
-    "tire",
-    "tired",
-    "tiredly",
-    "tires",
-    "tiring",
-    "tisane",
-    "tissue",
-    "tissues",
-    "tit",
-    "titan",
-    "titanic",
-    "titans",
-    "tithe",
-    "tithed",
-    "tither",
-    "tithes",
-    "titian",
-    "title",
-    "titled",
-    "titles",
-    "titling",
-    "titmice",
-    "titrate",
-    "titter",
-    "titters",
-    "tittle",
-    "titular",
-    "titus",
-    "tnt",
-    "to",
-    "toad",
-    "toadies",
-    "toads",
-    "toady",
-    "toast",
-    "toasted",
-    "toaster",
-    "toasts",
-    "tobacco",
-    "tobago",
-    "toccata",
-    "today",
-    "todd",
-    "toddies",
-    "toddle",
-    "toddled",
-    "toddler",
-    "toddles",
-    "toddy",
-    "toe",
-    "toed",
-    "toeing",
-    "toenail",
-    "toes",
-    "toffee",
-    "toffees",
-    "tofu",
-    "tog",
-    "toga",
-    "togged",
-    "toggery",
-    "togging",
-    "toggle",
-    "toggled",
-    "toggles",
-    "togo",
-    "togs",
-    "toil",
-    "toiled",
-    "toiler",
-    "toilers",
-    "toilet",
-    "toilets",
-    "toiling",
-    "toils",
-    "token",
-    "tokens",
-    "tokyo",
-    "told",
-    "toll",
-    "tollage",
-    "tolled",
-    "tolling",
-    "tolls",
-    "tolstoy",
-    "toluene",
-    "tom",
-    "tomato",
-    "tomb",
-    "tombola",
-    "tomboy",
-    "tomboys",
-    "tombs",
-    "tomcat",
-    "tomcats",
-    "tome",
-    "tomes",
-    "tommy",
-    "tomtit",
-    "ton",
-    "tonal",
-    "tonally",
-    "tone",
-    "toned",
-    "toner",
-    "tones",
-    "tong",
-    "tonga",
-    "tongs",
-    "tongue",
-    "tongued",
-    "tongues",
-    "tonic",
-    "tonics",
-    "tonight",
-    "toning",
-    "tonnage",
-    "tons",
-    "tonsil",
-    "tonsils",
-    "tonsure",
-    "tontine",
-    "tony",
-    "too",
-    "took",
-    "tool",
-    "toolbox",
-    "tooled",
-    "tooling",
-    "toolkit",
-    "tools",
-    "toot",
-    "tooted",
-    "tooth",
-    "toothed",
-    "toothy",
-    "tooting",
-    "toots",
-    "top",
-    "topaz",
-    "topcoat",
-    "tope",
-    "topic",
-    "topical",
-    "topics",
-    "topknot",
-    "topmast",
-    "topmost",
-    "topped",
-    "topper",
-    "toppers",
-    "topping",
-    "topple",
-    "toppled",
-    "topples",
-    "tops",
-    "topsail",
-    "topsoil",
-    "topsy",
-    "torah",
-    "torch",
-    "torched",
-    "torches",
-    "tore",
-    "tories",
-    "torment",
-    "torn",
-    "tornado",
-    "toronto",
-    "torpedo",
-    "torpid",
-    "torpor",
-    "torpors",
-    "torque",
-    "torrent",
-    "torrid",
-    "torsion",
-    "torsive",
-    "torso",
-    "torsos",
-    "tort",
-    "torture",
-    "torus",
-    "tory",
-    "tosco",
-    "toshiba",
-    "toss",
-    "tossed",
-    "tosser",
-    "tossers",
-    "tosses",
-    "tossing",
-    "tossup",
-    "tot",
-    "total",
-    "totaled",
-    "totally",
-    "totals",
-    "tote",
-    "toted",
-    "totem",
-    "totems",
-    "totes",
-    "toting",
-    "totted",
-    "totten",
-    "totter",
-    "totters",
-    "tottery",
-    "totting",
-    "toucan",
-    "toucans",
-    "touch",
-    "touched",
-    "touches",
-    "touchy",
-    "tough",
-    "toughen",
-    "tougher",
-    "toughly",
-    "toughs",
-    "toupee",
-    "toupees",
-    "tour",
-    "toured",
-    "tourer",
-    "tourers",
-    "touring",
-    "tourism",
-    "tourist",
-    "tourney",
-    "tours",
-    "tousle",
-    "tousled",
-    "tout",
-    "touted",
-    "touting",
-    "touts",
-    "tow",
-    "towage",
-    "toward",
-    "towards",
-    "towboat",
-    "towed",
-    "towel",
-    "toweled",
-    "towels",
-    "tower",
-    "towered",
-    "towers",
-    "towing",
-    "towline",
-    "town",
-    "towns",
-    "towpath",
-    "tows",
-    "toxic",
-    "toxical",
-    "toxin",
-    "toxins",
-    "toy",
-    "toyed",
-    "toying",
-    "toyota",
-    "toys",
-    "toyshop",
-    "trace",
-    "traced",
-    "tracer",
-    "tracers",
-    "tracery",
-    "traces",
-    "trachea",
-    "tracing",
-    "track",
-    "tracked",
-    "tracker",
-    "tracks",
-    "tract",
-    "tractor",
-    "tracts",
-    "tracy",
-    "trade",
-    "traded",
-    "trader",
-    "traders",
-    "trades",
-    "trading",
-    "traffic",
-    "tragedy",
-    "tragic",
-    "trail",
-    "trailed",
-    "trailer",
-    "trails",
-    "train",
-    "trained",
-    "trainee",
-    "trainer",
-    "trains",
-    "traipse",
-    "trait",
-    "traitor",
-    "traits",
-    "tram",
-    "trammel",
-    "tramp",
-    "tramped",
-    "trample",
-    "tramps",
-    "trams",
-    "tramway",
-    "trance",
-    "tranced",
-    "trances",
-    "tranche",
-    "transit",
-    "trap",
-    "trapeze",
-    "trapped",
-    "trapper",
-    "traps",
-    "trash",
-    "trashed",
-    "trashes",
-    "trashy",
-    "trauma",
-    "traumas",
-    "travail",
-    "travel",
-    "travels",
-    "travis",
-    "trawl",
-    "trawled",
-    "trawler",
-    "trawls",
-    "tray",
-    "trays",
-    "treacle",
-    "tread",
-    "treadle",
-    "treads",
-    "treason",
-    "treat",
-    "treated",
-    "treater",
-    "treats",
-    "treaty",
-    "treble",
-    "trebled",
-    "trebles",
-    "trebly",
-    "tree",
-    "trees",
-    "treetop",
-    "trefoil",
-    "trek",
-    "trekked",
-    "trekker",
-    "treks",
-    "trellis",
-    "tremble",
-    "tremolo",
-    "tremor",
-    "tremors",
-    "trench",
-    "trend",
-    "trends",
-    "trendy",
-    "tress",
-    "tresses",
-    "trestle",
-    "trevor",
-    "triable",
-    "triad",
-    "trial",
-    "trials",
-    "tribal",
-    "tribe",
-    "tribes",
-    "tribune",
-    "tribute",
-    "trice",
-    "triceps",
-    "trick",
-    "tricked",
-    "trickle",
-    "tricks",
-    "tricky",
-    "trident",
-    "tried",
-    "tries",
-    "trifle",
-    "trifled",
-    "trifler",
-    "trifles",
-    "trigger",
-    "trilby",
-    "trill",
-    "trilled",
-    "trills",
-    "trilogy",
-    "trim",
-    "trimly",
-    "trimmed",
-    "trimmer",
-    "trims",
-    "trinity",
-    "trinket",
-    "trio",
-    "triode",
-    "triodes",
-    "trios",
-    "trip",
-    "tripe",
-    "triple",
-    "triplet",
-    "triplex",
-    "triply",
-    "tripod",
-    "tripods",
-    "tripoli",
-    "tripped",
-    "tripper",
-    "trips",
-    "trireme",
-    "trisect",
-    "trite",
-    "tritely",
-    "tritium",
-    "triton",
-    "triumph",
-    "trivia",
-    "trivial",
-    "trod",
-    "trodden",
-    "troika",
-    "trojan",
-    "trojans",
-    "troll",
-    "trolley",
-    "trollop",
-    "trolls",
-    "troop",
-    "trooped",
-    "trooper",
-    "troops",
-    "tropes",
-    "trophy",
-    "tropic",
-    "tropics",
-    "trot",
-    "troth",
-    "trots",
-    "trotsky",
-    "trotted",
-    "trotter",
-    "trouble",
-    "trough",
-    "troughs",
-    "trounce",
-    "troupe",
-    "trouper",
-    "troupes",
-    "trouser",
-    "trout",
-    "trove",
-    "trowel",
-    "trowels",
-    "troy",
-    "truancy",
-    "truant",
-    "truants",
-    "truce",
-    "truces",
-    "trucial",
-    "truck",
-    "trucked",
-    "trucker",
-    "trucks",
-    "trudge",
-    "trudged",
-    "trudger",
-    "trudges",
-    "true",
-    "truer",
-    "trues",
-    "truest",
-    "truffle",
-    "truism",
-    "truly",
-    "truman",
-    "trump",
-    "trumped",
-    "trumpet",
-    "trumps",
-    "trundle",
-    "trunk",
-    "trunks",
-    "truss",
-    "trussed",
-    "trusser",
-    "trusses",
-    "trust",
-    "trusted",
-    "trustee",
-    "trusts",
-    "trusty",
-    "truth",
-    "truths",
-    "try",
-    "trying",
-    "tryst",
-    "trysts",
-    "tsunami",
-    "tub",
-    "tuba",
-    "tubas",
-    "tubby",
-    "tube",
-    "tubeful",
-    "tuber",
-    "tubers",
-    "tubes",
-    "tubful",
-    "tubfuls",
-    "tubing",
-    "tubs",
-    "tubular",
-    "tuck",
-    "tucked",
-    "tucker",
-    "tuckers",
-    "tucking",
-    "tucks",
-    "tudor",
-    "tudors",
-    "tuesday",
-    "tuft",
-    "tufted",
-    "tufts",
-    "tufty",
-    "tug",
-    "tugboat",
-    "tugged",
-    "tugging",
-    "tugs",
-    "tuition",
-    "tulip",
-    "tulips",
-    "tulsa",
-    "tumble",
-    "tumbled",
-    "tumbler",
-    "tumbles",
-    "tumbrel",
-    "tummy",
-    "tumor",
-    "tumors",
-    "tumult",
-    "tumults",
-    "tun",
-    "tuna",
-    "tunable",
-    "tunc",
-    "tundra",
-    "tune",
-    "tuned",
-    "tuneful",
-    "tuner",
-    "tuners",
-    "tunes",
-    "tunic",
-    "tunics",
-    "tuning",
-    "tunis",
-    "tunisia",
-    "tunnage",
-    "tunnel",
-    "tunnels",
-    "tunny",
-    "tuns",
-    "turban",
-    "turbans",
-    "turbid",
-    "turbine",
-    "turbo",
-    "turbot",
-    "tureen",
-    "tureens",
-    "turf",
-    "turfs",
-    "turgid",
-    "turin",
-    "turk",
-    "turkana",
-    "turkey",
-    "turkeys",
-    "turkish",
-    "turks",
-    "turmoil",
-    "turn",
-    "turned",
-    "turner",
-    "turning",
-    "turnip",
-    "turnips",
-    "turnkey",
-    "turnoff",
-    "turnout",
-    "turns",
-    "turret",
-    "turrets",
-    "turtle",
-    "turtles",
-    "turves",
-    "turvy",
-    "tuscan",
-    "tuscany",
-    "tusk",
-    "tusked",
-    "tusks",
-    "tussle",
-    "tussled",
-    "tussles",
-    "tussock",
-    "tutee",
-    "tutelar",
-    "tutor",
-    "tutored",
-    "tutors",
-    "tutu",
-    "tuvalu",
-    "tuxedo",
-    "tuxedos",
-    "tv",
-    "twaddle",
-    "twain",
-    "twang",
-    "twanged",
-    "twangs",
-    "twangy",
-    "tweak",
-    "tweaked",
-    "tweaks",
-    "tweed",
-    "tweedy",
-    "tweet",
-    "tweeze",
-    "tweezed",
-    "twelfth",
-    "twelve",
-    "twenty",
-    "twice",
-    "twiddle",
-    "twig",
-    "twigged",
-    "twiggy",
-    "twigs",
-    "twill",
-    "twin",
-    "twine",
-    "twined",
-    "twines",
-    "twinge",
-    "twinges",
-    "twining",
-    "twinkle",
-    "twinkly",
-    "twinned",
-    "twins",
-    "twirl",
-    "twirled",
-    "twirler",
-    "twirls",
-    "twirly",
-    "twist",
-    "twisted",
-    "twister",
-    "twists",
-    "twisty",
-    "twit",
-    "twitch",
-    "twitchy",
-    "twits",
-    "twitter",
-    "two",
-    "twofold",
-    "twos",
-    "twosome",
-    "tycoon",
-    "tycoons",
-    "tying",
-    "tyler",
-    "type",
-    "typed",
-    "types",
-    "typeset",
-    "typhoid",
-    "typhoon",
-    "typhus",
-    "typical",
-    "typify",
-    "typing",
-    "typist",
-    "typists",
-    "typo",
-    "tyranny",
-    "tyrant",
-    "tyrants",
-    "tyrol",
-    "tyros",
-    "tyson",
-    "tythe",
-    "tzar",
-    "tzars",
-    "udder",
-    "udders",
-    "ufo",
-    "uganda",
-    "ugh",
-    "uglier",
-    "ugliest",
-    "ugly",
-    "uk",
-    "ukase",
-    "ukraine",
-    "ukulele",
-    "ulcer",
-    "ulcers",
-    "ulster",
-    "ultimo",
-    "ultra",
-    "ululate",
-    "ulysses",
-    "um",
-    "umber",
-    "umbrage",
-    "umlaut",
-    "umlauts",
-    "umpire",
-    "umpired",
-    "umpires",
-    "umpteen",
-    "un",
-    "unable",
-    "unacute",
-    "unadept",
-    "unaided",
-    "unaimed",
-    "unaired",
-    "unapt",
-    "unarm",
-    "unarmed",
-    "unary",
-    "unasked",
-    "unaware",
-    "unawed",
-    "unbaked",
-    "unbar",
-    "unbased",
-    "unbelt",
-    "unbelts",
-    "unbend",
-    "unbent",
-    "unbid",
-    "unbind",
-    "unblest",
-    "unblock",
-    "unblown",
-    "unbolt",
-    "unbolts",
-    "unborn",
-    "unbound",
-    "unbowed",
-    "unboxed",
-    "unbred",
-    "unbung",
-    "unbungs",
-    "unburst",
-    "uncaged",
-    "uncaked",
-    "uncaned",
-    "uncanny",
-    "uncap",
-    "uncared",
-    "uncased",
-    "unchain",
-    "uncited",
-    "uncivil",
-    "unclad",
-    "unclasp",
-    "uncle",
-    "unclean",
-    "unclear",
-    "uncles",
-    "unclip",
-    "unclips",
-    "uncloak",
-    "unclose",
-    "uncoil",
-    "uncoils",
-    "uncored",
-    "uncork",
-    "uncouth",
-    "uncover",
-    "uncowed",
-    "uncrate",
-    "uncross",
-    "unction",
-    "uncurl",
-    "uncut",
-    "undared",
-    "undated",
-    "undazed",
-    "undealt",
-    "under",
-    "underdo",
-    "undergo",
-    "undid",
-    "undies",
-    "undo",
-    "undoes",
-    "undoing",
-    "undomed",
-    "undone",
-    "undoped",
-    "undress",
-    "undried",
-    "undue",
-    "unduly",
-    "undyed",
-    "undying",
-    "unearth",
-    "unease",
-    "uneasy",
-    "uneaten",
-    "unequal",
-    "unesco",
-    "uneven",
-    "unfaced",
-    "unfaded",
-    "unfair",
-    "unfaked",
-    "unfed",
-    "unfelt",
-    "unfiled",
-    "unfined",
-    "unfired",
-    "unfit",
-    "unfixed",
-    "unfold",
-    "unfolds",
-    "unfound",
-    "unfried",
-    "unfrock",
-    "unfunny",
-    "unfurl",
-    "unfurls",
-    "unfussy",
-    "ungated",
-    "ungird",
-    "unglued",
-    "ungodly",
-    "unguent",
-    "unhand",
-    "unhandy",
-    "unhappy",
-    "unhasty",
-    "unheard",
-    "unhinge",
-    "unhired",
-    "unhitch",
-    "unhoed",
-    "unholy",
-    "unhook",
-    "unhooks",
-    "unhoped",
-    "unhorse",
-    "unhosed",
-    "unhung",
-    "unhurt",
-    "unicef",
-    "unicorn",
-    "unideal",
-    "unified",
-    "unifies",
-    "uniform",
-    "unify",
-    "union",
-    "unions",
-    "uniplex",
-    "unique",
-    "unisex",
-    "unison",
-    "unit",
-    "unitary",
-    "unite",
-    "united",
-    "unites",
-    "unities",
-    "uniting",
-    "units",
-    "unity",
-    "univac",
-    "unix",
-    "unjaded",
-    "unjust",
-    "unkempt",
-    "unkind",
-    "unknown",
-    "unlace",
-    "unlaced",
-    "unladen",
-    "unlaid",
-    "unlatch",
-    "unlearn",
-    "unleash",
-    "unless",
-    "unlike",
-    "unlimed",
-    "unlined",
-    "unlink",
-    "unlived",
-    "unload",
-    "unloads",
-    "unlock",
-    "unlocks",
-    "unloose",
-    "unloved",
-    "unlucky",
-    "unmade",
-    "unmake",
-    "unmakes",
-    "unman",
-    "unmanly",
-    "unmask",
-    "unmasks",
-    "unmated",
-    "unmeant",
-    "unmined",
-    "unmixed",
-    "unmoved",
-    "unmown",
-    "unnamed",
-    "unnerve",
-    "unnoted",
-    "unoiled",
-    "unowned",
-    "unpaced",
-    "unpack",
-    "unpacks",
-    "unpaged",
-    "unpaid",
-    "unpaved",
-    "unpeg",
-    "unpick",
-    "unpicks",
-    "unpin",
-    "unpins",
-    "unpiped",
-    "unplug",
-    "unplugs",
-    "unposed",
-    "unquiet",
-    "unquote",
-    "unravel",
-    "unread",
-    "unready",
-    "unreal",
-    "unreel",
-    "unrest",
-    "unripe",
-    "unrobe",
-    "unrobed",
-    "unroll",
-    "unrolls",
-    "unroof",
-    "unruled",
-    "unruly",
-    "unsafe",
-    "unsaid",
-    "unsaved",
-    "unsawed",
-    "unsay",
-    "unscaly",
-    "unscrew",
-    "unseal",
-    "unseals",
-    "unseat",
-    "unseats",
-    "unseen",
-    "unset",
-    "unsets",
-    "unsewed",
-    "unsharp",
-    "unship",
-    "unships",
-    "unshod",
-    "unshown",
-    "unshut",
-    "unslit",
-    "unsnap",
-    "unsober",
-    "unsold",
-    "unsound",
-    "unsown",
-    "unspelt",
-    "unspent",
-    "unspilt",
-    "unsplit",
-    "unspool",
-    "unstick",
-    "unstrap",
-    "unstuck",
-    "unsung",
-    "unsure",
-    "unswept",
-    "untack",
-    "untacks",
-    "untamed",
-    "untaped",
-    "untaxed",
-    "untidy",
-    "untie",
-    "untied",
-    "unties",
-    "until",
-    "untiled",
-    "untimed",
-    "untired",
-    "unto",
-    "untold",
-    "untried",
-    "untrod",
-    "untrue",
-    "untruly",
-    "untruth",
-    "untuned",
-    "untwine",
-    "untwist",
-    "untying",
-    "untyped",
-    "unused",
-    "unusual",
-    "unveil",
-    "unveils",
-    "unwarty",
-    "unwary",
-    "unwaved",
-    "unwaxed",
-    "unweary",
-    "unwed",
-    "unweld",
-    "unwelds",
-    "unwell",
-    "unwind",
-    "unwinds",
-    "unwire",
-    "unwired",
-    "unwise",
-    "unworn",
-    "unwound",
-    "unwrap",
-    "unwraps",
-    "unyoke",
-    "unyoked",
-    "unyokes",
-    "unzip",
-    "unzips",
-    "up",
-    "upbeat",
-    "upbring",
-    "upcome",
-    "update",
-    "updated",
-    "updates",
-    "updike",
-    "upgrade",
-    "upheld",
-    "uphill",
-    "uphold",
-    "upholds",
-    "upkeep",
-    "upland",
-    "uplands",
-    "uplift",
-    "uplifts",
-    "upmost",
-    "upon",
-    "upped",
-    "upper",
-    "upping",
-    "uppity",
-    "upright",
-    "uprise",
-    "uprises",
-    "upriver",
-    "uproar",
-    "uproot",
-    "uproots",
-    "ups",
-    "upset",
-    "upsets",
-    "upshot",
-    "upshots",
-    "upside",
-    "upsilon",
-    "upstage",
-    "upstart",
-    "upsurge",
-    "upswept",
-    "upswing",
-    "uptake",
-    "uptight",
-    "uptown",
-    "uptrend",
-    "upturn",
-    "upturns",
-    "upward",
-    "upwards",
-    "upwind",
-    "uranium",
-    "uranus",
-    "urban",
-    "urbane",
-    "urchin",
-    "urchins",
-    "urdu",
-    "urethra",
-    "urge",
-    "urged",
-    "urgency",
-    "urgent",
-    "urges",
-    "urging",
-    "urgings",
-    "uric",
-    "urinal",
-    "urinals",
-    "urinary",
-    "urinate",
-    "urine",
-    "urn",
-    "urns",
-    "ursine",
-    "uruguay",
-    "us",
-    "usa",
-    "usable",
-    "usage",
-    "usages",
-    "use",
-    "useable",
-    "used",
-    "useful",
-    "useless",
-    "user",
-    "users",
-    "uses",
-    "usher",
-    "ushered",
-    "ushers",
-    "using",
-    "ussr",
-    "usual",
-    "usually",
-    "usurer",
-    "usurers",
-    "usurp",
-    "usurped",
-    "usurper",
-    "usurps",
-    "usury",
-    "utah",
-    "utensil",
-    "uteri",
-    "uterine",
-    "uterus",
-    "utility",
-    "utilize",
-    "utmost",
-    "utopia",
-    "utopian",
-    "utopias",
-    "utrecht",
-    "utter",
-    "uttered",
-    "utterly",
-    "utters",
-    "uvula",
-    "uvular",
-    "uvulas",
-    "uzbek",
-    "vacancy",
-    "vacant",
-    "vacate",
-    "vacated",
-    "vacates",
-    "vaccine",
-    "vacuate",
-    "vacuity",
-    "vacuous",
-    "vacuum",
-    "vacuums",
-    "vaduz",
-    "vagary",
-    "vaginal",
-    "vaginas",
-    "vagrant",
-    "vague",
-    "vaguely",
-    "vaguer",
-    "vaguest",
-    "vain",
-    "vainly",
-    "valance",
-    "vale",
-    "valence",
-    "valerie",
-    "vales",
-    "valet",
-    "valets",
-    "valetta",
-    "valiant",
-    "valid",
-    "validly",
-    "valise",
-    "valises",
-    "valley",
-    "valleys",
-    "valor",
-    "valuate",
-    "value",
-    "valued",
-    "valuer",
-    "valuers",
-    "values",
-    "valuing",
-    "valve",
-    "valved",
-    "valves",
-    "vamp",
-    "vamped",
-    "vamping",
-    "vampire",
-    "vamps",
-    "van",
-    "vandal",
-    "vandals",
-    "vane",
-    "vaned",
-    "vanes",
-    "vanilla",
-    "vanish",
-    "vanity",
-    "vans",
-    "vantage",
-    "vanuata",
-    "vapid",
-    "vapidly",
-    "vapor",
-    "vapors",
-    "variant",
-    "variate",
-    "varied",
-    "varies",
-    "variety",
-    "various",
-    "varnish",
-    "varsity",
-    "vary",
-    "varying",
-    "vase",
-    "vases",
-    "vassal",
-    "vassals",
-    "vast",
-    "vaster",
-    "vastest",
-    "vastly",
-    "vat",
-    "vatican",
-    "vats",
-    "vault",
-    "vaulted",
-    "vaulter",
-    "vaults",
-    "vaulty",
-    "vaunt",
-    "vaunted",
-    "vaunter",
-    "vaunts",
-    "vc",
-    "veal",
-    "vector",
-    "vectors",
-    "veer",
-    "veered",
-    "veering",
-    "veers",
-    "vegan",
-    "vegans",
-    "vehicle",
-    "veil",
-    "veiled",
-    "veiling",
-    "veils",
-    "vein",
-    "veined",
-    "veining",
-    "veins",
-    "vela",
-    "vellum",
-    "velour",
-    "velours",
-    "velum",
-    "velvet",
-    "velvety",
-    "venal",
-    "venally",
-    "vend",
-    "vended",
-    "vendee",
-    "vendees",
-    "vending",
-    "vendor",
-    "vendors",
-    "vends",
-    "veneer",
-    "veneers",
-    "venia",
-    "venial",
-    "venice",
-    "venire",
-    "venison",
-    "venom",
-    "venomed",
-    "venoms",
-    "venous",
-    "vent",
-    "vented",
-    "venter",
-    "venting",
-    "vents",
-    "venture",
-    "venue",
-    "venues",
-    "venus",
-    "verb",
-    "verba",
-    "verbal",
-    "verbose",
-    "verbs",
-    "verdant",
-    "verdi",
-    "verdict",
-    "verdure",
-    "verge",
-    "verged",
-    "verger",
-    "vergers",
-    "verges",
-    "verging",
-    "verify",
-    "verily",
-    "verity",
-    "vermin",
-    "vermont",
-    "vernal",
-    "verruca",
-    "versa",
-    "verse",
-    "versed",
-    "verses",
-    "versify",
-    "version",
-    "versus",
-    "vertex",
-    "vertigo",
-    "verve",
-    "very",
-    "vesicle",
-    "vesper",
-    "vespers",
-    "vessel",
-    "vessels",
-    "vest",
-    "vestal",
-    "vested",
-    "vestige",
-    "vesting",
-    "vestry",
-    "vests",
-    "vesture",
-    "vet",
-    "veteran",
-    "veto",
-    "vetoed",
-    "vetoes",
-    "vetoing",
-    "vets",
-    "vetting",
-    "vex",
-    "vexed",
-    "vexes",
-    "vexing",
-    "vi",
-    "via",
-    "viable",
-    "viably",
-    "viaduct",
-    "vials",
-    "vibes",
-    "vibrant",
-    "vibrate",
-    "vibrato",
-    "vic",
-    "vicar",
-    "vicars",
-    "vice",
-    "viceroy",
-    "vices",
-    "vicious",
-    "vicki",
-    "victim",
-    "victims",
-    "victor",
-    "victors",
-    "victory",
-    "victual",
-    "video",
-    "videos",
-    "vie",
-    "vied",
-    "vienna",
-    "vies",
-    "vietnam",
-    "view",
-    "viewed",
-    "viewer",
-    "viewers",
-    "viewing",
-    "views",
-    "vigil",
-    "vigor",
-    "viking",
-    "vikings",
-    "vile",
-    "vilely",
-    "viler",
-    "vilest",
-    "vilify",
-    "villa",
-    "village",
-    "villain",
-    "villas",
-    "vilnius",
-    "vim",
-    "vincent",
-    "vinculo",
-    "vine",
-    "vinegar",
-    "vines",
-    "vinous",
-    "vintage",
-    "vintner",
-    "vinyl",
-    "viol",
-    "viola",
-    "violas",
-    "violate",
-    "violent",
-    "violet",
-    "violets",
-    "violin",
-    "violins",
-    "violist",
-    "viols",
-    "viper",
-    "vipers",
-    "virago",
-    "viragos",
-    "viral",
-    "virgin",
-    "virgins",
-    "virgo",
-    "virgule",
-    "virile",
-    "virtual",
-    "virtue",
-    "virtues",
-    "virus",
-    "viruses",
-    "vis",
-    "visa",
-    "visage",
-    "visages",
-    "visas",
-    "viscera",
-    "viscose",
-    "viscous",
-    "visible",
-    "visibly",
-    "vision",
-    "visions",
-    "visit",
-    "visited",
-    "visitor",
-    "visits",
-    "visor",
-    "visored",
-    "visors",
-    "vista",
-    "vistas",
-    "visual",
-    "visuals",
-    "vital",
-    "vitally",
-    "vitals",
-    "vitamin",
-    "vitas",
-    "vitiate",
-    "vitrify",
-    "vitriol",
-    "vitro",
-    "viva",
-    "vivaldi",
-    "vivid",
-    "vividly",
-    "vivify",
-    "vixen",
-    "vixens",
-    "viz",
-    "vizier",
-    "viziers",
-    "vocal",
-    "vocalic",
-    "vocally",
-    "vocals",
-    "vocate",
-    "vodka",
-    "vogue",
-    "vogues",
-    "voguish",
-    "voice",
-    "voiced",
-    "voices",
-    "voicing",
-    "void",
-    "voided",
-    "voider",
-    "voiding",
-    "voids",
-    "volcano",
-    "vole",
-    "volenti",
-    "voles",
-    "volley",
-    "volleys",
-    "volt",
-    "volta",
-    "voltage",
-    "voltaic",
-    "volts",
-    "voluble",
-    "volubly",
-    "volume",
-    "volumed",
-    "volumes",
-    "volute",
-    "volvo",
-    "vomit",
-    "vomited",
-    "vomits",
-    "voodoo",
-    "vortex",
-    "vote",
-    "voted",
-    "voter",
-    "voters",
-    "votes",
-    "voting",
-    "votive",
-    "vouch",
-    "vouched",
-    "vouchee",
-    "voucher",
-    "vouches",
-    "vought",
-    "vow",
-    "vowed",
-    "vowel",
-    "vowels",
-    "vowing",
-    "vows",
-    "vox",
-    "voyage",
-    "voyaged",
-    "voyager",
-    "voyages",
-    "voyeur",
-    "voyeurs",
-    "vulcan",
-    "vulgar",
-    "vulpine",
-    "vulture",
-    "vulva",
-    "vulvas",
-    "vying",
-    "wad",
-    "wadded",
-    "wadding",
-    "waddle",
-    "waddled",
-    "waddles",
-    "wade",
-    "waded",
-    "wader",
-    "waders",
-    "wades",
-    "wading",
-    "wads",
-    "wafer",
-    "wafers",
-    "waffle",
-    "waffled",
-    "waffles",
-    "waft",
-    "wafted",
-    "wafting",
-    "wafts",
-    "wag",
-    "wage",
-    "waged",
-    "wager",
-    "wagered",
-    "wagerer",
-    "wagers",
-    "wages",
-    "wagged",
-    "wagging",
-    "waggish",
-    "waggle",
-    "waggled",
-    "waggles",
-    "waging",
-    "wagner",
-    "wagon",
-    "wagoner",
-    "wagons",
-    "wags",
-    "wagtail",
-    "waif",
-    "wail",
-    "wailed",
-    "wailful",
-    "wailing",
-    "wails",
-    "wain",
-    "waist",
-    "waisted",
-    "waists",
-    "wait",
-    "waited",
-    "waiter",
-    "waiters",
-    "waiting",
-    "waits",
-    "waive",
-    "waived",
-    "waiver",
-    "waives",
-    "waiving",
-    "wake",
-    "waked",
-    "wakeful",
-    "waken",
-    "wakened",
-    "wakens",
-    "wakes",
-    "waking",
-    "waldorf",
-    "wales",
-    "walk",
-    "walked",
-    "walker",
-    "walkers",
-    "walking",
-    "walkout",
-    "walks",
-    "walkway",
-    "wall",
-    "wallaby",
-    "walled",
-    "wallet",
-    "wallets",
-    "walleye",
-    "walling",
-    "wallop",
-    "wallops",
-    "wallow",
-    "wallows",
-    "walls",
-    "wally",
-    "walnut",
-    "walnuts",
-    "walrus",
-    "walter",
-    "waltz",
-    "waltzed",
-    "waltzer",
-    "waltzes",
-    "wan",
-    "wand",
-    "wander",
-    "wanders",
-    "wands",
-    "wane",
-    "waned",
-    "wanes",
-    "wangle",
-    "wangled",
-    "wangles",
-    "waning",
-    "wanly",
-    "want",
-    "wantage",
-    "wanted",
-    "wanting",
-    "wanton",
-    "wantons",
-    "wants",
-    "war",
-    "warble",
-    "warbled",
-    "warbler",
-    "warbles",
-    "ward",
-    "warded",
-    "warden",
-    "wardens",
-    "warder",
-    "warders",
-    "warding",
-    "wards",
-    "ware",
-    "wares",
-    "warfare",
-    "warhead",
-    "warier",
-    "wariest",
-    "warily",
-    "warless",
-    "warlike",
-    "warlock",
-    "warlord",
-    "warm",
-    "warmed",
-    "warmer",
-    "warmest",
-    "warming",
-    "warmish",
-    "warmly",
-    "warms",
-    "warmth",
-    "warmup",
-    "warn",
-    "warned",
-    "warner",
-    "warning",
-    "warns",
-    "warp",
-    "warpath",
-    "warped",
-    "warping",
-    "warps",
-    "warrant",
-    "warred",
-    "warren",
-    "warrens",
-    "warring",
-    "warrior",
-    "wars",
-    "warsaw",
-    "warship",
-    "wart",
-    "warthog",
-    "wartime",
-    "warts",
-    "warty",
-    "wary",
-    "was",
-    "wash",
-    "washed",
-    "washer",
-    "washers",
-    "washes",
-    "washing",
-    "washout",
-    "washtub",
-    "washy",
-    "wasp",
-    "waspish",
-    "wasps",
-    "wassail",
-    "wastage",
-    "waste",
-    "wasted",
-    "waster",
-    "wasters",
-    "wastes",
-    "wasting",
-    "wastrel",
-    "watch",
-    "watched",
-    "watcher",
-    "watches",
-    "water",
-    "watered",
-    "waters",
-    "watery",
-    "watt",
-    "wattage",
-    "wattle",
-    "wattled",
-    "wattles",
-    "watts",
-    "wave",
-    "waved",
-    "wavelet",
-    "waver",
-    "wavered",
-    "waverer",
-    "wavers",
-    "waves",
-    "wavier",
-    "waviest",
-    "wavily",
-    "waving",
-    "wavy",
-    "wax",
-    "waxed",
-    "waxen",
-    "waxes",
-    "waxier",
-    "waxiest",
-    "waxily",
-    "waxing",
-    "waxwing",
-    "waxwork",
-    "waxy",
-    "way",
-    "waylaid",
-    "waylay",
-    "waylays",
-    "waymark",
-    "ways",
-    "wayside",
-    "wayward",
-    "wayworn",
-    "we",
-    "weak",
-    "weaken",
-    "weakens",
-    "weaker",
-    "weakest",
-    "weakly",
-    "weal",
-    "weals",
-    "wealth",
-    "wealthy",
-    "wean",
-    "weaned",
-    "weaning",
-    "weans",
-    "weapon",
-    "weapons",
-    "wear",
-    "wearer",
-    "wearers",
-    "wearied",
-    "wearier",
-    "wearies",
-    "wearily",
-    "wearing",
-    "wears",
-    "weary",
-    "weasel",
-    "weasels",
-    "weather",
-    "weave",
-    "weaved",
-    "weaver",
-    "weavers",
-    "weaves",
-    "weaving",
-    "web",
-    "webbed",
-    "webbing",
-    "webfoot",
-    "webs",
-    "wed",
-    "wedded",
-    "wedding",
-    "wedge",
-    "wedged",
-    "wedges",
-    "wedging",
-    "wedlock",
-    "weds",
-    "wee",
-    "weed",
-    "weeded",
-    "weeder",
-    "weeding",
-    "weeds",
-    "weedy",
-    "week",
-    "weekday",
-    "weekend",
-    "weekly",
-    "weeks",
-    "weeny",
-    "weep",
-    "weeper",
-    "weepers",
-    "weeping",
-    "weeps",
-    "weepy",
-    "weevil",
-    "weevils",
-    "weft",
-    "weigh",
-    "weighed",
-    "weighs",
-    "weight",
-    "weights",
-    "weighty",
-    "weir",
-    "weird",
-    "weirder",
-    "weirdly",
-    "weirdo",
-    "weirs",
-    "welcher",
-    "welcome",
-    "weld",
-    "welded",
-    "welder",
-    "welders",
-    "welding",
-    "welds",
-    "welfare",
-    "well",
-    "welled",
-    "welling",
-    "wells",
-    "welsh",
-    "welt",
-    "welted",
-    "welter",
-    "welting",
-    "welts",
-    "wen",
-    "wench",
-    "wenched",
-    "wencher",
-    "wenches",
-    "wend",
-    "wended",
-    "wending",
-    "wends",
-    "went",
-    "wept",
-    "were",
-    "wesley",
-    "wesson",
-    "west",
-    "western",
-    "wet",
-    "wetland",
-    "wetly",
-    "wetness",
-    "wets",
-    "wetted",
-    "wetter",
-    "wettest",
-    "wetting",
-    "whack",
-    "whacked",
-    "whacker",
-    "whacks",
-    "whale",
-    "whaler",
-    "whalers",
-    "whales",
-    "whaling",
-    "wham",
-    "whammy",
-    "wharf",
-    "wharfed",
-    "wharfs",
-    "wharves",
-    "what",
-    "whatnot",
-    "wheat",
-    "wheaten",
-    "wheedle",
-    "wheel",
-    "wheeled",
-    "wheeler",
-    "wheels",
-    "wheeze",
-    "wheezed",
-    "wheezes",
-    "wheezy",
-    "whelk",
-    "whelks",
-    "when",
-    "whence",
-    "where",
-    "whereas",
-    "whereat",
-    "whereby",
-    "wherein",
-    "whereof",
-    "whereon",
-    "whereto",
-    "wherry",
-    "whet",
-    "whether",
-    "whets",
-    "whetted",
-    "whew",
-    "whey",
-    "which",
-    "whiff",
-    "whiffed",
-    "whiffs",
-    "whig",
-    "while",
-    "whiled",
-    "whiles",
-    "whiling",
-    "whilst",
-    "whim",
-    "whimper",
-    "whims",
-    "whimsy",
-    "whine",
-    "whined",
-    "whiner",
-    "whiners",
-    "whines",
-    "whinge",
-    "whinged",
-    "whinges",
-    "whingy",
-    "whining",
-    "whinny",
-    "whiny",
-    "whip",
-    "whipped",
-    "whipper",
-    "whippet",
-    "whips",
-    "whir",
-    "whirl",
-    "whirled",
-    "whirls",
-    "whirred",
-    "whisk",
-    "whisked",
-    "whisker",
-    "whiskey",
-    "whisks",
-    "whisky",
-    "whisper",
-    "whist",
-    "whistle",
-    "whit",
-    "white",
-    "whitely",
-    "whiten",
-    "whitens",
-    "whiter",
-    "whites",
-    "whitest",
-    "whither",
-    "whiting",
-    "whitish",
-    "whitney",
-    "whitsun",
-    "whittle",
-    "whiz",
-    "whizzed",
-    "whizzes",
-    "who",
-    "whoa",
-    "whoever",
-    "whole",
-    "wholes",
-    "wholly",
-    "whom",
-    "whoop",
-    "whooped",
-    "whoops",
-    "whoosh",
-    "whopper",
-    "whorl",
-    "whorled",
-    "whorls",
-    "whose",
-    "why",
-    "whys",
-    "wick",
-    "wicked",
-    "wicker",
-    "wicket",
-    "wickets",
-    "wicking",
-    "wicks",
-    "wide",
-    "widely",
-    "widen",
-    "widened",
-    "widener",
-    "widens",
-    "wider",
-    "widest",
-    "widgeon",
-    "widget",
-    "widgets",
-    "widish",
-    "widow",
-    "widowed",
-    "widower",
-    "widows",
-    "width",
-    "widths",
-    "wield",
-    "wielded",
-    "wielder",
-    "wields",
-    "wieldy",
-    "wife",
-    "wifely",
-    "wig",
-    "wigged",
-    "wigging",
-    "wiggins",
-    "wiggle",
-    "wiggled",
-    "wiggler",
-    "wiggles",
-    "wiggly",
-    "wigless",
-    "wigs",
-    "wigwag",
-    "wigwam",
-    "wigwams",
-    "wild",
-    "wildcat",
-    "wilder",
-    "wildest",
-    "wildly",
-    "wilds",
-    "wile",
-    "wiles",
-    "wilier",
-    "wiliest",
-    "will",
-    "willed",
-    "willful",
-    "william",
-    "willie",
-    "willies",
-    "willing",
-    "willow",
-    "willows",
-    "willowy",
-    "wills",
-    "wilt",
-    "wilted",
-    "wilting",
-    "wilts",
-    "wily",
-    "wimp",
-    "wimpish",
-    "wimple",
-    "wimpled",
-    "wimples",
-    "wimps",
-    "win",
-    "wince",
-    "winced",
-    "winces",
-    "winch",
-    "winched",
-    "winches",
-    "wincing",
-    "wind",
-    "windbag",
-    "winded",
-    "winder",
-    "winders",
-    "windily",
-    "winding",
-    "window",
-    "windows",
-    "winds",
-    "windsor",
-    "windup",
-    "windy",
-    "wine",
-    "wined",
-    "winery",
-    "wines",
-    "wing",
-    "winged",
-    "winger",
-    "wingers",
-    "winging",
-    "wingman",
-    "wingmen",
-    "wings",
-    "wingtip",
-    "wining",
-    "wink",
-    "winked",
-    "winker",
-    "winking",
-    "winkle",
-    "winkled",
-    "winkles",
-    "winks",
-    "winner",
-    "winners",
-    "winning",
-    "wino",
-    "wins",
-    "winsome",
-    "winter",
-    "winters",
-    "wintry",
-    "winy",
-    "wipe",
-    "wiped",
-    "wiper",
-    "wipers",
-    "wipes",
-    "wiping",
-    "wire",
-    "wired",
-    "wireman",
-    "wiremen",
-    "wires",
-    "wiretap",
-    "wirier",
-    "wiriest",
-    "wirily",
-    "wiring",
-    "wiry",
-    "wisdom",
-    "wise",
-    "wised",
-    "wisely",
-    "wiser",
-    "wisest",
-    "wish",
-    "wished",
-    "wishes",
-    "wishful",
-    "wishing",
-    "wishy",
-    "wisp",
-    "wisps",
-    "wispy",
-    "wistful",
-    "wistly",
-    "wit",
-    "witch",
-    "witches",
-    "with",
-    "withal",
-    "wither",
-    "withers",
-    "within",
-    "without",
-    "witless",
-    "witness",
-    "wits",
-    "witted",
-    "witter",
-    "witters",
-    "wittier",
-    "wittily",
-    "witting",
-    "witty",
-    "wives",
-    "wizard",
-    "wizards",
-    "wizen",
-    "wizened",
-    "wnw",
-    "wobble",
-    "wobbled",
-    "wobbles",
-    "wobbly",
-    "woe",
-    "woeful",
-    "woes",
-    "wok",
-    "woke",
-    "woken",
-    "wolf",
-    "wolfing",
-    "wolfish",
-    "wolfram",
-    "wolfs",
-    "wolves",
-    "woman",
-    "womanly",
-    "womb",
-    "wombat",
-    "wombats",
-    "wombs",
-    "women",
-    "won",
-    "wonder",
-    "wonders",
-    "wont",
-    "wonted",
-    "wonting",
-    "woo",
-    "wood",
-    "woodcut",
-    "wooded",
-    "wooden",
-    "woods",
-    "woody",
-    "wooed",
-    "wooer",
-    "woof",
-    "woofer",
-    "woofers",
-    "wooing",
-    "wool",
-    "wooled",
-    "woolen",
-    "woolens",
-    "woolly",
-    "woos",
-    "word",
-    "worded",
-    "wordily",
-    "wording",
-    "words",
-    "wordy",
-    "wore",
-    "work",
-    "workbag",
-    "workbox",
-    "workday",
-    "worked",
-    "worker",
-    "workers",
-    "working",
-    "workman",
-    "workmen",
-    "workout",
-    "works",
-    "world",
-    "worldly",
-    "worlds",
-    "worm",
-    "wormed",
-    "worming",
-    "worms",
-    "wormy",
-    "worn",
-    "worried",
-    "worrier",
-    "worries",
-    "worry",
-    "worse",
-    "worsen",
-    "worsens",
-    "worship",
-    "worst",
-    "worsted",
-    "worth",
-    "worthy",
-    "would",
-    "wound",
-    "wounded",
-    "wounds",
-    "wove",
-    "woven",
-    "wow",
-    "wowed",
-    "wrack",
-    "wraf",
-    "wrangle",
-    "wrap",
-    "wrapped",
-    "wrapper",
-    "wraps",
-    "wrasse",
-    "wrath",
-    "wreak",
-    "wreaked",
-    "wreaks",
-    "wreath",
-    "wreathe",
-    "wreaths",
-    "wreck",
-    "wrecked",
-    "wrecker",
-    "wrecks",
-    "wren",
-    "wrench",
-    "wrens",
-    "wrest",
-    "wrested",
-    "wrestle",
-    "wrests",
-    "wretch",
-    "wrier",
-    "wriest",
-    "wriggle",
-    "wrigley",
-    "wring",
-    "wringer",
-    "wrings",
-    "wrinkle",
-    "wrinkly",
-    "wrist",
-    "wristed",
-    "wrists",
-    "writ",
-    "write",
-    "writer",
-    "writers",
-    "writes",
-    "writeup",
-    "writhe",
-    "writhed",
-    "writhes",
-    "writing",
-    "writs",
-    "written",
-    "wrong",
-    "wronged",
-    "wrongly",
-    "wrongs",
-    "wrote",
-    "wroth",
-    "wrought",
-    "wrung",
-    "wry",
-    "wryly",
-    "wryness",
-    "wsw",
-    "wyoming",
-    "xavier",
-    "xenon",
-    "xerox",
-    "xeroxes",
-    "xi",
-    "xii",
-    "xiii",
-    "xiv",
-    "xix",
-    "xmas",
-    "xray",
-    "xrays",
-    "xv",
-    "xvi",
-    "xvii",
-    "xviii",
-    "xx",
-    "xxi",
-    "xxii",
-    "xxiii",
-    "xxiv",
-    "xxix",
-    "xxv",
-    "xxvi",
-    "xxvii",
-    "xxviii",
-    "xxx",
-    "xylene",
-    "yacht",
-    "yachts",
-    "yahoo",
-    "yak",
-    "yaks",
-    "yale",
-    "yalta",
-    "yam",
-    "yamaha",
-    "yams",
-    "yang",
-    "yank",
-    "yanked",
-    "yankee",
-    "yankees",
-    "yanking",
-    "yanks",
-    "yap",
-    "yapped",
-    "yapper",
-    "yappers",
-    "yapping",
-    "yaps",
-    "yard",
-    "yardarm",
-    "yardman",
-    "yards",
-    "yarn",
-    "yarns",
-    "yaw",
-    "yawed",
-    "yawing",
-    "yawl",
-    "yawls",
-    "yawn",
-    "yawned",
-    "yawner",
-    "yawning",
-    "yawns",
-    "yaws",
-    "yeah",
-    "year",
-    "yearly",
-    "yearn",
-    "yearned",
-    "yearns",
-    "years",
-    "yeas",
-    "yeast",
-    "yeasts",
-    "yeasty",
-    "yell",
-    "yelled",
-    "yeller",
-    "yellers",
-    "yelling",
-    "yellow",
-    "yellows",
-    "yells",
-    "yelp",
-    "yelped",
-    "yelping",
-    "yelps",
-    "yemen",
-    "yemeni",
-    "yen",
-    "yeoman",
-    "yeomen",
-    "yes",
-    "yet",
-    "yeti",
-    "yetis",
-    "yew",
-    "yews",
-    "yiddish",
-    "yield",
-    "yielded",
-    "yields",
-    "yin",
-    "ymca",
-    "yodel",
-    "yodeled",
-    "yodels",
-    "yoga",
-    "yogi",
-    "yogism",
-    "yogurt",
-    "yoke",
-    "yoked",
-    "yokel",
-    "yokels",
-    "yokes",
-    "yoking",
-    "yolk",
-    "yolks",
-    "yolky",
-    "yom",
-    "yon",
-    "yonder",
-    "yore",
-    "york",
-    "you",
-    "young",
-    "younger",
-    "your",
-    "yours",
-    "youth",
-    "youths",
-    "yoyo",
-    "yoyos",
-    "yttrium",
-    "yuan",
-    "yukon",
-    "yule",
-    "yummy",
-    "ywca",
-    "zagreb",
-    "zaire",
-    "zambezi",
-    "zambia",
-    "zambian",
-    "zanier",
-    "zaniest",
-    "zany",
-    "zap",
-    "zapped",
-    "zapping",
-    "zaps",
-    "zeal",
-    "zealand",
-    "zealot",
-    "zealots",
-    "zealous",
-    "zebra",
-    "zebras",
-    "zebrine",
-    "zebu",
-    "zees",
-    "zen",
-    "zenith",
-    "zephyr",
-    "zero",
-    "zeroed",
-    "zeroes",
-    "zeroing",
-    "zeros",
-    "zest",
-    "zestful",
-    "zesty",
-    "zeus",
-    "zigzag",
-    "zigzags",
-    "zillion",
-    "zinc",
-    "zion",
-    "zionism",
-    "zionist",
-    "zip",
-    "zipped",
-    "zipper",
-    "zippers",
-    "zipping",
-    "zippy",
-    "zips",
-    "zither",
-    "zithers",
-    "zloty",
-    "zlotys",
-    "zodiac",
-    "zombie",
-    "zombies",
-    "zonal",
-    "zonally",
-    "zone",
-    "zoned",
-    "zones",
-    "zoning",
-    "zoo",
-    "zoology",
-    "zoom",
-    "zoomed",
-    "zooming",
-    "zooms",
-    "zoos",
-    "zounds",
-    "zurich"
-]
\ No newline at end of file
+    """Returns every valid word (2 - 7 letters), sorted.
+
+    The words live in valid_words.lex, which is only read the first time this is called. Every call
+    returns the same tuple, so callers should copy it before changing it.
+    """
+    return load_lexicon("valid_words.lex").words
@@ -1,4 +1,5 @@
 from valid_word_list import get_valid_word_list
+from corpus_index import load_index
 
 
 def get_letter_masks(word: str) -> list[str]:
@@ -253,7 +254,8 @@ if __name__ == "__main__":
     w2 = "CAT"
     print(f"\n_____Running on {w1}/{w2}_____")
     word_length = len(w1)
-    word_list = filter_word_list(get_valid_word_list(), word_length)
+    # a set keeps the start/target membership checks O(1)
+    word_list = frozenset(load_index(get_valid_word_list).words_of_length(word_length))
     graph = build_ladder_graph(word_list)
     print(shortest_ladder(graph, w1, w2, word_list))
     print(all_shortest_ladders(graph, w1, w2, word_list))